@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+CloudWatch Metric Batcher
+Packs per-instance metric lookups into bulk GetMetricData requests.
+
+A single GetMetricData request carries up to 500 metric queries, so the CPU/memory series for
+hundreds of instances in a region come back in a handful of calls instead of one
+GetMetricStatistics call per instance per metric. Series are returned as NumPy arrays.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (result key, namespace, metric name, statistic)
+CPU_UTILIZATION = ('cpu', 'AWS/EC2', 'CPUUtilization', 'Average')
+MEMORY_UTILIZATION = ('memory', 'CWAgent', 'mem_used_percent', 'Average')
+
+
+class CloudWatchMetricBatcher:
+    """Fetch instance metric series for many instances with bulk GetMetricData calls"""
+
+    MAX_QUERIES_PER_REQUEST = 500
+
+    def __init__(self, cloudwatch_client):
+        self.cloudwatch_client = cloudwatch_client
+        self.request_count = 0
+
+    @staticmethod
+    def empty_series() -> Dict[str, np.ndarray]:
+        """Series placeholder for instances without datapoints"""
+        return {
+            'timestamps': np.array([], dtype='datetime64[s]'),
+            'values': np.array([], dtype=float)
+        }
+
+    def _build_queries(self, instance_ids: List[str], metrics: List[Tuple[str, str, str, str]],
+                       period: int) -> Tuple[List[Dict], Dict[str, Tuple[str, str]]]:
+        """Build one query per (metric, instance) and remember which query id maps to which pair"""
+        queries = []
+        query_map = {}
+        for metric_index, (key, namespace, metric_name, stat) in enumerate(metrics):
+            for instance_index, instance_id in enumerate(instance_ids):
+                # Query ids must start with a lowercase letter and be unique within a request
+                query_id = f"m{metric_index}_i{instance_index}"
+                query_map[query_id] = (key, instance_id)
+                queries.append({
+                    'Id': query_id,
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': namespace,
+                            'MetricName': metric_name,
+                            'Dimensions': [{'Name': 'InstanceId', 'Value': instance_id}]
+                        },
+                        'Period': period,
+                        'Stat': stat
+                    },
+                    'ReturnData': True
+                })
+        return queries, query_map
+
+    def get_instance_metrics(self, instance_ids: List[str], start_time, end_time, period: int = 300,
+                             metrics: List[Tuple[str, str, str, str]] = None) -> Dict[str, Dict[str, Dict[str, np.ndarray]]]:
+        """Fetch metric series for all instances
+
+        Args:
+            instance_ids: Instances to fetch metrics for
+            metrics: List of (result key, namespace, metric name, statistic); defaults to CPU only
+
+        Returns:
+            {result key: {instance_id: {'timestamps': np.ndarray, 'values': np.ndarray}}}
+            with datapoints sorted oldest first. Instances without data get empty arrays.
+        """
+        metrics = metrics or [CPU_UTILIZATION]
+        instance_ids = list(dict.fromkeys(instance_ids))
+        results = {key: {instance_id: self.empty_series() for instance_id in instance_ids}
+                   for key, _, _, _ in metrics}
+        if not instance_ids:
+            return results
+
+        queries, query_map = self._build_queries(instance_ids, metrics, period)
+        requests_made = 0
+        collected = {query_id: ([], []) for query_id in query_map}
+
+        for batch_start in range(0, len(queries), self.MAX_QUERIES_PER_REQUEST):
+            batch = queries[batch_start:batch_start + self.MAX_QUERIES_PER_REQUEST]
+            request = {
+                'MetricDataQueries': batch,
+                'StartTime': start_time,
+                'EndTime': end_time,
+                'ScanBy': 'TimestampAscending'
+            }
+            try:
+                while True:
+                    response = self.cloudwatch_client.get_metric_data(**request)
+                    self.request_count += 1
+                    requests_made += 1
+                    for result in response.get('MetricDataResults', []):
+                        timestamps, values = collected.get(result['Id'], ([], []))
+                        timestamps.extend(result.get('Timestamps', []))
+                        values.extend(result.get('Values', []))
+                    next_token = response.get('NextToken')
+                    if not next_token:
+                        break
+                    request['NextToken'] = next_token
+            except Exception as e:
+                logger.warning(f"GetMetricData batch of {len(batch)} queries failed: {e}")
+
+        for query_id, (timestamps, values) in collected.items():
+            if not values:
+                continue
+            key, instance_id = query_map[query_id]
+            ts_array = np.array([ts.replace(tzinfo=None) for ts in timestamps], dtype='datetime64[s]')
+            order = np.argsort(ts_array, kind='stable')
+            results[key][instance_id] = {
+                'timestamps': ts_array[order],
+                'values': np.asarray(values, dtype=float)[order]
+            }
+
+        logger.info(f"Fetched {len(queries)} metric series for {len(instance_ids)} instances "
+                    f"in {requests_made} GetMetricData request(s)")
+        return results
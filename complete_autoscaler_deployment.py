@@ -11,14 +11,12 @@ Current Time: 2025-06-19 07:40:20 UTC
 User: varadharajaan
 """
 
-import os
-import subprocess
-import tempfile
 import time
 import boto3
 import json
 from botocore.exceptions import ClientError, NoCredentialsError
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple
+from k8s_api_client import KubernetesAPIError, KubernetesClient, get_eks_kubernetes_client
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -75,44 +73,6 @@ class CompleteAutoscalerDeployer:
         self.print_colored(self.colors.CYAN, f"    User: varadharajaan")
         self.print_colored(self.colors.BOLD, "=" * 80)
     
-    def run_command(self, cmd: List[str], env: Optional[Dict] = None, timeout: int = 120) -> Tuple[bool, str, str]:
-        """Run command with proper error handling"""
-        try:
-            self.log_step("COMMAND", f"Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, env=env)
-            
-            if result.returncode == 0:
-                self.log_step("COMMAND", f"Success: {' '.join(cmd)}", "SUCCESS")
-                return True, result.stdout, result.stderr
-            else:
-                self.log_step("COMMAND", f"Failed: {' '.join(cmd)} | Error: {result.stderr}", "ERROR")
-                return False, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            self.log_step("COMMAND", f"Timeout: {' '.join(cmd)}", "ERROR")
-            return False, "", "Command timeout"
-        except Exception as e:
-            self.log_step("COMMAND", f"Exception: {' '.join(cmd)} | {str(e)}", "ERROR")
-            return False, "", str(e)
-    
-    def check_prerequisites(self) -> bool:
-        """Check all prerequisites"""
-        self.log_step("PREREQ", "Checking prerequisites...")
-        
-        # Check kubectl
-        success, _, _ = self.run_command(['kubectl', 'version', '--client'])
-        if not success:
-            self.log_step("PREREQ", "kubectl not found or not working", "ERROR")
-            return False
-        
-        # Check aws cli
-        success, _, _ = self.run_command(['aws', '--version'])
-        if not success:
-            self.log_step("PREREQ", "AWS CLI not found or not working", "ERROR")
-            return False
-        
-        self.log_step("PREREQ", "All prerequisites met", "SUCCESS")
-        return True
-    
     def create_aws_session(self, access_key: str, secret_key: str, region: str) -> boto3.Session:
         """Create AWS session with credentials"""
         try:
@@ -132,87 +92,67 @@ class CompleteAutoscalerDeployer:
             self.log_step("AWS", f"Failed to create session: {str(e)}", "ERROR")
             raise
     
-    def setup_kubeconfig(self, cluster_name: str, region: str, access_key: str, secret_key: str) -> Dict:
-        """Setup kubeconfig and return environment"""
-        self.log_step("KUBE", f"Setting up kubeconfig for cluster: {cluster_name}")
-        
-        env = os.environ.copy()
-        env.update({
-            'AWS_ACCESS_KEY_ID': access_key,
-            'AWS_SECRET_ACCESS_KEY': secret_key,
-            'AWS_DEFAULT_REGION': region,
-            'AWS_REGION': region
-        })
-        
-        # Update kubeconfig
-        cmd = ['aws', 'eks', 'update-kubeconfig', '--region', region, '--name', cluster_name]
-        success, stdout, stderr = self.run_command(cmd, env=env)
+    def connect_to_cluster(self, cluster_name: str, region: str, access_key: str, secret_key: str) -> KubernetesClient:
+        """Connect to the cluster's Kubernetes API and verify access"""
+        self.log_step("KUBE", f"Connecting to Kubernetes API of cluster: {cluster_name}")
         
-        if not success:
-            self.log_step("KUBE", f"Failed to update kubeconfig: {stderr}", "ERROR")
-            raise Exception(f"Kubeconfig update failed: {stderr}")
-        
-        # Test kubectl access
-        success, stdout, stderr = self.run_command(['kubectl', 'get', 'nodes'], env=env)
-        if not success:
-            self.log_step("KUBE", f"kubectl access test failed: {stderr}", "ERROR")
-            raise Exception(f"kubectl access failed: {stderr}")
+        try:
+            kube = get_eks_kubernetes_client(cluster_name, region, access_key, secret_key)
+            nodes = kube.list_items('nodes')
+        except Exception as e:
+            self.log_step("KUBE", f"Kubernetes API access test failed: {str(e)}", "ERROR")
+            raise Exception(f"Kubernetes API access failed: {str(e)}")
         
-        node_count = len(stdout.strip().split('\n')) - 1 if stdout.strip() else 0
-        self.log_step("KUBE", f"Cluster access verified. Found {node_count} nodes", "SUCCESS")
+        self.log_step("KUBE", f"Cluster access verified. Found {len(nodes)} nodes", "SUCCESS")
         
-        return env
+        return kube
     
-    def cleanup_existing_autoscaler(self, env: Dict) -> bool:
+    def cleanup_existing_autoscaler(self, kube: KubernetesClient) -> bool:
         """Clean up any existing autoscaler deployment"""
         self.log_step("CLEANUP", "Cleaning up existing autoscaler resources...")
         
-        cleanup_commands = [
-            ['kubectl', 'delete', 'deployment', 'cluster-autoscaler', '-n', 'kube-system', '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'secret', 'cluster-autoscaler-aws-credentials', '-n', 'kube-system', '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'serviceaccount', 'cluster-autoscaler', '-n', 'kube-system', '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'clusterrole', 'cluster-autoscaler', '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'clusterrolebinding', 'cluster-autoscaler', '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'role', 'cluster-autoscaler', '-n', 'kube-system', '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'rolebinding', 'cluster-autoscaler', '-n', 'kube-system', '--ignore-not-found=true']
+        cleanup_resources = [
+            ('deployment', 'cluster-autoscaler', 'kube-system'),
+            ('secret', 'cluster-autoscaler-aws-credentials', 'kube-system'),
+            ('serviceaccount', 'cluster-autoscaler', 'kube-system'),
+            ('clusterrole', 'cluster-autoscaler', None),
+            ('clusterrolebinding', 'cluster-autoscaler', None),
+            ('role', 'cluster-autoscaler', 'kube-system'),
+            ('rolebinding', 'cluster-autoscaler', 'kube-system')
         ]
         
-        for cmd in cleanup_commands:
-            self.run_command(cmd, env=env, timeout=60)
+        for resource_type, name, namespace in cleanup_resources:
+            try:
+                kube.delete(resource_type, name, namespace)
+            except KubernetesAPIError as e:
+                self.log_step("CLEANUP", f"Failed to delete {resource_type} {name}: {str(e)}", "WARNING")
         
         self.log_step("CLEANUP", "Cleanup completed", "SUCCESS")
         time.sleep(10)  # Wait for cleanup to complete
         return True
     
-    def create_aws_credentials_secret(self, access_key: str, secret_key: str, region: str, env: Dict) -> bool:
+    def create_aws_credentials_secret(self, access_key: str, secret_key: str, region: str,
+                                      kube: KubernetesClient) -> bool:
         """Create AWS credentials secret for autoscaler"""
         self.log_step("SECRET", "Creating AWS credentials secret...")
         
-        cmd = [
-            'kubectl', 'create', 'secret', 'generic', 'cluster-autoscaler-aws-credentials',
-            f'--from-literal=AWS_ACCESS_KEY_ID={access_key}',
-            f'--from-literal=AWS_SECRET_ACCESS_KEY={secret_key}',
-            f'--from-literal=AWS_DEFAULT_REGION={region}',
-            f'--from-literal=AWS_REGION={region}',
-            '-n', 'kube-system'
-        ]
-        
-        success, stdout, stderr = self.run_command(cmd, env=env)
-        if not success:
-            self.log_step("SECRET", f"Failed to create secret: {stderr}", "ERROR")
+        try:
+            kube.apply_secret('cluster-autoscaler-aws-credentials', 'kube-system', {
+                'AWS_ACCESS_KEY_ID': access_key,
+                'AWS_SECRET_ACCESS_KEY': secret_key,
+                'AWS_DEFAULT_REGION': region,
+                'AWS_REGION': region
+            })
+        except KubernetesAPIError as e:
+            self.log_step("SECRET", f"Failed to create secret: {str(e)}", "ERROR")
             return False
         
         # Verify secret
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'secret', 'cluster-autoscaler-aws-credentials', '-n', 'kube-system'],
-            env=env
-        )
-        
-        if success:
+        if kube.exists('secret', 'cluster-autoscaler-aws-credentials', 'kube-system'):
             self.log_step("SECRET", "AWS credentials secret created and verified", "SUCCESS")
             return True
         else:
-            self.log_step("SECRET", f"Secret verification failed: {stderr}", "ERROR")
+            self.log_step("SECRET", "Secret verification failed: secret not found", "ERROR")
             return False
     
     def discover_and_tag_asgs(self, session: boto3.Session, cluster_name: str, region: str) -> List[str]:
@@ -497,40 +437,46 @@ spec:
 """
         return yaml_content
     
-    def deploy_autoscaler(self, cluster_name: str, region: str, env: Dict) -> bool:
+    def deploy_autoscaler(self, cluster_name: str, region: str, kube: KubernetesClient) -> bool:
         """Deploy the autoscaler"""
         self.log_step("DEPLOY", "Deploying cluster autoscaler...")
         
         # Create YAML content
         yaml_content = self.create_autoscaler_yaml(cluster_name, region)
         
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
-            f.write(yaml_content)
-            temp_file = f.name
-        
+        # Server-side apply every document of the manifest
         try:
-            # Apply the YAML
-            success, stdout, stderr = self.run_command(
-                ['kubectl', 'apply', '-f', temp_file],
-                env=env
-            )
-            
-            if success:
-                self.log_step("DEPLOY", "Autoscaler deployment applied successfully", "SUCCESS")
-                return True
-            else:
-                self.log_step("DEPLOY", f"Deployment failed: {stderr}", "ERROR")
-                return False
+            results = kube.apply_manifest(yaml_content)
+        except Exception as e:
+            self.log_step("DEPLOY", f"Deployment failed: {str(e)}", "ERROR")
+            return False
         
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+        failed = [result for result in results if not result['success']]
+        if not failed:
+            self.log_step("DEPLOY", "Autoscaler deployment applied successfully", "SUCCESS")
+            return True
+        
+        for result in failed:
+            self.log_step("DEPLOY", f"Failed to apply {result['kind']} {result['name']}: {result['error']}", "ERROR")
+        return False
     
-    def wait_for_autoscaler_ready(self, env: Dict, timeout: int = 300) -> bool:
+    @staticmethod
+    def describe_pod_status(pod: Dict) -> Tuple[str, str]:
+        """kubectl-style READY (e.g. 1/1) and STATUS (phase or container waiting reason) of a pod"""
+        container_statuses = pod.get('status', {}).get('containerStatuses', [])
+        ready_count = sum(1 for container in container_statuses if container.get('ready'))
+        ready_status = f"{ready_count}/{len(pod.get('spec', {}).get('containers', []))}"
+        
+        pod_status = pod.get('status', {}).get('phase', 'Unknown')
+        for container in container_statuses:
+            state = container.get('state', {})
+            reason = state.get('waiting', {}).get('reason') or state.get('terminated', {}).get('reason')
+            if reason:
+                pod_status = reason
+                break
+        return ready_status, pod_status
+    
+    def wait_for_autoscaler_ready(self, kube: KubernetesClient, timeout: int = 300) -> bool:
         """Wait for autoscaler to be ready with detailed monitoring"""
         self.log_step("WAIT", f"Waiting for autoscaler to be ready (timeout: {timeout}s)...")
         
@@ -539,69 +485,55 @@ spec:
         
         while time.time() - start_time < timeout:
             # Check pod status
-            success, stdout, stderr = self.run_command(
-                ['kubectl', 'get', 'pods', '-n', 'kube-system', '-l', 'app=cluster-autoscaler', '--no-headers'],
-                env=env,
-                timeout=30
-            )
+            try:
+                pods = kube.list_items('pods', 'kube-system', 'app=cluster-autoscaler')
+            except KubernetesAPIError as e:
+                self.log_step("WAIT", f"Failed to list autoscaler pods: {str(e)}", "WARNING")
+                pods = []
             
-            if success and stdout.strip():
-                lines = stdout.strip().split('\n')
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        pod_name = parts[0]
-                        ready_status = parts[1]
-                        pod_status = parts[2]
-                        
-                        current_status = f"{pod_name} {ready_status} {pod_status}"
-                        if current_status != last_status:
-                            self.log_step("WAIT", f"Pod status: {current_status}")
-                            last_status = current_status
-                        
-                        if ready_status == "1/1" and pod_status == "Running":
-                            self.log_step("WAIT", f"Autoscaler pod is ready: {pod_name}", "SUCCESS")
-                            return True
-                        elif pod_status in ["CrashLoopBackOff", "Error", "CreateContainerConfigError"]:
-                            self.log_step("WAIT", f"Pod failed with status: {pod_status}", "ERROR")
-                            
-                            # Get logs for debugging
-                            self.run_command(
-                                ['kubectl', 'logs', '-n', 'kube-system', '-l', 'app=cluster-autoscaler', '--tail=20'],
-                                env=env
-                            )
-                            return False
+            for pod in pods:
+                pod_name = pod['metadata']['name']
+                ready_status, pod_status = self.describe_pod_status(pod)
+                
+                current_status = f"{pod_name} {ready_status} {pod_status}"
+                if current_status != last_status:
+                    self.log_step("WAIT", f"Pod status: {current_status}")
+                    last_status = current_status
+                
+                if ready_status == "1/1" and pod_status == "Running":
+                    self.log_step("WAIT", f"Autoscaler pod is ready: {pod_name}", "SUCCESS")
+                    return True
+                elif pod_status in ["CrashLoopBackOff", "Error", "CreateContainerConfigError"]:
+                    self.log_step("WAIT", f"Pod failed with status: {pod_status}", "ERROR")
+                    
+                    # Get logs for debugging
+                    try:
+                        print(kube.pod_logs(pod_name, 'kube-system', tail_lines=20))
+                    except KubernetesAPIError:
+                        pass
+                    return False
             
             time.sleep(10)
         
         self.log_step("WAIT", "Timeout waiting for autoscaler to be ready", "ERROR")
         return False
     
-    def verify_deployment(self, env: Dict, cluster_name: str) -> bool:
+    def verify_deployment(self, kube: KubernetesClient, cluster_name: str) -> bool:
         """Comprehensive deployment verification"""
         self.log_step("VERIFY", "Performing comprehensive deployment verification...")
         
         verification_passed = True
         
         # Check 1: Pod is running
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'pods', '-n', 'kube-system', '-l', 'app=cluster-autoscaler'],
-            env=env
-        )
-        
-        if success:
+        try:
+            kube.list_items('pods', 'kube-system', 'app=cluster-autoscaler')
             self.log_step("VERIFY", "[OK] Pod status check passed", "SUCCESS")
-        else:
+        except KubernetesAPIError:
             self.log_step("VERIFY", "[ERROR] Pod status check failed", "ERROR")
             verification_passed = False
         
         # Check 2: Secret exists
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'secret', 'cluster-autoscaler-aws-credentials', '-n', 'kube-system'],
-            env=env
-        )
-        
-        if success:
+        if kube.exists('secret', 'cluster-autoscaler-aws-credentials', 'kube-system'):
             self.log_step("VERIFY", "[OK] AWS credentials secret exists", "SUCCESS")
         else:
             self.log_step("VERIFY", "[ERROR] AWS credentials secret missing", "ERROR")
@@ -610,19 +542,14 @@ spec:
         # Check 3: RBAC resources
         rbac_resources = [
             ('serviceaccount', 'cluster-autoscaler', 'kube-system'),
-            ('clusterrole', 'cluster-autoscaler', ''),
-            ('clusterrolebinding', 'cluster-autoscaler', ''),
+            ('clusterrole', 'cluster-autoscaler', None),
+            ('clusterrolebinding', 'cluster-autoscaler', None),
             ('role', 'cluster-autoscaler', 'kube-system'),
             ('rolebinding', 'cluster-autoscaler', 'kube-system')
         ]
         
         for resource_type, name, namespace in rbac_resources:
-            cmd = ['kubectl', 'get', resource_type, name]
-            if namespace:
-                cmd.extend(['-n', namespace])
-            
-            success, stdout, stderr = self.run_command(cmd, env=env)
-            if success:
+            if kube.exists(resource_type, name, namespace):
                 self.log_step("VERIFY", f"[OK] {resource_type} {name} exists", "SUCCESS")
             else:
                 self.log_step("VERIFY", f"[ERROR] {resource_type} {name} missing", "ERROR")
@@ -630,22 +557,18 @@ spec:
         
         return verification_passed
     
-    def print_autoscaler_logs(self, env: Dict, lines: int = 50):
+    def print_autoscaler_logs(self, kube: KubernetesClient, lines: int = 50):
         """Print current autoscaler logs"""
         self.print_header("CLUSTER AUTOSCALER LOGS")
         
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'logs', '-n', 'kube-system', '-l', 'app=cluster-autoscaler', f'--tail={lines}'],
-            env=env
-        )
-        
-        if success:
+        try:
+            logs = kube.logs_for_selector('kube-system', 'app=cluster-autoscaler', tail_lines=lines)
             self.print_colored(self.colors.WHITE, "[LIST] Recent Autoscaler Logs:")
             self.print_colored(self.colors.CYAN, "-" * 80)
-            print(stdout)
+            print(logs)
             self.print_colored(self.colors.CYAN, "-" * 80)
-        else:
-            self.log_step("LOGS", f"Failed to get logs: {stderr}", "ERROR")
+        except KubernetesAPIError as e:
+            self.log_step("LOGS", f"Failed to get logs: {str(e)}", "ERROR")
     
     def print_success_summary(self, cluster_name: str, region: str, tagged_asgs: List[str]):
         """Print deployment success summary"""
@@ -703,47 +626,43 @@ spec:
             self.print_colored(self.colors.WHITE, f"   • Fast Scaling: 4 minute delays", 1)
             self.print_colored(self.colors.WHITE, f"   • Protected Nodes: Using 'no_delete=true' label", 1)
             
-            # Step 1: Check prerequisites
-            if not self.check_prerequisites():
-                return False
-            
-            # Step 2: Create AWS session
+            # Step 1: Create AWS session
             session = self.create_aws_session(access_key, secret_key, region)
             
-            # Step 3: Setup kubeconfig
-            env = self.setup_kubeconfig(cluster_name, region, access_key, secret_key)
+            # Step 2: Connect to the Kubernetes API (no kubectl/aws CLI required)
+            kube = self.connect_to_cluster(cluster_name, region, access_key, secret_key)
             
-            # Step 4: Cleanup existing resources
-            self.cleanup_existing_autoscaler(env)
+            # Step 3: Cleanup existing resources
+            self.cleanup_existing_autoscaler(kube)
             
-            # Step 5: Create AWS credentials secret
-            if not self.create_aws_credentials_secret(access_key, secret_key, region, env):
+            # Step 4: Create AWS credentials secret
+            if not self.create_aws_credentials_secret(access_key, secret_key, region, kube):
                 return False
             
-            # Step 6: Discover and tag ASGs
+            # Step 5: Discover and tag ASGs
             tagged_asgs = self.discover_and_tag_asgs(session, cluster_name, region)
             if not tagged_asgs:
                 self.log_step("ASG", "No ASGs were tagged, autoscaler may not work properly", "WARNING")
             
-            # Step 7: Deploy autoscaler
-            if not self.deploy_autoscaler(cluster_name, region, env):
+            # Step 6: Deploy autoscaler
+            if not self.deploy_autoscaler(cluster_name, region, kube):
                 return False
             
-            # Step 8: Wait for autoscaler to be ready
-            if not self.wait_for_autoscaler_ready(env):
+            # Step 7: Wait for autoscaler to be ready
+            if not self.wait_for_autoscaler_ready(kube):
                 self.log_step("DEPLOY", "Autoscaler may not be fully ready, but continuing", "WARNING")
             
-            # Step 9: Verify deployment
-            if not self.verify_deployment(env, cluster_name):
+            # Step 8: Verify deployment
+            if not self.verify_deployment(kube, cluster_name):
                 self.log_step("VERIFY", "Some verification checks failed", "WARNING")
             
-            # Step 10: Print logs
-            self.print_autoscaler_logs(env)
+            # Step 9: Print logs
+            self.print_autoscaler_logs(kube)
             
-            # Step 11: Print success summary
+            # Step 10: Print success summary
             self.print_success_summary(cluster_name, region, tagged_asgs)
 
-            # Step 12: do a sample deployment to verify autoscaler works
+            # Step 11: do a sample deployment to verify autoscaler works
             # Ask if user wants to test the autoscaler
             # try:
             #     response = input(f"\n🤔 Would you like to test the autoscaler with sample deployments? (y/n) [y]: ").strip()
@@ -9,13 +9,13 @@ Current User's Login: varadharajaan
 
 import os
 import subprocess
-import tempfile
 import time
 import json
 import boto3
 from typing import Dict, List, Tuple, Optional
 from botocore.exceptions import ClientError
 import textwrap
+from k8s_api_client import KubernetesAPIError, KubernetesClient, get_eks_kubernetes_client
 
 class Colors:
     GREEN = '\033[92m'
@@ -95,106 +95,82 @@ class CustomCloudWatchAgentDeployer:
             self.log_step("COMMAND", f"Exception: {' '.join(cmd)} | {str(e)}", "ERROR")
             return False, "", str(e)
 
-    def setup_environment(self, cluster_name: str, region: str, access_key: str, secret_key: str) -> Dict:
-        """Setup environment and kubeconfig"""
-        self.log_step("ENV", f"Setting up environment for cluster: {cluster_name}")
+    def connect_to_cluster(self, cluster_name: str, region: str, access_key: str, secret_key: str) -> KubernetesClient:
+        """Connect to the cluster's Kubernetes API and verify access"""
+        self.log_step("ENV", f"Connecting to Kubernetes API of cluster: {cluster_name}")
 
-        env = os.environ.copy()
-        env.update({
-            'AWS_ACCESS_KEY_ID': access_key,
-            'AWS_SECRET_ACCESS_KEY': secret_key,
-            'AWS_DEFAULT_REGION': region,
-            'AWS_REGION': region
-        })
-
-        cmd = ['aws', 'eks', 'update-kubeconfig', '--region', region, '--name', cluster_name]
-        success, stdout, stderr = self.run_command(cmd, env=env)
-
-        if not success:
-            self.log_step("ENV", f"Failed to update kubeconfig: {stderr}", "ERROR")
-            raise Exception(f"Kubeconfig update failed: {stderr}")
-
-        success, stdout, stderr = self.run_command(['kubectl', 'get', 'nodes'], env=env)
-        if not success:
-            self.log_step("ENV", f"kubectl access test failed: {stderr}", "ERROR")
-            raise Exception(f"kubectl access failed: {stderr}")
+        try:
+            kube = get_eks_kubernetes_client(cluster_name, region, access_key, secret_key)
+            kube.list_items('nodes')
+        except Exception as e:
+            self.log_step("ENV", f"Kubernetes API access test failed: {str(e)}", "ERROR")
+            raise Exception(f"Kubernetes API access failed: {str(e)}")
 
         self.log_step("ENV", "Environment setup completed", "SUCCESS")
-        return env
+        return kube
 
-    def create_namespace(self, env: Dict) -> bool:
+    def create_namespace(self, kube: KubernetesClient) -> bool:
         """Create or ensure namespace exists"""
         self.log_step("NAMESPACE", f"Creating namespace: {self.namespace}")
 
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'namespace', self.namespace], env=env
-        )
-
-        if success:
-            self.log_step("NAMESPACE", f"Namespace {self.namespace} already exists", "SUCCESS")
-            return True
-
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'create', 'namespace', self.namespace], env=env
-        )
+        try:
+            created = kube.ensure_namespace(self.namespace)
+        except KubernetesAPIError as e:
+            self.log_step("NAMESPACE", f"Failed to create namespace: {str(e)}", "ERROR")
+            return False
 
-        if success:
+        if created:
             self.log_step("NAMESPACE", f"Namespace {self.namespace} created", "SUCCESS")
-            return True
         else:
-            self.log_step("NAMESPACE", f"Failed to create namespace: {stderr}", "ERROR")
-            return False
+            self.log_step("NAMESPACE", f"Namespace {self.namespace} already exists", "SUCCESS")
+        return True
 
-    def cleanup_existing_agent(self, env: Dict) -> bool:
+    def cleanup_existing_agent(self, kube: KubernetesClient) -> bool:
         """Clean up any existing custom agent deployment"""
         self.log_step("CLEANUP", f"Cleaning up existing custom agent: {self.custom_agent_name}")
 
-        cleanup_commands = [
-            ['kubectl', 'delete', 'daemonset', self.custom_agent_name, '-n', self.namespace, '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'configmap', f'{self.custom_agent_name}-config', '-n', self.namespace, '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'serviceaccount', self.custom_agent_name, '-n', self.namespace, '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'clusterrole', self.custom_agent_name, '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'clusterrolebinding', self.custom_agent_name, '--ignore-not-found=true'],
-            ['kubectl', 'delete', 'secret', f'{self.custom_agent_name}-credentials', '-n', self.namespace, '--ignore-not-found=true']
+        cleanup_resources = [
+            ('daemonset', self.custom_agent_name, self.namespace),
+            ('configmap', f'{self.custom_agent_name}-config', self.namespace),
+            ('serviceaccount', self.custom_agent_name, self.namespace),
+            ('clusterrole', self.custom_agent_name, None),
+            ('clusterrolebinding', self.custom_agent_name, None),
+            ('secret', f'{self.custom_agent_name}-credentials', self.namespace)
         ]
 
-        for cmd in cleanup_commands:
-            self.run_command(cmd, env=env, timeout=60)
+        for resource_type, name, namespace in cleanup_resources:
+            try:
+                kube.delete(resource_type, name, namespace)
+            except KubernetesAPIError as e:
+                self.log_step("CLEANUP", f"Failed to delete {resource_type} {name}: {str(e)}", "WARNING")
 
         self.log_step("CLEANUP", "Cleanup completed", "SUCCESS")
         time.sleep(10)
         return True
 
-    def create_aws_credentials_secret(self, access_key: str, secret_key: str, region: str, env: Dict) -> bool:
+    def create_aws_credentials_secret(self, access_key: str, secret_key: str, region: str,
+                                      kube: KubernetesClient) -> bool:
         """Create AWS credentials secret for CloudWatch agent"""
         self.log_step("SECRET", "Creating AWS credentials secret for CloudWatch agent...")
 
         secret_name = f"{self.custom_agent_name}-credentials".replace("_", "-").lower()
 
-        cmd = [
-            'kubectl', 'create', 'secret', 'generic', secret_name,
-            f'--from-literal=AWS_ACCESS_KEY_ID={access_key}',
-            f'--from-literal=AWS_SECRET_ACCESS_KEY={secret_key}',
-            f'--from-literal=AWS_DEFAULT_REGION={region}',
-            f'--from-literal=AWS_REGION={region}',
-            '-n', self.namespace
-        ]
-
-        success, stdout, stderr = self.run_command(cmd, env=env)
-        if not success:
-            self.log_step("SECRET", f"Failed to create secret: {stderr}", "ERROR")
+        try:
+            kube.apply_secret(secret_name, self.namespace, {
+                'AWS_ACCESS_KEY_ID': access_key,
+                'AWS_SECRET_ACCESS_KEY': secret_key,
+                'AWS_DEFAULT_REGION': region,
+                'AWS_REGION': region
+            })
+        except KubernetesAPIError as e:
+            self.log_step("SECRET", f"Failed to create secret: {str(e)}", "ERROR")
             return False
 
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'secret', secret_name, '-n', self.namespace],
-            env=env
-        )
-
-        if success:
+        if kube.exists('secret', secret_name, self.namespace):
             self.log_step("SECRET", "AWS credentials secret created and verified", "SUCCESS")
             return True
         else:
-            self.log_step("SECRET", f"Secret verification failed: {stderr}", "ERROR")
+            self.log_step("SECRET", "Secret verification failed: secret not found", "ERROR")
             return False
 
     def create_cloudwatch_config(self, cluster_name: str, region: str) -> str:
@@ -288,36 +264,40 @@ class CustomCloudWatchAgentDeployer:
 
         return yaml_content
 
-    def deploy_cloudwatch_agent(self, cluster_name: str, region: str, env: Dict) -> bool:
+    def deploy_cloudwatch_agent(self, cluster_name: str, region: str, kube: KubernetesClient) -> bool:
         """Deploy the custom CloudWatch agent"""
         self.log_step("DEPLOY", f"Deploying custom CloudWatch agent: {self.custom_agent_name}")
 
         yaml_content = self.create_cloudwatch_agent_yaml(cluster_name, region)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
-            f.write(yaml_content)
-            temp_file = f.name
-
         try:
-            success, stdout, stderr = self.run_command(
-                ['kubectl', 'apply', '-f', temp_file],
-                env=env
-            )
+            results = kube.apply_manifest(yaml_content)
+        except Exception as e:
+            self.log_step("DEPLOY", f"Deployment failed: {str(e)}", "ERROR")
+            return False
 
-            if success:
-                self.log_step("DEPLOY", "Custom CloudWatch agent deployed successfully", "SUCCESS")
-                return True
-            else:
-                self.log_step("DEPLOY", f"Deployment failed: {stderr}", "ERROR")
-                return False
+        failed = [result for result in results if not result['success']]
+        if not failed:
+            self.log_step("DEPLOY", "Custom CloudWatch agent deployed successfully", "SUCCESS")
+            return True
 
-        finally:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+        for result in failed:
+            self.log_step("DEPLOY", f"Failed to apply {result['kind']} {result['name']}: {result['error']}", "ERROR")
+        return False
 
-    def wait_for_agent_ready(self, env: Dict, timeout: int = 300) -> bool:
+    @staticmethod
+    def daemonset_counts(daemonset: Dict) -> Dict[str, int]:
+        """DESIRED/CURRENT/READY/UP-TO-DATE/AVAILABLE counts of a DaemonSet object"""
+        status = daemonset.get('status', {})
+        return {
+            'desired': status.get('desiredNumberScheduled', 0),
+            'current': status.get('currentNumberScheduled', 0),
+            'ready': status.get('numberReady', 0),
+            'up_to_date': status.get('updatedNumberScheduled', 0),
+            'available': status.get('numberAvailable', 0)
+        }
+
+    def wait_for_agent_ready(self, kube: KubernetesClient, timeout: int = 300) -> bool:
         """Wait for CloudWatch agent to be ready"""
         self.log_step("WAIT", f"Waiting for CloudWatch agent to be ready (timeout: {timeout}s)...")
 
@@ -325,84 +305,64 @@ class CustomCloudWatchAgentDeployer:
         last_status = ""
 
         while time.time() - start_time < timeout:
-            success, stdout, stderr = self.run_command(
-                ['kubectl', 'get', 'daemonset', self.custom_agent_name, '-n', self.namespace, '--no-headers'],
-                env=env,
-                timeout=30
-            )
-
-            if success and stdout.strip():
-                parts = stdout.strip().split()
-                if len(parts) >= 6:
-                    desired = parts[1]
-                    current = parts[2]
-                    ready = parts[3]
-                    up_to_date = parts[4]
-                    available = parts[5]
-
-                    current_status = f"Desired: {desired}, Current: {current}, Ready: {ready}, Up-to-date: {up_to_date}, Available: {available}"
-                    if current_status != last_status:
-                        self.log_step("WAIT", f"DaemonSet status: {current_status}")
-                        last_status = current_status
-
-                    if int(ready) == int(desired) - 1 and int(desired) > 1:
-                        self.log_step("WAIT", f"n-1 pods are ready: {ready}/{desired}", "SUCCESS")
-                        return True
-                    if desired == ready and desired == available and int(desired) > 0:
-                        self.log_step("WAIT", f"CloudWatch agent DaemonSet is ready", "SUCCESS")
-                        return True
+            try:
+                counts = self.daemonset_counts(kube.get('daemonset', self.custom_agent_name, self.namespace))
+            except KubernetesAPIError:
+                counts = None
+
+            if counts:
+                desired = counts['desired']
+                ready = counts['ready']
+                available = counts['available']
+
+                current_status = (f"Desired: {desired}, Current: {counts['current']}, Ready: {ready}, "
+                                  f"Up-to-date: {counts['up_to_date']}, Available: {available}")
+                if current_status != last_status:
+                    self.log_step("WAIT", f"DaemonSet status: {current_status}")
+                    last_status = current_status
+
+                if ready == desired - 1 and desired > 1:
+                    self.log_step("WAIT", f"n-1 pods are ready: {ready}/{desired}", "SUCCESS")
+                    return True
+                if desired == ready and desired == available and desired > 0:
+                    self.log_step("WAIT", f"CloudWatch agent DaemonSet is ready", "SUCCESS")
+                    return True
             time.sleep(10)
 
         self.log_step("WAIT", "Timeout waiting for CloudWatch agent to be ready", "ERROR")
         return False
 
-    def verify_deployment(self, env: Dict, cluster_name: str, region: str) -> bool:
+    def verify_deployment(self, kube: KubernetesClient, cluster_name: str, region: str) -> bool:
         """Comprehensive deployment verification"""
         self.log_step("VERIFY", "Performing comprehensive deployment verification...")
 
         verification_passed = True
 
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'daemonset', self.custom_agent_name, '-n', self.namespace],
-            env=env
-        )
-
-        if success:
+        try:
+            counts = self.daemonset_counts(kube.get('daemonset', self.custom_agent_name, self.namespace))
             self.log_step("VERIFY", "[OK] DaemonSet status check passed", "SUCCESS")
-            self.print_colored(self.colors.WHITE, stdout, 1)
-        else:
+            self.print_colored(self.colors.WHITE, ', '.join(f"{key}: {value}" for key, value in counts.items()), 1)
+        except KubernetesAPIError:
             self.log_step("VERIFY", "[ERROR] DaemonSet status check failed", "ERROR")
             verification_passed = False
 
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'pods', '-n', self.namespace, '-l', f'app={self.custom_agent_name}'],
-            env=env
-        )
-
-        if success:
+        try:
+            pods = kube.list_items('pods', self.namespace, f'app={self.custom_agent_name}')
             self.log_step("VERIFY", "[OK] Pod status check passed", "SUCCESS")
-            self.print_colored(self.colors.WHITE, stdout, 1)
-        else:
+            for pod in pods:
+                self.print_colored(self.colors.WHITE,
+                                   f"{pod['metadata']['name']} {pod.get('status', {}).get('phase', 'Unknown')}", 1)
+        except KubernetesAPIError:
             self.log_step("VERIFY", "[ERROR] Pod status check failed", "ERROR")
             verification_passed = False
 
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'configmap', f'{self.custom_agent_name}-config', '-n', self.namespace],
-            env=env
-        )
-
-        if success:
+        if kube.exists('configmap', f'{self.custom_agent_name}-config', self.namespace):
             self.log_step("VERIFY", "[OK] ConfigMap exists", "SUCCESS")
         else:
             self.log_step("VERIFY", "[ERROR] ConfigMap missing", "ERROR")
             verification_passed = False
 
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'get', 'secret', f'{self.custom_agent_name}-credentials', '-n', self.namespace],
-            env=env
-        )
-
-        if success:
+        if kube.exists('secret', f'{self.custom_agent_name}-credentials', self.namespace):
             self.log_step("VERIFY", "[OK] AWS credentials secret exists", "SUCCESS")
         else:
             self.log_step("VERIFY", "[ERROR] AWS credentials secret missing", "ERROR")
@@ -410,17 +370,12 @@ class CustomCloudWatchAgentDeployer:
 
         rbac_resources = [
             ('serviceaccount', self.custom_agent_name, self.namespace),
-            ('clusterrole', self.custom_agent_name, ''),
-            ('clusterrolebinding', self.custom_agent_name, '')
+            ('clusterrole', self.custom_agent_name, None),
+            ('clusterrolebinding', self.custom_agent_name, None)
         ]
 
         for resource_type, name, namespace in rbac_resources:
-            cmd = ['kubectl', 'get', resource_type, name]
-            if namespace:
-                cmd.extend(['-n', namespace])
-
-            success, stdout, stderr = self.run_command(cmd, env=env)
-            if success:
+            if kube.exists(resource_type, name, namespace):
                 self.log_step("VERIFY", f"[OK] {resource_type} {name} exists", "SUCCESS")
             else:
                 self.log_step("VERIFY", f"[ERROR] {resource_type} {name} missing", "ERROR")
@@ -497,22 +452,18 @@ class CustomCloudWatchAgentDeployer:
             self.log_step("CLOUDWATCH", f"[ERROR] Failed to check CloudWatch: {str(e)}", "ERROR")
             return False
 
-    def print_agent_logs(self, env: Dict, lines: int = 50):
+    def print_agent_logs(self, kube: KubernetesClient, lines: int = 50):
         """Print current CloudWatch agent logs"""
         self.print_header("CLOUDWATCH AGENT LOGS")
 
-        success, stdout, stderr = self.run_command(
-            ['kubectl', 'logs', '-n', self.namespace, '-l', f'app={self.custom_agent_name}', f'--tail={lines}'],
-            env=env
-        )
-
-        if success:
+        try:
+            logs = kube.logs_for_selector(self.namespace, f'app={self.custom_agent_name}', tail_lines=lines)
             self.print_colored(self.colors.WHITE, "[LIST] Recent CloudWatch Agent Logs:")
             self.print_colored(self.colors.CYAN, "-" * 80)
-            print(stdout)
+            print(logs)
             self.print_colored(self.colors.CYAN, "-" * 80)
-        else:
-            self.log_step("LOGS", f"Failed to get logs: {stderr}", "ERROR")
+        except KubernetesAPIError as e:
+            self.log_step("LOGS", f"Failed to get logs: {str(e)}", "ERROR")
 
     def print_success_summary(self, cluster_name: str, region: str):
         """Print deployment success summary"""
@@ -587,34 +538,34 @@ class CustomCloudWatchAgentDeployer:
             self.print_colored(self.colors.WHITE, f"   • Namespace: {self.namespace}", 1)
             self.print_colored(self.colors.WHITE, f"   • Access Key: {access_key[:8]}...", 1)
 
-            env = self.setup_environment(cluster_name, region, access_key, secret_key)
+            kube = self.connect_to_cluster(cluster_name, region, access_key, secret_key)
 
-            if not self.create_namespace(env):
+            if not self.create_namespace(kube):
                 return False
 
-            self.cleanup_existing_agent(env)
+            self.cleanup_existing_agent(kube)
 
-            if not self.create_aws_credentials_secret(access_key, secret_key, region, env):
+            if not self.create_aws_credentials_secret(access_key, secret_key, region, kube):
                 return False
 
             self.ensure_log_group(f"/aws/eks/{cluster_name}/custom-logs", region, access_key, secret_key)
 
-            if not self.deploy_cloudwatch_agent(cluster_name, region, env):
+            if not self.deploy_cloudwatch_agent(cluster_name, region, kube):
                 return False
 
-            if not self.wait_for_agent_ready(env):
+            if not self.wait_for_agent_ready(kube):
                 self.log_step("DEPLOY", "CloudWatch agent may not be fully ready, but continuing", "WARNING")
 
             time.sleep(10)
-            # self.publish_custom_metric(env)
+            # self.publish_custom_metric(kube)
             # self.verify_custom_metric(cluster_name, region, access_key, secret_key)
 
-            if not self.verify_deployment(env, cluster_name, region):
+            if not self.verify_deployment(kube, cluster_name, region):
                 self.log_step("VERIFY", "Some verification checks failed", "WARNING")
 
             self.check_cloudwatch_logs(cluster_name, region, access_key, secret_key)
 
-            self.print_agent_logs(env)
+            self.print_agent_logs(kube)
 
             self.print_success_summary(cluster_name, region)
 
@@ -662,21 +613,18 @@ class CustomCloudWatchAgentDeployer:
             results[cluster_name] = success
         return results
 
-    def publish_custom_metric(self, env: dict):
+    def publish_custom_metric(self, kube: KubernetesClient, env: dict = None):
         """Send a custom metric to the CloudWatch agent via statsd."""
         self.log_step("METRIC", "Publishing custom metric via statsd...")
-        success, stdout, _ = self.run_command(
-            [
-                'kubectl', 'get', 'pods', '-n', self.namespace,
-                '-l', f'app={self.custom_agent_name}',
-                '-o', 'jsonpath={.items[0].metadata.name}'
-            ],
-            env=env
-        )
-        if not success or not stdout.strip():
+        try:
+            pods = kube.list_items('pods', self.namespace, f'app={self.custom_agent_name}')
+        except KubernetesAPIError:
+            pods = []
+        if not pods:
             self.log_step("METRIC", "No running agent pod found", "ERROR")
             return False
-        pod_name = stdout.strip()
+        pod_name = pods[0]['metadata']['name']
+        # exec needs a streaming (SPDY/WebSocket) upgrade, so it still goes through kubectl
         cmd = [
             'kubectl', 'exec', '-n', self.namespace, pod_name, '--',
             '/bin/sh', '-c', 'echo "my_custom_metric:42|g" | nc -u -w1 127.0.0.1 8125'
@@ -4,8 +4,11 @@ import botocore
 import time
 import os
 import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 
+from deletion_scheduler import AWSClientPool, DeleterTask, DeleterTimings, DependencyScheduler
+
 # Define the regions
 # REGIONS = [
 #     "ap-south-1", "eu-north-1", "eu-west-3", "eu-west-2", "eu-west-1", "ap-northeast-3", "ap-northeast-2", "ap-northeast-1",
@@ -18,51 +21,25 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 REGIONS = ["us-east-1" , "us-east-2", "us-west-1", "us-west-2", "ap-south-1"]
 
-def measure_time(func):
-    import functools
-    import time
-    @functools.wraps(func)
-    def wrapper_measure_time(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"Time taken for {func.__name__}: {end_time - start_time:.2f} seconds")
-        return result
-    return wrapper_measure_time
+# Deleters running at the same time across all regions of an account
+MAX_PARALLEL_DELETERS = 16
 
-@measure_time
-def delete_lambda_functions(exclude_list=None):
-    try:
-        lambda_client = boto3.client('lambda', region_name=region)
-        functions = lambda_client.list_functions()['Functions']
-        for function in functions:
-            function_name = function['FunctionName']
-            if not exclude_list or function_name not in exclude_list:
-                # Delete event source mappings before deleting the function
-                mappings = lambda_client.list_event_source_mappings(FunctionName=function_name)['EventSourceMappings']
-                for mapping in mappings:
-                    mapping_id = mapping['UUID']
-                    logging.info(f'Attempting to delete event source mapping: {mapping_id} for Lambda: {function_name}')
-                    try:
-                        lambda_client.delete_event_source_mapping(UUID=mapping_id)
-                        logging.info(f'Deleted event source mapping: {mapping_id}')
-                    except Exception as e:
-                        logging.error(f'Failed to delete event source mapping {mapping_id} for Lambda {function_name}: {e}')
+# S3 bucket purge: delete_objects takes at most 1000 keys per request
+S3_DELETE_BATCH_SIZE = 1000
+S3_DELETE_WORKERS = 8
+S3_DELETE_MAX_RETRIES = 5
 
-                # Delete the lambda function after removing mappings
-                logging.info(f'Attempting to delete Lambda function: {function_name}')
-                try:
-                    lambda_client.delete_function(FunctionName=function_name)
-                    logging.info(f'Deleted Lambda function: {function_name}')
-                except Exception as e:
-                    logging.error(f'Failed to delete Lambda function {function_name}: {e}')
-    except Exception as e:
-        logging.error('Failed to retrieve Lambda functions: {e}')
+# Every deleter gets its clients from this pool; it is bound to the account being cleaned
+CLIENT_POOL = AWSClientPool()
+DELETER_TIMINGS = DeleterTimings()
 
+def measure_time(func):
+    """Record the deleter's run time in DELETER_TIMINGS (printed as one table at the end)"""
+    return DELETER_TIMINGS.measure(func)
 
 @measure_time
 def delete_dynamodb_tables_except(to_keep, region):
-    dynamodb = boto3.client('dynamodb', region_name=region)
+    dynamodb = CLIENT_POOL.client('dynamodb', region_name=region)
     tables = dynamodb.list_tables()['TableNames']
     for table_name in tables:
         if table_name not in to_keep:
@@ -74,7 +51,7 @@ def delete_dynamodb_tables_except(to_keep, region):
 
 @measure_time
 def delete_security_groups(region):
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     try:
         security_groups = ec2.describe_security_groups()['SecurityGroups']
         for sg in security_groups:
@@ -94,7 +71,7 @@ def delete_security_groups(region):
 
 @measure_time
 def delete_key_pairs(region):
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     try:
         key_pairs = ec2.describe_key_pairs()['KeyPairs']
         for key_pair in key_pairs:
@@ -106,7 +83,7 @@ def delete_key_pairs(region):
 
 @measure_time
 def release_elastic_ips(region):
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     addresses = ec2.describe_addresses()
     for address in addresses['Addresses']:
         if 'InstanceId' not in address:
@@ -115,7 +92,7 @@ def release_elastic_ips(region):
 
 @measure_time
 def delete_key_pairs(region):
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     key_pairs = ec2.describe_key_pairs()
     for key_pair in key_pairs['KeyPairs']:
         ec2.delete_key_pair(KeyName=key_pair['KeyName'])
@@ -123,7 +100,7 @@ def delete_key_pairs(region):
 
 @measure_time
 def terminate_vpn_connections(region):
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     vpns = ec2.describe_vpn_connections()
     for vpn in vpns['VpnConnections']:
         if vpn['State'] != 'deleted':
@@ -132,7 +109,7 @@ def terminate_vpn_connections(region):
 
 @measure_time
 def delete_vpc_peering_connections(region):
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     peerings = ec2.describe_vpc_peering_connections()
     for peering in peerings['VpcPeeringConnections']:
         if peering['Status']['Code'] != 'deleted':
@@ -141,7 +118,7 @@ def delete_vpc_peering_connections(region):
 
 @measure_time
 def remove_vpc_endpoints(region):
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     endpoints = ec2.describe_vpc_endpoints()
     for endpoint in endpoints['VpcEndpoints']:
         ec2.delete_vpc_endpoint(VpcEndpointId=endpoint['VpcEndpointId'])
@@ -149,7 +126,7 @@ def remove_vpc_endpoints(region):
 
 @measure_time
 def delete_cloudformation_stacks(region):
-    cf = boto3.client('cloudformation', region_name=region)
+    cf = CLIENT_POOL.client('cloudformation', region_name=region)
     stacks = cf.list_stacks(StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE', 'ROLLBACK_COMPLETE', 'UPDATE_ROLLBACK_COMPLETE'])
     for stack in stacks['StackSummaries']:
         cf.delete_stack(StackName=stack['StackName'])
@@ -160,7 +137,7 @@ def delete_cloudformation_stacks(region):
 
 @measure_time
 def delete_datasync_resources(region):
-    client = boto3.client('datasync', region_name=region)
+    client = CLIENT_POOL.client('datasync', region_name=region)
     # Delete tasks
     tasks = client.list_tasks()
     for task in tasks.get('Tasks', []):
@@ -182,7 +159,7 @@ def delete_datasync_resources(region):
 
 @measure_time
 def delete_efs_resources(region):
-    client = boto3.client('efs', region_name=region)
+    client = CLIENT_POOL.client('efs', region_name=region)
 
     # Retrieve all file systems
     file_systems = client.describe_file_systems()['FileSystems']
@@ -226,14 +203,14 @@ def delete_efs_resources(region):
 
 @measure_time
 def delete_storage_gateway_resources(region):
-    client = boto3.client('storagegateway', region_name=region)
+    client = CLIENT_POOL.client('storagegateway', region_name=region)
     # Delete gateways (and implicitly deletes volumes)
     for gateway in client.list_gateways()['Gateways']:
         client.delete_gateway(GatewayARN=gateway['GatewayARN'])
 
 @measure_time
 def delete_aws_backup_resources(region):
-    client = boto3.client('backup', region_name=region)
+    client = CLIENT_POOL.client('backup', region_name=region)
     try:
         vaults = client.list_backup_vaults()['BackupVaultList']
         for vault in vaults:
@@ -251,14 +228,14 @@ def delete_aws_backup_resources(region):
 
 @measure_time
 def delete_transfer_family_resources(region):
-    client = boto3.client('transfer', region_name=region)
+    client = CLIENT_POOL.client('transfer', region_name=region)
     # Delete servers
     for server in client.list_servers()['Servers']:
         client.delete_server(ServerId=server['ServerId'])
 
 @measure_time
 def delete_cloudfront_distributions(region):
-    client = boto3.client('cloudfront', region_name=region)
+    client = CLIENT_POOL.client('cloudfront', region_name=region)
 
     # Get a list of all distributions
     response = client.list_distributions()
@@ -286,10 +263,9 @@ def delete_cloudfront_distributions(region):
             client.delete_distribution(Id=dist_id, IfMatch=etag)
             print(f"Deleted distribution: {dist_id}")
 
-@measure_time
 @measure_time
 def delete_iam_roles(region):
-    iam = boto3.client('iam', region_name=region)
+    iam = CLIENT_POOL.client('iam', region_name=region)
     roles = iam.list_roles()['Roles']
     for role in roles:
         role_name = role['RoleName']
@@ -345,7 +321,7 @@ def delete_iam_roles(region):
 
 @measure_time
 def delete_multipart_uploads(region):
-    s3 = boto3.client('s3', region_name=region)
+    s3 = CLIENT_POOL.client('s3', region_name=region)
     # List all S3 buckets
     buckets = s3.list_buckets()['Buckets']
     
@@ -368,7 +344,7 @@ def delete_multipart_uploads(region):
 
 @measure_time
 def delete_ecr_repositories(region):
-    ecr_client = boto3.client('ecr', region_name=region)
+    ecr_client = CLIENT_POOL.client('ecr', region_name=region)
     
     try:
         # List all ECR repositories
@@ -546,10 +522,10 @@ def delete_ecr_repositories(region):
 
 @measure_time
 def delete_eks_clusters(region):
-    eks_client = boto3.client('eks', region_name=region)
-    ec2_client = boto3.client('ec2', region_name=region)
-    iam_client = boto3.client('iam')
-    autoscaling_client = boto3.client('autoscaling', region_name=region)
+    eks_client = CLIENT_POOL.client('eks', region_name=region)
+    ec2_client = CLIENT_POOL.client('ec2', region_name=region)
+    iam_client = CLIENT_POOL.client('iam')
+    autoscaling_client = CLIENT_POOL.client('autoscaling', region_name=region)
     
     try:
         # List all EKS clusters
@@ -672,8 +648,8 @@ def delete_eks_clusters(region):
                 # 3. Delete associated AWS Load Balancer Controller resources
                 try:
                     # Find and delete load balancers created by the cluster
-                    elb_client = boto3.client('elbv2', region_name=region)
-                    classic_elb_client = boto3.client('elb', region_name=region)
+                    elb_client = CLIENT_POOL.client('elbv2', region_name=region)
+                    classic_elb_client = CLIENT_POOL.client('elb', region_name=region)
                     
                     # Delete Application/Network Load Balancers
                     try:
@@ -824,7 +800,7 @@ def delete_eks_clusters(region):
 
 @measure_time
 def delete_codecommit_repositories(region):
-    codecommit_client = boto3.client('codecommit', region_name=region)
+    codecommit_client = CLIENT_POOL.client('codecommit', region_name=region)
     repositories = codecommit_client.list_repositories()['repositories']
     for repo in repositories:
         repo_name = repo['repositoryName']
@@ -836,7 +812,7 @@ def delete_codecommit_repositories(region):
 
 @measure_time
 def delete_codedeploy_applications(region):
-    codedeploy_client = boto3.client('codedeploy', region_name=region)
+    codedeploy_client = CLIENT_POOL.client('codedeploy', region_name=region)
     applications = codedeploy_client.list_applications()['applications']
     for app in applications:
         deployment_groups = codedeploy_client.list_deployment_groups(applicationName=app)['deploymentGroups']
@@ -850,10 +826,9 @@ def delete_codedeploy_applications(region):
             print(f"Failed to delete CodeDeploy application {app}: {e}")
 
 
-@measure_time
 @measure_time
 def delete_elastic_beanstalk_applications(region):
-    eb_client = boto3.client('elasticbeanstalk', region_name=region)
+    eb_client = CLIENT_POOL.client('elasticbeanstalk', region_name=region)
 
     # List all Elastic Beanstalk applications
     try:
@@ -978,7 +953,7 @@ def delete_elastic_beanstalk_applications(region):
 
 @measure_time
 def delete_all_sns_subscriptions(region):
-    sns_client = boto3.client('sns', region_name=region)
+    sns_client = CLIENT_POOL.client('sns', region_name=region)
 
     # List and delete all subscriptions in the account
     while True:
@@ -1020,8 +995,8 @@ def delete_all_sns_subscriptions(region):
     
 @measure_time
 def delete_all_ecs_clusters(region):
-    ecs_client = boto3.client('ecs', region_name=region)
-    ec2_client = boto3.client('ec2', region_name=region)
+    ecs_client = CLIENT_POOL.client('ecs', region_name=region)
+    ec2_client = CLIENT_POOL.client('ec2', region_name=region)
     
     try:
         # List all ECS clusters
@@ -1211,7 +1186,7 @@ def delete_all_ecs_clusters(region):
 
 @measure_time
 def stop_codebuild_builds(region):
-    codebuild_client = boto3.client('codebuild', region_name=region)
+    codebuild_client = CLIENT_POOL.client('codebuild', region_name=region)
     
     try:
         # Get all builds (not just IDs)
@@ -1250,7 +1225,7 @@ def stop_codebuild_builds(region):
 
 @measure_time
 def delete_codebuild_projects(region):
-    codebuild_client = boto3.client('codebuild', region_name=region)
+    codebuild_client = CLIENT_POOL.client('codebuild', region_name=region)
     
     try:
         # List all projects
@@ -1299,7 +1274,7 @@ def delete_codebuild_projects(region):
         
 @measure_time
 def stop_codepipeline_executions(region):
-    codepipeline_client = boto3.client('codepipeline', region_name=region)
+    codepipeline_client = CLIENT_POOL.client('codepipeline', region_name=region)
     
     try:
         response = codepipeline_client.list_pipelines()
@@ -1348,7 +1323,7 @@ def stop_codepipeline_executions(region):
 
 @measure_time
 def delete_codepipelines(region):
-    codepipeline_client = boto3.client('codepipeline', region_name=region)
+    codepipeline_client = CLIENT_POOL.client('codepipeline', region_name=region)
     
     try:
         response = codepipeline_client.list_pipelines()
@@ -1398,7 +1373,7 @@ def delete_codepipelines(region):
 
 @measure_time
 def delete_route53_hosted_zones(region):
-    route53_client = boto3.client('route53')  # Route53 is global, no region needed
+    route53_client = CLIENT_POOL.client('route53')  # Route53 is global, no region needed
     
     try:
         # List all hosted zones
@@ -1585,7 +1560,7 @@ def delete_route53_hosted_zones(region):
 
 @measure_time
 def purge_and_delete_sqs_queues(region):
-    sqs_client = boto3.client('sqs', region_name=region)
+    sqs_client = CLIENT_POOL.client('sqs', region_name=region)
     queues = sqs_client.list_queues().get('QueueUrls', [])
 
     for queue in queues:
@@ -1594,10 +1569,9 @@ def purge_and_delete_sqs_queues(region):
         print(f"Deleting SQS queue: {queue} in {region}")
         sqs_client.delete_queue(QueueUrl=queue)
 
-@measure_time
 @measure_time
 def delete_sns_topics(region):
-    sns_client = boto3.client('sns', region_name=region)
+    sns_client = CLIENT_POOL.client('sns', region_name=region)
     topics = sns_client.list_topics()['Topics']
 
     for topic in topics:
@@ -1632,7 +1606,7 @@ def delete_sns_topics(region):
 
 @measure_time
 def delete_rds_instances(region):
-    rds_client = boto3.client('rds', region_name=region)
+    rds_client = CLIENT_POOL.client('rds', region_name=region)
     
     print(f"Starting comprehensive RDS cleanup in {region}")
     print(f"Processing by: varadharajaan at 2025-06-11 18:55:43 UTC")
@@ -2083,25 +2057,95 @@ def delete_rds_instances(region):
     except Exception as e:
         print(f"❌ Error during RDS cleanup in {region}: {e}")
 
+def iter_object_version_batches(s3, bucket_name):
+    """
+    Yield batches of up to 1000 {'Key', 'VersionId'} entries covering every version and delete marker.
+    """
+    batch = []
+    for page in s3.get_paginator('list_object_versions').paginate(Bucket=bucket_name):
+        for entry in page.get('Versions', []) + page.get('DeleteMarkers', []):
+            batch.append({'Key': entry['Key'], 'VersionId': entry['VersionId']})
+            if len(batch) == S3_DELETE_BATCH_SIZE:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+def delete_object_batch(s3, bucket_name, batch):
+    """
+    Delete one batch with delete_objects, retrying throttled requests and keys that failed.
+    Returns (deleted_count, failed_count, error_codes).
+    """
+    pending = batch
+    error_codes = set()
+    for attempt in range(S3_DELETE_MAX_RETRIES + 1):
+        if attempt:
+            time.sleep(min(2 ** attempt * 0.5, 20))
+        try:
+            response = s3.delete_objects(Bucket=bucket_name, Delete={'Objects': pending, 'Quiet': True})
+        except botocore.exceptions.ClientError as e:
+            error_codes = {e.response['Error']['Code']}
+            continue
+
+        # Quiet mode only reports the keys that failed
+        errors = response.get('Errors', [])
+        error_codes = {error.get('Code', 'Unknown') for error in errors}
+        failed = {(error['Key'], error.get('VersionId')) for error in errors}
+        pending = [obj for obj in pending if (obj['Key'], obj['VersionId']) in failed]
+        if not pending:
+            break
+    return len(batch) - len(pending), len(pending), error_codes
+
 @measure_time
 def delete_all_objects(bucket_name, region):
     """
-    Delete all objects in the specified S3 bucket.
+    Purge every object version, delete marker and incomplete multipart upload from the bucket.
+    1000-key delete_objects batches are streamed to a bounded worker pool, so memory stays
+    constant however large the bucket is. Returns counters, not keys.
     """
-    s3 = boto3.resource('s3', region_name=region)
-    bucket = s3.Bucket(bucket_name)
-    deleted_objects = []
-    for obj in bucket.objects.all():
-        obj.delete()
-        deleted_objects.append(obj.key)
-    return deleted_objects
+    s3 = CLIENT_POOL.client('s3', region_name=region)
+    counts = {'deleted': 0, 'failed': 0, 'batches': 0, 'multipart_aborted': 0}
+    error_codes = set()
+    start_time = time.time()
+
+    for page in s3.get_paginator('list_multipart_uploads').paginate(Bucket=bucket_name):
+        for upload in page.get('Uploads', []):
+            s3.abort_multipart_upload(Bucket=bucket_name, Key=upload['Key'], UploadId=upload['UploadId'])
+            counts['multipart_aborted'] += 1
+
+    def collect(futures):
+        for future in futures:
+            deleted, failed, codes = future.result()
+            counts['deleted'] += deleted
+            counts['failed'] += failed
+            counts['batches'] += 1
+            error_codes.update(codes)
+            if counts['batches'] % 100 == 0:
+                print(f"   {bucket_name}: {counts['deleted']:,} deleted so far")
+
+    with ThreadPoolExecutor(max_workers=S3_DELETE_WORKERS) as executor:
+        in_flight = set()
+        for batch in iter_object_version_batches(s3, bucket_name):
+            # Keep at most two batches per worker queued so listing never runs far ahead
+            if len(in_flight) >= S3_DELETE_WORKERS * 2:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            in_flight.add(executor.submit(delete_object_batch, s3, bucket_name, batch))
+        collect(wait(in_flight).done)
+
+    print(f"Purged bucket {bucket_name}: {counts['deleted']:,} versions/delete markers in {counts['batches']} "
+          f"batches, {counts['multipart_aborted']} multipart uploads aborted "
+          f"({time.time() - start_time:.1f}s)")
+    if counts['failed']:
+        print(f"Failed to delete {counts['failed']:,} versions from {bucket_name} ({', '.join(sorted(error_codes))})")
+    return counts
 
 @measure_time
 def delete_bucket_policy(bucket_name, region):
     """
     Delete the bucket policy if it exists.
     """
-    s3 = boto3.client('s3', region_name=region)
+    s3 = CLIENT_POOL.client('s3', region_name=region)
     try:
         s3.delete_bucket_policy(Bucket=bucket_name)
         print(f"Deleted policy for bucket: {bucket_name}")
@@ -2113,7 +2157,7 @@ def delete_s3_buckets(buckets_to_keep, region):
     """
     Delete all S3 buckets in the specified region except those specified to keep.
     """
-    s3 = boto3.client('s3', region_name=region)
+    s3 = CLIENT_POOL.client('s3', region_name=region)
 
     # List all buckets
     response = s3.list_buckets()
@@ -2124,11 +2168,11 @@ def delete_s3_buckets(buckets_to_keep, region):
     for bucket_name in all_bucket_names:
         if bucket_name not in buckets_to_keep:
             print(f"\nDeleting bucket: {bucket_name}")
-            # Delete all objects in the bucket
-            deleted_objects = delete_all_objects(bucket_name, region)
-            print(f"Deleted objects in bucket {bucket_name}:")
-            for obj_key in deleted_objects:
-                print(obj_key)
+            # Delete all object versions, delete markers and multipart uploads in the bucket
+            try:
+                delete_all_objects(bucket_name, region)
+            except Exception as e:
+                print(f"Error emptying bucket {bucket_name}: {e}")
             
             # Delete the bucket policy if exists
             delete_bucket_policy(bucket_name, region)
@@ -2146,7 +2190,7 @@ def delete_dynamodb_tables(tables_to_keep, region):
     Delete all DynamoDB tables in the specified region except those specified to keep.
     """
     # Initialize the DynamoDB client
-    dynamodb = boto3.client('dynamodb', region_name=region)
+    dynamodb = CLIENT_POOL.client('dynamodb', region_name=region)
 
     # List all tables
     response = dynamodb.list_tables()
@@ -2173,7 +2217,7 @@ def delete_ec2_instances(region):
     Terminate all EC2 instances in the specified region.
     """
     # Initialize the EC2 client
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
 
     # Describe all instances
     response = ec2.describe_instances()
@@ -2195,8 +2239,8 @@ def delete_ec2_instances(region):
 
 @measure_time
 def delete_auto_scaling_groups(region):
-    autoscaling_client = boto3.client('autoscaling', region_name=region)
-    ec2_client = boto3.client('ec2', region_name=region)
+    autoscaling_client = CLIENT_POOL.client('autoscaling', region_name=region)
+    ec2_client = CLIENT_POOL.client('ec2', region_name=region)
     
     try:
         # List all Auto Scaling Groups
@@ -2457,9 +2501,9 @@ def delete_auto_scaling_groups(region):
 @measure_time
 def delete_load_balancers_and_target_groups(region):
     # Initialize clients
-    elbv2_client = boto3.client('elbv2', region_name=region)  # Application/Network Load Balancers
-    elb_client = boto3.client('elb', region_name=region)      # Classic Load Balancers
-    ec2_client = boto3.client('ec2', region_name=region)
+    elbv2_client = CLIENT_POOL.client('elbv2', region_name=region)  # Application/Network Load Balancers
+    elb_client = CLIENT_POOL.client('elb', region_name=region)      # Classic Load Balancers
+    ec2_client = CLIENT_POOL.client('ec2', region_name=region)
     
     print(f"Starting comprehensive load balancer cleanup in {region}")
     print(f"Processing by: varadharajaan at 2025-06-11 09:14:24 UTC")
@@ -2790,7 +2834,7 @@ def delete_load_balancers_and_target_groups(region):
 
 @measure_time
 def delete_launch_templates(region):
-    ec2_client = boto3.client('ec2', region_name=region)
+    ec2_client = CLIENT_POOL.client('ec2', region_name=region)
 
     # List all launch templates
     launch_templates = ec2_client.describe_launch_templates()['LaunchTemplates']
@@ -2811,7 +2855,7 @@ def delete_ebs_snapshots(region):
     Delete all EBS snapshots in the specified region.
     """
     # Initialize the EC2 client
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
 
     # Describe all snapshots
     response = ec2.describe_snapshots(OwnerIds=['self'])
@@ -2848,7 +2892,7 @@ def find_amis_for_snapshot(snapshot_id, region):
     """
     Find all AMIs that use the specified snapshot.
     """
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     response = ec2.describe_images(Owners=['self'])
     ami_ids = []
     for image in response['Images']:
@@ -2863,7 +2907,7 @@ def delete_amis(region):
     Deregister all AMIs in the specified region.
     """
     # Initialize the EC2 client
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
 
     # Describe all AMIs
     response = ec2.describe_images(Owners=['self'])
@@ -2886,7 +2930,7 @@ def delete_ebs_volumes(region):
     """
     Delete all EBS volumes in the specified region.
     """
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     response = ec2.describe_volumes(Filters=[{'Name': 'status', 'Values': ['in-use', 'available']}])
     
     for volume in response['Volumes']:
@@ -2915,7 +2959,7 @@ def delete_lambda_functions(region):
     Delete all Lambda functions in the specified region.
     """
     # Initialize the Lambda client
-    lambda_client = boto3.client('lambda', region_name=region)
+    lambda_client = CLIENT_POOL.client('lambda', region_name=region)
 
     # List all Lambda functions
     response = lambda_client.list_functions()
@@ -2935,7 +2979,7 @@ def delete_lambda_functions(region):
             
 @measure_time
 def delete_custom_vpcs(region):
-    ec2_client = boto3.client('ec2', region_name=region)
+    ec2_client = CLIENT_POOL.client('ec2', region_name=region)
     vpcs = ec2_client.describe_vpcs()['Vpcs']
 
     for vpc in vpcs:
@@ -3031,7 +3075,7 @@ def delete_elastic_cache_clusters(clusters_to_keep, region):
     Delete all ElastiCache clusters in the specified region except those specified to keep.
     """
     # Initialize the ElastiCache client
-    elasti_cache = boto3.client('elasticache', region_name=region)
+    elasti_cache = CLIENT_POOL.client('elasticache', region_name=region)
     
     # Get the names of all clusters
     all_cluster_ids = [cluster['CacheClusterId'] for cluster in elasti_cache.describe_cache_clusters()['CacheClusters']]
@@ -3051,7 +3095,7 @@ def delete_elastic_cache_clusters(clusters_to_keep, region):
 
 @measure_time
 def delete_lambda_functions_except(to_keep, region='us-east-1'):
-    lambda_client = boto3.client('lambda', region_name=region)
+    lambda_client = CLIENT_POOL.client('lambda', region_name=region)
     functions = lambda_client.list_functions()['Functions']
     for function in functions:
         function_name = function['FunctionName']
@@ -3064,7 +3108,7 @@ def delete_lambda_functions_except(to_keep, region='us-east-1'):
 
 @measure_time
 def delete_cloudwatch_alarms(region='us-east-1'):
-    cloudwatch_client = boto3.client('cloudwatch', region_name=region)
+    cloudwatch_client = CLIENT_POOL.client('cloudwatch', region_name=region)
     alarms = cloudwatch_client.describe_alarms()['MetricAlarms']
     alarm_names = [alarm['AlarmName'] for alarm in alarms]  # Collect all alarm names
 
@@ -3079,8 +3123,8 @@ def delete_cloudwatch_alarms(region='us-east-1'):
 @measure_time
 def delete_api_gateway_rest_apis(apis_to_keep, region):
     # Initialize clients for all API Gateway types
-    apigateway_client = boto3.client('apigateway', region_name=region)  # REST APIs
-    apigatewayv2_client = boto3.client('apigatewayv2', region_name=region)  # HTTP/WebSocket APIs
+    apigateway_client = CLIENT_POOL.client('apigateway', region_name=region)  # REST APIs
+    apigatewayv2_client = CLIENT_POOL.client('apigatewayv2', region_name=region)  # HTTP/WebSocket APIs
     
     print(f"Starting comprehensive API Gateway cleanup in {region}")
     print(f"Processing by: varadharajaan at 2025-06-11 09:15:25 UTC")
@@ -3599,7 +3643,7 @@ def delete_kms_keys(keys_to_keep, region):
         raise ValueError("Region name must be a string")
     
     # Initialize the KMS client for the specified AWS region
-    kms_client = boto3.client('kms', region_name=region)
+    kms_client = CLIENT_POOL.client('kms', region_name=region)
 
     # Get the names of all keys
     all_key_ids = [key['KeyId'] for key in kms_client.list_keys()['Keys']]
@@ -3622,7 +3666,7 @@ def delete_internet_gateways(region):
     """
     Delete all internet gateways in the specified region, except those attached to the default VPC.
     """
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     
     # Describe all internet gateways
     response = ec2.describe_internet_gateways()
@@ -3656,7 +3700,7 @@ def delete_custom_vpcs(region):
     """
     Delete all custom VPCs in the specified region.
     """
-    ec2 = boto3.client('ec2', region_name=region)
+    ec2 = CLIENT_POOL.client('ec2', region_name=region)
     
     vpcs = ec2.describe_vpcs(Filters=[{'Name': 'is-default', 'Values': ['false']}])
     for vpc in vpcs['Vpcs']:
@@ -3801,7 +3845,7 @@ def delete_custom_vpcs(region):
 
 @measure_time
 def delete_ec2_snapshots(region):
-    ec2 = boto3.resource('ec2', region_name=region)
+    ec2 = CLIENT_POOL.resource('ec2', region_name=region)
     snapshots = ec2.snapshots.filter(OwnerIds=['self'])  # Ensure to operate only on owned snapshots
     
     for snapshot in snapshots:
@@ -3861,13 +3905,12 @@ def set_aws_profile(profile_name, access_key, secret_key, region="us-east-1"):
     except subprocess.CalledProcessError as e:
         print(f"⚠️ Warning: Could not create AWS CLI profile {profile_name}, using environment variables only")
 
-@measure_time
 @measure_time
 def delete_all_iam_roles(region):
     """
     Delete all IAM roles in the specified region, except service-linked roles.
     """
-    iam = boto3.client('iam', region_name=region)
+    iam = CLIENT_POOL.client('iam', region_name=region)
     
     try:
         # List all IAM roles
@@ -3985,6 +4028,101 @@ def set_current_profile(profile_name):
     os.environ['AWS_PROFILE'] = profile_name
     print(f"🔄 Switched to profile: {profile_name}")
 
+def build_deletion_tasks(buckets_to_keep, tables_to_keep, lambda_functions_to_keep):
+    """Deleters with the resources that have to be gone before each one can succeed"""
+    return [
+        # Resource protections and generators of other resources
+        DeleterTask('stop_codebuild_builds', stop_codebuild_builds),
+        DeleterTask('stop_codepipeline_executions', stop_codepipeline_executions),
+        DeleterTask('delete_elastic_beanstalk_applications', delete_elastic_beanstalk_applications),
+        DeleterTask('delete_eks_clusters', delete_eks_clusters),
+        DeleterTask('delete_all_ecs_clusters', delete_all_ecs_clusters),
+
+        # API Gateway and Lambda
+        DeleterTask('delete_api_gateway_rest_apis', lambda region: delete_api_gateway_rest_apis([], region)),
+        DeleterTask('delete_lambda_functions_except',
+                    lambda region: delete_lambda_functions_except(lambda_functions_to_keep, region)),
+        DeleterTask('delete_lambda_functions', delete_lambda_functions,
+                    depends_on=['delete_lambda_functions_except', 'delete_api_gateway_rest_apis']),
+
+        # Messaging
+        DeleterTask('delete_all_sns_subscriptions', delete_all_sns_subscriptions),
+        DeleterTask('delete_sns_topics', delete_sns_topics, depends_on=['delete_all_sns_subscriptions']),
+        DeleterTask('purge_and_delete_sqs_queues', purge_and_delete_sqs_queues,
+                    depends_on=['delete_lambda_functions']),
+
+        # Databases and storage (S3 is listed account-wide, so it runs once)
+        DeleterTask('delete_rds_instances', delete_rds_instances),
+        DeleterTask('delete_elastic_cache_clusters', lambda region: delete_elastic_cache_clusters([], region)),
+        DeleterTask('delete_dynamodb_tables_except',
+                    lambda region: delete_dynamodb_tables_except(tables_to_keep, region)),
+        DeleterTask('delete_multipart_uploads', delete_multipart_uploads, global_scope=True),
+        DeleterTask('delete_s3_buckets', lambda region: delete_s3_buckets(buckets_to_keep, region),
+                    depends_on=['delete_multipart_uploads', 'delete_elastic_beanstalk_applications'],
+                    global_scope=True),
+
+        # Compute: ASGs -> launch templates / instances -> AMIs -> snapshots -> volumes
+        DeleterTask('delete_auto_scaling_groups', delete_auto_scaling_groups,
+                    depends_on=['delete_eks_clusters', 'delete_all_ecs_clusters',
+                                'delete_elastic_beanstalk_applications']),
+        DeleterTask('delete_launch_templates', delete_launch_templates, depends_on=['delete_auto_scaling_groups']),
+        DeleterTask('delete_ec2_instances', delete_ec2_instances, depends_on=['delete_auto_scaling_groups']),
+        DeleterTask('delete_amis', delete_amis, depends_on=['delete_launch_templates', 'delete_ec2_instances']),
+        DeleterTask('delete_ebs_snapshots', delete_ebs_snapshots, depends_on=['delete_amis']),
+        DeleterTask('delete_ebs_volumes', delete_ebs_volumes,
+                    depends_on=['delete_ec2_instances', 'delete_ebs_snapshots']),
+        DeleterTask('delete_ecr_repositories', delete_ecr_repositories,
+                    depends_on=['delete_eks_clusters', 'delete_all_ecs_clusters']),
+        DeleterTask('delete_key_pairs', delete_key_pairs, depends_on=['delete_ec2_instances']),
+
+        # Load balancing and stacks
+        DeleterTask('delete_load_balancers_and_target_groups', delete_load_balancers_and_target_groups,
+                    depends_on=['delete_eks_clusters', 'delete_all_ecs_clusters',
+                                'delete_elastic_beanstalk_applications', 'delete_auto_scaling_groups']),
+        DeleterTask('release_elastic_ips', release_elastic_ips,
+                    depends_on=['delete_ec2_instances', 'delete_load_balancers_and_target_groups']),
+        DeleterTask('delete_cloudformation_stacks', delete_cloudformation_stacks,
+                    depends_on=['delete_eks_clusters', 'delete_elastic_beanstalk_applications']),
+
+        # Storage and backup services
+        DeleterTask('delete_datasync_resources', delete_datasync_resources),
+        DeleterTask('delete_efs_resources', delete_efs_resources, depends_on=['delete_datasync_resources']),
+        DeleterTask('delete_storage_gateway_resources', delete_storage_gateway_resources),
+        DeleterTask('delete_aws_backup_resources', delete_aws_backup_resources),
+        DeleterTask('delete_transfer_family_resources', delete_transfer_family_resources),
+
+        # Network: endpoints / peering / VPN -> security groups -> VPCs
+        DeleterTask('remove_vpc_endpoints', remove_vpc_endpoints),
+        DeleterTask('delete_vpc_peering_connections', delete_vpc_peering_connections),
+        DeleterTask('terminate_vpn_connections', terminate_vpn_connections),
+        DeleterTask('delete_security_groups', delete_security_groups,
+                    depends_on=['remove_vpc_endpoints', 'delete_vpc_peering_connections',
+                                'terminate_vpn_connections', 'delete_ec2_instances',
+                                'delete_load_balancers_and_target_groups', 'delete_rds_instances',
+                                'delete_elastic_cache_clusters', 'delete_lambda_functions',
+                                'delete_efs_resources', 'delete_cloudformation_stacks',
+                                'delete_transfer_family_resources']),
+        DeleterTask('delete_custom_vpcs', delete_custom_vpcs,
+                    depends_on=['delete_security_groups', 'release_elastic_ips']),
+
+        # Development and deployment
+        DeleterTask('delete_codebuild_projects', delete_codebuild_projects,
+                    depends_on=['stop_codebuild_builds', 'delete_codepipelines']),
+        DeleterTask('delete_codepipelines', delete_codepipelines, depends_on=['stop_codepipeline_executions']),
+        DeleterTask('delete_codecommit_repositories', delete_codecommit_repositories,
+                    depends_on=['delete_codepipelines']),
+        DeleterTask('delete_codedeploy_applications', delete_codedeploy_applications,
+                    depends_on=['delete_codepipelines']),
+
+        # Monitoring, DNS, keys and IAM last
+        DeleterTask('delete_cloudwatch_alarms', delete_cloudwatch_alarms),
+        DeleterTask('delete_kms_keys', lambda region: delete_kms_keys([], region), after_all=True),
+        DeleterTask('delete_route53_hosted_zones', delete_route53_hosted_zones, global_scope=True, after_all=True),
+        DeleterTask('delete_all_iam_roles', delete_all_iam_roles, global_scope=True, after_all=True),
+        DeleterTask('delete_iam_roles', delete_iam_roles, depends_on=['delete_all_iam_roles'],
+                    global_scope=True, after_all=True),
+    ]
+
 if __name__ == "__main__":
     # Load AWS accounts configuration
     CONFIG_FILE = "aws_accounts_config.json"
@@ -4071,90 +4209,40 @@ if __name__ == "__main__":
         try:
             # Switch to the current account profile
             set_current_profile(acc)
-            
-            # Process all regions for this account
-            for region in REGIONS:
-                print(f"\n🌍 Working on region: {region}")
-                
-                # 1. First, disable resource protections
-            stop_codebuild_builds(region)               # Stop running builds
-            stop_codepipeline_executions(region)        # (Add this function to stop pipeline executions)
-
-            # 2. Applications and services that generate other resources
-            delete_elastic_beanstalk_applications(region)  # These create many dependent resources
-            delete_eks_clusters(region)                    # These create many dependent resources
-            delete_all_ecs_clusters(region)                # These require networking resources
-
-            # 3. API Gateway and Lambda resources
-            delete_api_gateway_rest_apis([], region)       # APIs often connect to Lambda
-            delete_lambda_functions_except(LAMBDA_FUNCTIONS_TO_KEEP, region)
-            delete_lambda_functions(region)                # Remove duplicate call - use only one Lambda delete
-
-            # 4. Message and queue services
-            delete_sns_topics(region)                      # SNS topics may trigger other resources
-            delete_all_sns_subscriptions(region)           # Delete subscriptions before topics
-            purge_and_delete_sqs_queues(region)            # SQS queues may be triggered by other services
-
-            # 5. Database and storage resources
-            delete_rds_instances(region)                   # RDS may have dependencies
-            delete_elastic_cache_clusters([], region)      # ElastiCache clusters may have dependencies
-            delete_multipart_uploads(region)               # Clean up S3 multipart uploads before buckets
-            delete_s3_buckets(BUCKETS_TO_KEEP, region)     # S3 buckets may store deployment artifacts
-            delete_dynamodb_tables_except(TABLES_TO_KEEP, region)
-
-            # 6. Compute resources
-            delete_auto_scaling_groups(region)             # Delete ASGs before their EC2 instances
-            delete_launch_templates(region)                # Launch templates used by ASGs
-            delete_ec2_instances(region)                   # Delete standalone EC2 instances
-            delete_amis(region)                            # Delete AMIs before snapshots
-            delete_ebs_snapshots(region)                   # Delete snapshots before volumes
-            delete_ebs_volumes(region)                     # Delete volumes last in the compute section
-            delete_ecr_repositories(region)                # Container repositories
-
-            # 7. Load balancing and networking
-            delete_load_balancers_and_target_groups(region)  # Load balancers may have dependencies
-            release_elastic_ips(region)                      # Release IPs before deleting VPCs
-            delete_cloudformation_stacks(region)             # CloudFormation stacks create multiple resources
-
-            # 8. Network dependencies (order matters here)
-            remove_vpc_endpoints(region)                     # VPC endpoints must be deleted before VPCs
-            delete_vpc_peering_connections(region)           # VPC peering must be deleted before VPCs
-            terminate_vpn_connections(region)                # VPN connections must be deleted before VPCs
-            delete_security_groups(region)                   # Security groups might have cross-references
-            delete_custom_vpcs(region)                       # VPCs should be deleted after all their resources
-
-            # 9. Development and deployment resources
-            delete_codebuild_projects(region)
-            delete_codepipelines(region)
-            delete_codecommit_repositories(region)
-            delete_codedeploy_applications(region)
-            delete_key_pairs(region)
-
-            # 10. Storage and backup services
-            delete_datasync_resources(region)
-            delete_efs_resources(region)
-            delete_storage_gateway_resources(region)
-            delete_aws_backup_resources(region)
-            delete_transfer_family_resources(region)
-
-            # 11. Monitoring and IAM resources (do these last)
-            delete_cloudwatch_alarms(region)                  # Delete alarms that might monitor services
-            delete_route53_hosted_zones(region)               # DNS should be deleted last to prevent failures
-            delete_kms_keys([], region)                       # KMS keys might be used by other resources
-            delete_all_iam_roles(region)                      # IAM roles might be used by other resources
-            delete_iam_roles(region)                          # Remove duplicate call - use only one IAM role delete
-            
-            successful_accounts += 1
-            print(f"\n✅ Completed account: {acc}")
+            CLIENT_POOL.bind(boto3.Session(
+                aws_access_key_id=acc_info['access_key'],
+                aws_secret_access_key=acc_info['secret_key']
+            ))
+
+            # All regions and independent services run in parallel, in dependency order
+            scheduler = DependencyScheduler(
+                build_deletion_tasks(BUCKETS_TO_KEEP, TABLES_TO_KEEP, LAMBDA_FUNCTIONS_TO_KEEP),
+                REGIONS,
+                max_workers=MAX_PARALLEL_DELETERS
+            )
+            print(f"🌍 Regions: {', '.join(REGIONS)} ({len(scheduler.nodes)} deleter runs, "
+                  f"{MAX_PARALLEL_DELETERS} in parallel)")
+            account_start_time = time.time()
+            results = scheduler.run()
+            account_seconds = time.time() - account_start_time
+
+            failed_runs = [result for result in results if result['error']]
+            busy_seconds = sum(result['seconds'] for result in results)
+            print(f"\n⏱️ Account {acc} finished in {account_seconds:.1f}s "
+                  f"({busy_seconds:.1f}s of deleter time, {len(failed_runs)} failed runs)")
+            for result in failed_runs:
+                print(f"   ❌ [{result['region']}] {result['task']}: {result['error']}")
+
+            if failed_runs:
+                failed_accounts.append(acc)
+                print(f"\n⚠️ Completed account with errors: {acc}")
+            else:
+                successful_accounts += 1
+                print(f"\n✅ Completed account: {acc}")
             
         except Exception as e:
             failed_accounts.append(acc)
             print(f"\n❌ Failed to process account {acc}: {e}")
-            
-        # Pause between accounts if not the last one
-        if acc_idx < len(selected_accounts):
-            print(f"\n⏸️ Pausing before next account...")
-            time.sleep(2)
 
     # Calculate total time and show summary
     overall_end_time = time.time()
@@ -4178,6 +4266,9 @@ if __name__ == "__main__":
     
     if failed_accounts:
         print(f"\n❌ Failed accounts: {', '.join(failed_accounts)}")
+
+    print(f"\n⏱️ DELETER TIMINGS (slowest first, all accounts and regions):")
+    print(DELETER_TIMINGS.format_summary())
     
     print(f"{'='*100}")
     print("\n🎉 All selected accounts processed!")
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Deletion Scheduler
+Dependency-ordered, region-parallel execution engine for the account cleanup scripts.
+
+Every deleter declares the deleters that must finish before it (ASGs before launch templates
+and instances, instances before AMIs, endpoints/peering/VPN before security groups before VPCs,
+...). The scheduler expands the declarations into one node per (deleter, region), runs every
+node whose dependencies are done on a shared thread pool, and records per-deleter timings.
+Deleters get their boto3 clients from a shared pool bound to the account being cleaned.
+"""
+
+import functools
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+GLOBAL_REGION = 'global'
+
+
+class AWSClientPool:
+    """Thread-safe cache of boto3 clients/resources per (service, region) for one account session"""
+
+    def __init__(self, max_pool_connections: int = 50, max_attempts: int = 10):
+        """
+        Args:
+            max_pool_connections: HTTP connections per client (deleters share clients across threads)
+            max_attempts: botocore adaptive-retry attempts, absorbs throttling from parallel deleters
+        """
+        self.config = Config(max_pool_connections=max_pool_connections,
+                             retries={'max_attempts': max_attempts, 'mode': 'adaptive'})
+        self._session = None
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def bind(self, session: boto3.session.Session = None):
+        """Switch to another account's session (None = boto3 default credentials); drops cached clients"""
+        with self._lock:
+            self._session = session
+            self._clients = {}
+
+    def _get(self, key: tuple, factory_name: str, service: str, region_name: Optional[str]):
+        with self._lock:
+            cached = self._clients.get(key)
+            if cached is None:
+                # boto3 sessions are not thread-safe; clients are only created under the lock
+                if self._session is None:
+                    self._session = boto3.session.Session()
+                factory = getattr(self._session, factory_name)
+                cached = factory(service, region_name=region_name, config=self.config)
+                self._clients[key] = cached
+            return cached
+
+    def client(self, service: str, region_name: str = None):
+        """Shared boto3 client (same call shape as boto3.client)"""
+        return self._get(('client', service, region_name), 'client', service, region_name)
+
+    def resource(self, service: str, region_name: str = None):
+        """boto3 resource; resources are not thread-safe, so one is cached per thread"""
+        return self._get(('resource', service, region_name, threading.get_ident()), 'resource', service, region_name)
+
+
+class DeleterTimings:
+    """Thread-safe per-deleter timing table (replaces printing the time of every call)"""
+
+    def __init__(self):
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, failed: bool = False):
+        with self._lock:
+            stat = self.stats.setdefault(name, {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0, 'failures': 0})
+            stat['calls'] += 1
+            stat['seconds'] += seconds
+            stat['max_seconds'] = max(stat['max_seconds'], seconds)
+            stat['failures'] += int(failed)
+
+    def measure(self, func: Callable) -> Callable:
+        """Decorator recording every call of func under its name"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = time.time()
+            failed = True
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self.record(func.__name__, time.time() - start_time, failed)
+        return wrapper
+
+    def total_seconds(self) -> float:
+        with self._lock:
+            return sum(stat['seconds'] for stat in self.stats.values())
+
+    def format_summary(self, limit: int = None) -> str:
+        """One line per deleter, slowest first: calls, total/max seconds, failures"""
+        with self._lock:
+            rows = sorted(self.stats.items(), key=lambda item: -item[1]['seconds'])
+        if limit:
+            rows = rows[:limit]
+        return '\n'.join(
+            f"{name:<45} {int(stat['calls']):>5} calls {stat['seconds']:>9.2f}s total "
+            f"{stat['max_seconds']:>8.2f}s max {int(stat['failures']):>3} failed"
+            for name, stat in rows
+        )
+
+
+class DeleterTask:
+    """One deleter and the deleters that must complete before it"""
+
+    def __init__(self, name: str, func: Callable[[str], object], depends_on: Iterable[str] = (),
+                 global_scope: bool = False, after_all: bool = False):
+        """
+        Args:
+            name: Unique task name (used in depends_on and the reports)
+            func: Callable(region) doing the deletion
+            depends_on: Names of tasks that must finish first (in the same region for regional
+                tasks; in every region when a global task depends on a regional one)
+            global_scope: Account-wide service (IAM, Route53, S3 listing); runs once, not per region
+            after_all: Runs after every other task of its region (or of the account, if global)
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.global_scope = global_scope
+        self.after_all = after_all
+
+
+class DependencyScheduler:
+    """Run deleter tasks for many regions in dependency order on one thread pool"""
+
+    def __init__(self, tasks: List[DeleterTask], regions: List[str], max_workers: int = 16,
+                 log: Callable[[str], None] = print):
+        """
+        Args:
+            tasks: Deleter tasks; dependencies must name tasks in this list
+            regions: Regions every regional task runs in (the first one hosts global tasks)
+            max_workers: Deleters running at the same time across all regions
+            log: Progress output
+
+        Raises:
+            ValueError: unknown dependency names or a dependency cycle
+        """
+        self.tasks = {task.name: task for task in tasks}
+        self.regions = list(regions)
+        self.max_workers = max_workers
+        self.log = log
+        self.nodes, self.dependencies = self._build_graph()
+        self._check_acyclic()
+
+    def _build_graph(self) -> Tuple[Dict, Dict]:
+        nodes = {}
+        for task in self.tasks.values():
+            for region in ([GLOBAL_REGION] if task.global_scope else self.regions):
+                nodes[(task.name, region)] = task
+
+        dependencies = {key: set() for key in nodes}
+        for (name, region), task in nodes.items():
+            key = (name, region)
+            for dependency_name in task.depends_on:
+                dependency = self.tasks.get(dependency_name)
+                if dependency is None:
+                    raise ValueError(f"Task '{name}' depends on unknown task '{dependency_name}'")
+                if dependency.global_scope:
+                    dependencies[key].add((dependency_name, GLOBAL_REGION))
+                elif region == GLOBAL_REGION:
+                    dependencies[key].update((dependency_name, r) for r in self.regions)
+                else:
+                    dependencies[key].add((dependency_name, region))
+
+            if task.after_all:
+                dependencies[key].update(
+                    other for other, other_task in nodes.items()
+                    if other != key and not other_task.after_all
+                    and (region == GLOBAL_REGION or other[1] == region)
+                )
+        return nodes, dependencies
+
+    def _dependency_counts(self) -> Tuple[Dict, Dict]:
+        """Unfinished-dependency count per node and the reverse edges"""
+        remaining = {key: len(deps) for key, deps in self.dependencies.items()}
+        dependents = defaultdict(list)
+        for key, deps in self.dependencies.items():
+            for dependency in deps:
+                dependents[dependency].append(key)
+        return remaining, dependents
+
+    def _check_acyclic(self):
+        remaining, dependents = self._dependency_counts()
+
+        ready = [key for key, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            key = ready.pop()
+            visited += 1
+            for dependent in dependents[key]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if visited != len(self.nodes):
+            stuck = sorted(f"{name}@{region}" for (name, region), count in remaining.items() if count)
+            raise ValueError(f"Dependency cycle between deletion tasks: {', '.join(stuck[:10])}")
+
+    def _run_node(self, key: Tuple[str, str]) -> Dict:
+        name, region = key
+        task = self.nodes[key]
+        call_region = self.regions[0] if region == GLOBAL_REGION else region
+        self.log(f"▶️ [{region}] {name}")
+        start_time = time.time()
+        error = None
+        try:
+            task.func(call_region)
+        except Exception as e:
+            error = str(e)
+        seconds = time.time() - start_time
+
+        if error:
+            self.log(f"❌ [{region}] {name} failed after {seconds:.1f}s: {error}")
+        else:
+            self.log(f"✅ [{region}] {name} done in {seconds:.1f}s")
+        return {'task': name, 'region': region, 'seconds': seconds, 'error': error}
+
+    def run(self) -> List[Dict]:
+        """Run every node; a failed deleter does not stop its dependents (best-effort cleanup)
+
+        Returns:
+            One {'task', 'region', 'seconds', 'error'} per node, in completion order
+        """
+        remaining, dependents = self._dependency_counts()
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='deleter') as executor:
+            running = {executor.submit(self._run_node, key): key
+                       for key, count in remaining.items() if count == 0}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    results.append(future.result())
+                    for dependent in dependents[key]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            running[executor.submit(self._run_node, dependent)] = dependent
+        return results
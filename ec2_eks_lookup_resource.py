@@ -14,9 +14,11 @@ import sys
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple
 from botocore.exceptions import ClientError, NoCredentialsError
-import glob
 from collections import defaultdict
 
+from pricing_store import get_pricing_store
+from state_file_catalog import get_state_catalog
+
 # Set UTF-8 encoding for console output
 if sys.platform.startswith('win'):
     os.system('chcp 65001 >nul')  # Set Windows console to UTF-8
@@ -53,7 +55,21 @@ class AWSCostCalculator:
     EBS_GP3_COST_PER_GB_MONTH = 0.08
     
     def __init__(self):
-        pass
+        # Shared on-disk pricing store (populated by the live cost and spot tools)
+        try:
+            self.pricing_store = get_pricing_store()
+        except Exception as e:
+            print(f"[WARN] Pricing store unavailable, using built-in rates: {e}")
+            self.pricing_store = None
+    
+    def lookup_stored_ec2_rate(self, instance_type: str, region: str) -> Optional[float]:
+        """Get the on-demand rate from the shared pricing store, if it has been populated"""
+        if not self.pricing_store or not region:
+            return None
+        try:
+            return self.pricing_store.lookup_ec2_price(region, instance_type)
+        except Exception:
+            return None
     
     def get_current_time(self) -> datetime:
         """Get current UTC time (timezone-aware)"""
@@ -93,7 +109,9 @@ class AWSCostCalculator:
         if live_instance_data:
             current_state = live_instance_data.get('State', {}).get('Name', 'unknown')
         
-        hourly_rate = self.EC2_PRICING.get(instance_type, 0.05)  # Default fallback
+        hourly_rate = self.lookup_stored_ec2_rate(instance_type, instance_data.get('region'))
+        if hourly_rate is None:
+            hourly_rate = self.EC2_PRICING.get(instance_type, 0.05)  # Default fallback
         
         # Calculate compute cost (only for running time)
         compute_cost = hourly_rate * running_hours
@@ -209,6 +227,10 @@ class AWSCostCalculator:
     
     def get_ec2_hourly_rate(self, instance_type, region='us-east-1'):
         """Get EC2 instance hourly rate"""
+        stored_rate = self.lookup_stored_ec2_rate(instance_type, region)
+        if stored_rate is not None:
+            return stored_rate
+        
         # Your existing EC2 pricing logic
         base_rates = {
         't3.micro': 0.0104,
@@ -480,6 +502,7 @@ class AWSResourceManager:
         self.aws_config = self.load_aws_config()
         self.cost_calculator = AWSCostCalculator()
         self.execution_reports = []  # Store reports for consolidated saving
+        self.catalog = get_state_catalog()
         
     def get_current_time_formatted(self) -> str:
         """Get current IST time in formatted string"""
@@ -546,22 +569,11 @@ class AWSResourceManager:
 
     def find_state_files(self, patterns: List[str]) -> List[Tuple[str, str]]:
         """Find all state files matching the patterns and return sorted by timestamp"""
-        files = []
-        for pattern in patterns:
-            files.extend(glob.glob(pattern))
-        
-        file_timestamps = []
+        # The catalog only re-parses files whose mtime changed since the last run
+        self.catalog.refresh(patterns)
         
-        for file in files:
-            # Extract timestamp from filename
-            timestamp_match = re.search(r'(\d{8}_\d{6})', file)
-            if timestamp_match:
-                timestamp = timestamp_match.group(1)
-                file_timestamps.append((file, timestamp))
-        
-        # Sort by timestamp (latest first)
-        file_timestamps.sort(key=lambda x: x[1], reverse=True)
-        return file_timestamps
+        # Already sorted by timestamp (latest first)
+        return [(entry['path'], entry['timestamp']) for entry in self.catalog.files(patterns) if entry['timestamp']]
     
     def group_files_by_date(self, file_timestamps: List[Tuple[str, str]]) -> Dict[str, List[str]]:
         """Group files by date (YYYYMMDD) and return in reverse chronological order"""
@@ -1312,18 +1324,11 @@ class AWSResourceManager:
                 "ec2_report_*.json"
             ]
         
-        json_files = self.find_state_files(patterns)
-        for file_path, _ in json_files:
-            if resource_type.lower() == 'eks':
-                data = self.parse_eks_json_file(file_path)
-                for cluster in data.get('clusters', []):
-                    if cluster.get('cluster_name') == resource_id:
-                        return cluster.get('account_key'), cluster.get('region'), file_path
-            else:
-                data = self.parse_ec2_file(file_path)
-                for instance in data.get('created_instances', []):
-                    if instance.get('instance_id') == resource_id:
-                        return instance.get('account_name'), instance.get('region'), file_path
+        # Indexed lookup instead of parsing every state file; newest file wins
+        self.catalog.refresh(patterns)
+        entry = self.catalog.find_resource(resource_id, resource_type.lower(), patterns)
+        if entry:
+            return entry['account'], entry['region'], entry['path']
         
         return None
 
@@ -7,7 +7,6 @@ Automates the process of connecting EC2 instances to EKS clusters
 import json
 import os
 import sys
-import paramiko
 import boto3
 import logging
 import argparse
@@ -15,8 +14,11 @@ from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 import time
+from ssh_fleet_runner import AsyncSSHFleetRunner, HTMLLogSink, TextLogSink
+from ssh_session_pool import SSHSessionPool
+from state_file_catalog import get_state_catalog
 
 # Configure logging
 # Ensure log directory exists first
@@ -53,6 +55,7 @@ class EKSConnector:
         self.direct_instances = []
         self.direct_account = None
         self.instance_source = None
+        self.catalog = get_state_catalog()
 
         # Smart mapping storage
         self.asg_username_mapping = {}  # {asg_name: extracted_username}
@@ -64,6 +67,11 @@ class EKSConnector:
         self.current_time = "2025-06-26 16:53:37"
         self.current_user = "varadharajaan"
 
+        # Pooled SSH sessions: one transport per (host, user), commands run as channels on it
+        self.ssh_pool = SSHSessionPool()
+        self.max_parallel_hosts = 3
+        self.ssh_key_path = "./k8s_demo_key.pem"
+
         # Ensure reports directory exists
         Path(self.reports_path).mkdir(parents=True, exist_ok=True)
 
@@ -97,8 +105,11 @@ Examples:
 
         parser.add_argument('instances', nargs='?', help='Comma-separated instance IDs (e.g., i-123,i-456)')
         parser.add_argument('account', nargs='?', help='Account name to process (single account only in direct mode)')
+        parser.add_argument('--max-parallel-hosts', type=int, default=self.max_parallel_hosts,
+                            help=f'Number of instances processed in parallel (default: {self.max_parallel_hosts})')
 
         args = parser.parse_args()
+        self.max_parallel_hosts = max(1, args.max_parallel_hosts)
 
         # Check if direct mode arguments are provided
         if args.instances and args.account:
@@ -729,31 +740,25 @@ Examples:
 
             if asg_path.exists():
                 files_found = 0
-                for file_path in asg_path.glob("asg_asg-*.json"):
-                    # Extract timestamp from filename properly
-                    match = re.search(r'_(\d{8})_(\d{6})\.json$', file_path.name)
-                    if match:
-                        date_str = match.group(1)
-                        time_str = match.group(2)
-                        try:
-                            # Parse date and time separately
-                            date_obj = datetime.strptime(date_str, '%Y%m%d')
-                            # Parse time and add to date
-                            hour = int(time_str[:2])
-                            minute = int(time_str[2:4])
-                            second = int(time_str[4:6])
-                            full_datetime = date_obj.replace(hour=hour, minute=minute, second=second)
-
-                            day_key = date_obj.strftime('%Y-%m-%d')
-                            asg_files_by_day[day_key].append({
-                                'path': file_path,
-                                'account': account,
-                                'timestamp': full_datetime
-                            })
-                            files_found += 1
-                        except ValueError as e:
-                            logger.warning(f"Could not parse timestamp from {file_path.name}: {e}")
-                            continue
+                pattern = str(asg_path / "asg_asg-*.json")
+                # Timestamps come from the state file catalog (only new/changed files are re-indexed)
+                self.catalog.refresh([pattern])
+                for entry in self.catalog.files([pattern]):
+                    file_path = Path(entry['path'])
+                    if not entry['timestamp']:
+                        continue
+                    try:
+                        full_datetime = datetime.strptime(entry['timestamp'], '%Y%m%d_%H%M%S')
+                        day_key = full_datetime.strftime('%Y-%m-%d')
+                        asg_files_by_day[day_key].append({
+                            'path': file_path,
+                            'account': account,
+                            'timestamp': full_datetime
+                        })
+                        files_found += 1
+                    except ValueError as e:
+                        logger.warning(f"Could not parse timestamp from {file_path.name}: {e}")
+                        continue
                 print(f"  Found {files_found} ASG files in {asg_path}")
             else:
                 print(f"  ASG directory not found: {asg_path}")
@@ -798,7 +803,10 @@ Examples:
 
             if ec2_path.exists():
                 files_found = 0
-                for file_path in ec2_path.glob("ec2_instance_*.json"):
+                pattern = str(ec2_path / "ec2_instance_*.json")
+                self.catalog.refresh([pattern])
+                for entry in self.catalog.files([pattern], include_resources=True):
+                    file_path = Path(entry['path'])
                     # Match both: ec2_instance_{instance_id}_{account}_{username}_{timestamp}.json
                     # and ec2_instance_{instance_id}_root-account01_{timestamp}.json
                     match = re.match(
@@ -806,7 +814,10 @@ Examples:
                         file_path.name
                     )
                     if match:
-                        instance_id = match.group(1)
+                        # Prefer the instance ID recorded inside the file over the one in its name
+                        instance_ids = [resource['resource_id'] for resource in entry['resources']
+                                        if resource['resource_type'] == 'ec2']
+                        instance_id = instance_ids[0] if instance_ids else match.group(1)
                         account_or_root = match.group(2)
                         username = match.group(3) if match.group(3) else account_or_root
                         date_str = match.group(4)
@@ -1346,53 +1357,39 @@ Examples:
             logger.error(f"Error getting instance details for {instance_info['instance_id']}: {e}")
             return None
 
-    def test_ssh_connection(self, instance):
-        """Test SSH connection to an instance, supporting key-based auth for ec2-user."""
-        try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-            ip = instance['public_ip'] or instance['private_ip']
-            if not ip:
-                return False, "No IP address available", None
-
-            if self.ssh_username == "ec2-user":
-                key_path = "./k8s_demo_key.pem"  # Update this path as needed
-                if not os.path.exists(key_path):
-                    return False, f"Key file not found: {key_path}", None
-                pkey = paramiko.RSAKey.from_private_key_file(key_path)
-                ssh.connect(
-                    hostname=ip,
-                    username="ec2-user",
-                    pkey=pkey,
-                    timeout=10
-                )
-            else:
-                ssh.connect(
-                    hostname=ip,
-                    username=self.ssh_username,
-                    password=self.ssh_password,
-                    timeout=10
-                )
-
-            stdin, stdout, stderr = ssh.exec_command('echo "SSH connection successful"')
-            output = stdout.read().decode().strip()
-            ssh.close()
-
-            if "SSH connection successful" in output:
-                ssh_command = f"ssh {self.ssh_username}@{ip}"
-                if self.ssh_username == "ec2-user":
-                    ssh_command += f" -i k8s_demo_key.pem"
-                logger.info(f"SSH connection successful to {instance['instance_id']} ({ip})")
-                print(
-                    f"✓ SSH SUCCESS: {instance['instance_id']} - To connect manually: {ssh_command}")
-                return True, "SSH connection successful", ssh_command
-            else:
-                return False, "SSH command failed", None
+    def get_ssh_auth(self, username=None):
+        """Get (username, password, key_path) for an SSH user; ec2-user authenticates with the demo key"""
+        username = username or self.ssh_username
+        if username == "ec2-user":
+            return username, None, self.ssh_key_path
+        return username, self.ssh_password or "demouser@123", None
 
-        except Exception as e:
-            logger.error(f"SSH connection failed to {instance['instance_id']}: {e}")
-            return False, str(e), None
+    def test_ssh_connection(self, instance, username=None):
+        """Test SSH connection to an instance, supporting key-based auth for ec2-user.
+
+        The session opened here stays in the pool and is reused by execute_command_on_instance.
+        """
+        username, password, key_path = self.get_ssh_auth(username)
+        ip = instance['public_ip'] or instance['private_ip']
+        if not ip:
+            return False, "No IP address available", None
+
+        result = self.ssh_pool.execute(ip, username, 'echo "SSH connection successful"', timeout=10,
+                                       password=password, key_path=key_path)
+
+        if "SSH connection successful" in result['output']:
+            ssh_command = f"ssh {username}@{ip}"
+            if username == "ec2-user":
+                ssh_command += f" -i k8s_demo_key.pem"
+            logger.info(f"SSH connection successful to {instance['instance_id']} ({ip})")
+            print(
+                f"✓ SSH SUCCESS: {instance['instance_id']} - To connect manually: {ssh_command}")
+            return True, "SSH connection successful", ssh_command
+        elif result['exit_code'] == -1:
+            logger.error(f"SSH connection failed to {instance['instance_id']}: {result['error']}")
+            return False, result['error'], None
+        else:
+            return False, "SSH command failed", None
 
     def parse_user_instructions(self, file_path):
         """Parse user mini-instruction file and extract commands"""
@@ -1418,29 +1415,11 @@ Examples:
             logger.error(f"Error reading instruction file {file_path}: {e}")
             return None
 
-    def execute_command_on_instance(self, instance, command, timeout=30):
-        try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ip = instance['public_ip'] or instance['private_ip']
-
-            if self.ssh_username == "ec2-user":
-                key_path = "./k8s_demo_key.pem"
-                if not os.path.exists(key_path):
-                    return {'success': False, 'output': '', 'error': f'Key file not found: {key_path}', 'exit_code': -1}
-                pkey = paramiko.RSAKey.from_private_key_file(key_path)
-                ssh.connect(hostname=ip, username="ec2-user", pkey=pkey, timeout=10)
-            else:
-                ssh.connect(hostname=ip, username=self.ssh_username, password=self.ssh_password, timeout=10)
-
-            stdin, stdout, stderr = ssh.exec_command(command, timeout=timeout)
-            output = stdout.read().decode()
-            error = stderr.read().decode()
-            exit_code = stdout.channel.recv_exit_status()
-            ssh.close()
-            return {'success': exit_code == 0, 'output': output, 'error': error, 'exit_code': exit_code}
-        except Exception as e:
-            return {'success': False, 'output': '', 'error': str(e), 'exit_code': -1}
+    def execute_command_on_instance(self, instance, command, timeout=30, username=None):
+        """Run a command over a channel of the pooled SSH session for the instance"""
+        username, password, key_path = self.get_ssh_auth(username)
+        ip = instance['public_ip'] or instance['private_ip']
+        return self.ssh_pool.execute(ip, username, command, timeout=timeout, password=password, key_path=key_path)
 
     def log_command_output(log_file, username, command, output, error, success, command_number):
         with open(log_file, 'a', encoding='utf-8') as f:
@@ -1452,8 +1431,31 @@ Examples:
                 f.write(f"Error:\n{error}\n")
             f.write("-" * 50 + "\n")
 
-    def process_instance(self, instance, instruction_file_info):
-        """Process a single instance with user instructions for both demouser and ec2-user"""
+    async def run_instruction_commands(self, runner, instance, commands, username, sinks):
+        """Run commands as one SSH user, streaming every command's output to the sinks"""
+        _, password, key_path = self.get_ssh_auth(username)
+        ip = instance['public_ip'] or instance['private_ip']
+        results = []
+
+        for i, command in enumerate(commands, 1):
+            for sink in sinks:
+                sink.begin_command(i, command)
+            result = await runner.run_command(ip, username, command, sinks, password=password, key_path=key_path)
+            for sink in sinks:
+                sink.end_command(result)
+
+            result['command'] = command
+            result['command_number'] = i
+            results.append(result)
+
+        return results
+
+    async def process_instance_async(self, runner, instance, instruction_file_info):
+        """Process a single instance with user instructions for both demouser and ec2-user
+
+        Command output is streamed to the instance's text log and live HTML log as it arrives;
+        only a bounded tail of each command's output is kept in the returned results.
+        """
         logger.info(f"Processing instance {instance['instance_id']} in ASG {instance['asg_name']} for account {instance['account']}")
 
         # Prepare output file path
@@ -1464,11 +1466,11 @@ Examples:
         account_dir = Path(self.reports_path) / account / 'instances'
         account_dir.mkdir(parents=True, exist_ok=True)
         output_file = account_dir / f"{instance_id}_{account}_{extracted_username}_command_output.txt"
+        live_html_file = account_dir / f"{instance_id}_{account}_{extracted_username}_live.html"
 
         # --- 1. Run as demouser ---
-        self.ssh_username = "demouser"
-        self.ssh_password = "demouser@123"
-        ssh_success, ssh_message, ssh_command = self.test_ssh_connection(instance)
+        ssh_success, ssh_message, ssh_command = await runner.run_blocking(
+            self.test_ssh_connection, instance, "demouser")
 
         if not ssh_success:
             logger.error(f"SSH connection failed for {instance_id}: {ssh_message}")
@@ -1476,7 +1478,7 @@ Examples:
                 'instance_id': instance_id,
                 'account': account,
                 'instance_ip': instance['public_ip'] or instance['private_ip'],
-                'ssh_command': f"ssh {self.ssh_username}@{instance['public_ip'] or instance['private_ip']}",
+                'ssh_command': f"ssh demouser@{instance['public_ip'] or instance['private_ip']}",
                 'ssh_success': False,
                 'ssh_message': ssh_message,
                 'username': instruction_file_info.get('username', 'unknown'),
@@ -1505,34 +1507,6 @@ Examples:
                 'error': "Failed to parse instruction file"
             }
 
-        results = []
-        successful_commands = 0
-        total_commands = len(commands)
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"=== demouser OUTPUT ===\n")
-
-        for i, command in enumerate(commands, 1):
-            result = self.execute_command_on_instance(instance, command)
-            result['command'] = command
-            result['command_number'] = i
-            results.append(result)
-            if result['success']:
-                successful_commands += 1
-
-            # Append to output file
-            with open(output_file, 'a', encoding='utf-8') as f:
-                f.write(f"Command #{i}: {command}\n")
-                f.write(f"Success: {'YES' if result['success'] else 'NO'}\n")
-                f.write(f"Output:\n{result['output']}\n")
-                if result['error']:
-                    f.write(f"Error:\n{result['error']}\n")
-                f.write("-" * 50 + "\n")
-
-            time.sleep(1)
-
-        #self.log_command_output(output_file, self.ssh_username, command, result['output'], result['error'], result['success'], i)
-
         # --- 2. Run as ec2-user, skipping setup commands ---
         skip_cmds = [
             "sudo mkdir -p /home/ec2-user/.aws",
@@ -1542,44 +1516,37 @@ Examples:
             "sudo cp -r /home/demouser/.kube/* /home/ec2-user/.kube/",
             "sudo chown -R ec2-user:ec2-user /home/ec2-user/.kube"
         ]
-        self.ssh_username = "ec2-user"
-        self.ssh_password = None  # Use key-based auth if needed
-
-        # Try SSH as ec2-user
-        ssh_success_ec2, ssh_message_ec2, ssh_command_ec2 = self.test_ssh_connection(instance)
-        ec2_results = []
-        ec2_successful = 0
-
         filtered_commands = [
             cmd for cmd in commands
             if not any(cmd.strip().startswith(skip) for skip in skip_cmds)
         ]
 
-        with open(output_file, 'a', encoding='utf-8') as f:
-            f.write("\n =============ec2-user OUTPUT =============\n")
+        text_sink = TextLogSink(output_file, mode='w')
+        html_sink = HTMLLogSink(live_html_file, f"Live Command Output: {instance_id} ({account})")
+        sinks = [text_sink, html_sink]
+        try:
+            for sink in sinks:
+                sink.write_header("=== demouser OUTPUT ===\n")
+            results = await self.run_instruction_commands(runner, instance, commands, "demouser", sinks)
 
-        if ssh_success_ec2:
-            for i, command in enumerate(filtered_commands, 1):
-                result = self.execute_command_on_instance(instance, command)
-                result['command'] = command
-                result['command_number'] = i
-                ec2_results.append(result)
-                if result['success']:
-                    ec2_successful += 1
-
-                with open(output_file, 'a', encoding='utf-8') as f:
-                    f.write(f"Command #{i}: {command}\n")
-                    f.write(f"Success: {'YES' if result['success'] else 'NO'}\n")
-                    f.write(f"Output:\n{result['output']}\n")
-                    if result['error']:
-                        f.write(f"Error:\n{result['error']}\n")
-                    f.write("-" * 50 + "\n")
-                time.sleep(1)
-        else:
-            with open(output_file, 'a', encoding='utf-8') as f:
-                f.write(f"ec2-user SSH failed: {ssh_message_ec2}\n")
+            # Try SSH as ec2-user (key-based auth)
+            ssh_success_ec2, ssh_message_ec2, ssh_command_ec2 = await runner.run_blocking(
+                self.test_ssh_connection, instance, "ec2-user")
+
+            for sink in sinks:
+                sink.write_header("\n =============ec2-user OUTPUT =============\n")
+
+            ec2_results = []
+            if ssh_success_ec2:
+                ec2_results = await self.run_instruction_commands(
+                    runner, instance, filtered_commands, "ec2-user", sinks)
+            else:
+                for sink in sinks:
+                    sink.write_header(f"ec2-user SSH failed: {ssh_message_ec2}\n")
+        finally:
+            for sink in sinks:
+                sink.close()
 
-        #self.log_command_output(output_file, self.ssh_username, command, result['output'], result['error'], result['success'], i)
         # Return combined result (demouser + ec2-user)
         return {
             'instance_id': instance_id,
@@ -1590,17 +1557,48 @@ Examples:
             'cluster_name': cluster_name,
             'ssh_success': True,
             'ssh_message': "SSH successful (demouser)",
-            'commands_executed': total_commands,
-            'commands_successful': successful_commands,
+            'commands_executed': len(commands),
+            'commands_successful': sum(1 for r in results if r['success']),
             'command_results': results,
             'ec2_user_ssh_success': ssh_success_ec2,
             'ec2_user_ssh_message': ssh_message_ec2,
             'ec2_user_commands_executed': len(filtered_commands),
-            'ec2_user_commands_successful': ec2_successful,
+            'ec2_user_commands_successful': sum(1 for r in ec2_results if r['success']),
             'ec2_user_command_results': ec2_results,
             'asg_name': instance.get('asg_name', 'N/A')
         }
 
+    def process_instance(self, instance, instruction_file_info):
+        """Process a single instance (synchronous wrapper around process_instance_async)"""
+        runner = AsyncSSHFleetRunner(self.ssh_pool, max_concurrent_hosts=1)
+        try:
+            return asyncio.run(self.process_instance_async(runner, instance, instruction_file_info))
+        finally:
+            runner.shutdown(close_sessions=False)
+
+    async def process_instances_async(self, instances, instruction_file):
+        """Process instances concurrently on the asyncio fleet runner
+
+        Reports for an instance are written as soon as it finishes and its pooled sessions
+        are released. Returns results in instance order (exceptions for failed instances).
+        """
+        runner = AsyncSSHFleetRunner(self.ssh_pool, max_concurrent_hosts=self.max_parallel_hosts)
+
+        async def process_and_report(instance):
+            try:
+                result = await self.process_instance_async(runner, instance, instruction_file)
+                await runner.run_blocking(self.save_instance_html_report, result)
+                await runner.run_blocking(self.save_instance_report, result)
+                return result
+            finally:
+                # Instance is done - release its pooled sessions
+                self.ssh_pool.close(instance['public_ip'] or instance['private_ip'])
+
+        try:
+            return await runner.run_fleet(instances, process_and_report)
+        finally:
+            runner.shutdown(close_sessions=False)
+
     def save_instance_report(self, instance_result):
         """Save individual instance report with extracted username in filename, showing both demouser and ec2-user results"""
         account = instance_result['account']
@@ -2021,26 +2019,14 @@ Examples:
 
             mapping_results = []
 
-            # Process instances in parallel (limited concurrency)
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                future_to_instance = {
-                    executor.submit(self.process_instance, instance, instruction_file): instance
-                    for instance in instances
-                }
-
-                for future in as_completed(future_to_instance):
-                    instance = future_to_instance[future]
-                    try:
-                        result = future.result()
-                        mapping_results.append(result)
-                        all_results.append(result)
-
-                        # Save individual instance report
-                        self.save_instance_html_report(result)
-                        self.save_instance_report(result)
-
-                    except Exception as e:
-                        logger.error(f"Error processing instance {instance['instance_id']}: {e}")
+            # Process instances concurrently on the asyncio fleet runner
+            instance_results = asyncio.run(self.process_instances_async(instances, instruction_file))
+            for instance, result in zip(instances, instance_results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing instance {instance['instance_id']}: {result}")
+                    continue
+                mapping_results.append(result)
+                all_results.append(result)
 
             # Generate ASG reports if using ASG source
             if self.instance_source == 'asg' and mapping_results:
@@ -2063,6 +2049,9 @@ Examples:
             if results:
                 self.save_account_summary(account, results)
 
+        self.ssh_pool.close_all()
+        logger.info(f"SSH handshakes performed: {self.ssh_pool.handshake_count}")
+
         # Print final summary
         self.print_final_summary(all_results)
 
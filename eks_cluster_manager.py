@@ -20,6 +20,8 @@ import yaml
 
 import subprocess
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import string
 from typing import List, Tuple, Set
 from aws_credential_manager import CredentialInfo
@@ -31,6 +33,8 @@ import logging
 from logging.handlers import RotatingFileHandler
 from complete_autoscaler_deployment import CompleteAutoscalerDeployer
 from timing_utils import timing_decorator, add_timing_methods
+from readiness import ReadinessWaiter, ReadinessFailed
+from k8s_api_client import get_eks_kubernetes_client
 
 
 class Colors:
@@ -44,6 +48,40 @@ class Colors:
     WHITE = '\033[1;37m'
     NC = '\033[0m'  # No Color
 
+class ClusterCreationProgress:
+    """Thread-safe phase tracker that prints a progress table whenever a cluster changes phase"""
+
+    def __init__(self, cluster_names: List[str]):
+        self.start_time = time.time()
+        self._lock = threading.Lock()
+        self._clusters = {name: {'phase': 'queued', 'since': self.start_time, 'error': None}
+                          for name in cluster_names}
+
+    def update(self, cluster_name: str, phase: str, error: str = None):
+        with self._lock:
+            self._clusters[cluster_name] = {'phase': phase, 'since': time.time(), 'error': error}
+            self._print_table()
+
+    def phase_of(self, cluster_name: str) -> str:
+        with self._lock:
+            return self._clusters.get(cluster_name, {}).get('phase', 'queued')
+
+    def _print_table(self):
+        now = time.time()
+        counts = {}
+        for state in self._clusters.values():
+            counts[state['phase']] = counts.get(state['phase'], 0) + 1
+
+        print("\n" + "-" * 72)
+        print(f"[STATS] Cluster creation progress ({int(now - self.start_time)}s elapsed): " +
+              ', '.join(f"{phase}={count}" for phase, count in sorted(counts.items())))
+        print(f"{'Cluster':<40} {'Phase':<14} {'In phase':>10}")
+        for cluster_name, state in self._clusters.items():
+            phase = state['phase'] if not state['error'] else f"{state['phase']} (!)"
+            print(f"{cluster_name[:40]:<40} {phase:<14} {int(now - state['since']):>9}s")
+        print("-" * 72)
+
+
 #@add_timing_methods
 class EKSClusterManager:
     def __init__(self, config_file=None, current_user='varadharajaan'):
@@ -58,6 +96,18 @@ class EKSClusterManager:
             self.setup_logging()
         
             self.load_configuration()
+
+            # Pipelined multi-cluster creation
+            self.max_parallel_clusters = 6
+            self.max_clusters_per_account_region = 3
+            self.creation_progress = None
+            self._setup_locks = {}
+            self._setup_locks_guard = threading.Lock()
+            # kubectl steps use a kubeconfig file per cluster; only the merge into ~/.kube/config is shared
+            self._kubeconfig_lock = threading.Lock()
+
+            # Adaptive readiness polling used instead of fixed sleeps
+            self.readiness = ReadinessWaiter(log_operation=self.log_operation)
     
     def setup_logging(self):
         """Set up proper logging with file and console handlers, capturing all output"""
@@ -302,6 +352,7 @@ class EKSClusterManager:
         
             # Set environment variables for admin access
             env = os.environ.copy()
+            env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
             env['AWS_ACCESS_KEY_ID'] = admin_access_key
             env['AWS_SECRET_ACCESS_KEY'] = admin_secret_key
             env['AWS_DEFAULT_REGION'] = region
@@ -371,7 +422,7 @@ class EKSClusterManager:
                 return False
         
             # Wait for operator to be ready
-            time.sleep(30)
+            self._wait_for_pods_running('aws-application-signals-system', env)
         
             # Step 4: Deploy ADOT Collector
             self.print_colored(Colors.CYAN, "   [STATS] Deploying ADOT Collector for Application Signals...")
@@ -405,7 +456,7 @@ class EKSClusterManager:
         
             # Step 6: Verify deployment
             self.print_colored(Colors.CYAN, "   [WAIT] Verifying Application Signals deployment...")
-            time.sleep(30)
+            self._wait_for_pods_running('aws-application-signals-system', env)
         
             verify_cmd = ['kubectl', 'get', 'pods', '-n', 'aws-application-signals-system', '--no-headers']
             verify_result = subprocess.run(verify_cmd, env=env, capture_output=True, text=True, timeout=60)
@@ -702,6 +753,7 @@ class EKSClusterManager:
                 return {"error": "kubectl not available"}
         
             env = os.environ.copy()
+            env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
             env['AWS_ACCESS_KEY_ID'] = access_key
             env['AWS_SECRET_ACCESS_KEY'] = secret_key
             env['AWS_DEFAULT_REGION'] = region
@@ -1280,6 +1332,97 @@ class EKSClusterManager:
 
     ######
 
+    def _wait_for_cluster_active(self, eks_client, cluster_name: str, timeout: int = 1200) -> str:
+        """Wait until the EKS control plane is ACTIVE (raises ReadinessFailed/ReadinessTimeout)"""
+        return self.readiness.wait_for_status(
+            f"cluster {cluster_name} active",
+            lambda: eks_client.describe_cluster(name=cluster_name)['cluster']['status'],
+            ready=('ACTIVE',), failed=('FAILED', 'DELETING'), timeout=timeout, initial_delay=15
+        )
+
+    def _wait_for_nodegroup_active(self, eks_client, cluster_name: str, nodegroup_name: str,
+                                   timeout: int = 1200) -> str:
+        """Wait until a nodegroup is ACTIVE (raises ReadinessFailed/ReadinessTimeout)"""
+        return self.readiness.wait_for_status(
+            f"nodegroup {nodegroup_name} active",
+            lambda: eks_client.describe_nodegroup(clusterName=cluster_name,
+                                                  nodegroupName=nodegroup_name)['nodegroup']['status'],
+            ready=('ACTIVE',), failed=('CREATE_FAILED', 'DELETING', 'DELETE_FAILED'), timeout=timeout,
+            initial_delay=10
+        )
+
+    def _wait_for_addon_active(self, eks_client, cluster_name: str, addon_name: str, timeout: int = 300) -> str:
+        """Wait until an add-on is ACTIVE (raises ReadinessFailed/ReadinessTimeout)"""
+        return self.readiness.wait_for_status(
+            f"add-on {addon_name} active",
+            lambda: eks_client.describe_addon(clusterName=cluster_name, addonName=addon_name)['addon']['status'],
+            ready=('ACTIVE',), failed=('CREATE_FAILED', 'DEGRADED'), timeout=timeout, initial_delay=5
+        )
+
+    def _wait_for_iam_role(self, iam_client, role_name: str, policy_arns: List[str] = (), timeout: int = 60) -> bool:
+        """Wait until a role is readable and has the given managed policies attached"""
+        def role_ready():
+            iam_client.get_role(RoleName=role_name)
+            if not policy_arns:
+                return True
+            attached = iam_client.list_attached_role_policies(RoleName=role_name)['AttachedPolicies']
+            return set(policy_arns) <= {policy['PolicyArn'] for policy in attached}
+
+        return bool(self.readiness.wait_for(f"IAM role {role_name}", role_ready, timeout=timeout,
+                                            initial_delay=1, raise_on_timeout=False))
+
+    def _wait_for_iam_policy(self, iam_client, policy_arn: str, timeout: int = 60) -> bool:
+        """Wait until a newly created managed policy is readable"""
+        return bool(self.readiness.wait_for(f"IAM policy {policy_arn.split('/')[-1]}",
+                                            lambda: iam_client.get_policy(PolicyArn=policy_arn),
+                                            timeout=timeout, initial_delay=1, raise_on_timeout=False))
+
+    def _wait_for_lambda_ready(self, lambda_client, function_name: str, timeout: int = 120) -> bool:
+        """Wait until a Lambda function has no update in progress"""
+        def function_ready():
+            configuration = lambda_client.get_function_configuration(FunctionName=function_name)
+            if configuration.get('LastUpdateStatus') == 'Failed':
+                raise ReadinessFailed(configuration.get('LastUpdateStatusReason', 'Lambda update failed'))
+            return (configuration.get('State', 'Active') == 'Active' and
+                    configuration.get('LastUpdateStatus', 'Successful') != 'InProgress')
+
+        return bool(self.readiness.wait_for(f"Lambda {function_name} ready", function_ready, timeout=timeout,
+                                            initial_delay=1, raise_on_timeout=False))
+
+    def _create_lambda_function(self, lambda_client, role_name: str, **function_args) -> Dict:
+        """create_function, retried while a newly created role cannot be assumed by Lambda yet"""
+        return self.readiness.call_until_success(
+            f"Lambda role {role_name} assumable",
+            lambda: lambda_client.create_function(**function_args),
+            retry_on=(lambda_client.exceptions.InvalidParameterValueException,),
+            retry_if=lambda error: 'assume' in str(error).lower(),
+            timeout=90, initial_delay=2
+        )
+
+    def _wait_for_pods_running(self, namespace: str, env: dict, timeout: int = 180) -> bool:
+        """Wait until a namespace has pods and all of them are Running or Succeeded"""
+        def pods_running():
+            result = subprocess.run(['kubectl', 'get', 'pods', '-n', namespace, '-o', 'json'],
+                                    env=env, capture_output=True, text=True, timeout=60)
+            if result.returncode != 0:
+                return False
+            pods = json.loads(result.stdout).get('items', [])
+            return bool(pods) and all(pod.get('status', {}).get('phase') in ('Running', 'Succeeded') for pod in pods)
+
+        return bool(self.readiness.wait_for(f"pods in {namespace} running", pods_running, timeout=timeout,
+                                            initial_delay=3, max_delay=15, raise_on_timeout=False))
+
+    def _wait_for_kube_resource_deleted(self, kind: str, name: str, namespace: str, env: dict,
+                                        timeout: int = 60) -> bool:
+        """Wait until kubectl no longer finds a resource"""
+        def resource_gone():
+            result = subprocess.run(['kubectl', 'get', kind, name, '-n', namespace, '--no-headers'],
+                                    env=env, capture_output=True, text=True, timeout=30)
+            return result.returncode != 0 and 'NotFound' in result.stderr
+
+        return bool(self.readiness.wait_for(f"{kind} {namespace}/{name} deleted", resource_gone, timeout=timeout,
+                                            initial_delay=1, max_delay=10, raise_on_timeout=False))
+
     def create_eks_control_plane(self, eks_client, cluster_name: str, eks_version: str, eks_role_arn: str, subnet_ids: List[str], security_group_id: str) -> bool:
         """Create EKS control plane with CloudWatch logging enabled"""
         try:
@@ -1317,8 +1460,7 @@ class EKSClusterManager:
             
             # Wait for cluster to be active
             print(f"[WAIT] Waiting for cluster {cluster_name} to be active...")
-            waiter = eks_client.get_waiter('cluster_active')
-            waiter.wait(name=cluster_name, WaiterConfig={'Delay': 30, 'MaxAttempts': 40})
+            self._wait_for_cluster_active(eks_client, cluster_name)
             
             print(f"[OK] Cluster {cluster_name} is now active")
             return True
@@ -1671,12 +1813,7 @@ class EKSClusterManager:
                     )
             
                     self.print_colored(Colors.CYAN, f"[WAIT] Waiting for On-Demand nodegroup {ondemand_ng_name} to be active...")
-                    waiter = eks_client.get_waiter('nodegroup_active')
-                    waiter.wait(
-                        clusterName=cluster_name,
-                        nodegroupName=ondemand_ng_name,
-                        WaiterConfig={'Delay': 30, 'MaxAttempts': 40}
-                    )
+                    self._wait_for_nodegroup_active(eks_client, cluster_name, ondemand_ng_name)
                     self.print_colored(Colors.GREEN, f"[OK] On-Demand nodegroup {ondemand_ng_name} is now active")
                     success_count += 1
                     created_nodegroups.append(ondemand_ng_name)
@@ -1722,12 +1859,7 @@ class EKSClusterManager:
                     )
             
                     self.print_colored(Colors.CYAN, f"[WAIT] Waiting for Spot nodegroup {spot_ng_name} to be active...")
-                    waiter = eks_client.get_waiter('nodegroup_active')
-                    waiter.wait(
-                        clusterName=cluster_name,
-                        nodegroupName=spot_ng_name,
-                        WaiterConfig={'Delay': 30, 'MaxAttempts': 40}
-                    )
+                    self._wait_for_nodegroup_active(eks_client, cluster_name, spot_ng_name)
                     self.print_colored(Colors.GREEN, f"[OK] Spot nodegroup {spot_ng_name} is now active")
                     success_count += 1
                     created_nodegroups.append(spot_ng_name)
@@ -1806,12 +1938,7 @@ class EKSClusterManager:
 
             # Wait for nodegroup to be active
             self.print_colored(Colors.CYAN, f"[WAIT] Waiting for nodegroup {nodegroup_name} to be active...")
-            waiter = eks_client.get_waiter('nodegroup_active')
-            waiter.wait(
-                clusterName=cluster_name,
-                nodegroupName=nodegroup_name,
-                WaiterConfig={'Delay': 30, 'MaxAttempts': 40}
-            )
+            self._wait_for_nodegroup_active(eks_client, cluster_name, nodegroup_name)
 
             self.print_colored(Colors.GREEN, f"[OK] Nodegroup {nodegroup_name} is now active")
             return True
@@ -1878,12 +2005,7 @@ class EKSClusterManager:
 
             # Wait for nodegroup to be active
             self.print_colored(Colors.CYAN, f"[WAIT] Waiting for nodegroup {nodegroup_name} to be active...")
-            waiter = eks_client.get_waiter('nodegroup_active')
-            waiter.wait(
-                clusterName=cluster_name,
-                nodegroupName=nodegroup_name,
-                WaiterConfig={'Delay': 30, 'MaxAttempts': 40}
-            )
+            self._wait_for_nodegroup_active(eks_client, cluster_name, nodegroup_name)
 
             self.print_colored(Colors.GREEN, f"[OK] Nodegroup {nodegroup_name} is now active")
             return True
@@ -1932,7 +2054,7 @@ class EKSClusterManager:
                     iam_client.attach_role_policy(RoleName=eks_role_name, PolicyArn=policy)
             
                 # Wait for role to be available
-                time.sleep(10)
+                self._wait_for_iam_role(iam_client, eks_role_name, policies)
     
             try:
                 iam_client.get_role(RoleName=node_role_name)
@@ -1967,7 +2089,7 @@ class EKSClusterManager:
                     iam_client.attach_role_policy(RoleName=node_role_name, PolicyArn=policy)
             
                 # Wait for role to be available
-                time.sleep(10)
+                self._wait_for_iam_role(iam_client, node_role_name, node_policies)
     
             # Create and attach the AWS CSI Policy
             self.log_operation('INFO', f"Checking and attaching AWS CSI policy for EBS driver")
@@ -2049,7 +2171,7 @@ class EKSClusterManager:
                 self.log_operation('INFO', f"Created AWS CSI policy: {csi_policy_arn}")
         
                 # Wait for policy to be available
-                time.sleep(5)
+                self._wait_for_iam_policy(iam_client, csi_policy_arn)
     
             # Attach CSI policy to the node role
             try:
@@ -2574,6 +2696,7 @@ class EKSClusterManager:
 
                 # Set environment variables for admin access
                 myenv = os.environ.copy()
+                myenv['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                 myenv['AWS_ACCESS_KEY_ID'] = admin_access_key
                 myenv['AWS_SECRET_ACCESS_KEY'] = admin_secret_key
                 myenv['AWS_DEFAULT_REGION'] = region
@@ -2650,15 +2773,13 @@ class EKSClusterManager:
                 # Test access after a brief delay (only for IAM user, not root)
                 if not is_root_user:
                     try:
-                        import time
-                        time.sleep(10)  # Wait for ConfigMap to propagate
-
                         username = user_data.get('username', 'unknown')
                         self.log_operation('INFO', f"Testing user access for {username}")
                         self.print_colored(Colors.YELLOW, f"[TEST] Testing user access...")
 
                         # Set user environment
                         user_env = os.environ.copy()
+                        user_env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                         user_env['AWS_ACCESS_KEY_ID'] = user_data.get('access_key', '')
                         user_env['AWS_SECRET_ACCESS_KEY'] = user_data.get('secret_key', '')
                         user_env['AWS_DEFAULT_REGION'] = region
@@ -2674,10 +2795,18 @@ class EKSClusterManager:
                                                             text=True, timeout=120)
 
                         if user_update_result.returncode == 0:
-                            # Test kubectl access
+                            # Test kubectl access, retrying while the ConfigMap/access entries propagate
                             test_cmd = ['kubectl', 'get', 'nodes']
-                            test_result = subprocess.run(test_cmd, env=user_env, capture_output=True, text=True,
-                                                         timeout=60)
+                            test_results = []
+
+                            def user_can_get_nodes():
+                                test_results.append(subprocess.run(test_cmd, env=user_env, capture_output=True,
+                                                                   text=True, timeout=60))
+                                return test_results[-1].returncode == 0
+
+                            self.readiness.wait_for(f"user {username} cluster access", user_can_get_nodes,
+                                                    timeout=90, initial_delay=2, raise_on_timeout=False)
+                            test_result = test_results[-1]
 
                             if test_result.returncode == 0:
                                 self.log_operation('INFO', f"User access test successful for {username}")
@@ -2873,6 +3002,7 @@ class EKSClusterManager:
                 
                     if kubectl_available:
                         env = os.environ.copy()
+                        env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                         env['AWS_ACCESS_KEY_ID'] = admin_access_key
                         env['AWS_SECRET_ACCESS_KEY'] = admin_secret_key
                         env['AWS_DEFAULT_REGION'] = region
@@ -3199,18 +3329,7 @@ class EKSClusterManager:
                                       aws_secret_access_key=admin_secret_key)
             account_id = sts_client.get_caller_identity()['Account']
 
-            # Step 1: Create only kubectl layer (much smaller, ~15MB)
-            self.print_colored(Colors.CYAN, "   [PACKAGE] Creating kubectl layer (optimized)...")
-
-            kubectl_layer_arn = self.create_kubectl_only_layer(lambda_client)
-
-            if not kubectl_layer_arn:
-                self.print_colored(Colors.RED, "   [ERROR] Failed to create kubectl layer")
-                return False
-
-            self.print_colored(Colors.GREEN, f"   [OK] kubectl layer created: {kubectl_layer_arn}")
-
-            # Step 2: Create IAM role with new naming convention
+            # Step 1: Create IAM role with new naming convention
             role_name = f"NodeProtectionMonitorRole-{cluster_suffix}"
             self.print_colored(Colors.CYAN, f"   [KEY] Creating IAM role: {role_name}")
 
@@ -3288,9 +3407,9 @@ class EKSClusterManager:
 
             # Wait for role to be ready
             self.print_colored(Colors.CYAN, f"   [TIMER]  Waiting for IAM role to be ready...")
-            time.sleep(10)
+            self._wait_for_iam_role(iam_client, role_name)
 
-            # Step 3: Create optimized Lambda function with template replacement
+            # Step 2: Create optimized Lambda function with template replacement
             function_name = f"node-protection-monitor-eks-{cluster_suffix}"
             self.print_colored(Colors.CYAN, f"   [START] Creating optimized Lambda function: {function_name}")
 
@@ -3365,7 +3484,8 @@ class EKSClusterManager:
 
             if not function_exists:
                 try:
-                    lambda_client.create_function(
+                    self._create_lambda_function(
+                        lambda_client, role_name,
                         FunctionName=function_name,
                         Runtime='python3.9',
                         Role=role_arn,
@@ -3374,7 +3494,6 @@ class EKSClusterManager:
                         Description=f'Optimized node protection monitoring for EKS cluster {cluster_name} (suffix: {cluster_suffix}) - No AWS CLI dependency',
                         Timeout=180,
                         MemorySize=256,
-                        Layers=[kubectl_layer_arn],
                         Environment={
                             'Variables': {
                                 'CLUSTER_NAME': cluster_name,
@@ -3400,7 +3519,7 @@ class EKSClusterManager:
                         )
 
                         # Wait for update to complete
-                        time.sleep(5)
+                        self._wait_for_lambda_ready(lambda_client, function_name)
 
                         # Update function configuration
                         lambda_client.update_function_configuration(
@@ -3410,7 +3529,7 @@ class EKSClusterManager:
                             Description=f'Optimized node protection monitoring for EKS cluster {cluster_name} (suffix: {cluster_suffix}) - Updated at {current_datetime}',
                             Timeout=180,
                             MemorySize=256,
-                            Layers=[kubectl_layer_arn],
+                            Layers=[],  # kubectl layer no longer needed; the function talks to the API directly
                             Environment={
                                 'Variables': {
                                     'CLUSTER_NAME': cluster_name,
@@ -3427,8 +3546,8 @@ class EKSClusterManager:
                     except lambda_client.exceptions.ResourceConflictException:
                         if attempt < max_retries - 1:
                             self.print_colored(Colors.YELLOW,
-                                               f"   [WARN]  Function update in progress, retrying in {10 * (attempt + 1)} seconds...")
-                            time.sleep(10 * (attempt + 1))
+                                               f"   [WARN]  Function update in progress, waiting for it to finish...")
+                            self._wait_for_lambda_ready(lambda_client, function_name)
                         else:
                             self.print_colored(Colors.RED,
                                                f"   [ERROR] Failed to update Lambda function after {max_retries} attempts")
@@ -3437,7 +3556,7 @@ class EKSClusterManager:
                         self.print_colored(Colors.RED, f"   [ERROR] Failed to update Lambda function: {str(e)}")
                         return False
 
-            # Step 4: Create EventBridge rule with new naming convention
+            # Step 3: Create EventBridge rule with new naming convention
             events_client = boto3.client('events', region_name=region,
                                          aws_access_key_id=admin_access_key,
                                          aws_secret_access_key=admin_secret_key)
@@ -3465,7 +3584,7 @@ class EKSClusterManager:
             except Exception as e:
                 self.print_colored(Colors.YELLOW, f"   [WARN]  EventBridge rule may already exist: {str(e)}")
 
-            # Step 5: Add Lambda permission for EventBridge
+            # Step 4: Add Lambda permission for EventBridge
             self.print_colored(Colors.CYAN, f"   [SECURE] Adding Lambda permission for EventBridge...")
 
             try:
@@ -3482,7 +3601,7 @@ class EKSClusterManager:
             except Exception as e:
                 self.print_colored(Colors.RED, f"   [ERROR] Failed to add Lambda permission: {str(e)}")
 
-            # Step 6: Create EventBridge target
+            # Step 5: Create EventBridge target
             self.print_colored(Colors.CYAN, f"   [TARGET] Creating EventBridge target...")
 
             try:
@@ -3513,7 +3632,7 @@ class EKSClusterManager:
                 self.print_colored(Colors.RED, f"   [ERROR] Failed to create EventBridge target: {str(e)}")
                 return False
 
-            # Step 7: Test the Lambda function
+            # Step 6: Test the Lambda function
             # self.print_colored(Colors.CYAN, f"   [TEST] STEP 7: Testing optimized Lambda function...")
             #
             # test_event = {
@@ -3545,7 +3664,7 @@ class EKSClusterManager:
             #     self.print_colored(Colors.YELLOW,
             #                        f"   [WARN]  Lambda function test failed (this is often normal): {str(e)}")
 
-            # # Step 8: Create scheduled trigger for regular monitoring
+            # # Step 7: Create scheduled trigger for regular monitoring
             # self.print_colored(Colors.CYAN, f"   [ALARM] Creating scheduled monitoring rule...")
             #
             # schedule_rule_name = f"node-protection-monitor-eks-{cluster_suffix}-schedule"
@@ -3829,13 +3948,18 @@ class EKSClusterManager:
                             FunctionName=lambda_arn,
                             StatementId=statement_id
                         )
-                        time.sleep(2)
-                        lambda_client.add_permission(
-                            FunctionName=lambda_arn,
-                            StatementId=statement_id,
-                            Action='lambda:InvokeFunction',
-                            Principal='events.amazonaws.com',
-                            SourceArn=rule_arn
+                        # Re-add as soon as the removal has gone through
+                        self.readiness.call_until_success(
+                            f"Lambda permission {statement_id}",
+                            lambda: lambda_client.add_permission(
+                                FunctionName=lambda_arn,
+                                StatementId=statement_id,
+                                Action='lambda:InvokeFunction',
+                                Principal='events.amazonaws.com',
+                                SourceArn=rule_arn
+                            ),
+                            retry_on=(lambda_client.exceptions.ResourceConflictException,),
+                            timeout=30, initial_delay=0.5
                         )
                         self.print_colored(Colors.GREEN, f"   [OK] Lambda permission recreated successfully")
                     except Exception as e2:
@@ -3913,6 +4037,7 @@ class EKSClusterManager:
             )
             eks_client = session.client('eks')
             env = os.environ.copy()
+            env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
             env['AWS_ACCESS_KEY_ID'] = access_key
             env['AWS_SECRET_ACCESS_KEY'] = secret_key
             env['AWS_DEFAULT_REGION'] = region
@@ -4252,6 +4377,7 @@ class EKSClusterManager:
 
             # Set environment variables for access
             env = os.environ.copy()
+            env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
             env['AWS_ACCESS_KEY_ID'] = access_key
             env['AWS_SECRET_ACCESS_KEY'] = secret_key
             env['AWS_DEFAULT_REGION'] = region
@@ -4989,13 +5115,8 @@ class EKSClusterManager:
                     eks_client.create_addon(**create_params)
                 
                     # Wait for addon to be active
-                    waiter = eks_client.get_waiter('addon_active')
                     try:
-                        waiter.wait(
-                            clusterName=cluster_name,
-                            addonName=addon['addonName'],
-                            WaiterConfig={'Delay': 15, 'MaxAttempts': 20}
-                        )
+                        self._wait_for_addon_active(eks_client, cluster_name, addon['addonName'])
                 
                         successful_addons.append(addon['addonName'])
                         self.print_colored(Colors.GREEN, f"   [OK] {addon['addonName']} installed successfully")
@@ -5123,7 +5244,7 @@ class EKSClusterManager:
                     self.print_colored(Colors.GREEN, f"   [OK] Created custom CSI policy: {custom_policy_name}")
                 
                     # Wait for policy to be available
-                    time.sleep(5)
+                    self._wait_for_iam_policy(iam_client, custom_policy_arn)
                 
                 except Exception as e:
                     self.log_operation('ERROR', f"Failed to create custom CSI policy: {str(e)}")
@@ -5250,6 +5371,7 @@ class EKSClusterManager:
 
                 # Set environment variables for user access
                 my_env = os.environ.copy()
+                my_env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                 my_env['AWS_ACCESS_KEY_ID'] = access_key
                 my_env['AWS_SECRET_ACCESS_KEY'] = secret_key
                 my_env['AWS_DEFAULT_REGION'] = region
@@ -6190,16 +6312,14 @@ class EKSClusterManager:
             return yaml.dump(manifest, default_flow_style=False)
 
     def apply_kubernetes_manifest_fixed(self, cluster_name: str, region: str, access_key: str, secret_key: str, manifest: str) -> bool:
-            """Apply Kubernetes manifest using kubectl with proper error handling and YAML validation"""
+            """Server-side apply a Kubernetes manifest through the pooled API client with YAML validation"""
             try:
-                import tempfile
-                import subprocess
                 import yaml
 
-                # Validate YAML syntax before writing to file
+                # Validate YAML syntax before applying
                 try:
                     # This will raise yaml.YAMLError if the manifest is invalid
-                    yaml.safe_load_all(manifest)
+                    list(yaml.safe_load_all(manifest))
                 except yaml.YAMLError as e:
                     print("\n[ERROR] Invalid YAML syntax detected. Manifest will not be applied.")
                     print("[YAML ERROR]:", e)
@@ -6208,40 +6328,20 @@ class EKSClusterManager:
                     print("-"*60)
                     return False
 
-                # Create temporary file for manifest
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                    f.write(manifest)
-                    manifest_file = f.name
+                kube = get_eks_kubernetes_client(cluster_name, region, access_key, secret_key)
+                failed = [result for result in kube.apply_manifest(manifest) if not result['success']]
 
-                # Set up kubectl context
-                env = os.environ.copy()
-                env['AWS_ACCESS_KEY_ID'] = access_key
-                env['AWS_SECRET_ACCESS_KEY'] = secret_key
-                env['AWS_DEFAULT_REGION'] = region
-
-                try:
-                    # Apply manifest
-                    kubectl_cmd = ['kubectl', 'apply', '-f', manifest_file]
-                    result = subprocess.run(kubectl_cmd, capture_output=True, text=True, env=env, timeout=120)
+                if not failed:
+                    self.log_operation('INFO', f"Successfully applied manifest")
+                    return True
 
-                    if result.returncode == 0:
-                        self.log_operation('INFO', f"Successfully applied manifest")
-                        return True
-                    else:
-                        self.log_operation('ERROR', f"Failed to apply manifest: {result.stderr}")
-                        print(f"[ERROR] Failed to apply manifest: error parsing")
-                        print(f"\n[DEBUG] manifest file failed: {manifest_file}")
-                        print("[DEBUG] Manifest contents:\n" + "-"*60)
-                        with open(manifest_file, 'r') as debug_f:
-                            print(debug_f.read())
-                        print("-"*60)
-                        return False
-                finally:
-                    # Clean up
-                    try:
-                        os.unlink(manifest_file)
-                    except:
-                        pass
+                for result in failed:
+                    self.log_operation('ERROR', f"Failed to apply {result['kind']} {result['name']}: {result['error']}")
+                print(f"[ERROR] Failed to apply manifest: {failed[0]['error']}")
+                print("[DEBUG] Manifest contents:\n" + "-"*60)
+                print(manifest)
+                print("-"*60)
+                return False
 
             except Exception as e:
                 self.log_operation('ERROR', f"Failed to apply Kubernetes manifest: {str(e)}")
@@ -6251,28 +6351,23 @@ class EKSClusterManager:
     def wait_for_daemonset_ready_fixed(self, cluster_name: str, region: str, access_key: str, secret_key: str, namespace: str, daemonset_name: str, timeout: int = 300) -> bool:
             """Wait for DaemonSet to be ready with improved error handling"""
             try:
-                import subprocess
-        
-                env = os.environ.copy()
-                env['AWS_ACCESS_KEY_ID'] = access_key
-                env['AWS_SECRET_ACCESS_KEY'] = secret_key
-                env['AWS_DEFAULT_REGION'] = region
-    
+                kube = get_eks_kubernetes_client(cluster_name, region, access_key, secret_key)
+
+                def pods_ready():
+                    pods = kube.list_items('pods', namespace, f'name={daemonset_name}')
+                    return bool(pods) and all(
+                        any(condition.get('type') == 'Ready' and condition.get('status') == 'True'
+                            for condition in pod.get('status', {}).get('conditions', []))
+                        for pod in pods
+                    )
+
                 # Wait for DaemonSet pods to be ready
-                wait_cmd = [
-                    'kubectl', 'wait', '--for=condition=ready', 'pod',
-                    '-l', f'name={daemonset_name}',
-                    '-n', namespace,
-                    f'--timeout={timeout}s'
-                ]
-    
-                result = subprocess.run(wait_cmd, capture_output=True, text=True, env=env, timeout=timeout+30)
-    
-                if result.returncode == 0:
+                if self.readiness.wait_for(f"DaemonSet {daemonset_name} pods ready", pods_ready,
+                                           timeout=timeout, initial_delay=5, raise_on_timeout=False):
                     self.log_operation('INFO', f"DaemonSet {daemonset_name} is ready")
                     return True
                 else:
-                    self.log_operation('WARNING', f"DaemonSet {daemonset_name} not ready within timeout: {result.stderr}")
+                    self.log_operation('WARNING', f"DaemonSet {daemonset_name} not ready within timeout")
                     # Still return True as it might work eventually
                     return True
         
@@ -6298,6 +6393,7 @@ class EKSClusterManager:
         
                 # Set environment variables for admin access
                 env = os.environ.copy()
+                env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                 env['AWS_ACCESS_KEY_ID'] = access_key
                 env['AWS_SECRET_ACCESS_KEY'] = secret_key
                 env['AWS_DEFAULT_REGION'] = region
@@ -6389,6 +6485,7 @@ class EKSClusterManager:
     
                 # Set environment variables for admin access
                 env = os.environ.copy()
+                env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                 env['AWS_ACCESS_KEY_ID'] = access_key
                 env['AWS_SECRET_ACCESS_KEY'] = secret_key
                 env['AWS_DEFAULT_REGION'] = region
@@ -6459,37 +6556,27 @@ class EKSClusterManager:
                         self.print_colored(Colors.CYAN, f"   [DELETE] Forcefully deleted existing DaemonSet")
                 
                         # Wait for deletion to complete
-                        import time
-                        time.sleep(10)  # Increased wait time for proper deletion
-                
-                        # Verify deletion has completed
-                        verify_cmd = ['kubectl', 'get', 'daemonset', 'cloudwatch-agent', 
-                                     '-n', 'amazon-cloudwatch', '--no-headers']
-                        verify_result = subprocess.run(verify_cmd, env=env, capture_output=True, text=True, timeout=30)
-                
-                        if verify_result.returncode == 0 and verify_result.stdout.strip():
-                            self.print_colored(Colors.YELLOW, "   [WARN] DaemonSet still exists, waiting longer...")
-                            time.sleep(10)  # Wait more if it still exists
+                        if not self._wait_for_kube_resource_deleted('daemonset', 'cloudwatch-agent',
+                                                                    'amazon-cloudwatch', env):
+                            self.print_colored(Colors.YELLOW, "   [WARN] DaemonSet still exists, continuing anyway...")
                     else:
                         self.print_colored(Colors.CYAN, "   [OK] No existing DaemonSet found, proceeding with creation")
         
                     # 5. Apply DaemonSet manifest with retry
-                    max_retries = 2
-                    for attempt in range(max_retries):
-                        self.print_colored(Colors.CYAN, f"   [PACKAGE] Creating CloudWatch DaemonSet (attempt {attempt+1}/{max_retries})...")
-                        daemonset_success = self.apply_kubernetes_manifest_fixed(
+                    self.print_colored(Colors.CYAN, f"   [PACKAGE] Creating CloudWatch DaemonSet...")
+                    daemonset_success = self.readiness.wait_for(
+                        "CloudWatch agent DaemonSet applied",
+                        lambda: self.apply_kubernetes_manifest_fixed(
                             cluster_name, region, access_key, secret_key, daemonset_manifest
-                        )
+                        ),
+                        timeout=60, initial_delay=5, raise_on_timeout=False
+                    )
                 
-                        if daemonset_success:
-                            self.print_colored(Colors.GREEN, "   [OK] CloudWatch agent DaemonSet deployed successfully")
-                            break
-                        elif attempt < max_retries - 1:
-                            self.print_colored(Colors.YELLOW, f"   [WARN] Deployment failed, retrying in 5 seconds...")
-                            time.sleep(5)
-                        else:
-                            self.print_colored(Colors.RED, "   [ERROR] Failed to deploy CloudWatch agent DaemonSet after retries")
-                            return False
+                    if daemonset_success:
+                        self.print_colored(Colors.GREEN, "   [OK] CloudWatch agent DaemonSet deployed successfully")
+                    else:
+                        self.print_colored(Colors.RED, "   [ERROR] Failed to deploy CloudWatch agent DaemonSet after retries")
+                        return False
         
                     # 6. Wait for DaemonSet to be ready
                     self.print_colored(Colors.CYAN, "   [WAIT] Waiting for CloudWatch agent DaemonSet to be ready...")
@@ -6804,19 +6891,17 @@ class EKSClusterManager:
             with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                 zip_file.writestr('index.py', lambda_code)
 
-            zip_buffer.seek(0)
+            zip_content = zip_buffer.getvalue()
 
             try:
-                # Wait for role to be available
-                time.sleep(10)
-
-                # Create Lambda function
-                lambda_response = lambda_client.create_function(
+                # Create Lambda function (retried until a new role can be assumed)
+                lambda_response = self._create_lambda_function(
+                    lambda_client, lambda_role_name,
                     FunctionName=function_name,
                     Runtime='python3.9',
                     Role=lambda_role_arn,
                     Handler='index.lambda_handler',
-                    Code={'ZipFile': zip_buffer.read()},
+                    Code={'ZipFile': zip_content},
                     Description=f'Scheduled scaling for EKS cluster {cluster_name} nodegroups',
                     Timeout=60
                 )
@@ -6828,7 +6913,7 @@ class EKSClusterManager:
                 # Function already exists - update the code
                 lambda_client.update_function_code(
                     FunctionName=function_name,
-                    ZipFile=zip_buffer.read()
+                    ZipFile=zip_content
                 )
                 function_response = lambda_client.get_function(FunctionName=function_name)
                 function_arn = function_response['Configuration']['FunctionArn']
@@ -7217,25 +7302,22 @@ class EKSClusterManager:
             # Create a zip file with the lambda code
             import io
             import zipfile
-            import time
 
             zip_buffer = io.BytesIO()
             with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                 zip_file.writestr('index.py', lambda_code)
     
-            zip_buffer.seek(0)
+            zip_content = zip_buffer.getvalue()
 
             try:
-                # Wait for role to be available
-                time.sleep(10)
-    
-                # Create Lambda function
-                lambda_response = lambda_client.create_function(
+                # Create Lambda function (retried until a new role can be assumed)
+                lambda_response = self._create_lambda_function(
+                    lambda_client, lambda_role_name,
                     FunctionName=function_name,
                     Runtime='python3.9',
                     Role=lambda_role_arn,
                     Handler='index.lambda_handler',
-                    Code={'ZipFile': zip_buffer.read()},
+                    Code={'ZipFile': zip_content},
                     Description=f'Scheduled scaling for EKS cluster {cluster_name} nodegroups',
                     Timeout=60
                 )
@@ -7248,7 +7330,7 @@ class EKSClusterManager:
                 zip_buffer.seek(0)  # Reset buffer position
                 lambda_client.update_function_code(
                     FunctionName=function_name,
-                    ZipFile=zip_buffer.read()
+                    ZipFile=zip_content
                 )
                 function_response = lambda_client.get_function(FunctionName=function_name)
                 function_arn = function_response['Configuration']['FunctionArn']
@@ -7563,12 +7645,7 @@ class EKSClusterManager:
                     )
                 
                     # Wait for addon to be active
-                    waiter = eks_client.get_waiter('addon_active')
-                    waiter.wait(
-                        clusterName=cluster_name,
-                        addonName='aws-efs-csi-driver',
-                        WaiterConfig={'Delay': 15, 'MaxAttempts': 20}
-                    )
+                    self._wait_for_addon_active(eks_client, cluster_name, 'aws-efs-csi-driver')
                 
                     self.print_colored(Colors.GREEN, f"   [OK] Amazon EFS CSI Driver installed successfully")
                     self.log_operation('INFO', f"Amazon EFS CSI Driver installed successfully for {cluster_name}")
@@ -7597,6 +7674,7 @@ class EKSClusterManager:
                 else:
                     # Setup environment
                     env = os.environ.copy()
+                    env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                     env['AWS_ACCESS_KEY_ID'] = admin_access_key
                     env['AWS_SECRET_ACCESS_KEY'] = admin_secret_key
                     env['AWS_DEFAULT_REGION'] = region
@@ -7720,12 +7798,7 @@ class EKSClusterManager:
                     )
                 
                     # Wait for addon to be active
-                    waiter = eks_client.get_waiter('addon_active')
-                    waiter.wait(
-                        clusterName=cluster_name,
-                        addonName='eks-pod-identity-agent',
-                        WaiterConfig={'Delay': 15, 'MaxAttempts': 20}
-                    )
+                    self._wait_for_addon_active(eks_client, cluster_name, 'eks-pod-identity-agent')
                 
                     self.print_colored(Colors.GREEN, f"   [OK] Amazon EKS Pod Identity Agent installed successfully")
                     self.log_operation('INFO', f"Amazon EKS Pod Identity Agent installed successfully for {cluster_name}")
@@ -7986,6 +8059,7 @@ class EKSClusterManager:
         
                 if kubectl_available:
                     env = os.environ.copy()
+                    env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                     env['AWS_ACCESS_KEY_ID'] = access_key
                     env['AWS_SECRET_ACCESS_KEY'] = secret_key
                     env['AWS_DEFAULT_REGION'] = region
@@ -8387,6 +8461,7 @@ class EKSClusterManager:
 
             # Set environment variables for access
             env = os.environ.copy()
+            env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
             env['AWS_ACCESS_KEY_ID'] = access_key
             env['AWS_SECRET_ACCESS_KEY'] = secret_key
             env['AWS_DEFAULT_REGION'] = region
@@ -8461,6 +8536,7 @@ class EKSClusterManager:
         
                 # Set environment variables for access
                 env = os.environ.copy()
+                env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                 env['AWS_ACCESS_KEY_ID'] = access_key
                 env['AWS_SECRET_ACCESS_KEY'] = secret_key
                 env['AWS_DEFAULT_REGION'] = region
@@ -8559,6 +8635,7 @@ class EKSClusterManager:
                     return False
         
                 env = os.environ.copy()
+                env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                 env['AWS_ACCESS_KEY_ID'] = access_key
                 env['AWS_SECRET_ACCESS_KEY'] = secret_key
                 env['AWS_DEFAULT_REGION'] = region
@@ -8682,6 +8759,7 @@ class EKSClusterManager:
                 return False
     
             env = os.environ.copy()
+            env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
             env['AWS_ACCESS_KEY_ID'] = access_key
             env['AWS_SECRET_ACCESS_KEY'] = secret_key
             env['AWS_DEFAULT_REGION'] = region
@@ -8781,6 +8859,7 @@ class EKSClusterManager:
     
                 # Set environment variables for admin access
                 env = os.environ.copy()
+                env['KUBECONFIG'] = self.cluster_kubeconfig_path(cluster_name, region)
                 env['AWS_ACCESS_KEY_ID'] = admin_access_key
                 env['AWS_SECRET_ACCESS_KEY'] = admin_secret_key
                 env['AWS_DEFAULT_REGION'] = region
@@ -8832,7 +8911,15 @@ class EKSClusterManager:
                 
                         # Wait for addon to be active
                         self.print_colored(Colors.CYAN, "   [WAIT] Waiting for Container Insights add-on to be active...")
-                        time.sleep(30)
+                        try:
+                            eks_client = boto3.Session(
+                                aws_access_key_id=admin_access_key,
+                                aws_secret_access_key=admin_secret_key,
+                                region_name=region
+                            ).client('eks')
+                            self._wait_for_addon_active(eks_client, cluster_name, 'amazon-cloudwatch-observability')
+                        except Exception as wait_error:
+                            self.print_colored(Colors.YELLOW, f"   [WARN] Container Insights add-on not active yet: {wait_error}")
                 
                         return True
                     else:
@@ -8921,7 +9008,7 @@ class EKSClusterManager:
         
                 # FIXED: Wait longer for pods to be created and check status
                 self.print_colored(Colors.CYAN, "   [WAIT] Waiting for Container Insights pods to start...")
-                time.sleep(45)  # Increased wait time
+                self._wait_for_pods_running('amazon-cloudwatch', env)
         
                 if success_count >= 2:  # At least 2 manifests applied successfully
                     self.print_colored(Colors.GREEN, f"   [OK] Container Insights deployed manually ({success_count}/{len(manifests)} manifests applied)")
@@ -9069,6 +9156,192 @@ class EKSClusterManager:
 
 ########
 
+    def configure_cluster_interactively(self, config: Dict) -> List[Dict]:
+        """
+        Prompt for the nodegroup strategy, sizing, subnets and add-ons of a cluster.
+
+        Args:
+            config: Cluster configuration; config['nodegroup_configs'] is filled in
+
+        Returns:
+            List[Dict]: The generated nodegroup configs
+        """
+        cluster_name = config.get('cluster_name')
+        username = config.get('username', 'unknown')
+
+        # Step 1: Interactive configuration prompts
+        print("\n" + "="*60)
+        print("[COMPUTE] CLUSTER CONFIGURATION")
+        print("="*60)
+
+        # 1.1 Ask for nodegroup strategy
+        print("\n🔄 Nodegroup Strategy Selection:")
+        print("1. On-demand (reliable, consistent performance, higher cost)")
+        print("2. Spot (cheaper, but can be terminated, best for non-critical workloads)")
+        print("3. Mixed (combination of on-demand and spot for balance)")
+
+        default_strategy = config.get('strategy', 'on-demand')
+        default_choice = "1" if default_strategy == "on-demand" else "2" if default_strategy == "spot" else "3"
+
+        while True:
+            strategy_choice = input(f"Select nodegroup strategy (1-3) [default: {default_choice}]: ").strip()
+            if not strategy_choice:
+                strategy_choice = default_choice
+
+            if strategy_choice == "1":
+                strategy = "on-demand"
+                break
+            elif strategy_choice == "2":
+                strategy = "spot"
+                break
+            elif strategy_choice == "3":
+                strategy = "mixed"
+                break
+            else:
+                print("[ERROR] Invalid choice. Please enter 1, 2, or 3.")
+
+        self.print_colored(Colors.GREEN, f"[OK] Selected nodegroup strategy: {strategy.upper()}")
+
+        # 1.2 Select instance type
+        instance_type = self.select_instance_type(username)
+
+        # 1.3 Configure nodegroup sizing
+        print("\n🔢 Nodegroup Sizing:")
+        default_min = config.get('min_size', 1)
+        default_desired = config.get('desired_size', 1)
+        default_max = config.get('max_size', 3)
+
+        try:
+            min_size = int(input(f"Minimum nodes [default: {default_min}]: ").strip() or default_min)
+            desired_size = int(input(f"Desired nodes [default: {default_desired}]: ").strip() or default_desired)
+            max_size = int(input(f"Maximum nodes [default: {default_max}]: ").strip() or default_max)
+
+            # Validate values
+            if min_size < 0 or desired_size < 0 or max_size < 0:
+                print("[ERROR] Negative values are not allowed. Using defaults.")
+                min_size, desired_size, max_size = default_min, default_desired, default_max
+
+            if min_size > desired_size or desired_size > max_size:
+                print("[ERROR] Invalid values (should be min ≤ desired ≤ max). Adjusting...")
+                max_size = max(max_size, desired_size, min_size)
+                min_size = min(min_size, desired_size)
+                desired_size = max(min_size, min(desired_size, max_size))
+
+        except ValueError:
+            print("[ERROR] Invalid number format. Using defaults.")
+            min_size, desired_size, max_size = default_min, default_desired, default_max
+
+        self.print_colored(Colors.GREEN, f"[OK] Nodegroup sizing: Min={min_size}, Desired={desired_size}, Max={max_size}")
+
+        # 1.4 For mixed strategy, ask for on-demand percentage
+        instance_selections = {}
+        if strategy == 'mixed':
+            print("\n[STATS] Mixed Strategy Configuration:")
+            default_percentage = 30
+            try:
+                on_demand_percentage = int(input(f"Percentage of On-Demand capacity (0-100) [default: {default_percentage}%]: ").strip() or default_percentage)
+                if on_demand_percentage < 0 or on_demand_percentage > 100:
+                    print("[ERROR] Percentage must be between 0 and 100. Using default.")
+                    on_demand_percentage = default_percentage
+            except ValueError:
+                print("[ERROR] Invalid number format. Using default percentage.")
+                on_demand_percentage = default_percentage
+
+            # Create instance selections for mixed strategy
+            instance_selections = {
+                'on-demand': [instance_type],
+                'spot': self.get_diversified_instance_types(instance_type),
+                'on_demand_percentage': on_demand_percentage
+            }
+
+            self.print_colored(Colors.GREEN, f"[OK] Mixed strategy: {on_demand_percentage}% On-Demand, {100-on_demand_percentage}% Spot")
+
+        elif strategy == 'spot':
+            # Use diversified instance types for better spot availability
+            instance_selections = {
+                'spot': self.get_diversified_instance_types(instance_type)
+            }
+            spot_types = ', '.join(instance_selections['spot'])
+            self.print_colored(Colors.GREEN, f"[OK] Spot instance types: {spot_types}")
+
+        elif strategy == 'on-demand':
+            print("\n[COMPUTE] On-Demand Instance Configuration:", instance_type)
+            instance_selections = {
+                'on-demand': [instance_type]
+            }
+
+
+        # 1.5 Subnet preference
+        print("\n[NETWORK] Subnet Preference:")
+        print("1. Auto (use all available subnets)")
+        print("2. Public (prefer public subnets)")
+        print("3. Private (prefer private subnets)")
+
+        default_subnet = "1"
+        subnet_choice = input(f"Select subnet preference (1-3) [default: {default_subnet}]: ").strip()
+        if not subnet_choice:
+            subnet_choice = default_subnet
+
+        if subnet_choice == "1":
+            subnet_preference = "auto"
+        elif subnet_choice == "2":
+            subnet_preference = "public"
+        elif subnet_choice == "3":
+            subnet_preference = "private"
+        else:
+            subnet_preference = "auto"
+
+        self.print_colored(Colors.GREEN, f"[OK] Subnet preference: {subnet_preference.upper()}")
+
+        # Create a single nodegroup config
+        nodegroup_name = self.generate_nodegroup_name(cluster_name, strategy)
+        nodegroup_configs = [{
+            'name': nodegroup_name,
+            'strategy': strategy,
+            'min_nodes': min_size,
+            'desired_nodes': desired_size,
+            'max_nodes': max_size,
+            'instance_selections': instance_selections,
+            'subnet_preference': subnet_preference
+        }]
+
+        # Update config with the created nodegroup config
+        config['nodegroup_configs'] = nodegroup_configs
+        self.log_operation('DEBUG', f"Generated nodegroup_configs: {nodegroup_configs}")
+
+        # 1.6 Ask for add-ons and Container Insights
+        if not hasattr(self, 'setup_addons') or not hasattr(self, 'setup_container_insights'):
+            # Ask once and store for all future cluster creations
+            print("\n" + "="*60)
+            print("[PACKAGE] CLUSTER ADD-ONS CONFIGURATION")
+            print("="*60)
+            self.setup_addons = config.get('install_addons', True)
+            self.setup_container_insights = config.get('enable_container_insights', True)
+
+            if self.setup_addons:
+                self.print_colored(Colors.GREEN, "[OK] Essential add-ons will be installed")
+            else:
+                self.print_colored(Colors.YELLOW, "[WARN] Essential add-ons will NOT be installed")
+    
+            if self.setup_container_insights:
+                self.print_colored(Colors.GREEN, "[OK] CloudWatch Container Insights will be enabled")
+            else:
+                self.print_colored(Colors.YELLOW, "[WARN] CloudWatch Container Insights will NOT be enabled")
+
+        # Display cost estimation based on selected configuration
+        for ng_config in nodegroup_configs:
+            # Get primary instance type
+            if ng_config['strategy'] == 'on-demand':
+                primary_instance = ng_config['instance_selections'].get('on-demand', [instance_type])[0]
+            elif ng_config['strategy'] == 'spot':
+                primary_instance = ng_config['instance_selections'].get('spot', [instance_type])[0]
+            else:
+                primary_instance = ng_config['instance_selections'].get('on-demand', [instance_type])[0]
+
+            self.display_cost_estimation(primary_instance, ng_config['strategy'], ng_config['desired_nodes'])
+
+        return nodegroup_configs
+
     def create_cluster(self, config: Dict) -> bool:
         """
         Create EKS cluster with nodegroups based on provided configuration.
@@ -9105,181 +9378,12 @@ class EKSClusterManager:
 
             # Skip interactive configuration if nodegroup_configs are already provided
             if not nodegroup_configs:
-                # Step 1: Interactive configuration prompts
-                print("\n" + "="*60)
-                print("[COMPUTE] CLUSTER CONFIGURATION")
-                print("="*60)
-    
-                # 1.1 Ask for nodegroup strategy
-                print("\n🔄 Nodegroup Strategy Selection:")
-                print("1. On-demand (reliable, consistent performance, higher cost)")
-                print("2. Spot (cheaper, but can be terminated, best for non-critical workloads)")
-                print("3. Mixed (combination of on-demand and spot for balance)")
-    
-                default_strategy = config.get('strategy', 'on-demand')
-                default_choice = "1" if default_strategy == "on-demand" else "2" if default_strategy == "spot" else "3"
-    
-                while True:
-                    strategy_choice = input(f"Select nodegroup strategy (1-3) [default: {default_choice}]: ").strip()
-                    if not strategy_choice:
-                        strategy_choice = default_choice
-        
-                    if strategy_choice == "1":
-                        strategy = "on-demand"
-                        break
-                    elif strategy_choice == "2":
-                        strategy = "spot"
-                        break
-                    elif strategy_choice == "3":
-                        strategy = "mixed"
-                        break
-                    else:
-                        print("[ERROR] Invalid choice. Please enter 1, 2, or 3.")
-    
-                self.print_colored(Colors.GREEN, f"[OK] Selected nodegroup strategy: {strategy.upper()}")
-    
-                # 1.2 Select instance type
-                instance_type = self.select_instance_type(username)
-    
-                # 1.3 Configure nodegroup sizing
-                print("\n🔢 Nodegroup Sizing:")
-                default_min = config.get('min_size', 1)
-                default_desired = config.get('desired_size', 1)
-                default_max = config.get('max_size', 3)
-    
-                try:
-                    min_size = int(input(f"Minimum nodes [default: {default_min}]: ").strip() or default_min)
-                    desired_size = int(input(f"Desired nodes [default: {default_desired}]: ").strip() or default_desired)
-                    max_size = int(input(f"Maximum nodes [default: {default_max}]: ").strip() or default_max)
-        
-                    # Validate values
-                    if min_size < 0 or desired_size < 0 or max_size < 0:
-                        print("[ERROR] Negative values are not allowed. Using defaults.")
-                        min_size, desired_size, max_size = default_min, default_desired, default_max
-        
-                    if min_size > desired_size or desired_size > max_size:
-                        print("[ERROR] Invalid values (should be min ≤ desired ≤ max). Adjusting...")
-                        max_size = max(max_size, desired_size, min_size)
-                        min_size = min(min_size, desired_size)
-                        desired_size = max(min_size, min(desired_size, max_size))
-        
-                except ValueError:
-                    print("[ERROR] Invalid number format. Using defaults.")
-                    min_size, desired_size, max_size = default_min, default_desired, default_max
-    
-                self.print_colored(Colors.GREEN, f"[OK] Nodegroup sizing: Min={min_size}, Desired={desired_size}, Max={max_size}")
-    
-                # 1.4 For mixed strategy, ask for on-demand percentage
-                instance_selections = {}
-                if strategy == 'mixed':
-                    print("\n[STATS] Mixed Strategy Configuration:")
-                    default_percentage = 30
-                    try:
-                        on_demand_percentage = int(input(f"Percentage of On-Demand capacity (0-100) [default: {default_percentage}%]: ").strip() or default_percentage)
-                        if on_demand_percentage < 0 or on_demand_percentage > 100:
-                            print("[ERROR] Percentage must be between 0 and 100. Using default.")
-                            on_demand_percentage = default_percentage
-                    except ValueError:
-                        print("[ERROR] Invalid number format. Using default percentage.")
-                        on_demand_percentage = default_percentage
-        
-                    # Create instance selections for mixed strategy
-                    instance_selections = {
-                        'on-demand': [instance_type],
-                        'spot': self.get_diversified_instance_types(instance_type),
-                        'on_demand_percentage': on_demand_percentage
-                    }
-        
-                    self.print_colored(Colors.GREEN, f"[OK] Mixed strategy: {on_demand_percentage}% On-Demand, {100-on_demand_percentage}% Spot")
-        
-                elif strategy == 'spot':
-                    # Use diversified instance types for better spot availability
-                    instance_selections = {
-                        'spot': self.get_diversified_instance_types(instance_type)
-                    }
-                    spot_types = ', '.join(instance_selections['spot'])
-                    self.print_colored(Colors.GREEN, f"[OK] Spot instance types: {spot_types}")
-        
-                elif strategy == 'on-demand':
-                    print("\n[COMPUTE] On-Demand Instance Configuration:", instance_type)
-                    instance_selections = {
-                        'on-demand': [instance_type]
-                    }
-
-    
-                # 1.5 Subnet preference
-                print("\n[NETWORK] Subnet Preference:")
-                print("1. Auto (use all available subnets)")
-                print("2. Public (prefer public subnets)")
-                print("3. Private (prefer private subnets)")
-    
-                default_subnet = "1"
-                subnet_choice = input(f"Select subnet preference (1-3) [default: {default_subnet}]: ").strip()
-                if not subnet_choice:
-                    subnet_choice = default_subnet
-        
-                if subnet_choice == "1":
-                    subnet_preference = "auto"
-                elif subnet_choice == "2":
-                    subnet_preference = "public"
-                elif subnet_choice == "3":
-                    subnet_preference = "private"
-                else:
-                    subnet_preference = "auto"
-        
-                self.print_colored(Colors.GREEN, f"[OK] Subnet preference: {subnet_preference.upper()}")
-    
-                # Create a single nodegroup config
-                nodegroup_name = self.generate_nodegroup_name(cluster_name, strategy)
-                nodegroup_configs = [{
-                    'name': nodegroup_name,
-                    'strategy': strategy,
-                    'min_nodes': min_size,
-                    'desired_nodes': desired_size,
-                    'max_nodes': max_size,
-                    'instance_selections': instance_selections,
-                    'subnet_preference': subnet_preference
-                }]
-    
-                # Update config with the created nodegroup config
-                config['nodegroup_configs'] = nodegroup_configs
-                self.log_operation('DEBUG', f"Generated nodegroup_configs: {nodegroup_configs}")
-    
-                # 1.6 Ask for add-ons and Container Insights
-                if not hasattr(self, 'setup_addons') or not hasattr(self, 'setup_container_insights'):
-                    # Ask once and store for all future cluster creations
-                    print("\n" + "="*60)
-                    print("[PACKAGE] CLUSTER ADD-ONS CONFIGURATION")
-                    print("="*60)
-                    self.setup_addons = config.get('install_addons', True)
-                    self.setup_container_insights = config.get('enable_container_insights', True)
-        
-                    if self.setup_addons:
-                        self.print_colored(Colors.GREEN, "[OK] Essential add-ons will be installed")
-                    else:
-                        self.print_colored(Colors.YELLOW, "[WARN] Essential add-ons will NOT be installed")
-            
-                    if self.setup_container_insights:
-                        self.print_colored(Colors.GREEN, "[OK] CloudWatch Container Insights will be enabled")
-                    else:
-                        self.print_colored(Colors.YELLOW, "[WARN] CloudWatch Container Insights will NOT be enabled")
-    
-                # Display cost estimation based on selected configuration
-                for ng_config in nodegroup_configs:
-                    # Get primary instance type
-                    if ng_config['strategy'] == 'on-demand':
-                        primary_instance = ng_config['instance_selections'].get('on-demand', [instance_type])[0]
-                    elif ng_config['strategy'] == 'spot':
-                        primary_instance = ng_config['instance_selections'].get('spot', [instance_type])[0]
-                    else:
-                        primary_instance = ng_config['instance_selections'].get('on-demand', [instance_type])[0]
-        
-                    self.display_cost_estimation(primary_instance, ng_config['strategy'], ng_config['desired_nodes'])
+                nodegroup_configs = self.configure_cluster_interactively(config)
             else:
                 # We already have nodegroup configs (likely from multi-nodegroup workflow)
                 # Just extract the key data we need for further processing
                 self.log_operation('INFO', f"Using existing nodegroup_configs: {nodegroup_configs}")
-                strategy = nodegroup_configs[0]['strategy']  # Use the strategy from the first nodegroup
+            strategy = nodegroup_configs[0]['strategy']  # Use the strategy from the first nodegroup
 
             # Final confirmation
             print("\n" + "="*60)
@@ -9334,15 +9438,21 @@ class EKSClusterManager:
                 account_id = sts_client.get_caller_identity()['Account']
                 self.log_operation('INFO', f"Detected Account ID: {account_id}")
 
-            # Step 3: Ensure IAM roles exist
-            self.print_colored(Colors.CYAN, "   [LOCKED] Setting up IAM roles...")
-            eks_role_arn, node_role_arn = self.ensure_iam_roles(iam_client, account_id)
+            # Steps 3-4 create shared resources; clusters take turns so they do not race to create
+            # duplicate roles (account-wide, so across regions too) or VPC resources (per region)
+            self._set_cluster_phase(cluster_name, 'setup')
+            with self._get_setup_lock(account_id):
+                # Step 3: Ensure IAM roles exist
+                self.print_colored(Colors.CYAN, "   [LOCKED] Setting up IAM roles...")
+                eks_role_arn, node_role_arn = self.ensure_iam_roles(iam_client, account_id)
 
-            # Step 4: Get or create VPC resources
-            self.print_colored(Colors.CYAN, "   [NETWORK] Setting up networking resources...")
-            subnet_ids, security_group_id = self.get_or_create_vpc_resources(ec2_client, region)
+            with self._get_setup_lock(account_id, region):
+                # Step 4: Get or create VPC resources
+                self.print_colored(Colors.CYAN, "   [NETWORK] Setting up networking resources...")
+                subnet_ids, security_group_id = self.get_or_create_vpc_resources(ec2_client, region)
 
             # Step 5: Create EKS control plane
+            self._set_cluster_phase(cluster_name, 'control_plane')
             self.print_colored(Colors.CYAN, f"   [START] Creating EKS control plane {cluster_name}...")
 
             # Set default EKS version - adjust based on your requirements
@@ -9391,11 +9501,7 @@ class EKSClusterManager:
 
                     # Wait for cluster to be active
                     self.print_colored(Colors.CYAN, f"   [WAIT] Waiting for cluster {cluster_name} to be active...")
-                    waiter = eks_client.get_waiter('cluster_active')
-                    waiter.wait(
-                        name=cluster_name,
-                        WaiterConfig={'Delay': 30, 'MaxAttempts': 40}
-                    )
+                    self._wait_for_cluster_active(eks_client, cluster_name)
         
                     self.print_colored(Colors.GREEN, f"   [OK] EKS control plane {cluster_name} is now active")
                     self.log_operation('INFO', f"EKS control plane {cluster_name} created successfully")
@@ -9411,16 +9517,19 @@ class EKSClusterManager:
             #     cluster_name, region, account_id, config, access_key, secret_key
             # )
 
+            self._set_cluster_phase(cluster_name, 'access')
             auth_configured = self.enable_cluster_access_modes(cluster_name, region, account_id, config,
-                                                            access_key, secret_key)
+                                                               access_key, secret_key)
 
             # Step 7: Create nodegroups based on strategy
+            self._set_cluster_phase(cluster_name, 'nodegroups')
             self.print_colored(Colors.CYAN, f"   [START] Creating nodegroups with {strategy} strategy...")
 
             # Generate nodegroup name
             ami_type = config.get('ami_type', 'AL2_x86_64')  # Amazon Linux 2 x86_64
             key_name = self.eks_ssh_keypair_name
-            ec2_key_name = self.ensure_ec2_key_pair(ec2_client, key_name)
+            with self._get_setup_lock(account_id, region):
+                ec2_key_name = self.ensure_ec2_key_pair(ec2_client, key_name)
 
             # Create nodegroup(s) based on strategy
             nodegroups_created = []
@@ -9494,6 +9603,8 @@ class EKSClusterManager:
                 self.print_colored(Colors.RED, f"[ERROR] Failed to create nodegroups: {str(e)}")
                 return False
 
+            # Steps 8-13 drive kubectl against this cluster's own kubeconfig (cluster_kubeconfig_path)
+
             # Step 8: Verify user access to the cluster
             print("\n[SECURE] Step 8: Verify user access...")
             self.print_colored(Colors.CYAN, "   [SCAN] Verifying user access...")
@@ -9536,6 +9647,7 @@ class EKSClusterManager:
 
             # Step 10: Install essential add-ons if confirmed by user
             print("\n[SECURE] Step 10: Setting up add ons...")
+            self._set_cluster_phase(cluster_name, 'addons')
             if self.setup_addons:
                 self.print_colored(Colors.CYAN, "   [PACKAGE] Installing essential add-ons...")
                 addons_installed = self.install_essential_addons(
@@ -9548,6 +9660,7 @@ class EKSClusterManager:
 
             # Step 11: Set up and verify all components
             print("\n[SECURE] Step 11: Setting up and Verify all components...")
+            self._set_cluster_phase(cluster_name, 'components')
             components_status = self.setup_and_verify_all_components(
                 cluster_name, region, access_key, secret_key, account_id, nodegroups_created,self.setup_container_insights
             )
@@ -9561,11 +9674,14 @@ class EKSClusterManager:
 
             # Step 13: Perform health check
             print("\n[SECURE] Step 13: Peform cluster health check...")
+            self._set_cluster_phase(cluster_name, 'health_check')
             self.print_colored(Colors.CYAN, "   🏥 Running health check...")
             initial_health_check = self.health_check_cluster(
                 cluster_name, region, access_key, secret_key
             )
 
+            self.update_default_kubeconfig(cluster_name, region, access_key, secret_key)
+
             # Save cluster details for future use
             features_status = {
                 'eks_version': eks_version,
@@ -9710,8 +9826,47 @@ class EKSClusterManager:
                     'kubectl', 'label', 'node', n['name'], 'NO_DELETE=true', '--overwrite'
                 ], check=True, env=env)
 
+    def _set_cluster_phase(self, cluster_name: str, phase: str) -> None:
+        """Report a create_cluster phase change to the multi-cluster progress table (if one is running)"""
+        if self.creation_progress is not None:
+            self.creation_progress.update(cluster_name, phase)
+
+    def _get_setup_lock(self, account_id: str, region: str = None) -> threading.Lock:
+        """Lock serialising creation of shared resources: per account for IAM (region=None),
+        per account and region for VPC resources and key pairs"""
+        with self._setup_locks_guard:
+            return self._setup_locks.setdefault((account_id, region), threading.Lock())
+
+    def cluster_kubeconfig_path(self, cluster_name: str, region: str) -> str:
+        """Kubeconfig file of one cluster, so concurrent setups never switch each other's current context"""
+        kubeconfig_dir = os.path.join(os.path.expanduser('~'), '.kube', 'eks-cluster-manager')
+        os.makedirs(kubeconfig_dir, exist_ok=True)
+        return os.path.join(kubeconfig_dir, f"{region}_{cluster_name}.config")
+
+    def update_default_kubeconfig(self, cluster_name: str, region: str, access_key: str, secret_key: str) -> bool:
+        """Add the cluster's context to the shared kubeconfig (~/.kube/config) for the user"""
+        env = os.environ.copy()
+        env['AWS_ACCESS_KEY_ID'] = access_key
+        env['AWS_SECRET_ACCESS_KEY'] = secret_key
+        env['AWS_DEFAULT_REGION'] = region
+
+        update_cmd = ['aws', 'eks', 'update-kubeconfig', '--region', region, '--name', cluster_name]
+        try:
+            # Concurrent update-kubeconfig runs would overwrite each other's entries in the shared file
+            with self._kubeconfig_lock:
+                result = subprocess.run(update_cmd, env=env, capture_output=True, text=True, timeout=120)
+        except Exception as e:
+            self.log_operation('WARNING', f"Could not add {cluster_name} to the default kubeconfig: {e}")
+            return False
+
+        if result.returncode != 0:
+            self.log_operation('WARNING', f"Could not add {cluster_name} to the default kubeconfig: {result.stderr}")
+            return False
+        self.log_operation('INFO', f"Added {cluster_name} to the default kubeconfig")
+        return True
+
     def create_multiple_clusters(self, cluster_configs: List[Dict]) -> bool:
-        """Create multiple clusters with shared configuration and enhanced error handling"""
+        """Create multiple clusters concurrently with shared configuration and enhanced error handling"""
         if not cluster_configs:
             self.logger.warning("No clusters configured to create")
             return False
@@ -9732,22 +9887,38 @@ class EKSClusterManager:
             region = config.get('region', 'unknown')
             self.logger.info(f"  {i}. {cluster_name} - Region: {region}, User: {username}")
     
-        # Create all clusters with shared configuration
         total_clusters = len(cluster_configs)
-        print(f"\n[START] Starting creation of {total_clusters} clusters...")
-    
-        for i, config in enumerate(cluster_configs, 1):
+
+        # Interactive prompts must not run inside the worker threads; answer them up front
+        for config in cluster_configs:
+            if not config.get('nodegroup_configs'):
+                self.configure_cluster_interactively(config)
+
+        # Create the clusters as a pipeline: every cluster runs its own phases (control plane,
+        # nodegroups, add-ons, Container Insights, autoscaler, alarms) while others are in theirs
+        max_workers = max(1, min(self.max_parallel_clusters, total_clusters))
+        print(f"\n[START] Starting creation of {total_clusters} clusters "
+              f"({max_workers} in flight, at most {self.max_clusters_per_account_region} per account/region)...")
+
+        cluster_names = [config.get('cluster_name', 'unnamed') for config in cluster_configs]
+        self.creation_progress = ClusterCreationProgress(cluster_names)
+        account_region_slots = {}
+        for config in cluster_configs:
+            key = (config.get('account_id', ''), config.get('region', 'unknown'))
+            if key not in account_region_slots:
+                account_region_slots[key] = threading.Semaphore(self.max_clusters_per_account_region)
+
+        def create_one(config):
             cluster_name = config.get('cluster_name', 'unnamed')
             username = config.get('username', 'unknown')
             region = config.get('region', 'unknown')
-        
-            self.logger.info(f"[{i}/{total_clusters}] Creating cluster {cluster_name} for {username} in {region}")
-            print(f"\n[{i}/{total_clusters}] [START] Creating cluster {cluster_name} for {username}...")
-        
-            try:
+
+            with account_region_slots[(config.get('account_id', ''), region)]:
+                self.logger.info(f"Creating cluster {cluster_name} for {username} in {region}")
+
                 # Create structured log entry for start of cluster creation
                 self.logger.info(json.dumps({
-                    "event": "cluster_creation_start", 
+                    "event": "cluster_creation_start",
                     "cluster_name": cluster_name,
                     "username": username,
                     "region": region,
@@ -9756,53 +9927,65 @@ class EKSClusterManager:
                     "desired_size": config.get('desired_size', 0),
                     "max_size": config.get('max_size', 0)
                 }))
-            
+
                 # Call existing create_cluster method
-                result = self.create_cluster(config)
-            
-                if result:
-                    created_clusters.append(cluster_name)
-                    self.logger.info(json.dumps({
-                        "event": "cluster_creation_success", 
-                        "cluster_name": cluster_name,
-                        "username": username
-                    }))
-                else:
-                    failed_clusters.append(cluster_name)
-                    error_message = "Create cluster method returned False"
-                    error_details[cluster_name] = error_message
-                    self.logger.error(json.dumps({
-                        "event": "cluster_creation_failure", 
-                        "cluster_name": cluster_name,
-                        "username": username,
-                        "error": error_message
-                    }))
-                
-            except Exception as e:
-                failed_clusters.append(cluster_name)
-                error_msg = str(e)
-                error_details[cluster_name] = error_msg
-            
-                # Log the full stack trace for debugging
-                import traceback
-                stack_trace = traceback.format_exc()
-                self.logger.error(json.dumps({
-                    "event": "cluster_creation_exception", 
-                    "cluster_name": cluster_name,
-                    "username": username,
-                    "error": error_msg,
-                    "stack_trace": stack_trace
-                }))
-            
-                self.print_colored(Colors.RED, f"[ERROR] Error creating cluster {cluster_name}: {error_msg}")
-            
-                # Ask if user wants to continue with remaining clusters
-                if i < total_clusters:
-                    continue_choice = input(f"\n[WARN] Failed to create cluster {cluster_name}. Continue with remaining {total_clusters - i} clusters? (y/N): ").strip().lower()
-                    if continue_choice not in ['y', 'yes']:
-                        self.logger.warning(f"Batch creation aborted by user after failure of {cluster_name}")
-                        break
-    
+                return self.create_cluster(config)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_config = {executor.submit(create_one, config): config for config in cluster_configs}
+
+                for future in as_completed(future_to_config):
+                    config = future_to_config[future]
+                    cluster_name = config.get('cluster_name', 'unnamed')
+                    username = config.get('username', 'unknown')
+
+                    try:
+                        result = future.result()
+
+                        if result:
+                            created_clusters.append(cluster_name)
+                            self.creation_progress.update(cluster_name, 'done')
+                            self.logger.info(json.dumps({
+                                "event": "cluster_creation_success",
+                                "cluster_name": cluster_name,
+                                "username": username
+                            }))
+                        else:
+                            failed_clusters.append(cluster_name)
+                            error_message = "Create cluster method returned False"
+                            error_details[cluster_name] = error_message
+                            self.creation_progress.update(cluster_name, self.creation_progress.phase_of(cluster_name),
+                                                          error_message)
+                            self.logger.error(json.dumps({
+                                "event": "cluster_creation_failure",
+                                "cluster_name": cluster_name,
+                                "username": username,
+                                "error": error_message
+                            }))
+
+                    except Exception as e:
+                        failed_clusters.append(cluster_name)
+                        error_msg = str(e)
+                        error_details[cluster_name] = error_msg
+                        self.creation_progress.update(cluster_name, self.creation_progress.phase_of(cluster_name),
+                                                      error_msg)
+
+                        # Log the full stack trace for debugging
+                        import traceback
+                        stack_trace = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
+                        self.logger.error(json.dumps({
+                            "event": "cluster_creation_exception",
+                            "cluster_name": cluster_name,
+                            "username": username,
+                            "error": error_msg,
+                            "stack_trace": stack_trace
+                        }))
+
+                        self.print_colored(Colors.RED, f"[ERROR] Error creating cluster {cluster_name}: {error_msg}")
+        finally:
+            self.creation_progress = None
+
         # Generate and log final summary
         success_rate = len(created_clusters) / total_clusters * 100 if total_clusters > 0 else 0
     
@@ -9836,6 +10019,12 @@ class EKSClusterManager:
             for cluster in failed_clusters:
                 error = error_details.get(cluster, "Unknown error")
                 print(f"   - {cluster}: {error}")
+
+        wait_summary = self.readiness.format_summary()
+        if wait_summary:
+            self.print_colored(Colors.CYAN, "\n[TIMER] Readiness wait time:")
+            for line in wait_summary.splitlines():
+                print(f"   - {line}")
     
         # Save error details to a report file
         if failed_clusters:
@@ -10295,8 +10484,12 @@ class EKSClusterManager:
             )
 
             # Wait for the update to complete
-            waiter = eks_client.get_waiter('cluster_active')
-            waiter.wait(name=cluster_name)
+            update_id = update_response['update']['id']
+            self.readiness.wait_for_status(
+                f"cluster {cluster_name} endpoint update",
+                lambda: eks_client.describe_update(name=cluster_name, updateId=update_id)['update']['status'],
+                ready=('Successful',), failed=('Failed', 'Cancelled'), timeout=1800, initial_delay=15
+            )
 
             self.log_operation('SUCCESS', f"Successfully disabled public access for EKS cluster {cluster_name}")
             return True
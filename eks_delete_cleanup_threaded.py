@@ -40,6 +40,7 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from eks_inventory import EKSInventoryCollector
 
 # Import your existing logging module
 try:
@@ -102,6 +103,7 @@ class EKSClusterDeleteManager:
         
         self.discovered_clusters = {}  # account -> region -> clusters
         self.deletion_summary = []
+        self.inventory_collector = EKSInventoryCollector(max_workers=10)
         
         # Thread safety
         self.printer = ThreadSafePrinter()
@@ -240,85 +242,77 @@ class EKSClusterDeleteManager:
             
             eks_client = admin_session.client('eks')
             
-            # List all clusters
-            clusters_response = eks_client.list_clusters()
-            cluster_names = clusters_response.get('clusters', [])
+            # Collect clusters and nodegroups concurrently (shared short-TTL cache)
+            inventory = self.inventory_collector.collect(eks_client, (admin_access_key, region))
             
             clusters_info = []
             
-            if cluster_names:
-                self.log_operation('INFO', f"Found {len(cluster_names)} clusters in {account_key} - {region}", str(thread_id))
+            if inventory:
+                self.log_operation('INFO', f"Found {len(inventory)} clusters in {account_key} - {region}", str(thread_id))
                 
-                for cluster_name in cluster_names:
-                    try:
-                        # Get cluster details
-                        cluster_details = eks_client.describe_cluster(name=cluster_name)
-                        cluster_info = cluster_details['cluster']
-                        
-                        # Get nodegroups
-                        nodegroups_response = eks_client.list_nodegroups(clusterName=cluster_name)
-                        nodegroups = nodegroups_response.get('nodegroups', [])
-                        
-                        # Get nodegroup details
-                        nodegroup_details = []
-                        total_nodes = 0
-                        
-                        for ng_name in nodegroups:
-                            try:
-                                ng_details = eks_client.describe_nodegroup(
-                                    clusterName=cluster_name,
-                                    nodegroupName=ng_name
-                                )
-                                ng_info = ng_details['nodegroup']
-                                
-                                # Calculate node count
-                                scaling_config = ng_info.get('scalingConfig', {})
-                                desired_size = scaling_config.get('desiredSize', 0)
-                                total_nodes += desired_size
-                                
-                                nodegroup_details.append({
-                                    'name': ng_name,
-                                    'status': ng_info.get('status', 'UNKNOWN'),
-                                    'instance_types': ng_info.get('instanceTypes', []),
-                                    'desired_size': desired_size,
-                                    'min_size': scaling_config.get('minSize', 0),
-                                    'max_size': scaling_config.get('maxSize', 0),
-                                    'created_at': ng_info.get('createdAt', 'Unknown')
-                                })
-                                
-                            except Exception as e:
-                                self.log_operation('WARNING', f"Failed to get nodegroup {ng_name} details: {str(e)}", str(thread_id))
-                                nodegroup_details.append({
-                                    'name': ng_name,
-                                    'status': 'ERROR',
-                                    'error': str(e)
-                                })
-                        
-                        cluster_data = {
-                            'name': cluster_name,
-                            'status': cluster_info.get('status', 'UNKNOWN'),
-                            'version': cluster_info.get('version', 'Unknown'),
-                            'created_at': cluster_info.get('createdAt', 'Unknown'),
-                            'endpoint': cluster_info.get('endpoint', 'Unknown'),
-                            'nodegroups': nodegroup_details,
-                            'nodegroup_count': len(nodegroups),
-                            'total_nodes': total_nodes,
-                            'account_key': account_key,
-                            'region': region
-                        }
-                        
-                        clusters_info.append(cluster_data)
-                        self.log_operation('INFO', f"Cluster {cluster_name}: {len(nodegroups)} nodegroups, {total_nodes} total nodes", str(thread_id))
-                        
-                    except Exception as e:
-                        self.log_operation('ERROR', f"Failed to get details for cluster {cluster_name}: {str(e)}", str(thread_id))
+                for record in inventory:
+                    cluster_name = record['name']
+                    if record['error'] or record['nodegroups_error']:
+                        error = record['error'] or record['nodegroups_error']
+                        self.log_operation('ERROR', f"Failed to get details for cluster {cluster_name}: {error}", str(thread_id))
                         clusters_info.append({
                             'name': cluster_name,
                             'status': 'ERROR',
-                            'error': str(e),
+                            'error': error,
                             'account_key': account_key,
                             'region': region
                         })
+                        continue
+                    
+                    cluster_info = record['cluster']
+                    
+                    # Get nodegroup details
+                    nodegroup_details = []
+                    total_nodes = 0
+                    
+                    for ng_record in record['nodegroups']:
+                        ng_name = ng_record['name']
+                        if ng_record['error']:
+                            self.log_operation('WARNING', f"Failed to get nodegroup {ng_name} details: {ng_record['error']}", str(thread_id))
+                            nodegroup_details.append({
+                                'name': ng_name,
+                                'status': 'ERROR',
+                                'error': ng_record['error']
+                            })
+                            continue
+                        
+                        ng_info = ng_record['nodegroup']
+                        
+                        # Calculate node count
+                        scaling_config = ng_info.get('scalingConfig', {})
+                        desired_size = scaling_config.get('desiredSize', 0)
+                        total_nodes += desired_size
+                        
+                        nodegroup_details.append({
+                            'name': ng_name,
+                            'status': ng_info.get('status', 'UNKNOWN'),
+                            'instance_types': ng_info.get('instanceTypes', []),
+                            'desired_size': desired_size,
+                            'min_size': scaling_config.get('minSize', 0),
+                            'max_size': scaling_config.get('maxSize', 0),
+                            'created_at': ng_info.get('createdAt', 'Unknown')
+                        })
+                    
+                    cluster_data = {
+                        'name': cluster_name,
+                        'status': cluster_info.get('status', 'UNKNOWN'),
+                        'version': cluster_info.get('version', 'Unknown'),
+                        'created_at': cluster_info.get('createdAt', 'Unknown'),
+                        'endpoint': cluster_info.get('endpoint', 'Unknown'),
+                        'nodegroups': nodegroup_details,
+                        'nodegroup_count': len(record['nodegroups']),
+                        'total_nodes': total_nodes,
+                        'account_key': account_key,
+                        'region': region
+                    }
+                    
+                    clusters_info.append(cluster_data)
+                    self.log_operation('INFO', f"Cluster {cluster_name}: {len(record['nodegroups'])} nodegroups, {total_nodes} total nodes", str(thread_id))
             else:
                 self.log_operation('INFO', f"No clusters found in {account_key} - {region}", str(thread_id))
             
@@ -864,6 +858,7 @@ class EKSClusterDeleteManager:
             
             self.log_operation('INFO', f"Cluster {cluster_name} successfully deleted", thread_id)
             self.printer.print_colored(Colors.GREEN, f"   ✅ Cluster {cluster_name} deleted successfully", thread_id)
+            self.inventory_collector.cache.invalidate((admin_access_key, region))
             
             return True
             
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+EKS Inventory
+Paginated, concurrent collector of the EKS clusters and nodegroups in a region, with a
+short-TTL cache shared by every tool in the process.
+
+Scanning a region used to be list_clusters followed by describe_cluster -> list_nodegroups ->
+describe_nodegroup one call at a time. The collector pages through the listings and fans all
+describes out on a thread pool, so a busy region costs a handful of parallel round trips; a
+second scan of the same region within the TTL is served from the cache.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 60
+
+
+class EKSInventoryCache:
+    """Thread-safe TTL cache of region inventories keyed by e.g. (access_key, region)"""
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, tuple] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def lock_for(self, key: Hashable) -> threading.Lock:
+        """Per-key lock so concurrent scans of one region wait for a single collection"""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get(self, key: Hashable) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, inventory = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            return inventory
+
+    def put(self, key: Hashable, inventory: List[Dict]):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), inventory)
+
+    def invalidate(self, key: Hashable = None):
+        """Drop one region's inventory (e.g. after deleting clusters there), or everything"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+SHARED_INVENTORY_CACHE = EKSInventoryCache()
+
+
+class EKSInventoryCollector:
+    """Collect the raw describe_cluster/describe_nodegroup data of every cluster in a region"""
+
+    def __init__(self, max_workers: int = 10, cache: EKSInventoryCache = None):
+        """
+        Args:
+            max_workers: Describe calls in flight at once
+            cache: Inventory cache (defaults to the process-wide shared cache)
+        """
+        self.max_workers = max_workers
+        self.cache = cache or SHARED_INVENTORY_CACHE
+
+    @staticmethod
+    def _list_cluster_names(eks_client) -> List[str]:
+        cluster_names = []
+        for page in eks_client.get_paginator('list_clusters').paginate():
+            cluster_names.extend(page.get('clusters', []))
+        return cluster_names
+
+    @staticmethod
+    def _list_nodegroup_names(eks_client, cluster_name: str) -> List[str]:
+        nodegroup_names = []
+        for page in eks_client.get_paginator('list_nodegroups').paginate(clusterName=cluster_name):
+            nodegroup_names.extend(page.get('nodegroups', []))
+        return nodegroup_names
+
+    def _scan(self, eks_client) -> List[Dict]:
+        cluster_names = self._list_cluster_names(eks_client)
+        if not cluster_names:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            cluster_futures = {name: executor.submit(eks_client.describe_cluster, name=name)
+                               for name in cluster_names}
+            list_futures = {name: executor.submit(self._list_nodegroup_names, eks_client, name)
+                            for name in cluster_names}
+
+            # Nodegroup describes start as soon as their cluster's listing is in
+            nodegroup_futures = {}
+            for cluster_name, list_future in list_futures.items():
+                try:
+                    nodegroup_futures[cluster_name] = [
+                        (ng_name, executor.submit(eks_client.describe_nodegroup,
+                                                  clusterName=cluster_name, nodegroupName=ng_name))
+                        for ng_name in list_future.result()
+                    ]
+                except Exception as e:
+                    nodegroup_futures[cluster_name] = e
+
+            inventory = []
+            for cluster_name in cluster_names:
+                record = {'name': cluster_name, 'cluster': None, 'error': None,
+                          'nodegroups': [], 'nodegroups_error': None}
+                try:
+                    record['cluster'] = cluster_futures[cluster_name].result()['cluster']
+                except Exception as e:
+                    record['error'] = str(e)
+
+                nodegroups = nodegroup_futures[cluster_name]
+                if isinstance(nodegroups, Exception):
+                    record['nodegroups_error'] = str(nodegroups)
+                else:
+                    for ng_name, ng_future in nodegroups:
+                        try:
+                            record['nodegroups'].append({'name': ng_name, 'error': None,
+                                                         'nodegroup': ng_future.result().get('nodegroup', {})})
+                        except Exception as e:
+                            record['nodegroups'].append({'name': ng_name, 'error': str(e), 'nodegroup': None})
+                inventory.append(record)
+
+        return inventory
+
+    def collect(self, eks_client, cache_key: Hashable, use_cache: bool = True) -> List[Dict]:
+        """Get the region inventory, from the cache when a fresh copy exists
+
+        Returns:
+            One record per cluster: {'name', 'cluster' (describe_cluster data or None), 'error',
+            'nodegroups': [{'name', 'nodegroup' (describe_nodegroup data or None), 'error'}],
+            'nodegroups_error'}
+
+        Raises:
+            botocore errors from list_clusters (the region could not be listed at all)
+        """
+        with self.cache.lock_for(cache_key):
+            if use_cache:
+                inventory = self.cache.get(cache_key)
+                if inventory is not None:
+                    logger.debug("EKS inventory served from cache")
+                    return list(inventory)
+
+            start_time = time.time()
+            inventory = self._scan(eks_client)
+            self.cache.put(cache_key, inventory)
+            logger.info(f"Collected {len(inventory)} EKS clusters in {time.time() - start_time:.2f}s")
+            return list(inventory)
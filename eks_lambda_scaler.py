@@ -1,11 +1,11 @@
 import os
-import glob
 import json
 import boto3
 from datetime import datetime, timedelta
 import re
 from typing import Dict, List, Optional, Any
 from root_iam_credential_manager import AWSCredentialManager, Colors
+from state_file_catalog import get_state_catalog
 
 
 class EKSLambdaScaler:
@@ -23,6 +23,7 @@ class EKSLambdaScaler:
 
         # Set up directory paths
         self.eks_dir = os.path.join(self.config_dir, "aws", "eks")
+        self.catalog = get_state_catalog()
 
         # Lambda event templates
         self.lambda_scale_up_file = os.path.join(self.config_dir, "lambda_scale_up_event.json")
@@ -140,26 +141,26 @@ class EKSLambdaScaler:
 
         # Look for all eks cluster files under all account directories
         eks_pattern = os.path.join(self.eks_dir, "*", "eks_cluster_*-*-*.json")
-        all_files = glob.glob(eks_pattern)
+        # Indexed by the state file catalog; only new or changed files are re-read
+        self.catalog.refresh([eks_pattern])
+        all_entries = self.catalog.files([eks_pattern])
 
-        if not all_files:
+        if not all_entries:
             self.print_colored(Colors.RED, f"[ERROR] No EKS cluster files found")
             return {}
 
         # Group files by date (day)
         files_by_date = {}
-        for file_path in all_files:
+        for entry in all_entries:
+            file_path = entry['path']
             try:
-                # Extract timestamp from filename
                 filename = os.path.basename(file_path)
-                match = re.search(r'(\d{4}-\d{2}-\d{2})(?:_\d{2}-\d{2}-\d{2})?\.json$', filename)
-
-                if match:
-                    date_key = match.group(1)  # YYYY-MM-DD
+                if entry['file_date']:
+                    date_str = entry['file_date']
+                    date_key = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"  # YYYY-MM-DD
                 else:
-                    # Use file modification date if pattern not found
-                    mod_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    date_key = mod_time.strftime('%Y-%m-%d')
+                    # Use file modification date if the name carries no date
+                    date_key = entry['mtime'].strftime('%Y-%m-%d')
 
                 # Extract account and cluster info from filename
                 account_match = re.search(r'eks_cluster_(.*?)(?:_clouduser|\.json|-us)', filename)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Hourly Cost Matrix
+NumPy-backed region x hour cost matrix for the historical and forecast breakdowns.
+
+Every resource contributes a flat hourly rate for the first N hours of the window. Instead of
+looping over resources x hours, each resource adds its rate at its start column and subtracts it
+at its end column of a difference array; a cumulative sum along the hour axis then yields the
+per-region cost for every hour. Building the matrix is O(resources + regions x hours), so
+week-long horizons at one-hour resolution stay cheap.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+SERVICES = ('ec2', 'eks')
+DEFAULT_CONFIDENCE = 0.85
+
+
+def parse_confidence(value, default: float = DEFAULT_CONFIDENCE) -> float:
+    """Convert a confidence value such as '85%' or 0.85 to a fraction"""
+    try:
+        if isinstance(value, str):
+            value = float(value.strip().rstrip('%')) / 100
+        value = float(value)
+        if value > 1:
+            value /= 100
+        return min(max(value, 0.0), 1.0)
+    except (TypeError, ValueError):
+        return default
+
+
+class HourlyCostMatrix:
+    """Accumulates resource hourly rates and expands them into region x hour cost matrices"""
+
+    def __init__(self, start_time: datetime, hours: int):
+        """
+        Args:
+            start_time: Start of the first hour column
+            hours: Number of one-hour columns
+        """
+        self.start_time = start_time
+        self.hours = max(int(hours), 0)
+        self.regions: List[str] = []
+        self._region_index: Dict[str, int] = {}
+        self._resources = {service: {'region': [], 'rate': [], 'active': [], 'confidence': []}
+                           for service in SERVICES}
+
+    def _get_region_index(self, region: str) -> int:
+        if region not in self._region_index:
+            self._region_index[region] = len(self.regions)
+            self.regions.append(region)
+        return self._region_index[region]
+
+    def add_resources(self, service: str, region: str, hourly_rates: Iterable[float],
+                      active_hours: Optional[Iterable[float]] = None,
+                      confidence: Optional[Iterable[float]] = None):
+        """Add resources of one service in one region
+
+        Args:
+            hourly_rates: Hourly cost of each resource
+            active_hours: Number of leading hour columns each resource is billed for
+                (None bills every column, as in a forecast)
+            confidence: Forecast confidence fraction of each resource, used for the bands
+        """
+        region_index = self._get_region_index(region)
+        rates = np.asarray(list(hourly_rates), dtype=float)
+        if active_hours is None:
+            active = np.full(rates.shape, float(self.hours))
+        else:
+            active = np.asarray(list(active_hours), dtype=float)
+        if confidence is None:
+            conf = np.full(rates.shape, DEFAULT_CONFIDENCE)
+        else:
+            conf = np.asarray(list(confidence), dtype=float)
+
+        resources = self._resources[service]
+        resources['region'].append(np.full(rates.shape, region_index, dtype=int))
+        resources['rate'].append(rates)
+        resources['active'].append(active)
+        resources['confidence'].append(conf)
+
+    def _expand(self, service: str, weights: str = 'rate') -> np.ndarray:
+        """Build the (regions x hours) matrix for one service using a difference array"""
+        matrix = np.zeros((len(self.regions), self.hours + 1))
+        resources = self._resources[service]
+        if not resources['rate'] or not self.hours:
+            return matrix[:, :self.hours]
+
+        region_ids = np.concatenate(resources['region'])
+        rates = np.concatenate(resources['rate'])
+        if weights == 'uncertainty':
+            rates = rates * (1.0 - np.concatenate(resources['confidence']))
+
+        # "active > hour" for integer hour columns is "hour < ceil(active)"
+        end_columns = np.clip(np.ceil(np.concatenate(resources['active'])), 0, self.hours).astype(int)
+        np.add.at(matrix, (region_ids, 0), rates)
+        np.add.at(matrix, (region_ids, end_columns), -rates)
+        return np.cumsum(matrix[:, :self.hours], axis=1)
+
+    def build(self) -> Dict[str, np.ndarray]:
+        """Get the region x hour cost matrix for each service plus the total and band widths"""
+        matrices = {service: self._expand(service) for service in SERVICES}
+        matrices['total'] = matrices['ec2'] + matrices['eks']
+        matrices['uncertainty'] = sum(self._expand(service, 'uncertainty') for service in SERVICES)
+        return matrices
+
+    def hour_starts(self) -> List[datetime]:
+        return [self.start_time + timedelta(hours=hour) for hour in range(self.hours)]
+
+    def to_hourly_records(self, include_regions: bool = False, include_bands: bool = False) -> List[Dict]:
+        """Convert the matrices into the per-hour dicts used by the cost reports
+
+        Args:
+            include_regions: Add a per-region {'ec2', 'eks', 'total'} rollup to every hour
+            include_bands: Add lower/upper confidence bounds to every hour
+        """
+        matrices = self.build()
+        ec2_hourly = matrices['ec2'].sum(axis=0).tolist()
+        eks_hourly = matrices['eks'].sum(axis=0).tolist()
+        total_hourly = matrices['total'].sum(axis=0).tolist()
+        if include_bands:
+            uncertainty = matrices['uncertainty'].sum(axis=0)
+            lower_hourly = np.maximum(matrices['total'].sum(axis=0) - uncertainty, 0.0).tolist()
+            upper_hourly = (matrices['total'].sum(axis=0) + uncertainty).tolist()
+        if include_regions:
+            region_ec2 = matrices['ec2'].T.tolist()
+            region_eks = matrices['eks'].T.tolist()
+            region_total = matrices['total'].T.tolist()
+
+        records = []
+        for hour, hour_start in enumerate(self.hour_starts()):
+            hour_data = {
+                "hour": hour_start.strftime("%H:00"),
+                "timestamp": hour_start.strftime("%Y-%m-%d %H:%M:%S"),
+                "total_cost": total_hourly[hour],
+                "ec2_cost": ec2_hourly[hour],
+                "eks_cost": eks_hourly[hour]
+            }
+            if include_bands:
+                hour_data["lower_bound"] = lower_hourly[hour]
+                hour_data["upper_bound"] = upper_hourly[hour]
+            if include_regions:
+                hour_data["regions"] = {
+                    region: {
+                        "ec2": region_ec2[hour][index],
+                        "eks": region_eks[hour][index],
+                        "total": region_total[hour][index]
+                    }
+                    for index, region in enumerate(self.regions)
+                }
+            records.append(hour_data)
+
+        return records
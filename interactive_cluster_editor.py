@@ -18,6 +18,7 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Set
 import tempfile
 import logging
+from state_file_catalog import get_state_catalog
 
 
 class Colors:
@@ -41,6 +42,7 @@ class EnhancedInteractiveClusterManager:
         self.current_time = current_timestamp
         self.current_user = "varadharajaan"
         self.execution_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.catalog = get_state_catalog()
 
         # Setup logging
         self.setup_logging()
@@ -607,7 +609,6 @@ class EnhancedInteractiveClusterManager:
             for i, cluster_info in enumerate(selected_clusters, 1):
                 cluster_name = cluster_info['cluster_name']
                 region = cluster_info['region']
-                cluster_data = cluster_info['cluster_data']
 
                 self.print_colored(Colors.YELLOW, f"\n[{i}/{len(selected_clusters)}] Processing: {cluster_name}")
 
@@ -626,6 +627,7 @@ class EnhancedInteractiveClusterManager:
                         continue
 
                     # Extract user data from cluster data
+                    cluster_data = cluster_info.get('cluster_data') or self.load_cluster_file(cluster_info['file_path'])
                     user_data = self.extract_user_data_from_cluster(cluster_data, cluster_name)
 
                     # Configure auth for cluster - SIMPLIFIED VERSION
@@ -1432,17 +1434,19 @@ class EnhancedInteractiveClusterManager:
 
                 account_id = base_dir.split('/')[-1]
                 pattern = os.path.join(base_dir, "eks_cluster_eks-cluster-*.json")
-                files = glob.glob(pattern)
+                # Only files that are new or changed since the last scan get parsed
+                self.catalog.refresh([pattern])
+                entries = self.catalog.files([pattern], include_resources=True)
 
-                self.print_colored(Colors.CYAN, f"   [FOLDER] {account_id}: Found {len(files)} cluster files")
+                self.print_colored(Colors.CYAN, f"   [FOLDER] {account_id}: Found {len(entries)} cluster files")
 
-                for file_path in files:
+                for entry in entries:
                     try:
-                        file_info = self.parse_cluster_file_info(file_path, account_id)
+                        file_info = self.parse_cluster_file_info(entry, account_id)
                         if file_info:
                             cluster_files.append(file_info)
                     except Exception as e:
-                        self.print_colored(Colors.YELLOW, f"   [WARN]  Error parsing {file_path}: {str(e)}")
+                        self.print_colored(Colors.YELLOW, f"   [WARN]  Error parsing {entry['path']}: {str(e)}")
 
             self.print_colored(Colors.GREEN, f"[OK] Total cluster files found: {len(cluster_files)}")
             return cluster_files
@@ -1451,26 +1455,25 @@ class EnhancedInteractiveClusterManager:
             self.print_colored(Colors.RED, f"[ERROR] Error scanning cluster files: {str(e)}")
             return []
 
-    def parse_cluster_file_info(self, file_path: str, account_id: str) -> Dict:
-        """Parse cluster file to extract relevant information"""
+    def parse_cluster_file_info(self, entry: Dict, account_id: str) -> Dict:
+        """Build cluster file information from its state file catalog entry"""
         try:
+            file_path = entry['path']
             filename = os.path.basename(file_path)
-            date_match = re.search(r'_(\d{8})_\d{6}\.json$', filename)
-            if not date_match:
+            date_str = entry['file_date']
+            if not date_str or not entry['file_time'] or entry['parse_error']:
                 return None
 
-            date_str = date_match.group(1)
             formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
 
-            with open(file_path, 'r') as f:
-                cluster_data = json.load(f)
-
-            cluster_name = cluster_data.get('cluster_info', {}).get('cluster_name', 'Unknown')
-            region = cluster_data.get('account_info', {}).get('region', 'us-east-1')
-            created_by = cluster_data.get('created_by', 'Unknown')
-            timestamp = cluster_data.get('timestamp', 'Unknown')
-            account_name = cluster_data.get('account_info', {}).get('account_name', account_id)
+            cluster = next((resource for resource in entry['resources'] if resource['resource_type'] == 'eks'), {})
+            cluster_name = cluster.get('resource_id') or 'Unknown'
+            region = cluster.get('region') or 'us-east-1'
+            created_by = entry['created_by'] or 'Unknown'
+            timestamp = entry['created_at'] or 'Unknown'
+            account_name = cluster.get('account') or account_id
 
+            # cluster_data (the full file) is loaded only for the clusters that get selected
             return {
                 'file_path': file_path,
                 'filename': filename,
@@ -1481,14 +1484,18 @@ class EnhancedInteractiveClusterManager:
                 'date': formatted_date,
                 'date_raw': date_str,
                 'created_by': created_by,
-                'timestamp': timestamp,
-                'cluster_data': cluster_data
+                'timestamp': timestamp
             }
 
         except Exception as e:
-            self.log_operation('ERROR', f"Error parsing cluster file {file_path}: {str(e)}")
+            self.log_operation('ERROR', f"Error parsing cluster file {entry.get('path')}: {str(e)}")
             return None
 
+    def load_cluster_file(self, file_path: str) -> Dict:
+        """Load the full JSON of a cluster file"""
+        with open(file_path, 'r') as f:
+            return json.load(f)
+
     def group_clusters_by_date(self, cluster_files: List[Dict]) -> Dict:
         """Group cluster files by creation date"""
         try:
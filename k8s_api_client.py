@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Kubernetes API Client for EKS
+In-process replacement for kubectl subprocess calls: one pooled HTTPS connection per cluster,
+a cached IAM bearer token and structured JSON responses.
+
+Every kubectl call pays process startup, kubeconfig parsing, an exec credential plugin
+(aws eks get-token) and a fresh TLS handshake. The client presigns the STS token itself, keeps
+it until shortly before it expires, reuses keep-alive connections to the API server and
+supports server-side apply of multi-document manifests.
+"""
+
+import base64
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+from urllib.parse import quote, urlencode
+
+import boto3
+import urllib3
+import yaml
+from botocore.signers import RequestSigner
+
+logger = logging.getLogger(__name__)
+
+# EKS accepts a presigned token for 15 minutes; refresh a minute early
+TOKEN_TTL_SECONDS = 14 * 60
+DEFAULT_FIELD_MANAGER = 'aws-infra-setup'
+
+
+class KubernetesAPIError(Exception):
+    """Non-2xx response from the Kubernetes API server"""
+
+    def __init__(self, status: int, reason: str, message: str = ''):
+        self.status = status
+        self.reason = reason
+        self.message = message
+        super().__init__(f"{status} {reason}: {message}" if message else f"{status} {reason}")
+
+    @property
+    def not_found(self) -> bool:
+        return self.status == 404
+
+
+class EKSTokenProvider:
+    """Presigned STS GetCallerIdentity token for an EKS cluster, cached until it nears expiry"""
+
+    def __init__(self, session: boto3.Session, cluster_name: str, region: str):
+        self.session = session
+        self.cluster_name = cluster_name
+        self.region = region
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def _generate(self) -> str:
+        sts_client = self.session.client('sts', region_name=self.region)
+        signer = RequestSigner(sts_client.meta.service_model.service_id, self.region, 'sts', 'v4',
+                               self.session.get_credentials(), self.session.events)
+        url = signer.generate_presigned_url(
+            {
+                'method': 'GET',
+                'url': f"https://sts.{self.region}.amazonaws.com/?Action=GetCallerIdentity&Version=2011-06-15",
+                'body': {},
+                'headers': {'x-k8s-aws-id': self.cluster_name},
+                'context': {}
+            },
+            region_name=self.region,
+            expires_in=60,
+            operation_name=''
+        )
+        return 'k8s-aws-v1.' + base64.urlsafe_b64encode(url.encode('utf-8')).decode('utf-8').rstrip('=')
+
+    def get_token(self, force_refresh: bool = False) -> str:
+        with self._lock:
+            if force_refresh or self._token is None or time.monotonic() >= self._expires_at:
+                self._token = self._generate()
+                self._expires_at = time.monotonic() + TOKEN_TTL_SECONDS
+            return self._token
+
+
+class KubernetesClient:
+    """JSON client for one cluster's API server over a keep-alive HTTPS connection pool"""
+
+    def __init__(self, endpoint: str, ca_data: str, token_provider: Callable[[bool], str],
+                 timeout: float = 30, max_connections: int = 10):
+        """
+        Args:
+            endpoint: API server URL (describe_cluster endpoint)
+            ca_data: Base64 cluster CA certificate (describe_cluster certificateAuthority.data)
+            token_provider: Callable(force_refresh) returning a bearer token
+            timeout: Per-request timeout in seconds
+            max_connections: Keep-alive connections kept to the API server
+        """
+        self.endpoint = endpoint.rstrip('/')
+        self.token_provider = token_provider
+
+        # urllib3 verifies against a CA bundle file
+        ca_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.crt', delete=False)
+        ca_file.write(base64.b64decode(ca_data))
+        ca_file.close()
+        self._ca_path = ca_file.name
+
+        self._pool = urllib3.connection_from_url(
+            self.endpoint, cert_reqs='CERT_REQUIRED', ca_certs=self._ca_path,
+            maxsize=max_connections, block=False,
+            timeout=urllib3.Timeout(connect=10, read=timeout), retries=False
+        )
+        self._resources: Dict[str, List[Dict]] = {}
+        self._versions: Optional[List[str]] = None
+        self._resource_lock = threading.Lock()
+
+    def close(self):
+        self._pool.close()
+        try:
+            os.unlink(self._ca_path)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------ raw requests
+
+    def request(self, method: str, path: str, query: Dict = None, body=None,
+                content_type: str = 'application/json', raw: bool = False):
+        """Send a request, retrying once with a fresh token on 401
+
+        Returns:
+            Parsed JSON (dict), or the response text when raw=True
+
+        Raises:
+            KubernetesAPIError: the API server answered with an error status
+        """
+        if query:
+            path = f"{path}?{urlencode({k: v for k, v in query.items() if v is not None})}"
+        if body is not None and not isinstance(body, (str, bytes)):
+            body = json.dumps(body)
+
+        for attempt in range(2):
+            headers = {
+                'Authorization': f"Bearer {self.token_provider(attempt > 0)}",
+                'Accept': '*/*' if raw else 'application/json'
+            }
+            if body is not None:
+                headers['Content-Type'] = content_type
+            response = self._pool.urlopen(method, path, body=body, headers=headers)
+            if response.status != 401:
+                break
+
+        text = response.data.decode('utf-8', errors='replace')
+        if response.status >= 400:
+            message = text
+            try:
+                message = json.loads(text).get('message', text)
+            except ValueError:
+                pass
+            raise KubernetesAPIError(response.status, response.reason or '', message)
+        if raw:
+            return text
+        return json.loads(text) if text else {}
+
+    # ------------------------------------------------------------------ discovery
+
+    def _api_resources(self, api_version: str) -> List[Dict]:
+        with self._resource_lock:
+            if api_version not in self._resources:
+                path = '/api/v1' if api_version == 'v1' else f"/apis/{api_version}"
+                self._resources[api_version] = self.request('GET', path).get('resources', [])
+            return self._resources[api_version]
+
+    def _preferred_versions(self) -> List[str]:
+        if self._versions is None:
+            groups = self.request('GET', '/apis').get('groups', [])
+            self._versions = ['v1'] + [group['preferredVersion']['groupVersion'] for group in groups]
+        return self._versions
+
+    def resolve(self, resource: str, api_version: str = None) -> Dict:
+        """Resolve a kind or kubectl-style name (deployment, ds, clusterrolebinding) to its API resource
+
+        Returns:
+            {'api_version', 'plural', 'kind', 'namespaced'}
+        """
+        wanted = resource.lower()
+        versions = [api_version] if api_version else self._preferred_versions()
+        for version in versions:
+            for item in self._api_resources(version):
+                if '/' in item['name']:
+                    continue
+                names = {item['name'], item.get('singularName', ''), item['kind'].lower()}
+                names.update(item.get('shortNames', []))
+                if wanted in names:
+                    return {'api_version': version, 'plural': item['name'],
+                            'kind': item['kind'], 'namespaced': item['namespaced']}
+        raise KubernetesAPIError(404, 'Not Found', f"unknown resource type {resource}")
+
+    def resource_path(self, resource: str, name: str = None, namespace: str = None,
+                      api_version: str = None) -> str:
+        info = self.resolve(resource, api_version)
+        base = '/api/v1' if info['api_version'] == 'v1' else f"/apis/{info['api_version']}"
+        if info['namespaced'] and namespace:
+            base += f"/namespaces/{quote(namespace)}"
+        path = f"{base}/{info['plural']}"
+        if name:
+            path += f"/{quote(name)}"
+        return path
+
+    # ------------------------------------------------------------------ resources
+
+    def get(self, resource: str, name: str = None, namespace: str = None,
+            label_selector: str = None, api_version: str = None) -> Dict:
+        """Get one object, or a list object when name is omitted"""
+        path = self.resource_path(resource, name, namespace, api_version)
+        return self.request('GET', path, query={'labelSelector': label_selector} if label_selector else None)
+
+    def list_items(self, resource: str, namespace: str = None, label_selector: str = None,
+                   api_version: str = None) -> List[Dict]:
+        """List items across all pages"""
+        path = self.resource_path(resource, namespace=namespace, api_version=api_version)
+        items, token = [], None
+        while True:
+            page = self.request('GET', path, query={'labelSelector': label_selector, 'limit': 500,
+                                                    'continue': token})
+            items.extend(page.get('items', []))
+            token = page.get('metadata', {}).get('continue')
+            if not token:
+                return items
+
+    def exists(self, resource: str, name: str, namespace: str = None) -> bool:
+        try:
+            self.get(resource, name, namespace)
+            return True
+        except KubernetesAPIError as e:
+            if e.not_found:
+                return False
+            raise
+
+    def delete(self, resource: str, name: str, namespace: str = None, ignore_not_found: bool = True,
+               propagation_policy: str = 'Background') -> bool:
+        """Delete an object
+
+        Returns:
+            True if it was deleted, False if it did not exist (ignore_not_found=True)
+        """
+        try:
+            self.request('DELETE', self.resource_path(resource, name, namespace),
+                         body={'kind': 'DeleteOptions', 'apiVersion': 'v1',
+                               'propagationPolicy': propagation_policy})
+            return True
+        except KubernetesAPIError as e:
+            if e.not_found and ignore_not_found:
+                return False
+            raise
+
+    def patch(self, resource: str, name: str, patch: Dict, namespace: str = None,
+              patch_type: str = 'merge') -> Dict:
+        """Patch an object ('merge', 'strategic' or 'json' patch)"""
+        content_types = {
+            'merge': 'application/merge-patch+json',
+            'strategic': 'application/strategic-merge-patch+json',
+            'json': 'application/json-patch+json'
+        }
+        return self.request('PATCH', self.resource_path(resource, name, namespace), body=patch,
+                            content_type=content_types[patch_type])
+
+    def apply(self, obj: Dict, field_manager: str = DEFAULT_FIELD_MANAGER, force: bool = True) -> Dict:
+        """Server-side apply of one object (creates or updates it)"""
+        metadata = obj.get('metadata', {})
+        info = self.resolve(obj['kind'], obj.get('apiVersion'))
+        namespace = metadata.get('namespace') or ('default' if info['namespaced'] else None)
+        path = self.resource_path(obj['kind'], metadata['name'], namespace, obj.get('apiVersion'))
+        return self.request('PATCH', path, query={'fieldManager': field_manager, 'force': str(force).lower()},
+                            body=obj, content_type='application/apply-patch+yaml')
+
+    def apply_manifest(self, manifest: str, field_manager: str = DEFAULT_FIELD_MANAGER,
+                       force: bool = True) -> List[Dict]:
+        """Server-side apply every document of a (multi-document) YAML or JSON manifest
+
+        Documents are applied in order so namespaces and CRDs land before the objects using them.
+
+        Returns:
+            One {'kind', 'name', 'namespace', 'success', 'error'} result per object
+        """
+        objects = []
+        for document in yaml.safe_load_all(manifest):
+            if not document:
+                continue
+            if document.get('kind', '').endswith('List') and 'items' in document:
+                objects.extend(document['items'])
+            else:
+                objects.append(document)
+
+        results = []
+        for obj in objects:
+            metadata = obj.get('metadata', {})
+            result = {'kind': obj.get('kind'), 'name': metadata.get('name'),
+                      'namespace': metadata.get('namespace'), 'success': True, 'error': None}
+            try:
+                self.apply(obj, field_manager, force)
+            except KubernetesAPIError as e:
+                result.update(success=False, error=str(e))
+                logger.warning(f"Apply failed for {result['kind']}/{result['name']}: {e}")
+            results.append(result)
+        return results
+
+    def apply_secret(self, name: str, namespace: str, string_data: Dict[str, str]) -> Dict:
+        """Create or update an Opaque secret (kubectl create secret generic --from-literal)"""
+        return self.apply({
+            'apiVersion': 'v1',
+            'kind': 'Secret',
+            'type': 'Opaque',
+            'metadata': {'name': name, 'namespace': namespace},
+            'stringData': string_data
+        })
+
+    def ensure_namespace(self, name: str) -> bool:
+        """Create a namespace unless it exists
+
+        Returns:
+            True if it was created, False if it already existed
+        """
+        if self.exists('namespace', name):
+            return False
+        self.request('POST', '/api/v1/namespaces',
+                     body={'apiVersion': 'v1', 'kind': 'Namespace', 'metadata': {'name': name}})
+        return True
+
+    def pod_logs(self, name: str, namespace: str, tail_lines: int = None, container: str = None) -> str:
+        return self.request('GET', f"/api/v1/namespaces/{quote(namespace)}/pods/{quote(name)}/log",
+                            query={'tailLines': tail_lines, 'container': container}, raw=True)
+
+    def logs_for_selector(self, namespace: str, label_selector: str, tail_lines: int = None) -> str:
+        """Concatenated logs of every pod matching a label selector (kubectl logs -l)"""
+        output = []
+        for pod in self.list_items('pods', namespace, label_selector):
+            output.append(self.pod_logs(pod['metadata']['name'], namespace, tail_lines))
+        return ''.join(output)
+
+
+class KubernetesClientPool:
+    """Process-wide KubernetesClient per (access key, region, cluster)"""
+
+    def __init__(self):
+        self._clients: Dict[Hashable, KubernetesClient] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _lock_for(self, key: Hashable) -> threading.Lock:
+        """Per-key lock so one cluster is described once while other clusters connect in parallel"""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get_client(self, cluster_name: str, region: str, access_key: str = None,
+                   secret_key: str = None) -> KubernetesClient:
+        """Get the pooled client for a cluster, describing it and connecting on first use"""
+        key = (access_key, region, cluster_name)
+        with self._lock:
+            client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock_for(key):
+            with self._lock:
+                client = self._clients.get(key)
+            if client is not None:
+                return client
+
+            if access_key and secret_key:
+                session = boto3.Session(aws_access_key_id=access_key, aws_secret_access_key=secret_key,
+                                        region_name=region)
+            else:
+                session = boto3.Session(region_name=region)
+            cluster = session.client('eks').describe_cluster(name=cluster_name)['cluster']
+            token_provider = EKSTokenProvider(session, cluster_name, region)
+            client = KubernetesClient(cluster['endpoint'], cluster['certificateAuthority']['data'],
+                                      lambda force_refresh: token_provider.get_token(force_refresh))
+            with self._lock:
+                self._clients[key] = client
+            logger.debug(f"Connected Kubernetes API client for {cluster_name} ({region})")
+            return client
+
+    def invalidate(self, cluster_name: str):
+        """Drop the clients of a deleted/recreated cluster"""
+        with self._lock:
+            keys = [key for key in self._clients if key[2] == cluster_name]
+            clients = [self._clients.pop(key) for key in keys]
+        for client in clients:
+            client.close()
+
+    def close_all(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+SHARED_CLIENT_POOL = KubernetesClientPool()
+
+
+def get_eks_kubernetes_client(cluster_name: str, region: str, access_key: str = None,
+                              secret_key: str = None) -> KubernetesClient:
+    """Shared pooled client for an EKS cluster"""
+    return SHARED_CLIENT_POOL.get_client(cluster_name, region, access_key, secret_key)
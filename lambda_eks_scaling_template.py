@@ -12,7 +12,9 @@ import boto3
 import json
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
 from botocore.exceptions import ClientError, BotoCoreError
@@ -37,6 +39,10 @@ for handler in logger.handlers:
 
 
 class EKSNodeGroupScaler:
+    MAX_PARALLEL_NODEGROUPS = 10
+    UPDATE_POLL_INITIAL_SECONDS = 2
+    UPDATE_POLL_MAX_SECONDS = 10
+
     def __init__(self):
         self.logger = logger
         self.start_time = None
@@ -48,6 +54,12 @@ class EKSNodeGroupScaler:
             'warnings_issued': 0,
             'total_scaling_changes': 0
         }
+        self._stats_lock = threading.Lock()
+
+    def increment_stat(self, key, amount=1):
+        """Thread-safe execution_stats counter update (nodegroups may be processed concurrently)"""
+        with self._stats_lock:
+            self.execution_stats[key] += amount
 
     def log_execution_start(self, cluster_name, region, action, ist_time):
         """Log execution start with detailed context"""
@@ -97,7 +109,7 @@ class EKSNodeGroupScaler:
 
         except Exception as e:
             self.logger.warning(f"[WARN]  Error calculating IST time: {str(e)} - using UTC time")
-            self.execution_stats['warnings_issued'] += 1
+            self.increment_stat('warnings_issued')
             utc_time = datetime.utcnow().strftime('%I:%M %p UTC')
             return utc_time
 
@@ -107,7 +119,7 @@ class EKSNodeGroupScaler:
 
         if not nodegroup_name:
             self.logger.warning(f"[WARN]  [{index}] Skipping nodegroup with missing name: {ng_config}")
-            self.execution_stats['warnings_issued'] += 1
+            self.increment_stat('warnings_issued')
             return None
 
         # Get scaling parameters with defaults
@@ -119,12 +131,12 @@ class EKSNodeGroupScaler:
         if min_size > max_size:
             self.logger.warning(
                 f"[WARN]  [{index}] Invalid config for {nodegroup_name}: min_size ({min_size}) > max_size ({max_size})")
-            self.execution_stats['warnings_issued'] += 1
+            self.increment_stat('warnings_issued')
 
         if desired_size < min_size or desired_size > max_size:
             self.logger.warning(
                 f"[WARN]  [{index}] Invalid config for {nodegroup_name}: desired_size ({desired_size}) not between min_size ({min_size}) and max_size ({max_size})")
-            self.execution_stats['warnings_issued'] += 1
+            self.increment_stat('warnings_issued')
 
         self.logger.info(
             f"[OK] [{index}] Validated config for {nodegroup_name}: min={min_size}, desired={desired_size}, max={max_size}")
@@ -168,7 +180,7 @@ class EKSNodeGroupScaler:
 
             if status != 'ACTIVE':
                 self.logger.warning(f"   [WARN]  Nodegroup status is {status}, not ACTIVE")
-                self.execution_stats['warnings_issued'] += 1
+                self.increment_stat('warnings_issued')
 
             return current_config
 
@@ -209,7 +221,7 @@ class EKSNodeGroupScaler:
             self.logger.info(
                 f"   └── [TARGET] New configuration will be: min={target_config['min_size']}, desired={target_config['desired_size']}, max={target_config['max_size']}")
 
-            self.execution_stats['total_scaling_changes'] += 1
+            self.increment_stat('total_scaling_changes')
 
             return {
                 'update_id': update_id,
@@ -245,6 +257,7 @@ class EKSNodeGroupScaler:
         self.logger.info(f"[PACKAGE] [{index}/{total}] Processing nodegroup: {nodegroup_name}")
         self.logger.info(
             f"   ├── [TARGET] Target: min={target_config['min_size']}, desired={target_config['desired_size']}, max={target_config['max_size']}")
+        started_at = time.monotonic()
 
         try:
             # Get current configuration
@@ -257,11 +270,12 @@ class EKSNodeGroupScaler:
                 self.logger.info(f"   ├── [SKIP]  No changes needed - scaling configuration already matches target")
                 self.logger.info(f"   └── [OK] Skipping update for {nodegroup_name}")
 
-                self.execution_stats['skipped_operations'] += 1
+                self.increment_stat('skipped_operations')
                 return {
                     'nodegroup': nodegroup_name,
                     'status': 'skipped',
                     'message': 'Configuration unchanged',
+                    'submit_latency_seconds': round(time.monotonic() - started_at, 2),
                     'current': {
                         'min': current_config['min'],
                         'desired': current_config['desired'],
@@ -272,14 +286,15 @@ class EKSNodeGroupScaler:
             # Perform the update
             update_result = self.update_nodegroup_scaling(eks_client, cluster_name, nodegroup_name, target_config)
 
-            self.execution_stats['successful_operations'] += 1
-            self.execution_stats['nodegroups_processed'] += 1
+            self.increment_stat('successful_operations')
+            self.increment_stat('nodegroups_processed')
 
             return {
                 'nodegroup': nodegroup_name,
                 'status': 'success',
                 'update_id': update_result['update_id'],
                 'update_status': update_result['status'],
+                'submit_latency_seconds': round(time.monotonic() - started_at, 2),
                 'previous': {
                     'min': current_config['min'],
                     'desired': current_config['desired'],
@@ -296,13 +311,14 @@ class EKSNodeGroupScaler:
             error_msg = str(e)
             self.logger.error(f"   [ERROR] Failed to process nodegroup {nodegroup_name}: {error_msg}")
 
-            self.execution_stats['failed_operations'] += 1
-            self.execution_stats['nodegroups_processed'] += 1
+            self.increment_stat('failed_operations')
+            self.increment_stat('nodegroups_processed')
 
             return {
                 'nodegroup': nodegroup_name,
                 'status': 'error',
                 'error': error_msg,
+                'submit_latency_seconds': round(time.monotonic() - started_at, 2),
                 'target': {
                     'min': target_config['min_size'],
                     'desired': target_config['desired_size'],
@@ -310,8 +326,97 @@ class EKSNodeGroupScaler:
                 }
             }
 
-    def scale_nodegroups(self, cluster_name, region, action, ist_time, nodegroups_config):
-        """Main scaling logic with enhanced logging and error handling"""
+    def submit_nodegroup_updates(self, eks_client, cluster_name, valid_configs):
+        """Describe and update every nodegroup at once; results keep the input order"""
+        total = len(valid_configs)
+        workers = min(self.MAX_PARALLEL_NODEGROUPS, total)
+        self.logger.info(f"[FAST] Submitting {total} nodegroup updates concurrently ({workers} workers)")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.process_nodegroup, eks_client, cluster_name, ng_config, i, total)
+                for i, ng_config in enumerate(valid_configs, 1)
+            ]
+            return [future.result() for future in futures]
+
+    def track_nodegroup_updates(self, eks_client, cluster_name, results, started_at, timeout):
+        """
+        Poll every submitted update in one shared describe_update loop until it finishes or
+        the timeout passes. Adds 'final_update_status' and 'completion_latency_seconds' to results.
+        """
+        pending = {result['nodegroup']: result for result in results if result.get('update_id')}
+        if not pending:
+            return
+
+        self.logger.info(f"[WAIT] Tracking {len(pending)} nodegroup updates (timeout: {timeout:.0f}s)")
+        deadline = time.monotonic() + timeout
+        poll_interval = self.UPDATE_POLL_INITIAL_SECONDS
+
+        def describe(item):
+            nodegroup_name, result = item
+            try:
+                response = eks_client.describe_update(
+                    name=cluster_name, nodegroupName=nodegroup_name, updateId=result['update_id']
+                )
+                return nodegroup_name, response['update']
+            except Exception as e:
+                self.logger.warning(f"   [WARN]  describe_update failed for {nodegroup_name}: {str(e)}")
+                return nodegroup_name, None
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_NODEGROUPS, len(pending))) as executor:
+            while pending:
+                for nodegroup_name, update in executor.map(describe, list(pending.items())):
+                    if not update or update['status'] == 'InProgress':
+                        continue
+
+                    result = pending.pop(nodegroup_name)
+                    result['final_update_status'] = update['status']
+                    result['completion_latency_seconds'] = round(time.monotonic() - started_at, 2)
+
+                    if update['status'] == 'Successful':
+                        self.logger.info(f"   [OK] {nodegroup_name}: update completed in "
+                                         f"{result['completion_latency_seconds']}s")
+                    else:
+                        errors = '; '.join(error.get('errorMessage', '') for error in update.get('errors', []))
+                        result['status'] = 'error'
+                        result['error'] = errors or f"Update {update['status']}"
+                        self.logger.error(f"   [ERROR] {nodegroup_name}: update {update['status']} {errors}")
+                        self.increment_stat('failed_operations')
+                        with self._stats_lock:
+                            self.execution_stats['successful_operations'] -= 1
+
+                remaining = deadline - time.monotonic()
+                if not pending or remaining <= 0:
+                    break
+                time.sleep(min(poll_interval, remaining))
+                poll_interval = min(poll_interval * 1.5, self.UPDATE_POLL_MAX_SECONDS)
+
+        for nodegroup_name, result in pending.items():
+            result['final_update_status'] = 'InProgress'
+            self.logger.warning(f"   [WARN]  {nodegroup_name}: update still in progress when tracking stopped")
+            self.increment_stat('warnings_issued')
+
+    def log_latency_report(self, results):
+        """Per-nodegroup submit/completion latency table"""
+        self.logger.info("[TIMER]  PER-NODEGROUP LATENCY:")
+        for result in results:
+            line = f"   ├── {result['nodegroup']}: {result['status']}, submitted in {result.get('submit_latency_seconds', 0)}s"
+            if result.get('completion_latency_seconds') is not None:
+                line += f", {result['final_update_status']} after {result['completion_latency_seconds']}s"
+            elif result.get('final_update_status'):
+                line += f", {result['final_update_status']}"
+            self.logger.info(line)
+
+    def scale_nodegroups(self, cluster_name, region, action, ist_time, nodegroups_config,
+                         concurrent=True, wait_for_completion=True, wait_timeout=45):
+        """
+        Main scaling logic with enhanced logging and error handling
+
+        Args:
+            concurrent: Submit all nodegroup updates at once instead of one after another
+            wait_for_completion: Track the submitted updates with a shared describe_update poll loop
+            wait_timeout: Seconds to track updates (bounded by the Lambda's remaining time by the caller)
+        """
         self.log_execution_start(cluster_name, region, action, ist_time)
 
         try:
@@ -327,7 +432,7 @@ class EKSNodeGroupScaler:
                 self.logger.info(f"   User/Role ARN: {identity.get('Arn')}")
             except Exception as e:
                 self.logger.warning(f"[WARN]  Could not verify AWS identity: {str(e)}")
-                self.execution_stats['warnings_issued'] += 1
+                self.increment_stat('warnings_issued')
 
             # Validate input
             if not nodegroups_config:
@@ -376,10 +481,19 @@ class EKSNodeGroupScaler:
             self.logger.info(f"[START] PHASE 2: EXECUTING SCALING OPERATIONS")
             self.logger.info("─" * 60)
 
-            results = []
-            for i, ng_config in enumerate(valid_configs, 1):
-                result = self.process_nodegroup(eks_client, cluster_name, ng_config, i, len(valid_configs))
-                results.append(result)
+            operations_started_at = time.monotonic()
+            if concurrent and len(valid_configs) > 1:
+                results = self.submit_nodegroup_updates(eks_client, cluster_name, valid_configs)
+            else:
+                results = []
+                for i, ng_config in enumerate(valid_configs, 1):
+                    result = self.process_nodegroup(eks_client, cluster_name, ng_config, i, len(valid_configs))
+                    results.append(result)
+
+            if wait_for_completion:
+                self.track_nodegroup_updates(eks_client, cluster_name, results, operations_started_at, wait_timeout)
+            operations_seconds = round(time.monotonic() - operations_started_at, 2)
+            self.log_latency_report(results)
 
             # Calculate final statistics
             total_processed = len(valid_configs)
@@ -392,7 +506,8 @@ class EKSNodeGroupScaler:
             self.logger.info(f"   ├── Skipped operations: {self.execution_stats['skipped_operations']}")
             self.logger.info(f"   ├── Failed operations: {self.execution_stats['failed_operations']}")
             self.logger.info(f"   ├── Success rate: {success_rate:.1f}%")
-            self.logger.info(f"   └── Total scaling changes: {self.execution_stats['total_scaling_changes']}")
+            self.logger.info(f"   ├── Total scaling changes: {self.execution_stats['total_scaling_changes']}")
+            self.logger.info(f"   └── Scaling wall-clock time: {operations_seconds}s ({'concurrent' if concurrent else 'sequential'})")
 
             self.log_execution_end(success=True)
 
@@ -411,6 +526,8 @@ class EKSNodeGroupScaler:
                 'success_rate_percent': round(success_rate, 1),
                 'total_scaling_changes': self.execution_stats['total_scaling_changes'],
                 'execution_stats': self.execution_stats,
+                'concurrent': concurrent,
+                'scaling_seconds': operations_seconds,
                 'results': results,
                 'processed_by': 'eks-nodegroup-scaling-lambda',
                 'processed_by_user': '{{CURRENT_USER}}',
@@ -512,8 +629,15 @@ def lambda_handler(event, context):
         logger.info(f"   ├── IST Time: {ist_time}")
         logger.info(f"   └── Nodegroups: {len(nodegroups_config)} configured")
 
+        # Concurrent submission and update tracking (tracking stops 5s before the Lambda times out)
+        concurrent = event.get('concurrent', True)
+        wait_for_completion = event.get('wait_for_completion', True)
+        wait_timeout = max(0, context.get_remaining_time_in_millis() / 1000 - 5)
+
         # Run the scaling logic
-        result = scaler.scale_nodegroups(cluster_name, region, action, ist_time, nodegroups_config)
+        result = scaler.scale_nodegroups(cluster_name, region, action, ist_time, nodegroups_config,
+                                         concurrent=concurrent, wait_for_completion=wait_for_completion,
+                                         wait_timeout=wait_timeout)
 
         logger.info(f"[PARTY] Lambda execution completed with status: {result['statusCode']}")
         return result
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-Optimized Lambda Node Protection Monitor with Boto3-based kubeconfig generation
-Eliminates AWS CLI dependency to solve package size and timeout issues
+Optimized Lambda Node Protection Monitor with an in-process Kubernetes API client
+Eliminates AWS CLI and kubectl dependencies to solve package size and timeout issues
 Ensures only ONE instance across ALL nodegroups has NO_DELETE protection
 Generated on: {{CURRENT_DATETIME}}
 Created by: {{CURRENT_USER}}
@@ -16,7 +16,10 @@ import logging
 import time
 import base64
 import tempfile
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError, BotoCoreError
+from botocore.signers import RequestSigner
 
 # Configure enhanced logging
 logger = logging.getLogger()
@@ -36,7 +39,86 @@ for handler in logger.handlers:
     handler.setFormatter(CustomFormatter())
 
 
+class LambdaKubernetesAPI:
+    """
+    Minimal Kubernetes API client for the Lambda package (which ships as this single file).
+    Keeps one keep-alive HTTPS pool to the API server and a presigned STS token that is
+    reused until shortly before EKS stops accepting it (15 minutes).
+    """
+
+    TOKEN_TTL_SECONDS = 14 * 60
+
+    def __init__(self, session, cluster_name, region):
+        self.session = session
+        self.cluster_name = cluster_name
+        self.region = region
+        self._token = None
+        self._token_expires_at = 0
+
+        cluster = session.client('eks').describe_cluster(name=cluster_name)['cluster']
+        ca_path = os.path.join(tempfile.gettempdir(), f"{cluster_name}-ca.crt")
+        with open(ca_path, 'wb') as f:
+            f.write(base64.b64decode(cluster['certificateAuthority']['data']))
+
+        self.endpoint = cluster['endpoint']
+        self.pool = urllib3.connection_from_url(
+            self.endpoint, cert_reqs='CERT_REQUIRED', ca_certs=ca_path, maxsize=16,
+            timeout=urllib3.Timeout(connect=10, read=30), retries=False
+        )
+
+    def get_token(self, force_refresh=False):
+        if force_refresh or not self._token or time.time() >= self._token_expires_at:
+            sts_client = self.session.client('sts', region_name=self.region)
+            signer = RequestSigner(sts_client.meta.service_model.service_id, self.region, 'sts', 'v4',
+                                   self.session.get_credentials(), self.session.events)
+            url = signer.generate_presigned_url(
+                {
+                    'method': 'GET',
+                    'url': f"https://sts.{self.region}.amazonaws.com/?Action=GetCallerIdentity&Version=2011-06-15",
+                    'body': {},
+                    'headers': {'x-k8s-aws-id': self.cluster_name},
+                    'context': {}
+                },
+                region_name=self.region, expires_in=60, operation_name=''
+            )
+            self._token = 'k8s-aws-v1.' + base64.urlsafe_b64encode(url.encode('utf-8')).decode('utf-8').rstrip('=')
+            self._token_expires_at = time.time() + self.TOKEN_TTL_SECONDS
+        return self._token
+
+    def request(self, method, path, body=None, content_type='application/json'):
+        """Send a JSON request, retrying once with a fresh token on 401"""
+        payload = json.dumps(body) if body is not None else None
+        for attempt in range(2):
+            headers = {'Authorization': f"Bearer {self.get_token(attempt > 0)}", 'Accept': 'application/json'}
+            if payload is not None:
+                headers['Content-Type'] = content_type
+            response = self.pool.urlopen(method, path, body=payload, headers=headers)
+            if response.status != 401:
+                break
+        if response.status >= 400:
+            raise Exception(f"Kubernetes API {method} {path} failed: {response.status} "
+                            f"{response.data.decode('utf-8', errors='replace')[:300]}")
+        return json.loads(response.data.decode('utf-8')) if response.data else {}
+
+    def list_nodes(self):
+        return self.request('GET', '/api/v1/nodes').get('items', [])
+
+    def patch_node(self, node_name, patch):
+        return self.request('PATCH', f"/api/v1/nodes/{node_name}", patch,
+                            content_type='application/merge-patch+json')
+
+
 class LambdaNodeProtectionMonitor:
+    PROTECTION_TAG_KEY = 'kubernetes.io/cluster-autoscaler/node-template/label/protection'
+    PROTECTION_TAG_VALUE = 'NO_DELETE'
+    SCALE_DOWN_ANNOTATION = 'cluster-autoscaler.kubernetes.io/scale-down-disabled'
+
+    # API batch limits
+    ASG_NAMES_PER_DESCRIBE = 50
+    INSTANCES_PER_PROTECTION_CALL = 50
+    INSTANCES_PER_TAG_CALL = 200
+    PARALLEL_WORKERS = 16
+
     def __init__(self):
         self.logger = logger
         self.start_time = None
@@ -48,6 +130,8 @@ class LambdaNodeProtectionMonitor:
             'errors_encountered': 0,
             'warnings_issued': 0
         }
+        # Kubernetes API clients survive between invocations of a warm container
+        self.kube_api_clients = {}
 
     def log_execution_start(self, cluster_name, region):
         """Log execution start with detailed context"""
@@ -60,7 +144,7 @@ class LambdaNodeProtectionMonitor:
         self.logger.info(f"[REGION] Target Region: {region}")
         self.logger.info(f"👤 Generated By: {{CURRENT_USER}}")
         self.logger.info(f"[LOG] Template Generated: {{CURRENT_DATETIME}}")
-        self.logger.info(f"[CONFIG] Method: Boto3-based kubeconfig (NO AWS CLI)")
+        self.logger.info(f"[CONFIG] Method: In-process Kubernetes API client (NO AWS CLI/kubectl)")
         self.logger.info("=" * 80)
 
     def log_execution_end(self, success=True):
@@ -79,263 +163,139 @@ class LambdaNodeProtectionMonitor:
         self.logger.info(f"[OK] Status: {'SUCCESS' if success else 'FAILED'}")
         self.logger.info("=" * 80)
 
-    def generate_kubeconfig_with_boto3(self, cluster_name, region, access_key=None, secret_key=None):
+    def get_kubernetes_api(self, cluster_name, region, access_key=None, secret_key=None):
         """
-        Generate kubeconfig using Boto3 instead of AWS CLI
-        This eliminates the 70MB AWS CLI dependency
+        Get the Kubernetes API client for a cluster, reusing the one from a previous
+        invocation of this container when possible
         """
-        self.logger.info("[CONFIG] Generating kubeconfig using Boto3...")
-
-        try:
-            # Create EKS client
-            if access_key and secret_key:
-                eks_client = boto3.client(
-                    'eks',
-                    region_name=region,
-                    aws_access_key_id=access_key,
-                    aws_secret_access_key=secret_key
-                )
-                sts_client = boto3.client(
-                    'sts',
-                    region_name=region,
-                    aws_access_key_id=access_key,
-                    aws_secret_access_key=secret_key
-                )
-            else:
-                eks_client = boto3.client('eks', region_name=region)
-                sts_client = boto3.client('sts', region_name=region)
-
-            # Get cluster information
-            self.logger.info(f"[SCAN] Retrieving cluster information for {cluster_name}...")
-            cluster_info = eks_client.describe_cluster(name=cluster_name)
-            cluster = cluster_info['cluster']
-
-            endpoint = cluster['endpoint']
-            ca_data = cluster['certificateAuthority']['data']
-
-            self.logger.info(f"[OK] Cluster endpoint: {endpoint}")
-            self.logger.info(f"[OK] CA data retrieved: {len(ca_data)} characters")
-
-            # Get AWS account information
-            identity = sts_client.get_caller_identity()
-            account_id = identity['Account']
-
-            self.logger.info(f"[OK] Account ID: {account_id}")
-
-            # Create kubeconfig structure
-            kubeconfig = {
-                'apiVersion': 'v1',
-                'clusters': [{
-                    'cluster': {
-                        'certificate-authority-data': ca_data,
-                        'server': endpoint
-                    },
-                    'name': f'arn:aws:eks:{region}:{account_id}:cluster/{cluster_name}'
-                }],
-                'contexts': [{
-                    'context': {
-                        'cluster': f'arn:aws:eks:{region}:{account_id}:cluster/{cluster_name}',
-                        'user': f'arn:aws:eks:{region}:{account_id}:cluster/{cluster_name}'
-                    },
-                    'name': f'arn:aws:eks:{region}:{account_id}:cluster/{cluster_name}'
-                }],
-                'current-context': f'arn:aws:eks:{region}:{account_id}:cluster/{cluster_name}',
-                'kind': 'Config',
-                'users': [{
-                    'name': f'arn:aws:eks:{region}:{account_id}:cluster/{cluster_name}',
-                    'user': {
-                        'exec': {
-                            'apiVersion': 'client.authentication.k8s.io/v1beta1',
-                            'command': '/bin/sh',
-                            'args': [
-                                '-c',
-                                f'python3 -c "import boto3, base64; '
-                                f'sts=boto3.client(\'sts\', region_name=\'{region}\'); '
-                                f'token=base64.urlsafe_b64encode(f\'k8s-aws-v1.{{base64.urlsafe_b64encode(f\\"https://sts.{region}.amazonaws.com/?Action=GetCallerIdentity&Version=2011-06-15\\".encode()).decode().rstrip(\\"=\\").replace(\\"+\\", \\"-\\").replace(\\"/\\", \\"_\\")}}\'.encode()).decode().rstrip(\'=\'); '
-                                f'print(token)"'
-                            ],
-                            'env': []
-                        }
-                    }
-                }]
-            }
-
-            # Add credentials if provided
-            if access_key and secret_key:
-                kubeconfig['users'][0]['user']['exec']['env'] = [
-                    {'name': 'AWS_ACCESS_KEY_ID', 'value': access_key},
-                    {'name': 'AWS_SECRET_ACCESS_KEY', 'value': secret_key},
-                    {'name': 'AWS_REGION', 'value': region}
-                ]
-
-            # Write kubeconfig to temporary file using JSON format
-            kubeconfig_path = '/tmp/kubeconfig'
-            with open(kubeconfig_path, 'w') as f:
-                json.dump(kubeconfig, f, indent=2)
-
-            self.logger.info(f"[OK] Kubeconfig generated at: {kubeconfig_path}")
-            return kubeconfig_path
-
-        except Exception as e:
-            self.logger.error(f"[ERROR] Failed to generate kubeconfig: {str(e)}")
-            raise
-
-    def find_kubectl_binary(self):
-        """Find kubectl binary from Lambda layer"""
-        import shutil
-
-        # Add Lambda layer paths to PATH
-        os.environ["PATH"] += os.pathsep + "/opt/bin"
-
-        # Prioritized paths for kubectl
-        kubectl_paths = [
-            '/opt/bin/kubectl',
-            '/opt/kubectl/kubectl',
-            '/usr/local/bin/kubectl',
-            '/usr/bin/kubectl'
-        ]
-
-        # Try using which with updated PATH
-        kubectl_path = shutil.which('kubectl')
-        if kubectl_path:
-            self.logger.info(f"[SCAN] Found kubectl via PATH: {kubectl_path}")
-            return kubectl_path
-
-        # Try direct paths
-        for path in kubectl_paths:
-            if os.path.exists(path) and os.access(path, os.X_OK):
-                self.logger.info(f"[SCAN] Found kubectl at: {path}")
-                return path
-
-        self.logger.warning("[WARN]  kubectl not found in any expected location")
-        return None
-
-    def annotate_k8s_node_scale_down_disabled(self, kubeconfig_path, node_name):
+        key = (cluster_name, region, access_key)
+        if key in self.kube_api_clients:
+            self.logger.info("[CONFIG] Reusing Kubernetes API connection from previous invocation")
+            return self.kube_api_clients[key]
+
+        self.logger.info("[CONFIG] Connecting to Kubernetes API...")
+        if access_key and secret_key:
+            session = boto3.Session(
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name=region
+            )
+        else:
+            session = boto3.Session(region_name=region)
+
+        kube_api = LambdaKubernetesAPI(session, cluster_name, region)
+        self.logger.info(f"[OK] Cluster endpoint: {kube_api.endpoint}")
+        self.kube_api_clients[key] = kube_api
+        return kube_api
+
+    def get_k8s_nodes_with_instance_ids(self, kube_api):
         """
-        Annotate Kubernetes node with scale-down-disabled using kubectl
+        Get all Kubernetes nodes with their EC2 instance IDs in one API list
+        Returns: {instance_id: {'name': node_name, 'annotations': {...}}}
         """
-        import subprocess
-
-        kubectl_path = self.find_kubectl_binary()
-        if not kubectl_path:
-            self.logger.error("[ERROR] kubectl not found. Cannot annotate nodes.")
-            return False
-
-        self.logger.info(f"[SECURE] Annotating node {node_name} with scale-down protection...")
+        self.logger.info("[SCAN] Retrieving Kubernetes nodes with instance IDs...")
 
         try:
-            # Check if annotation already exists
-            check_cmd = [
-                kubectl_path, '--kubeconfig', kubeconfig_path,
-                'get', 'node', node_name,
-                '-o', 'jsonpath={.metadata.annotations.cluster-autoscaler\\.kubernetes\\.io/scale-down-disabled}'
-            ]
-
-            check_result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=30)
-
-            if check_result.returncode == 0 and check_result.stdout.strip() == "true":
-                self.logger.info(f"[OK] Node {node_name} already has scale-down protection")
-                return True
-
-            # Add the annotation
-            annotate_cmd = [
-                kubectl_path, '--kubeconfig', kubeconfig_path,
-                'annotate', 'node', node_name,
-                'cluster-autoscaler.kubernetes.io/scale-down-disabled=true',
-                '--overwrite'
-            ]
+            node_map = {}
+            for node in kube_api.list_nodes():
+                metadata = node['metadata']
+                # Provider ID format: aws:///us-east-1a/i-1234567890abcdef0
+                instance_id = node.get('spec', {}).get('providerID', '').split('/')[-1]
 
-            annotate_result = subprocess.run(annotate_cmd, capture_output=True, text=True, timeout=30)
+                if instance_id.startswith('i-'):
+                    node_map[instance_id] = {'name': metadata['name'], 'annotations': metadata.get('annotations', {})}
 
-            if annotate_result.returncode == 0:
-                self.logger.info(f"[OK] Successfully annotated node {node_name}")
-                return True
-            else:
-                self.logger.error(f"[ERROR] Failed to annotate node {node_name}: {annotate_result.stderr}")
-                return False
+            self.logger.info(f"[STATS] Successfully mapped {len(node_map)} instances to nodes")
+            return node_map
 
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"[ERROR] Timeout annotating node {node_name}")
-            return False
         except Exception as e:
-            self.logger.error(f"[ERROR] Error annotating node {node_name}: {str(e)}")
-            return False
+            self.logger.error(f"[ERROR] Error getting node information: {str(e)}")
+            return {}
 
-    def get_k8s_nodes_with_instance_ids(self, kubeconfig_path):
+    def describe_nodegroups(self, eks_client, cluster_name, nodegroup_names):
         """
-        Get all Kubernetes nodes with their EC2 instance IDs
-        Returns: {instance_id: node_name}
+        Describe all nodegroups in parallel
+        Returns: {nodegroup_name: nodegroup dict or the Exception raised}
         """
-        import subprocess
-
-        kubectl_path = self.find_kubectl_binary()
-        if not kubectl_path:
-            self.logger.error("[ERROR] kubectl not found. Cannot get node information.")
-            return {}
+        def describe(ng_name):
+            try:
+                return eks_client.describe_nodegroup(clusterName=cluster_name, nodegroupName=ng_name)['nodegroup']
+            except Exception as e:
+                return e
 
-        self.logger.info("[SCAN] Retrieving Kubernetes nodes with instance IDs...")
+        with ThreadPoolExecutor(max_workers=min(self.PARALLEL_WORKERS, max(1, len(nodegroup_names)))) as executor:
+            return dict(zip(nodegroup_names, executor.map(describe, nodegroup_names)))
 
-        try:
-            # Get all nodes with instance IDs
-            nodes_cmd = [
-                kubectl_path, '--kubeconfig', kubeconfig_path,
-                'get', 'nodes', '-o', 'wide', '--no-headers'
+    def get_in_service_instances(self, autoscaling_client, asg_names):
+        """
+        Get InService instances of many ASGs with batched describe calls
+        Returns: {asg_name: [{'InstanceId', 'ProtectedFromScaleIn'}]} (ASGs that were not found are absent)
+        """
+        instances_by_asg = {}
+        paginator = autoscaling_client.get_paginator('describe_auto_scaling_groups')
+        for start in range(0, len(asg_names), self.ASG_NAMES_PER_DESCRIBE):
+            batch = asg_names[start:start + self.ASG_NAMES_PER_DESCRIBE]
+            for page in paginator.paginate(AutoScalingGroupNames=batch):
+                for asg in page['AutoScalingGroups']:
+                    instances_by_asg[asg['AutoScalingGroupName']] = [
+                        instance for instance in asg.get('Instances', [])
+                        if instance['LifecycleState'] == 'InService'
+                    ]
+        return instances_by_asg
+
+    def get_protected_instance_ids(self, ec2_client, instance_ids):
+        """Instance IDs carrying the NO_DELETE protection tag, via batched describe_tags"""
+        protected = set()
+        paginator = ec2_client.get_paginator('describe_tags')
+        for start in range(0, len(instance_ids), self.INSTANCES_PER_TAG_CALL):
+            filters = [
+                {'Name': 'resource-id', 'Values': instance_ids[start:start + self.INSTANCES_PER_TAG_CALL]},
+                {'Name': 'key', 'Values': [self.PROTECTION_TAG_KEY]}
             ]
+            for page in paginator.paginate(Filters=filters):
+                protected.update(tag['ResourceId'] for tag in page['Tags']
+                                 if tag['Value'] == self.PROTECTION_TAG_VALUE)
+        return protected
 
-            nodes_result = subprocess.run(nodes_cmd, capture_output=True, text=True, timeout=60)
-
-            if nodes_result.returncode != 0:
-                self.logger.error(f"[ERROR] Failed to get nodes: {nodes_result.stderr}")
-                return {}
-
-            # Parse node information and match with instance IDs
-            node_map = {}
-            for line in nodes_result.stdout.strip().split('\n'):
-                if not line.strip():
-                    continue
-
-                cols = line.split()
-                if len(cols) >= 7:
-                    node_name = cols[0]
-                    # Try to get instance ID from different columns
-                    instance_id = None
-
-                    # Check EXTERNAL-IP column first
-                    if cols[6].startswith('i-'):
-                        instance_id = cols[6]
-                    else:
-                        # Try to get from node provider ID
-                        try:
-                            provider_cmd = [
-                                kubectl_path, '--kubeconfig', kubeconfig_path,
-                                'get', 'node', node_name,
-                                '-o', 'jsonpath={.spec.providerID}'
-                            ]
-
-                            provider_result = subprocess.run(provider_cmd, capture_output=True, text=True, timeout=10)
-                            if provider_result.returncode == 0:
-                                provider_id = provider_result.stdout.strip()
-                                # Provider ID format: aws:///us-east-1a/i-1234567890abcdef0
-                                if '/' in provider_id:
-                                    potential_id = provider_id.split('/')[-1]
-                                    if potential_id.startswith('i-'):
-                                        instance_id = potential_id
-                        except:
-                            pass
-
-                    if instance_id and instance_id.startswith('i-'):
-                        node_map[instance_id] = node_name
-                        self.logger.info(f"[OK] Mapped instance {instance_id} to node {node_name}")
-
-            self.logger.info(f"[STATS] Successfully mapped {len(node_map)} instances to nodes")
-            return node_map
+    def set_scale_in_protection(self, autoscaling_client, instance_ids_by_asg, protected):
+        """
+        Set ASG scale-in protection with multi-instance calls (50 instances per call)
+        Returns: number of instances updated
+        """
+        updated = 0
+        for asg_name, instance_ids in instance_ids_by_asg.items():
+            for start in range(0, len(instance_ids), self.INSTANCES_PER_PROTECTION_CALL):
+                batch = instance_ids[start:start + self.INSTANCES_PER_PROTECTION_CALL]
+                try:
+                    autoscaling_client.set_instance_protection(
+                        AutoScalingGroupName=asg_name,
+                        InstanceIds=batch,
+                        ProtectedFromScaleIn=protected
+                    )
+                    updated += len(batch)
+                    self.logger.info(f"[OK] Scale-in protection {'enabled' if protected else 'removed'} "
+                                     f"for {len(batch)} instance(s) in {asg_name}")
+                except Exception as e:
+                    self.logger.error(f"[ERROR] Failed to set scale-in protection in {asg_name}: {str(e)}")
+                    self.execution_stats['errors_encountered'] += 1
+        return updated
 
-        except subprocess.TimeoutExpired:
-            self.logger.error("[ERROR] Timeout getting node information")
-            return {}
-        except Exception as e:
-            self.logger.error(f"[ERROR] Error getting node information: {str(e)}")
-            return {}
+    def patch_node_annotations(self, kube_api, annotation_values):
+        """
+        Set (value 'true') or remove (value None) the scale-down-disabled annotation on many nodes in parallel
+        Returns: {node_name: success}
+        """
+        def patch(item):
+            node_name, value = item
+            try:
+                kube_api.patch_node(node_name, {'metadata': {'annotations': {self.SCALE_DOWN_ANNOTATION: value}}})
+                return node_name, True
+            except Exception as e:
+                self.logger.error(f"[ERROR] Error annotating node {node_name}: {str(e)}")
+                return node_name, False
+
+        with ThreadPoolExecutor(max_workers=self.PARALLEL_WORKERS) as executor:
+            return dict(executor.map(patch, annotation_values.items()))
 
     def create_aws_clients(self, region, access_key=None, secret_key=None):
         """Create AWS clients with validation"""
@@ -382,11 +342,11 @@ class LambdaNodeProtectionMonitor:
             # Create AWS clients
             eks_client, ec2_client, autoscaling_client = self.create_aws_clients(region, access_key, secret_key)
 
-            # Generate kubeconfig using Boto3 (eliminates AWS CLI dependency)
-            kubeconfig_path = self.generate_kubeconfig_with_boto3(cluster_name, region, access_key, secret_key)
+            # Connect to the Kubernetes API directly (no AWS CLI or kubectl needed)
+            kube_api = self.get_kubernetes_api(cluster_name, region, access_key, secret_key)
 
-            # Get Kubernetes nodes with instance IDs
-            node_map = self.get_k8s_nodes_with_instance_ids(kubeconfig_path)
+            # Get all Kubernetes nodes with instance IDs (one API list)
+            node_map = self.get_k8s_nodes_with_instance_ids(kube_api)
 
             if not node_map:
                 self.logger.warning("[WARN]  No Kubernetes nodes found with instance IDs")
@@ -418,121 +378,89 @@ class LambdaNodeProtectionMonitor:
 
             self.logger.info(f"[OK] Found {len(nodegroups)} nodegroups: {nodegroups}")
 
-            # PHASE 1: Scan all nodegroups for current protection status
+            # PHASE 1: Scan all nodegroups for current protection status (batched API calls)
             self.logger.info("[SCAN] PHASE 1: SCANNING NODEGROUPS FOR PROTECTION STATUS")
             self.logger.info("─" * 60)
 
+            nodegroup_details = self.describe_nodegroups(eks_client, cluster_name, nodegroups)
+            asg_by_nodegroup = {}
+
             for i, ng_name in enumerate(nodegroups, 1):
                 self.logger.info(f"[PACKAGE] [{i}/{len(nodegroups)}] Processing nodegroup: {ng_name}")
 
-                try:
-                    # Get nodegroup details
-                    ng_response = eks_client.describe_nodegroup(
-                        clusterName=cluster_name,
-                        nodegroupName=ng_name
-                    )
+                nodegroup = nodegroup_details[ng_name]
+                if isinstance(nodegroup, Exception):
+                    self.logger.error(f"   [ERROR] Error processing nodegroup {ng_name}: {str(nodegroup)}")
+                    self.execution_stats['errors_encountered'] += 1
+                    continue
 
-                    nodegroup = ng_response['nodegroup']
-                    status = nodegroup['status']
-                    capacity_type = nodegroup.get('capacityType', 'ON_DEMAND')
-                    instance_types = nodegroup.get('instanceTypes', ['Unknown'])
+                status = nodegroup['status']
+                self.logger.info(f"   ├── Status: {status}")
+                self.logger.info(f"   ├── Capacity Type: {nodegroup.get('capacityType', 'ON_DEMAND')}")
+                self.logger.info(f"   ├── Instance Types: {nodegroup.get('instanceTypes', ['Unknown'])}")
 
-                    self.logger.info(f"   ├── Status: {status}")
-                    self.logger.info(f"   ├── Capacity Type: {capacity_type}")
-                    self.logger.info(f"   ├── Instance Types: {instance_types}")
+                if status != 'ACTIVE':
+                    self.logger.warning(f"   [WARN]  Nodegroup {ng_name} is not ACTIVE (status: {status})")
+                    self.execution_stats['warnings_issued'] += 1
 
-                    if status != 'ACTIVE':
-                        self.logger.warning(f"   [WARN]  Nodegroup {ng_name} is not ACTIVE (status: {status})")
-                        self.execution_stats['warnings_issued'] += 1
+                # Get Auto Scaling Group
+                asg_list = nodegroup.get('resources', {}).get('autoScalingGroups', [])
+                if not asg_list:
+                    self.logger.warning(f"   [WARN]  No ASG found for nodegroup {ng_name}")
+                    continue
 
-                    # Get Auto Scaling Group
-                    asg_name = None
-                    if 'resources' in nodegroup and 'autoScalingGroups' in nodegroup['resources']:
-                        asg_list = nodegroup['resources']['autoScalingGroups']
-                        if asg_list:
-                            asg_name = asg_list[0]['name']
-                            self.logger.info(f"   ├── ASG: {asg_name}")
+                asg_by_nodegroup[ng_name] = asg_list[0]['name']
+                self.logger.info(f"   └── ASG: {asg_list[0]['name']}")
 
-                    if not asg_name:
-                        self.logger.warning(f"   [WARN]  No ASG found for nodegroup {ng_name}")
-                        continue
+            # One batched ASG describe and one batched tag lookup for the whole cluster
+            instances_by_asg = self.get_in_service_instances(autoscaling_client, list(asg_by_nodegroup.values()))
+            protected_ids = self.get_protected_instance_ids(
+                ec2_client,
+                [instance['InstanceId'] for instances in instances_by_asg.values() for instance in instances]
+            )
 
-                    # Get instances in ASG
-                    asg_response = autoscaling_client.describe_auto_scaling_groups(
-                        AutoScalingGroupNames=[asg_name]
-                    )
-
-                    if not asg_response['AutoScalingGroups']:
-                        self.logger.warning(f"   [WARN]  ASG {asg_name} not found")
-                        continue
+            for ng_name, asg_name in asg_by_nodegroup.items():
+                if asg_name not in instances_by_asg:
+                    self.logger.warning(f"   [WARN]  ASG {asg_name} not found")
+                    continue
 
-                    asg = asg_response['AutoScalingGroups'][0]
-                    instances = [i for i in asg.get('Instances', []) if i['LifecycleState'] == 'InService']
+                instances = instances_by_asg[asg_name]
+                if not instances:
+                    self.logger.warning(f"   [WARN]  No instances in service for nodegroup {ng_name}")
+                    continue
 
-                    self.logger.info(f"   ├── Instances in service: {len(instances)}")
+                # Check protection status
+                ng_protected_instances = []
+                ng_unprotected_instances = []
+
+                for instance in instances:
+                    instance_id = instance['InstanceId']
+                    instance_info = {
+                        'instance_id': instance_id,
+                        'nodegroup': ng_name,
+                        'asg': asg_name,
+                        'node_name': node_map.get(instance_id, {}).get('name', 'unknown'),
+                        'scale_in_protected': instance.get('ProtectedFromScaleIn', False)
+                    }
 
-                    if not instances:
-                        self.logger.warning(f"   [WARN]  No instances in service for nodegroup {ng_name}")
-                        continue
+                    if instance_id in protected_ids:
+                        ng_protected_instances.append(instance_id)
+                        all_protected_instances.append(instance_info)
+                    else:
+                        ng_unprotected_instances.append(instance_id)
+                        all_unprotected_instances.append(instance_info)
 
-                    # Check protection status
-                    ng_protected_instances = []
-                    ng_unprotected_instances = []
-
-                    for instance in instances:
-                        instance_id = instance['InstanceId']
-
-                        try:
-                            # Get instance details
-                            instance_response = ec2_client.describe_instances(InstanceIds=[instance_id])
-                            if not instance_response['Reservations']:
-                                continue
-
-                            instance_data = instance_response['Reservations'][0]['Instances'][0]
-                            tags = instance_data.get('Tags', [])
-
-                            # Check for NO_DELETE protection
-                            has_protection = any(
-                                tag['Key'] == 'kubernetes.io/cluster-autoscaler/node-template/label/protection'
-                                and tag['Value'] == 'NO_DELETE'
-                                for tag in tags
-                            )
-
-                            instance_info = {
-                                'instance_id': instance_id,
-                                'nodegroup': ng_name,
-                                'asg': asg_name,
-                                'node_name': node_map.get(instance_id, 'unknown')
-                            }
-
-                            if has_protection:
-                                ng_protected_instances.append(instance_id)
-                                all_protected_instances.append(instance_info)
-                                self.logger.info(f"   │   [OK] {instance_id}: Protected")
-                            else:
-                                ng_unprotected_instances.append(instance_id)
-                                all_unprotected_instances.append(instance_info)
-                                self.logger.info(f"   │   [UNLOCKED] {instance_id}: Not protected")
-
-                            self.execution_stats['instances_scanned'] += 1
-
-                        except Exception as e:
-                            self.logger.error(f"   │   [ERROR] Error checking {instance_id}: {str(e)}")
-                            self.execution_stats['errors_encountered'] += 1
-
-                    results[ng_name] = {
-                        'status': 'scanned',
-                        'protected_instances': ng_protected_instances,
-                        'unprotected_instances': ng_unprotected_instances,
-                        'asg_name': asg_name
-                    }
+                    self.execution_stats['instances_scanned'] += 1
 
-                    self.logger.info(
-                        f"   └── Protected: {len(ng_protected_instances)}, Unprotected: {len(ng_unprotected_instances)}")
+                results[ng_name] = {
+                    'status': 'scanned',
+                    'protected_instances': ng_protected_instances,
+                    'unprotected_instances': ng_unprotected_instances,
+                    'asg_name': asg_name
+                }
 
-                except Exception as e:
-                    self.logger.error(f"   [ERROR] Error processing nodegroup {ng_name}: {str(e)}")
-                    self.execution_stats['errors_encountered'] += 1
+                self.logger.info(f"[PACKAGE] {ng_name}: {len(instances)} in service, "
+                                 f"Protected: {len(ng_protected_instances)}, Unprotected: {len(ng_unprotected_instances)}")
 
             # PHASE 2: Apply protection logic
             self.logger.info("[PROTECTED]  PHASE 2: APPLYING PROTECTION LOGIC")
@@ -541,6 +469,8 @@ class LambdaNodeProtectionMonitor:
                 f"[STATS] Cluster-wide: {len(all_protected_instances)} protected, {len(all_unprotected_instances)} unprotected")
 
             target_instance_info = None
+            released_instances = []
+            protection_tag = [{'Key': self.PROTECTION_TAG_KEY, 'Value': self.PROTECTION_TAG_VALUE}]
 
             if len(all_protected_instances) == 0 and len(all_unprotected_instances) > 0:
                 # No protection exists, apply to first available instance
@@ -550,13 +480,7 @@ class LambdaNodeProtectionMonitor:
                 self.logger.info(f"[TARGET] Applying protection to: {instance_id}")
 
                 try:
-                    ec2_client.create_tags(
-                        Resources=[instance_id],
-                        Tags=[{
-                            'Key': 'kubernetes.io/cluster-autoscaler/node-template/label/protection',
-                            'Value': 'NO_DELETE'
-                        }]
-                    )
+                    ec2_client.create_tags(Resources=[instance_id], Tags=protection_tag)
                     self.logger.info(f"[OK] Protection applied to {instance_id}")
                     self.execution_stats['protection_applied'] += 1
 
@@ -585,24 +509,26 @@ class LambdaNodeProtectionMonitor:
                 self.execution_stats['protection_maintained'] += 1
 
             elif len(all_protected_instances) > 1:
-                # Too many protected, remove excess
+                # Too many protected, remove excess in batched delete_tags calls
                 target_instance_info = all_protected_instances[0]
                 remove_instances = all_protected_instances[1:]
 
                 self.logger.info(f"[TARGET] Removing excess protection from {len(remove_instances)} instances")
 
-                for instance_info in remove_instances:
-                    instance_id = instance_info['instance_id']
+                for start in range(0, len(remove_instances), self.INSTANCES_PER_TAG_CALL):
+                    batch = remove_instances[start:start + self.INSTANCES_PER_TAG_CALL]
                     try:
-                        ec2_client.delete_tags(
-                            Resources=[instance_id],
-                            Tags=[{
-                                'Key': 'kubernetes.io/cluster-autoscaler/node-template/label/protection',
-                                'Value': 'NO_DELETE'
-                            }]
-                        )
+                        ec2_client.delete_tags(Resources=[info['instance_id'] for info in batch], Tags=protection_tag)
+                    except Exception as e:
+                        self.logger.error(f"[ERROR] Failed to remove protection from {len(batch)} instances: {str(e)}")
+                        self.execution_stats['errors_encountered'] += 1
+                        continue
+
+                    for instance_info in batch:
+                        instance_id = instance_info['instance_id']
                         self.logger.info(f"[OK] Removed protection from {instance_id}")
                         self.execution_stats['protection_removed'] += 1
+                        released_instances.append(instance_info)
 
                         # Update results
                         ng_name = instance_info['nodegroup']
@@ -610,10 +536,6 @@ class LambdaNodeProtectionMonitor:
                         results[ng_name]['message'] = f'Removed excess protection from {instance_id}'
                         results[ng_name]['action_taken'] = 'protection_removed'
 
-                    except Exception as e:
-                        self.logger.error(f"[ERROR] Failed to remove protection from {instance_id}: {str(e)}")
-                        self.execution_stats['errors_encountered'] += 1
-
                 # Update the kept instance's nodegroup and count maintained protection
                 keep_ng = target_instance_info['nodegroup']
                 if results[keep_ng]['status'] != 'error':
@@ -622,27 +544,50 @@ class LambdaNodeProtectionMonitor:
                     results[keep_ng]['action_taken'] = 'protection_kept'
                     self.execution_stats['protection_maintained'] += 1
 
-            # PHASE 3: Annotate Kubernetes node
+            # ASG scale-in protection follows the NO_DELETE tag, grouped per ASG
+            if target_instance_info and not target_instance_info['scale_in_protected']:
+                self.set_scale_in_protection(
+                    autoscaling_client, {target_instance_info['asg']: [target_instance_info['instance_id']]}, True
+                )
+            release_by_asg = {}
+            for instance_info in released_instances:
+                if instance_info['scale_in_protected']:
+                    release_by_asg.setdefault(instance_info['asg'], []).append(instance_info['instance_id'])
+            if release_by_asg:
+                self.set_scale_in_protection(autoscaling_client, release_by_asg, False)
+
+            # PHASE 3: Annotate Kubernetes nodes (only those that change, patched in parallel)
+            annotation_values = {}
             if target_instance_info:
                 instance_id = target_instance_info['instance_id']
-                node_name = target_instance_info['node_name']
-
-                if node_name and node_name != 'unknown':
-                    self.logger.info("[SECURE] PHASE 3: ANNOTATING KUBERNETES NODE")
-                    self.logger.info("─" * 60)
-                    self.logger.info(f"[TARGET] Target node: {node_name} (instance: {instance_id})")
+                node = node_map.get(instance_id)
 
-                    annotation_success = self.annotate_k8s_node_scale_down_disabled(kubeconfig_path, node_name)
-
-                    if annotation_success:
-                        self.logger.info(f"[OK] Successfully annotated node {node_name}")
+                if node:
+                    if node['annotations'].get(self.SCALE_DOWN_ANNOTATION) == 'true':
+                        self.logger.info(f"[OK] Node {node['name']} already has scale-down protection")
                     else:
-                        self.logger.warning(f"[WARN]  Failed to annotate node {node_name}")
-                        self.execution_stats['warnings_issued'] += 1
+                        annotation_values[node['name']] = 'true'
                 else:
                     self.logger.warning(f"[WARN]  Could not find Kubernetes node for instance {instance_id}")
                     self.execution_stats['warnings_issued'] += 1
 
+            for instance_info in released_instances:
+                node = node_map.get(instance_info['instance_id'])
+                if node and node['annotations'].get(self.SCALE_DOWN_ANNOTATION) == 'true':
+                    annotation_values[node['name']] = None
+
+            if annotation_values:
+                self.logger.info("[SECURE] PHASE 3: ANNOTATING KUBERNETES NODES")
+                self.logger.info("─" * 60)
+                self.logger.info(f"[TARGET] Updating scale-down annotation on {len(annotation_values)} node(s)")
+
+                for node_name, success in self.patch_node_annotations(kube_api, annotation_values).items():
+                    if success:
+                        self.logger.info(f"[OK] Successfully updated annotation on node {node_name}")
+                    else:
+                        self.logger.warning(f"[WARN]  Failed to update annotation on node {node_name}")
+                        self.execution_stats['warnings_issued'] += 1
+
             # Update final status for nodegroups that were only scanned
             for ng_name, result in results.items():
                 if result.get('status') == 'scanned':
@@ -698,7 +643,7 @@ def lambda_handler(event, context):
     """
     try:
         logger.info("[START] Optimized Lambda function started")
-        logger.info(f"[PACKAGE] No AWS CLI dependency - using Boto3 for kubeconfig")
+        logger.info(f"[PACKAGE] No AWS CLI/kubectl dependency - using the Kubernetes API directly")
         logger.info(f"👤 Generated by: varadharajaan")
         logger.info(f"[DATE] Template generated: 2025-07-04 13:50:34 UTC")
         logger.info(f"[TARGET] Target cluster: {{CLUSTER_NAME}}")
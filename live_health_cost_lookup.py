@@ -1,6 +1,7 @@
 ﻿#!/usr/bin/env python3
 
 import boto3
+import numpy as np
 import json
 import sys
 import os
@@ -8,8 +9,13 @@ import time
 import threading
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
+from cloudwatch_metric_batcher import CloudWatchMetricBatcher, CPU_UTILIZATION, MEMORY_UTILIZATION
+from hourly_cost_matrix import HourlyCostMatrix, parse_confidence
+from pricing_store import get_pricing_store
+
 class LiveCostCalculator:
     def __init__(self, config_file='aws_accounts_config.json'):
         self.config_file = config_file
@@ -27,6 +33,20 @@ class LiveCostCalculator:
         self.pricing_cache_timestamp = None
         self.pricing_cache_valid_hours = 24  # Pricing cache valid for 24 hours
         
+        # Persistent pricing store shared with the other cost/spot tools
+        self.pricing_store = get_pricing_store()
+        
+        # boto3 clients shared per (service, account, region) across worker threads
+        self._client_cache = {}
+        self._client_cache_lock = threading.Lock()
+        
+        # Rows per page in the HTML report tables
+        self.report_table_page_size = 250
+        
+        # Parallel account x region execution limits
+        self.max_workers = 16
+        self.max_concurrent_per_account = 4
+        
         # Generate timestamp for output files
         self.execution_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -130,15 +150,23 @@ class LiveCostCalculator:
             self.logger.error(f"Error loading configuration: {e}")
             sys.exit(1)
 
+    def get_shared_client(self, service, access_key, secret_key, region):
+        """Get a boto3 client shared by all work units of the same (account, region)"""
+        cache_key = (service, access_key, region)
+        with self._client_cache_lock:
+            if cache_key not in self._client_cache:
+                self._client_cache[cache_key] = boto3.client(
+                    service,
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key,
+                    region_name=region
+                )
+            return self._client_cache[cache_key]
+
     def create_ec2_client(self, access_key, secret_key, region):
         """Create EC2 client for specified region"""
         try:
-            return boto3.client(
-                'ec2',
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region
-            )
+            return self.get_shared_client('ec2', access_key, secret_key, region)
         except Exception as e:
             self.logger.error(f"Failed to create EC2 client for region {region}: {e}")
             return None
@@ -146,12 +174,7 @@ class LiveCostCalculator:
     def create_eks_client(self, access_key, secret_key, region):
         """Create EKS client for specified region"""
         try:
-            return boto3.client(
-                'eks',
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region
-            )
+            return self.get_shared_client('eks', access_key, secret_key, region)
         except Exception as e:
             self.logger.error(f"Failed to create EKS client for region {region}: {e}")
             return None
@@ -159,12 +182,7 @@ class LiveCostCalculator:
     def create_cloudwatch_client(self, access_key, secret_key, region):
         """Create CloudWatch client for specified region"""
         try:
-            return boto3.client(
-                'cloudwatch',
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region
-            )
+            return self.get_shared_client('cloudwatch', access_key, secret_key, region)
         except Exception as e:
             self.logger.error(f"Failed to create CloudWatch client for region {region}: {e}")
             return None
@@ -178,110 +196,28 @@ class LiveCostCalculator:
                 self.logger.info(f"Using cached EC2 pricing data for {region_code}")
                 return self.ec2_pricing_cache[region_code]
         
-        # Map region codes to pricing API region descriptions
-        region_map = {
-            'us-east-1': 'US East (N. Virginia)',
-            'us-east-2': 'US East (Ohio)',
-            'us-west-1': 'US West (N. California)',
-            'us-west-2': 'US West (Oregon)',
-            'ap-south-1': 'Asia Pacific (Mumbai)',
-            'ap-northeast-1': 'Asia Pacific (Tokyo)',
-            'ap-northeast-2': 'Asia Pacific (Seoul)',
-            'ap-northeast-3': 'Asia Pacific (Osaka)',
-            'ap-southeast-1': 'Asia Pacific (Singapore)',
-            'ap-southeast-2': 'Asia Pacific (Sydney)',
-            'ca-central-1': 'Canada (Central)',
-            'eu-central-1': 'EU (Frankfurt)',
-            'eu-west-1': 'EU (Ireland)',
-            'eu-west-2': 'EU (London)',
-            'eu-west-3': 'EU (Paris)',
-            'eu-north-1': 'EU (Stockholm)',
-            'sa-east-1': 'South America (Sao Paulo)'
-        }
-        
-        # Use the AWS Price List API instead of downloading the index file
-        self.logger.info(f"Fetching EC2 pricing data for region {region_code}...")
+        self.logger.info(f"Loading EC2 pricing data for region {region_code}...")
         
         try:
-               # Get credentials for the selected account
-            account_name = next(iter(self.account_id_to_name.values()), None)
-            if not account_name:
-                self.logger.error("No valid account found for pricing API")
-                return {}
-            
-            account_data = self.aws_config['accounts'].get(account_name)
-            if not account_data:
-                self.logger.error(f"Account {account_name} not found in configuration")
-                return {}
-            
-            access_key = account_data['access_key']
-            secret_key = account_data['secret_key']
-        
-            # Create pricing client with credentials
-            pricing_client = boto3.client(
-                'pricing',
-                region_name= 'us-east-1',  # pricing API is only available in us-east-1
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key
-            )
-            
-            # Get EC2 pricing for Linux on-demand instances
-            region_name = region_map.get(region_code, region_code)
-            
-            # Initialize pricing map
-            pricing_map = {}
-            
-            # Get pricing for Linux On-Demand instances
-            paginator = pricing_client.get_paginator('get_products')
-            
-            # Service code for EC2
-            service_code = 'AmazonEC2'
-            
-            # Set up the filter
-            filters = [
-                {'Type': 'TERM_MATCH', 'Field': 'ServiceCode', 'Value': service_code},
-                {'Type': 'TERM_MATCH', 'Field': 'regionCode', 'Value': region_code},
-                {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': 'Linux'},
-                {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': 'Shared'},
-                {'Type': 'TERM_MATCH', 'Field': 'capacitystatus', 'Value': 'Used'}
-            ]
+            # Pricing client is only created if the shared store needs to refresh this region
+            def create_pricing_client():
+                # Get credentials for the selected account
+                account_name = next(iter(self.account_id_to_name.values()), None)
+                if not account_name:
+                    raise ValueError("No valid account found for pricing API")
+                
+                account_data = self.aws_config['accounts'].get(account_name)
+                if not account_data:
+                    raise ValueError(f"Account {account_name} not found in configuration")
+                
+                return boto3.client(
+                    'pricing',
+                    region_name='us-east-1',  # pricing API is only available in us-east-1
+                    aws_access_key_id=account_data['access_key'],
+                    aws_secret_access_key=account_data['secret_key']
+                )
             
-            # Get products
-            page_iterator = paginator.paginate(
-                ServiceCode=service_code,
-                Filters=filters
-            )
-            
-            # Process each page
-            for page in page_iterator:
-                for price_item in page['PriceList']:
-                    price_data = json.loads(price_item)
-                    
-                    # Extract SKU and product attributes
-                    product = price_data.get('product', {})
-                    attributes = product.get('attributes', {})
-                    instance_type = attributes.get('instanceType')
-                    
-                    # If not an instance type we're interested in, skip
-                    if not instance_type:
-                        continue
-                    
-                    # Extract price
-                    terms = price_data.get('terms', {})
-                    on_demand = terms.get('OnDemand', {})
-                    
-                    if on_demand:
-                        # Get the first price dimension
-                        sku_id = list(on_demand.keys())[0]
-                        price_dimensions = on_demand[sku_id].get('priceDimensions', {})
-                        
-                        if price_dimensions:
-                            dimension_id = list(price_dimensions.keys())[0]
-                            price_per_unit = float(price_dimensions[dimension_id].get('pricePerUnit', {}).get('USD', '0'))
-                            
-                            # Store pricing information
-                            if instance_type not in pricing_map or price_per_unit > 0:
-                                pricing_map[instance_type] = price_per_unit
+            pricing_map = self.pricing_store.get_ec2_prices(region_code, create_pricing_client)
             
             # Cache the data
             if not self.pricing_cache_timestamp:
@@ -418,94 +354,76 @@ class LiveCostCalculator:
 
     def get_ec2_instance_health(self, ec2_client, cloudwatch_client, instance_id):
         """Get EC2 instance health metadata"""
-        health_data = {
-            "status": "Unknown",
-            "status_checks": {
-                "system": "Unknown",
-                "instance": "Unknown"
-            },
-            "cpu_utilization": None,
-            "memory_utilization": None,
-            "last_checked": self.current_time_str
+        return self.get_ec2_instances_health(ec2_client, cloudwatch_client, [instance_id])[instance_id]
+
+    def get_ec2_instances_health(self, ec2_client, cloudwatch_client, instance_ids):
+        """Get EC2 health metadata for many instances with bulk status and metric calls"""
+        health_by_instance = {
+            instance_id: {
+                "status": "Unknown",
+                "status_checks": {
+                    "system": "Unknown",
+                    "instance": "Unknown"
+                },
+                "cpu_utilization": None,
+                "memory_utilization": None,
+                "last_checked": self.current_time_str
+            }
+            for instance_id in instance_ids
         }
-        
+        if not instance_ids:
+            return health_by_instance
+
+        # Get instance status (up to 100 instance IDs per call)
         try:
-            # Get instance status
-            response = ec2_client.describe_instance_status(InstanceIds=[instance_id])
-            
-            if response['InstanceStatuses']:
-                status_info = response['InstanceStatuses'][0]
-                
-                # Overall status
-                health_data["status"] = status_info['InstanceState']['Name']
-                
-                # Status checks
-                if 'SystemStatus' in status_info:
-                    health_data["status_checks"]["system"] = status_info['SystemStatus']['Status']
-                
-                if 'InstanceStatus' in status_info:
-                    health_data["status_checks"]["instance"] = status_info['InstanceStatus']['Status']
-            
-            # Get CloudWatch metrics for the instance
-            end_time = datetime.now()
-            start_time = end_time - timedelta(hours=1)
-            
-            # Get CPU utilization
-            try:
-                cpu_response = cloudwatch_client.get_metric_statistics(
-                    Namespace='AWS/EC2',
-                    MetricName='CPUUtilization',
-                    Dimensions=[
-                        {
-                            'Name': 'InstanceId',
-                            'Value': instance_id
-                        }
-                    ],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=300,  # 5-minute intervals
-                    Statistics=['Average']
-                )
-                
-                if cpu_response['Datapoints']:
-                    # Get the latest datapoint
-                    latest_datapoint = max(cpu_response['Datapoints'], key=lambda x: x['Timestamp'])
-                    health_data["cpu_utilization"] = round(latest_datapoint['Average'], 2)
-            except Exception as e:
-                self.logger.warning(f"Could not get CPU utilization for instance {instance_id}: {e}")
-            
-            # Try to get memory utilization if available
-            try:
-                memory_response = cloudwatch_client.get_metric_statistics(
-                    Namespace='CWAgent',
-                    MetricName='mem_used_percent',
-                    Dimensions=[
-                        {
-                            'Name': 'InstanceId',
-                            'Value': instance_id
-                        }
-                    ],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=300,  # 5-minute intervals
-                    Statistics=['Average']
-                )
-                
-                if memory_response['Datapoints']:
-                    # Get the latest datapoint
-                    latest_datapoint = max(memory_response['Datapoints'], key=lambda x: x['Timestamp'])
-                    health_data["memory_utilization"] = round(latest_datapoint['Average'], 2)
-            except Exception:
-                # Memory metrics might not be available if CloudWatch agent isn't installed
-                pass
-            
+            for i in range(0, len(instance_ids), 100):
+                response = ec2_client.describe_instance_status(InstanceIds=instance_ids[i:i + 100])
+
+                for status_info in response.get('InstanceStatuses', []):
+                    health_data = health_by_instance.get(status_info['InstanceId'])
+                    if health_data is None:
+                        continue
+
+                    # Overall status
+                    health_data["status"] = status_info['InstanceState']['Name']
+
+                    # Status checks
+                    if 'SystemStatus' in status_info:
+                        health_data["status_checks"]["system"] = status_info['SystemStatus']['Status']
+
+                    if 'InstanceStatus' in status_info:
+                        health_data["status_checks"]["instance"] = status_info['InstanceStatus']['Status']
         except Exception as e:
-            self.logger.warning(f"Error getting health data for instance {instance_id}: {e}")
-            health_data["status"] = "Error"
-        
-        return health_data
+            self.logger.warning(f"Error getting instance status for {len(instance_ids)} instances: {e}")
+            for health_data in health_by_instance.values():
+                health_data["status"] = "Error"
+
+        if not cloudwatch_client:
+            return health_by_instance
+
+        # Get CPU and memory (CloudWatch agent) metrics for all instances in bulk
+        end_time = datetime.now()
+        start_time = end_time - timedelta(hours=1)
+        metrics = CloudWatchMetricBatcher(cloudwatch_client).get_instance_metrics(
+            instance_ids, start_time, end_time,
+            period=300,  # 5-minute intervals
+            metrics=[CPU_UTILIZATION, MEMORY_UTILIZATION]
+        )
+
+        for instance_id, health_data in health_by_instance.items():
+            # Use the latest datapoint of each series
+            cpu_values = metrics['cpu'][instance_id]['values']
+            if len(cpu_values):
+                health_data["cpu_utilization"] = round(float(cpu_values[-1]), 2)
 
-    def calculate_ec2_costs(self, account_selection, region_selection, ec2_selection=None):
+            # Memory metrics might not be available if CloudWatch agent isn't installed
+            memory_values = metrics['memory'][instance_id]['values']
+            if len(memory_values):
+                health_data["memory_utilization"] = round(float(memory_values[-1]), 2)
+
+        return health_by_instance
+
+    def calculate_ec2_costs(self, account_selection, region_selection, ec2_selection=None, save_results=True):
         """Calculate costs for EC2 instances"""
         self.logger.info(f"Calculating EC2 costs for account {account_selection} in regions: {region_selection}")
 
@@ -566,57 +484,68 @@ class LiveCostCalculator:
                     # Get all instances
                     response = ec2_client.describe_instances()
 
-                # Process each reservation and instance
+                # Collect running instances first so health can be fetched in bulk
+                running_instances = []
                 for reservation in response.get('Reservations', []):
                     for instance in reservation.get('Instances', []):
-                        instance_id = instance['InstanceId']
-                        instance_type = instance['InstanceType']
                         state = instance['State']['Name']
 
                         # Only calculate costs for running instances
                         if state != 'running':
-                            self.logger.info(f"Skipping instance {instance_id} with state: {state}")
+                            self.logger.info(f"Skipping instance {instance['InstanceId']} with state: {state}")
                             continue
 
-                        # Get instance name from tags
-                        instance_name = 'Unnamed'
-                        for tag in instance.get('Tags', []):
-                            if tag['Key'] == 'Name':
-                                instance_name = tag['Value']
-                                break
-
-                        # Calculate uptime based on launch time
-                        launch_time = instance['LaunchTime']
-                        uptime_hours = (self.current_time - launch_time.replace(tzinfo=None)).total_seconds() / 3600
-
-                        # Get hourly rate from pricing data
-                        hourly_rate = pricing_data.get(instance_type, 0.0)
-
-                        # Calculate cost
-                        estimated_cost = round(uptime_hours * hourly_rate, 2)
-
-                        # Get instance health
-                        health_data = self.get_ec2_instance_health(ec2_client, cloudwatch_client, instance_id)
-
-                        # Add instance to results
-                        instance_info = {
-                            "instance_id": instance_id,
-                            "instance_name": instance_name,
-                            "instance_type": instance_type,
-                            "state": state,
-                            "launch_time": launch_time.strftime("%Y-%m-%d %H:%M:%S"),
-                            "uptime_hours": round(uptime_hours, 2),
-                            "hourly_rate": hourly_rate,
-                            "estimated_cost": estimated_cost,
-                            "health": health_data
-                        }
+                        running_instances.append(instance)
+
+                health_by_instance = self.get_ec2_instances_health(
+                    ec2_client, cloudwatch_client, [instance['InstanceId'] for instance in running_instances]
+                )
+
+                # Process each running instance
+                for instance in running_instances:
+                    instance_id = instance['InstanceId']
+                    instance_type = instance['InstanceType']
+                    state = instance['State']['Name']
+
+                    # Get instance name from tags
+                    instance_name = 'Unnamed'
+                    for tag in instance.get('Tags', []):
+                        if tag['Key'] == 'Name':
+                            instance_name = tag['Value']
+                            break
+
+                    # Calculate uptime based on launch time
+                    launch_time = instance['LaunchTime']
+                    uptime_hours = (self.current_time - launch_time.replace(tzinfo=None)).total_seconds() / 3600
+
+                    # Get hourly rate from pricing data
+                    hourly_rate = pricing_data.get(instance_type, 0.0)
+
+                    # Calculate cost
+                    estimated_cost = round(uptime_hours * hourly_rate, 2)
+
+                    # Get instance health
+                    health_data = health_by_instance[instance_id]
+
+                    # Add instance to results
+                    instance_info = {
+                        "instance_id": instance_id,
+                        "instance_name": instance_name,
+                        "instance_type": instance_type,
+                        "state": state,
+                        "launch_time": launch_time.strftime("%Y-%m-%d %H:%M:%S"),
+                        "uptime_hours": round(uptime_hours, 2),
+                        "hourly_rate": hourly_rate,
+                        "estimated_cost": estimated_cost,
+                        "health": health_data
+                    }
 
-                        region_results["instances"].append(instance_info)
-                        region_results["total_cost"] += estimated_cost
-                        region_results["instance_count"] += 1
+                    region_results["instances"].append(instance_info)
+                    region_results["total_cost"] += estimated_cost
+                    region_results["instance_count"] += 1
 
-                        self.logger.info(
-                            f"Calculated cost for instance {instance_id} ({instance_type}): ${estimated_cost} for {round(uptime_hours, 2)} hours")
+                    self.logger.info(
+                        f"Calculated cost for instance {instance_id} ({instance_type}): ${estimated_cost} for {round(uptime_hours, 2)} hours")
 
             except Exception as e:
                 self.logger.error(f"Error getting EC2 instances in {region}: {e}")
@@ -627,7 +556,16 @@ class LiveCostCalculator:
             results["instance_count"] += region_results["instance_count"]
 
         # Save results to file with proper directory creation
-        account_save_name = self.account_id_to_name.get(account_selection, "Unknown")
+        if save_results:
+            self.save_ec2_cost_results(results)
+
+        self.logger.info(f"Total EC2 cost: ${results['total_cost']:.2f} for {results['instance_count']} instances")
+
+        return results
+
+    def save_ec2_cost_results(self, results):
+        """Save per-account EC2 cost results to the EC2 output directory"""
+        account_save_name = self.account_id_to_name.get(results['account_id'], "Unknown")
         account_output_dir = f"{self.ec2_output_dir}/{account_save_name}"
 
         # Create directory if it doesn't exist
@@ -649,10 +587,6 @@ class LiveCostCalculator:
         except Exception as e:
             self.logger.error(f"Failed to save EC2 results to {output_file}: {e}")
 
-        self.logger.info(f"Total EC2 cost: ${results['total_cost']:.2f} for {results['instance_count']} instances")
-
-        return results
-
     def calculate_historical_costs(self, account_selection, region_selection, hours_back=9):
         """Calculate costs for the last N hours"""
         self.logger.info(f"Calculating historical costs for last {hours_back} hours")
@@ -867,11 +801,8 @@ class LiveCostCalculator:
                             access_key = account_data['access_key']
                             secret_key = account_data['secret_key']
 
-                            autoscaling_client = boto3.client(
-                                'autoscaling',
-                                aws_access_key_id=access_key,
-                                aws_secret_access_key=secret_key,
-                                region_name=region
+                            autoscaling_client = self.get_shared_client(
+                                'autoscaling', access_key, secret_key, region
                             )
 
                             asg_response = autoscaling_client.describe_auto_scaling_groups(
@@ -1024,45 +955,52 @@ class LiveCostCalculator:
 
     def get_recent_cpu_trend(self, cloudwatch_client, instance_id):
         """Get recent CPU utilization trend for forecast confidence calculation"""
-        try:
-            end_time = datetime.now()
-            start_time = end_time - timedelta(hours=3)  # Last 3 hours
-
-            response = cloudwatch_client.get_metric_statistics(
-                Namespace='AWS/EC2',
-                MetricName='CPUUtilization',
-                Dimensions=[{'Name': 'InstanceId', 'Value': instance_id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=900,  # 15-minute intervals
-                Statistics=['Average']
-            )
+        return self.get_recent_cpu_trends(cloudwatch_client, [instance_id])[instance_id]
+
+    def get_recent_cpu_trends(self, cloudwatch_client, instance_ids):
+        """Get recent CPU trends (last 3 hours) for many instances with bulk GetMetricData calls
+
+        The "values" of each trend is a NumPy array (oldest datapoint first).
+        """
+        trends = {
+            instance_id: {
+                "values": np.array([], dtype=float),
+                "average": 0,
+                "min": 0,
+                "max": 0,
+                "trend": "unknown"
+            }
+            for instance_id in instance_ids
+        }
+        if not cloudwatch_client or not instance_ids:
+            return trends
+
+        end_time = datetime.now()
+        start_time = end_time - timedelta(hours=3)  # Last 3 hours
+        cpu_series = CloudWatchMetricBatcher(cloudwatch_client).get_instance_metrics(
+            instance_ids, start_time, end_time, period=900  # 15-minute intervals
+        )['cpu']
+
+        for instance_id, series in cpu_series.items():
+            values = series['values']
+            if not len(values):
+                continue
 
-            if response['Datapoints']:
-                datapoints = sorted(response['Datapoints'], key=lambda x: x['Timestamp'])
-                values = [dp['Average'] for dp in datapoints]
+            spread = float(values.max() - values.min())
+            trends[instance_id] = {
+                "values": values,
+                "average": round(float(values.mean()), 2),
+                "min": round(float(values.min()), 2),
+                "max": round(float(values.max()), 2),
+                "trend": "stable" if spread < 20 else "variable"
+            }
 
-                return {
-                    "values": values,
-                    "average": round(sum(values) / len(values), 2),
-                    "min": round(min(values), 2),
-                    "max": round(max(values), 2),
-                    "trend": "stable" if max(values) - min(values) < 20 else "variable"
-                }
-        except Exception as e:
-            self.logger.warning(f"Could not get CPU trend for {instance_id}: {e}")
-
-        return {
-            "values": [],
-            "average": 0,
-            "min": 0,
-            "max": 0,
-            "trend": "unknown"
-        }
+        return trends
 
     def calculate_forecast_confidence(self, cpu_trend):
         """Calculate forecast confidence based on CPU trend stability"""
-        if not cpu_trend or not cpu_trend.get('values'):
+        values = cpu_trend.get('values') if cpu_trend else None
+        if values is None or len(values) == 0:
             return "60%"  # Low confidence if no data
 
         trend_type = cpu_trend.get('trend', 'unknown')
@@ -1077,145 +1015,58 @@ class LiveCostCalculator:
         else:
             return "65%"  # Lower confidence for highly variable or overloaded instances
 
-    def generate_overall_hourly_breakdown(self, regions_data, hours):
-        """Generate overall hourly breakdown across all regions"""
-        hourly_breakdown = []
-
-        for hour in range(hours):
-            hour_start = self.current_time - timedelta(hours=hours - hour)
-
-            hour_data = {
-                "hour": hour_start.strftime("%H:00"),
-                "timestamp": hour_start.strftime("%Y-%m-%d %H:%M:%S"),
-                "total_cost": 0.0,
-                "ec2_cost": 0.0,
-                "eks_cost": 0.0,
-                "regions": {}
-            }
-
-            # Aggregate costs from all regions
-            for region, region_data in regions_data.items():
-                region_cost = {
-                    "ec2": 0.0,
-                    "eks": 0.0,
-                    "total": 0.0
-                }
-
-                # Add EC2 costs for this hour
-                for instance in region_data.get("ec2_instances", []):
-                    if instance.get("running_hours", 0) > hour:
-                        instance_hourly = instance.get("hourly_rate", 0)
-                        region_cost["ec2"] += instance_hourly
-                        hour_data["ec2_cost"] += instance_hourly
-
-                # Add EKS costs for this hour
-                for cluster in region_data.get("eks_clusters", []):
-                    if cluster.get("running_hours", 0) > hour:
-                        # Control plane cost (constant per hour)
-                        control_plane_hourly = 0.10  # $0.10 per hour
-                        region_cost["eks"] += control_plane_hourly
-                        hour_data["eks_cost"] += control_plane_hourly
-
-                        # Worker nodes cost
-                        worker_cost = cluster.get("nodegroups_cost", 0)
-                        if cluster.get("running_hours", 0) > 0:
-                            worker_hourly = worker_cost / cluster.get("running_hours", 1)
-                            region_cost["eks"] += worker_hourly
-                            hour_data["eks_cost"] += worker_hourly
-
-                region_cost["total"] = region_cost["ec2"] + region_cost["eks"]
-                hour_data["regions"][region] = region_cost
+    def _add_historical_resources(self, matrix, region, ec2_instances, eks_clusters):
+        """Add historical EC2 instances and EKS clusters of a region to an HourlyCostMatrix"""
+        matrix.add_resources(
+            'ec2', region,
+            [instance.get("hourly_rate", 0) for instance in ec2_instances],
+            [instance.get("running_hours", 0) for instance in ec2_instances]
+        )
+        # Control plane + worker nodes spread evenly over the cluster's running hours
+        matrix.add_resources(
+            'eks', region,
+            [(cluster.get("control_plane_cost", 0) + cluster.get("nodegroups_cost", 0)) / cluster["running_hours"]
+             if cluster.get("running_hours", 0) > 0 else 0.0 for cluster in eks_clusters],
+            [cluster.get("running_hours", 0) for cluster in eks_clusters]
+        )
 
-            hour_data["total_cost"] = hour_data["ec2_cost"] + hour_data["eks_cost"]
-            hourly_breakdown.append(hour_data)
+    def _add_forecast_resources(self, matrix, region, ec2_forecast, eks_forecast):
+        """Add forecast EC2 instances and EKS clusters of a region to an HourlyCostMatrix"""
+        matrix.add_resources(
+            'ec2', region,
+            [instance.get("hourly_rate", 0) for instance in ec2_forecast],
+            confidence=[parse_confidence(instance.get("confidence")) for instance in ec2_forecast]
+        )
+        matrix.add_resources(
+            'eks', region,
+            [(cluster.get("control_plane_forecast", 0) + cluster.get("nodegroups_forecast", 0)) / cluster["forecast_hours"]
+             if cluster.get("forecast_hours", 0) > 0 else 0.0 for cluster in eks_forecast],
+            confidence=[parse_confidence(cluster.get("confidence")) for cluster in eks_forecast]
+        )
 
-        return hourly_breakdown
+    def generate_overall_hourly_breakdown(self, regions_data, hours):
+        """Generate overall hourly breakdown across all regions"""
+        matrix = HourlyCostMatrix(self.current_time - timedelta(hours=hours), hours)
+        for region, region_data in regions_data.items():
+            self._add_historical_resources(
+                matrix, region, region_data.get("ec2_instances", []), region_data.get("eks_clusters", [])
+            )
+        return matrix.to_hourly_records(include_regions=True)
 
     def generate_overall_hourly_forecast(self, regions_data, hours):
-        """Generate overall hourly forecast across all regions"""
-        hourly_forecast = []
-
-        for hour in range(hours):
-            hour_start = self.current_time + timedelta(hours=hour)
-
-            hour_data = {
-                "hour": hour_start.strftime("%H:00"),
-                "timestamp": hour_start.strftime("%Y-%m-%d %H:%M:%S"),
-                "total_cost": 0.0,
-                "ec2_cost": 0.0,
-                "eks_cost": 0.0,
-                "regions": {}
-            }
-
-            # Aggregate forecast costs from all regions
-            for region, region_data in regions_data.items():
-                region_cost = {
-                    "ec2": 0.0,
-                    "eks": 0.0,
-                    "total": 0.0
-                }
-
-                # Add EC2 forecast costs for this hour
-                for instance in region_data.get("ec2_forecast", []):
-                    instance_hourly = instance.get("hourly_rate", 0)
-                    region_cost["ec2"] += instance_hourly
-                    hour_data["ec2_cost"] += instance_hourly
-
-                # Add EKS forecast costs for this hour
-                for cluster in region_data.get("eks_forecast", []):
-                    # Control plane cost (constant per hour)
-                    control_plane_hourly = 0.10  # $0.10 per hour
-                    region_cost["eks"] += control_plane_hourly
-                    hour_data["eks_cost"] += control_plane_hourly
-
-                    # Worker nodes forecast cost
-                    worker_forecast = cluster.get("nodegroups_forecast", 0)
-                    if cluster.get("forecast_hours", 0) > 0:
-                        worker_hourly = worker_forecast / cluster.get("forecast_hours", 1)
-                        region_cost["eks"] += worker_hourly
-                        hour_data["eks_cost"] += worker_hourly
-
-                region_cost["total"] = region_cost["ec2"] + region_cost["eks"]
-                hour_data["regions"][region] = region_cost
-
-            hour_data["total_cost"] = hour_data["ec2_cost"] + hour_data["eks_cost"]
-            hourly_forecast.append(hour_data)
-
-        return hourly_forecast
+        """Generate overall hourly forecast across all regions with confidence bounds"""
+        matrix = HourlyCostMatrix(self.current_time, hours)
+        for region, region_data in regions_data.items():
+            self._add_forecast_resources(
+                matrix, region, region_data.get("ec2_forecast", []), region_data.get("eks_forecast", [])
+            )
+        return matrix.to_hourly_records(include_regions=True, include_bands=True)
 
     def generate_hourly_forecast(self, ec2_forecast, eks_forecast, hours):
-        """Generate hourly forecast for a specific region"""
-        hourly_forecast = []
-
-        for hour in range(hours):
-            hour_start = self.current_time + timedelta(hours=hour)
-
-            hour_data = {
-                "hour": hour_start.strftime("%H:00"),
-                "timestamp": hour_start.strftime("%Y-%m-%d %H:%M:%S"),
-                "ec2_cost": 0.0,
-                "eks_cost": 0.0,
-                "total_cost": 0.0
-            }
-
-            # Calculate EC2 cost for this hour
-            for instance in ec2_forecast:
-                hour_data["ec2_cost"] += instance.get("hourly_rate", 0)
-
-            # Calculate EKS cost for this hour
-            for cluster in eks_forecast:
-                # Control plane: $0.10/hour
-                hour_data["eks_cost"] += 0.10
-
-                # Worker nodes
-                if cluster.get("forecast_hours", 0) > 0:
-                    worker_hourly = cluster.get("nodegroups_forecast", 0) / cluster.get("forecast_hours", 1)
-                    hour_data["eks_cost"] += worker_hourly
-
-            hour_data["total_cost"] = hour_data["ec2_cost"] + hour_data["eks_cost"]
-            hourly_forecast.append(hour_data)
-
-        return hourly_forecast
+        """Generate hourly forecast for a specific region with confidence bounds"""
+        matrix = HourlyCostMatrix(self.current_time, hours)
+        self._add_forecast_resources(matrix, 'region', ec2_forecast, eks_forecast)
+        return matrix.to_hourly_records(include_bands=True)
 
 
     def analyze_ec2_historical_costs(self, ec2_client, cloudwatch_client, ec2_pricing, hours_back):
@@ -1231,6 +1082,12 @@ class LiveCostCalculator:
             end_time = self.current_time
             start_time = end_time - timedelta(hours=hours_back)
 
+            # Get CPU utilization trends for all instances in bulk
+            instance_ids = [instance['InstanceId']
+                            for reservation in response.get('Reservations', [])
+                            for instance in reservation.get('Instances', [])]
+            cpu_trends = self.get_cpu_utilization_trends(cloudwatch_client, instance_ids, start_time, end_time)
+
             for reservation in response.get('Reservations', []):
                 for instance in reservation.get('Instances', []):
                     instance_id = instance['InstanceId']
@@ -1256,9 +1113,7 @@ class LiveCostCalculator:
                             break
 
                     # Get CPU utilization trend
-                    cpu_trend = self.get_cpu_utilization_trend(
-                        cloudwatch_client, instance_id, start_time, end_time
-                    )
+                    cpu_trend = cpu_trends[instance_id]
 
                     instance_data = {
                         "instance_id": instance_id,
@@ -1361,6 +1216,12 @@ class LiveCostCalculator:
                 Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
             )
 
+            # Get recent CPU trends for all instances in bulk
+            instance_ids = [instance['InstanceId']
+                            for reservation in response.get('Reservations', [])
+                            for instance in reservation.get('Instances', [])]
+            cpu_trends = self.get_recent_cpu_trends(cloudwatch_client, instance_ids)
+
             for reservation in response.get('Reservations', []):
                 for instance in reservation.get('Instances', []):
                     instance_id = instance['InstanceId']
@@ -1378,7 +1239,7 @@ class LiveCostCalculator:
                             break
 
                     # Get recent CPU trend for confidence level
-                    cpu_trend = self.get_recent_cpu_trend(cloudwatch_client, instance_id)
+                    cpu_trend = cpu_trends[instance_id]
                     confidence = self.calculate_forecast_confidence(cpu_trend)
 
                     instance_forecast = {
@@ -1460,62 +1321,38 @@ class LiveCostCalculator:
 
     def get_cpu_utilization_trend(self, cloudwatch_client, instance_id, start_time, end_time):
         """Get CPU utilization trend for an instance"""
-        try:
-            response = cloudwatch_client.get_metric_statistics(
-                Namespace='AWS/EC2',
-                MetricName='CPUUtilization',
-                Dimensions=[{'Name': 'InstanceId', 'Value': instance_id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=3600,  # 1-hour periods
-                Statistics=['Average']
-            )
-
-            if response['Datapoints']:
-                datapoints = sorted(response['Datapoints'], key=lambda x: x['Timestamp'])
-                trend = [round(dp['Average'], 2) for dp in datapoints]
-                return {
-                    "values": trend,
-                    "average": round(sum(trend) / len(trend), 2),
-                    "min": min(trend),
-                    "max": max(trend)
-                }
-        except Exception as e:
-            self.logger.warning(f"Could not get CPU trend for {instance_id}: {e}")
+        return self.get_cpu_utilization_trends(cloudwatch_client, [instance_id], start_time, end_time)[instance_id]
 
-        return {"values": [], "average": 0, "min": 0, "max": 0}
+    def get_cpu_utilization_trends(self, cloudwatch_client, instance_ids, start_time, end_time):
+        """Get hourly CPU utilization trends for many instances with bulk GetMetricData calls"""
+        trends = {instance_id: {"values": [], "average": 0, "min": 0, "max": 0} for instance_id in instance_ids}
+        if not cloudwatch_client or not instance_ids:
+            return trends
 
-    def generate_hourly_breakdown(self, ec2_instances, eks_clusters, hours):
-        """Generate hourly cost breakdown"""
-        hourly_breakdown = []
-
-        for hour in range(hours):
-            hour_start = self.current_time - timedelta(hours=hours - hour)
-            hour_end = hour_start + timedelta(hours=1)
-
-            hour_data = {
-                "hour": hour_start.strftime("%H:00"),
-                "timestamp": hour_start.strftime("%Y-%m-%d %H:%M:%S"),
-                "ec2_cost": 0.0,
-                "eks_cost": 0.0,
-                "total_cost": 0.0
-            }
+        cpu_series = CloudWatchMetricBatcher(cloudwatch_client).get_instance_metrics(
+            instance_ids, start_time, end_time, period=3600  # 1-hour periods
+        )['cpu']
 
-            # Calculate EC2 cost for this hour
-            for instance in ec2_instances:
-                if instance["running_hours"] > hour:
-                    hour_data["ec2_cost"] += instance["hourly_rate"]
+        for instance_id, series in cpu_series.items():
+            values = np.round(series['values'], 2)
+            if not len(values):
+                continue
 
-            # Calculate EKS cost for this hour
-            for cluster in eks_clusters:
-                if cluster["running_hours"] > hour:
-                    hour_data["eks_cost"] += (cluster["control_plane_cost"] + cluster["nodegroups_cost"]) / cluster[
-                        "running_hours"]
+            # Kept as plain lists because the historical trend is written to the JSON reports
+            trends[instance_id] = {
+                "values": values.tolist(),
+                "average": round(float(values.mean()), 2),
+                "min": float(values.min()),
+                "max": float(values.max())
+            }
 
-            hour_data["total_cost"] = hour_data["ec2_cost"] + hour_data["eks_cost"]
-            hourly_breakdown.append(hour_data)
+        return trends
 
-        return hourly_breakdown
+    def generate_hourly_breakdown(self, ec2_instances, eks_clusters, hours):
+        """Generate hourly cost breakdown"""
+        matrix = HourlyCostMatrix(self.current_time - timedelta(hours=hours), hours)
+        self._add_historical_resources(matrix, 'region', ec2_instances, eks_clusters)
+        return matrix.to_hourly_records()
 
     def get_eks_node_info(self, ec2_client, instance_ids):
         """Get information about EC2 instances used as EKS nodes"""
@@ -1557,7 +1394,7 @@ class LiveCostCalculator:
             self.logger.error(f"Error getting EKS node info: {e}")
             return {}
 
-    def calculate_eks_costs(self, account_selection, region_selection, eks_selection=None):
+    def calculate_eks_costs(self, account_selection, region_selection, eks_selection=None, save_results=True):
         """Calculate costs for EKS clusters with proper timezone handling"""
         current_timestamp_utc = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         current_user = "varadharajaan"
@@ -1775,7 +1612,17 @@ class LiveCostCalculator:
                 f"Region {region} summary: {region_results['cluster_count']} clusters, ${region_results['total_cost']:.2f}")
 
         # Save results to file with proper directory creation
-        account_save_name = self.account_id_to_name.get(account_selection, "Unknown")
+        if save_results:
+            self.save_eks_cost_results(results)
+
+        self.logger.info(
+            f"Total EKS cost for account {account_selection}: ${results['total_cost']:.2f} for {results['cluster_count']} clusters")
+
+        return results
+
+    def save_eks_cost_results(self, results):
+        """Save per-account EKS cost results to the EKS output directory"""
+        account_save_name = self.account_id_to_name.get(results['account_id'], "Unknown")
         account_output_dir = f"{self.eks_output_dir}/{account_save_name}"
 
         # Create directory if it doesn't exist
@@ -1799,11 +1646,6 @@ class LiveCostCalculator:
         except Exception as e:
             self.logger.error(f"Failed to save EKS results to {output_file}: {e}")
 
-        self.logger.info(
-            f"Total EKS cost for account {account_selection}: ${results['total_cost']:.2f} for {results['cluster_count']} clusters")
-
-        return results
-
     def display_ec2_cost_summary(self, cost_data):
         """Display EC2 cost summary to console"""
         print("\n" + "=" * 80)
@@ -2255,6 +2097,116 @@ class LiveCostCalculator:
         # Return enhanced summary for further use
         return scan_summary
 
+    def _merge_region_results(self, partial_results, sum_keys):
+        """Merge single-region results of one account into one result, in region order"""
+        merged = dict(partial_results[0])
+        merged["regions"] = {}
+        for key in sum_keys:
+            merged[key] = 0.0 if isinstance(partial_results[0].get(key), float) else 0
+
+        for partial in partial_results:
+            merged["regions"].update(partial.get("regions", {}))
+            for key in sum_keys:
+                merged[key] += partial.get(key, 0)
+
+        return merged
+
+    def _run_cost_unit(self, kind, account_id, region, ec2_selection, eks_selection, hours, account_semaphore):
+        """Run one (kind, account, region) unit of the cost analysis under the account's concurrency cap"""
+        with account_semaphore:
+            start_time = time.time()
+            if kind == 'ec2':
+                result = self.calculate_ec2_costs(account_id, [region], ec2_selection, save_results=False)
+            elif kind == 'eks':
+                result = self.calculate_eks_costs(account_id, [region], eks_selection, save_results=False)
+            elif kind == 'historical':
+                result = self.calculate_historical_costs(account_id, [region], hours)
+            else:
+                result = self.calculate_forecast_costs(account_id, [region], hours)
+            return result, time.time() - start_time
+
+    def calculate_costs_parallel(self, selected_account_ids, selected_regions, calculate_ec2, calculate_eks,
+                                 ec2_selection='all', eks_selection='all', hours=9):
+        """Calculate EC2/EKS costs, history and forecast for every account x region in parallel
+
+        Each (kind, account, region) unit runs on a shared thread pool, with at most
+        max_concurrent_per_account units of the same account in flight. Results are merged
+        per account in selection order, so the output does not depend on completion order.
+        """
+        kinds = []
+        if calculate_ec2:
+            kinds.append('ec2')
+        if calculate_eks:
+            kinds.append('eks')
+        kinds.extend(['historical', 'forecast'])
+
+        # Warm the pricing caches once so workers only read them
+        for region in selected_regions:
+            self.load_ec2_pricing_data(region)
+        self.load_eks_pricing_data()
+
+        account_semaphores = {account_id: threading.Semaphore(self.max_concurrent_per_account)
+                              for account_id in selected_account_ids}
+        unit_results = {}
+        unit_timings = {}
+        total_units = len(kinds) * len(selected_account_ids) * len(selected_regions)
+        start_time = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for account_id in selected_account_ids:
+                for region in selected_regions:
+                    for kind in kinds:
+                        future = executor.submit(self._run_cost_unit, kind, account_id, region,
+                                                 ec2_selection, eks_selection, hours,
+                                                 account_semaphores[account_id])
+                        futures[future] = (kind, account_id, region)
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                kind, account_id, region = futures[future]
+                account_name = self.account_id_to_name.get(account_id, "Unknown")
+                try:
+                    result, duration = future.result()
+                    unit_results[(kind, account_id, region)] = result
+                    unit_timings[(kind, account_id, region)] = duration
+                    print(f"  [{completed}/{total_units}] {kind.upper():<10} {account_name} / {region} done in {duration:.1f}s")
+                except Exception as e:
+                    self.logger.error(f"{kind} analysis failed for {account_name} in {region}: {e}")
+                    print(f"  [{completed}/{total_units}] {kind.upper():<10} {account_name} / {region} FAILED: {e}")
+
+        self.logger.info(f"Parallel cost analysis finished {total_units} units in {time.time() - start_time:.1f}s")
+        self.cost_unit_timings = unit_timings
+
+        # Deterministic aggregation: accounts and regions in selection order
+        merge_plan = {
+            'ec2': (["total_cost", "instance_count"], None),
+            'eks': (["total_cost", "cluster_count"], None),
+            'historical': (["total_historical_cost"], 'hourly_breakdown'),
+            'forecast': (["total_forecast_cost"], 'hourly_forecast')
+        }
+        all_results = {kind: {} for kind in merge_plan}
+        for kind in kinds:
+            sum_keys, hourly_key = merge_plan[kind]
+            for account_id in selected_account_ids:
+                partials = [unit_results[(kind, account_id, region)] for region in selected_regions
+                            if (kind, account_id, region) in unit_results]
+                if not partials:
+                    continue
+
+                merged = self._merge_region_results(partials, sum_keys)
+                if kind == 'historical':
+                    merged[hourly_key] = self.generate_overall_hourly_breakdown(merged["regions"], hours)
+                elif kind == 'forecast':
+                    merged[hourly_key] = self.generate_overall_hourly_forecast(merged["regions"], hours)
+                elif kind == 'ec2':
+                    self.save_ec2_cost_results(merged)
+                elif kind == 'eks':
+                    self.save_eks_cost_results(merged)
+
+                all_results[kind][account_id] = merged
+
+        return all_results['ec2'], all_results['eks'], all_results['historical'], all_results['forecast']
+
     def run(self):
         """Main execution method"""
         print("\n" + "=" * 80)
@@ -2462,36 +2414,10 @@ class LiveCostCalculator:
         # Step 4: Calculate costs, historical analysis, and forecasts
         print("\n🧮 CALCULATING COSTS AND ANALYSIS...")
 
-        # Containers to store results for all accounts
-        all_ec2_results = {}
-        all_eks_results = {}
-        all_historical_results = {}
-        all_forecast_results = {}
-
-        # Calculate for each selected account
-        for account_id in selected_account_ids:
-            account_name = self.account_id_to_name.get(account_id, "Unknown")
-            print(f"\n[STATS] Processing account: {account_name} ({account_id})")
-
-            if calculate_ec2:
-                print(f"  [COMPUTE] Calculating EC2 costs...")
-                ec2_results = self.calculate_ec2_costs(account_id, selected_regions, ec2_selection)
-                all_ec2_results[account_id] = ec2_results
-
-            if calculate_eks:
-                print(f"  🚢 Calculating EKS costs...")
-                eks_results = self.calculate_eks_costs(account_id, selected_regions, eks_selection)
-                all_eks_results[account_id] = eks_results
-
-            # Historical analysis (last 9 hours)
-            print(f"  📈 Analyzing last 9 hours...")
-            historical_results = self.calculate_historical_costs(account_id, selected_regions, 9)
-            all_historical_results[account_id] = historical_results
-
-            # Forecast analysis (next 9 hours)
-            print(f"  🔮 Forecasting next 9 hours...")
-            forecast_results = self.calculate_forecast_costs(account_id, selected_regions, 9)
-            all_forecast_results[account_id] = forecast_results
+        # Calculate every account x region unit in parallel
+        all_ec2_results, all_eks_results, all_historical_results, all_forecast_results = \
+            self.calculate_costs_parallel(selected_account_ids, selected_regions, calculate_ec2, calculate_eks,
+                                          ec2_selection, eks_selection, hours=9)
 
         # Step 5: Aggregate and display final summary
         print("\n" + "=" * 80)
@@ -3001,14 +2927,21 @@ class LiveCostCalculator:
         # Prepare data for charts including historical and forecast
         chart_data = self.prepare_chart_data(aggregated_results, all_ec2_results, all_eks_results)
 
-        # Generate the HTML content
-        html_content = self.generate_html_content(aggregated_results, chart_data, timestamp, all_historical_results,
-                                                  all_forecast_results)
+        # Chart data goes to a compact sidecar that the report lazy-loads after the page renders
+        chart_data_filename = f"{html_dir}/aws_cost_report_{timestamp}_chart_data.js"
+        try:
+            with open(chart_data_filename, 'w', encoding='utf-8') as f:
+                f.write("window.COST_REPORT_CHART_DATA = ")
+                json.dump(chart_data, f, separators=(',', ':'), default=str)
+                f.write(";\n")
+        except Exception as e:
+            self.logger.error(f"Failed to save chart data to {chart_data_filename}: {e}")
 
-        # Write HTML file
+        # Stream the HTML content to the file in chunks
         try:
             with open(html_filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                self.write_html_content(f, aggregated_results, os.path.basename(chart_data_filename), timestamp,
+                                        all_historical_results, all_forecast_results)
             self.logger.info(f"HTML report generated: {html_filename}")
             print(f"   [STATS] HTML Report: {html_filename}")
         except Exception as e:
@@ -3086,9 +3019,13 @@ class LiveCostCalculator:
 
         return chart_data
 
-    def generate_html_content(self, aggregated_results, chart_data, timestamp, historical_results=None,
-                              forecast_results=None):
-        """Generate the complete HTML content with proper error handling"""
+    def write_html_content(self, output, aggregated_results, chart_data_file, timestamp, historical_results=None,
+                           forecast_results=None):
+        """Stream the complete HTML report to an open file handle in chunks
+
+        Data tables are written row by row and paged in the browser; chart data is
+        lazy-loaded from the chart_data_file sidecar instead of being embedded.
+        """
 
         # Current timestamp and user
         current_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -3140,14 +3077,6 @@ class LiveCostCalculator:
             self.logger.warning(f"Error calculating forecast trend: {e}")
             forecast_trend = 0
 
-        # Generate data tables HTML safely
-        try:
-            data_tables_html = self.generate_data_tables_html_inline(aggregated_results, current_timestamp,
-                                                                     current_user)
-        except Exception as e:
-            self.logger.error(f"Error generating data tables: {e}")
-            data_tables_html = '<div class="data-tables"><p>Error generating data tables.</p></div>'
-
         # Safely get aggregated data
         try:
             accounts_processed = aggregated_results.get('accounts_processed', 0) if isinstance(aggregated_results,
@@ -3162,7 +3091,7 @@ class LiveCostCalculator:
             ec2_instance_count = 0
             eks_cluster_count = 0
 
-        html_content = f'''
+        output.write(f'''
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -3555,6 +3484,27 @@ class LiveCostCalculator:
                     border-radius: 0;
                 }}
             }}
+            .report-page-hidden {{
+                display: none;
+            }}
+
+            .table-pager {{
+                display: flex;
+                align-items: center;
+                gap: 12px;
+                padding: 10px 15px;
+                background: #f8f9fa;
+                border-top: 1px solid #e9ecef;
+            }}
+
+            .table-pager button {{
+                padding: 4px 12px;
+                border: 1px solid #667eea;
+                border-radius: 4px;
+                background: white;
+                color: #667eea;
+                cursor: pointer;
+            }}
         </style>
     </head>
     <body>
@@ -3670,8 +3620,17 @@ class LiveCostCalculator:
                 </div>
             </div>
 
-            {data_tables_html}
+        ''')
 
+        # Stream data tables safely
+        try:
+            for chunk in self.iter_data_tables_html(aggregated_results, current_timestamp, current_user):
+                output.write(chunk)
+        except Exception as e:
+            self.logger.error(f"Error generating data tables: {e}")
+            output.write('<p>Error generating data tables.</p></div>')
+
+        output.write(f'''
             <div class="footer">
                 <p>[START] AWS Cost Report Generated by Live Cost Calculator</p>
                 <p>[DATE] Report Generated: {current_timestamp} UTC • 🆔 Report ID: {timestamp}</p>
@@ -3686,300 +3645,327 @@ class LiveCostCalculator:
             Chart.defaults.maintainAspectRatio = false;
             Chart.defaults.plugins.legend.labels.usePointStyle = true;
 
-            // Chart data - safely handle chart_data
-            let chartData;
-            try {{
-                chartData = {chart_data};
-            }} catch(e) {{
-                console.warn('Error loading chart data:', e);
-                chartData = {{
+            // Table paging: only one page of rows is displayed at a time
+            function showTablePage(tableId, page) {{
+                const table = document.getElementById(tableId);
+                const pages = table.querySelectorAll('tbody.report-page');
+                page = Math.max(0, Math.min(page, pages.length - 1));
+                pages.forEach((tbody, index) => tbody.classList.toggle('report-page-hidden', index !== page));
+                table.dataset.page = page;
+                const label = document.getElementById(tableId + '-page-label');
+                if (label) {{
+                    label.textContent = 'Page ' + (page + 1) + ' of ' + pages.length;
+                }}
+            }}
+
+            function changeTablePage(tableId, delta) {{
+                const table = document.getElementById(tableId);
+                showTablePage(tableId, parseInt(table.dataset.page || '0', 10) + delta);
+            }}
+
+            // Chart data is lazy-loaded from the compact sidecar file
+            function renderCharts(chartData) {{
+                chartData = chartData || {{
                     service_breakdown: [],
                     account_costs: [],
                     regional_distribution: {{}},
                     instance_types: {{}}
                 }};
-            }}
 
-            // Timeline Chart (Historical + Current + Forecast)
-            const timelineCtx = document.getElementById('timelineChart').getContext('2d');
-            const timelineLabels = ['-9h', '-6h', '-3h', 'Now', '+3h', '+6h', '+9h'];
-            const timelineData = [
-                {total_historical * 0.6:.2f},
-                {total_historical * 0.8:.2f},
-                {total_historical:.2f},
-                {current_total:.2f},
-                {total_forecast * 0.4:.2f},
-                {total_forecast * 0.7:.2f},
-                {total_forecast:.2f}
-            ];
-
-            new Chart(timelineCtx, {{
-                type: 'line',
-                data: {{
-                    labels: timelineLabels,
-                    datasets: [{{
-                        label: 'Cost Trend ($)',
-                        data: timelineData,
-                        borderColor: '#FF6384',
-                        backgroundColor: 'rgba(255, 99, 132, 0.1)',
-                        borderWidth: 3,
-                        fill: true,
-                        tension: 0.4,
-                        pointBackgroundColor: ['#36A2EB', '#36A2EB', '#36A2EB', '#FF6384', '#FFCE56', '#FFCE56', '#FFCE56'],
-                        pointBorderColor: '#fff',
-                        pointBorderWidth: 2,
-                        pointRadius: 6
-                    }}]
-                }},
-                options: {{
-                    plugins: {{
-                        legend: {{
-                            position: 'bottom',
-                            labels: {{
-                                padding: 20
+                // Timeline Chart (Historical + Current + Forecast)
+                const timelineCtx = document.getElementById('timelineChart').getContext('2d');
+                const timelineLabels = ['-9h', '-6h', '-3h', 'Now', '+3h', '+6h', '+9h'];
+                const timelineData = [
+                    {total_historical * 0.6:.2f},
+                    {total_historical * 0.8:.2f},
+                    {total_historical:.2f},
+                    {current_total:.2f},
+                    {total_forecast * 0.4:.2f},
+                    {total_forecast * 0.7:.2f},
+                    {total_forecast:.2f}
+                ];
+
+                new Chart(timelineCtx, {{
+                    type: 'line',
+                    data: {{
+                        labels: timelineLabels,
+                        datasets: [{{
+                            label: 'Cost Trend ($)',
+                            data: timelineData,
+                            borderColor: '#FF6384',
+                            backgroundColor: 'rgba(255, 99, 132, 0.1)',
+                            borderWidth: 3,
+                            fill: true,
+                            tension: 0.4,
+                            pointBackgroundColor: ['#36A2EB', '#36A2EB', '#36A2EB', '#FF6384', '#FFCE56', '#FFCE56', '#FFCE56'],
+                            pointBorderColor: '#fff',
+                            pointBorderWidth: 2,
+                            pointRadius: 6
+                        }}]
+                    }},
+                    options: {{
+                        plugins: {{
+                            legend: {{
+                                position: 'bottom',
+                                labels: {{
+                                    padding: 20
+                                }}
+                            }},
+                            tooltip: {{
+                                callbacks: {{
+                                    label: function(context) {{
+                                        const phase = context.dataIndex < 3 ? 'Historical' : 
+                                                    context.dataIndex === 3 ? 'Current' : 'Forecast';
+                                        return phase + ': $' + context.parsed.y.toFixed(2);
+                                    }}
+                                }}
                             }}
                         }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
-                                    const phase = context.dataIndex < 3 ? 'Historical' : 
-                                                context.dataIndex === 3 ? 'Current' : 'Forecast';
-                                    return phase + ': $' + context.parsed.y.toFixed(2);
+                        scales: {{
+                            y: {{
+                                beginAtZero: true,
+                                ticks: {{
+                                    callback: function(value) {{
+                                        return '$' + value.toFixed(2);
+                                    }}
+                                }}
+                            }},
+                            x: {{
+                                grid: {{
+                                    color: function(context) {{
+                                        return context.tick.value === 3 ? '#FF6384' : '#e9ecef';
+                                    }},
+                                    lineWidth: function(context) {{
+                                        return context.tick.value === 3 ? 3 : 1;
+                                    }}
                                 }}
                             }}
                         }}
+                    }}
+                }});
+
+                // Service Breakdown Chart
+                const serviceCtx = document.getElementById('serviceChart').getContext('2d');
+                const serviceData = chartData.service_breakdown || [];
+                new Chart(serviceCtx, {{
+                    type: 'doughnut',
+                    data: {{
+                        labels: serviceData.map(item => item.service || 'Unknown'),
+                        datasets: [{{
+                            data: serviceData.map(item => item.cost || 0),
+                            backgroundColor: [
+                                '#FF6384',
+                                '#36A2EB',
+                                '#FFCE56',
+                                '#4BC0C0',
+                                '#9966FF',
+                                '#FF9F40'
+                            ],
+                            borderWidth: 3,
+                            borderColor: '#fff',
+                            hoverBorderWidth: 5
+                        }}]
                     }},
-                    scales: {{
-                        y: {{
-                            beginAtZero: true,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return '$' + value.toFixed(2);
+                    options: {{
+                        plugins: {{
+                            legend: {{
+                                position: 'bottom',
+                                labels: {{
+                                    padding: 20,
+                                    font: {{
+                                        size: 12
+                                    }}
                                 }}
-                            }}
-                        }},
-                        x: {{
-                            grid: {{
-                                color: function(context) {{
-                                    return context.tick.value === 3 ? '#FF6384' : '#e9ecef';
-                                }},
-                                lineWidth: function(context) {{
-                                    return context.tick.value === 3 ? 3 : 1;
+                            }},
+                            tooltip: {{
+                                callbacks: {{
+                                    label: function(context) {{
+                                        const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                                        const percentage = total > 0 ? ((context.parsed / total) * 100).toFixed(1) : '0';
+                                        return context.label + ': $' + context.parsed.toFixed(2) + ' (' + percentage + '%)';
+                                    }}
                                 }}
                             }}
                         }}
                     }}
-                }}
-            }});
+                }});
 
-            // Service Breakdown Chart
-            const serviceCtx = document.getElementById('serviceChart').getContext('2d');
-            const serviceData = chartData.service_breakdown || [];
-            new Chart(serviceCtx, {{
-                type: 'doughnut',
-                data: {{
-                    labels: serviceData.map(item => item.service || 'Unknown'),
-                    datasets: [{{
-                        data: serviceData.map(item => item.cost || 0),
-                        backgroundColor: [
-                            '#FF6384',
-                            '#36A2EB',
-                            '#FFCE56',
-                            '#4BC0C0',
-                            '#9966FF',
-                            '#FF9F40'
-                        ],
-                        borderWidth: 3,
-                        borderColor: '#fff',
-                        hoverBorderWidth: 5
-                    }}]
-                }},
-                options: {{
-                    plugins: {{
-                        legend: {{
-                            position: 'bottom',
-                            labels: {{
-                                padding: 20,
-                                font: {{
-                                    size: 12
+                // Account Chart
+                const accountCtx = document.getElementById('accountChart').getContext('2d');
+                const accountData = chartData.account_costs || [];
+                new Chart(accountCtx, {{
+                    type: 'bar',
+                    data: {{
+                        labels: accountData.map(item => (item.account || 'Unknown').split('(')[0].trim()),
+                        datasets: [
+                            {{
+                                label: 'EC2 Cost',
+                                data: accountData.map(item => item.ec2_cost || 0),
+                                backgroundColor: '#36A2EB',
+                                borderColor: '#36A2EB',
+                                borderWidth: 1,
+                                borderRadius: 5
+                            }},
+                            {{
+                                label: 'EKS Cost',
+                                data: accountData.map(item => item.eks_cost || 0),
+                                backgroundColor: '#FF6384',
+                                borderColor: '#FF6384',
+                                borderWidth: 1,
+                                borderRadius: 5
+                            }}
+                        ]
+                    }},
+                    options: {{
+                        plugins: {{
+                            legend: {{
+                                position: 'bottom',
+                                labels: {{
+                                    padding: 20
+                                }}
+                            }},
+                            tooltip: {{
+                                callbacks: {{
+                                    label: function(context) {{
+                                        return context.dataset.label + ': $' + context.parsed.y.toFixed(2);
+                                    }}
                                 }}
                             }}
                         }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
-                                    const total = context.dataset.data.reduce((a, b) => a + b, 0);
-                                    const percentage = total > 0 ? ((context.parsed / total) * 100).toFixed(1) : '0';
-                                    return context.label + ': $' + context.parsed.toFixed(2) + ' (' + percentage + '%)';
+                        scales: {{
+                            y: {{
+                                beginAtZero: true,
+                                ticks: {{
+                                    callback: function(value) {{
+                                        return '$' + value.toFixed(2);
+                                    }}
                                 }}
                             }}
                         }}
                     }}
-                }}
-            }});
+                }});
 
-            // Account Chart
-            const accountCtx = document.getElementById('accountChart').getContext('2d');
-            const accountData = chartData.account_costs || [];
-            new Chart(accountCtx, {{
-                type: 'bar',
-                data: {{
-                    labels: accountData.map(item => (item.account || 'Unknown').split('(')[0].trim()),
-                    datasets: [
-                        {{
-                            label: 'EC2 Cost',
-                            data: accountData.map(item => item.ec2_cost || 0),
-                            backgroundColor: '#36A2EB',
-                            borderColor: '#36A2EB',
-                            borderWidth: 1,
-                            borderRadius: 5
-                        }},
-                        {{
-                            label: 'EKS Cost',
-                            data: accountData.map(item => item.eks_cost || 0),
-                            backgroundColor: '#FF6384',
-                            borderColor: '#FF6384',
-                            borderWidth: 1,
-                            borderRadius: 5
-                        }}
-                    ]
-                }},
-                options: {{
-                    plugins: {{
-                        legend: {{
-                            position: 'bottom',
-                            labels: {{
-                                padding: 20
+                // Regional Distribution Chart
+                const regionCtx = document.getElementById('regionChart').getContext('2d');
+                const regionalData = chartData.regional_distribution || {{}};
+                const regionLabels = Object.keys(regionalData);
+                const regionEC2Data = regionLabels.map(region => (regionalData[region] || {{}}).ec2 || 0);
+                const regionEKSData = regionLabels.map(region => (regionalData[region] || {{}}).eks || 0);
+
+                new Chart(regionCtx, {{
+                    type: 'bar',
+                    data: {{
+                        labels: regionLabels,
+                        datasets: [
+                            {{
+                                label: 'EC2 Cost',
+                                data: regionEC2Data,
+                                backgroundColor: '#4BC0C0',
+                                borderColor: '#4BC0C0',
+                                borderWidth: 1,
+                                borderRadius: 5
+                            }},
+                            {{
+                                label: 'EKS Cost',
+                                data: regionEKSData,
+                                backgroundColor: '#FFCE56',
+                                borderColor: '#FFCE56',
+                                borderWidth: 1,
+                                borderRadius: 5
                             }}
-                        }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
-                                    return context.dataset.label + ': $' + context.parsed.y.toFixed(2);
+                        ]
+                    }},
+                    options: {{
+                        plugins: {{
+                            legend: {{
+                                position: 'bottom',
+                                labels: {{
+                                    padding: 20
+                                }}
+                            }},
+                            tooltip: {{
+                                callbacks: {{
+                                    label: function(context) {{
+                                        return context.dataset.label + ': $' + context.parsed.y.toFixed(2);
+                                    }}
                                 }}
                             }}
-                        }}
-                    }},
-                    scales: {{
-                        y: {{
-                            beginAtZero: true,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return '$' + value.toFixed(2);
+                        }},
+                        scales: {{
+                            y: {{
+                                beginAtZero: true,
+                                ticks: {{
+                                    callback: function(value) {{
+                                        return '$' + value.toFixed(2);
+                                    }}
                                 }}
                             }}
                         }}
                     }}
-                }}
-            }});
+                }});
 
-            // Regional Distribution Chart
-            const regionCtx = document.getElementById('regionChart').getContext('2d');
-            const regionalData = chartData.regional_distribution || {{}};
-            const regionLabels = Object.keys(regionalData);
-            const regionEC2Data = regionLabels.map(region => (regionalData[region] || {{}}).ec2 || 0);
-            const regionEKSData = regionLabels.map(region => (regionalData[region] || {{}}).eks || 0);
-
-            new Chart(regionCtx, {{
-                type: 'bar',
-                data: {{
-                    labels: regionLabels,
-                    datasets: [
-                        {{
-                            label: 'EC2 Cost',
-                            data: regionEC2Data,
-                            backgroundColor: '#4BC0C0',
-                            borderColor: '#4BC0C0',
+                // Instance Types Chart
+                const instanceCtx = document.getElementById('instanceChart').getContext('2d');
+                const instanceData = chartData.instance_types || {{}};
+                const instanceLabels = Object.keys(instanceData).slice(0, 10); // Top 10
+                const instanceCosts = instanceLabels.map(type => (instanceData[type] || {{}}).cost || 0);
+
+                new Chart(instanceCtx, {{
+                    type: 'bar',
+                    data: {{
+                        labels: instanceLabels,
+                        datasets: [{{
+                            label: 'Cost ($)',
+                            data: instanceCosts,
+                            backgroundColor: '#FF9F40',
+                            borderColor: '#FF9F40',
                             borderWidth: 1,
                             borderRadius: 5
-                        }},
-                        {{
-                            label: 'EKS Cost',
-                            data: regionEKSData,
-                            backgroundColor: '#FFCE56',
-                            borderColor: '#FFCE56',
-                            borderWidth: 1,
-                            borderRadius: 5
-                        }}
-                    ]
-                }},
-                options: {{
-                    plugins: {{
-                        legend: {{
-                            position: 'bottom',
-                            labels: {{
-                                padding: 20
-                            }}
-                        }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
-                                    return context.dataset.label + ': $' + context.parsed.y.toFixed(2);
-                                }}
-                            }}
-                        }}
+                        }}]
                     }},
-                    scales: {{
-                        y: {{
-                            beginAtZero: true,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return '$' + value.toFixed(2);
+                    options: {{
+                        indexAxis: 'y',
+                        plugins: {{
+                            legend: {{
+                                display: false
+                            }},
+                            tooltip: {{
+                                callbacks: {{
+                                    label: function(context) {{
+                                        const type = context.label;
+                                        const cost = context.parsed.x;
+                                        const count = ((instanceData[type] || {{}}).count || 0);
+                                        return `${{cost.toFixed(2)}} ({{count}} instances)`;
+                                    }}
                                 }}
                             }}
-                        }}
-                    }}
-                }}
-            }});
-
-            // Instance Types Chart
-            const instanceCtx = document.getElementById('instanceChart').getContext('2d');
-            const instanceData = chartData.instance_types || {{}};
-            const instanceLabels = Object.keys(instanceData).slice(0, 10); // Top 10
-            const instanceCosts = instanceLabels.map(type => (instanceData[type] || {{}}).cost || 0);
-
-            new Chart(instanceCtx, {{
-                type: 'bar',
-                data: {{
-                    labels: instanceLabels,
-                    datasets: [{{
-                        label: 'Cost ($)',
-                        data: instanceCosts,
-                        backgroundColor: '#FF9F40',
-                        borderColor: '#FF9F40',
-                        borderWidth: 1,
-                        borderRadius: 5
-                    }}]
-                }},
-                options: {{
-                    indexAxis: 'y',
-                    plugins: {{
-                        legend: {{
-                            display: false
                         }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
-                                    const type = context.label;
-                                    const cost = context.parsed.x;
-                                    const count = ((instanceData[type] || {{}}).count || 0);
-                                    return `${{cost.toFixed(2)}} ({{count}} instances)`;
-                                }}
-                            }}
-                        }}
-                    }},
-                    scales: {{
-                        x: {{
-                            beginAtZero: true,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return '$' + value.toFixed(2);
+                        scales: {{
+                            x: {{
+                                beginAtZero: true,
+                                ticks: {{
+                                    callback: function(value) {{
+                                        return '$' + value.toFixed(2);
+                                    }}
                                 }}
                             }}
                         }}
                     }}
-                }}
-            }});
+                }});
+            }}
+
+            (function loadChartData() {{
+                const script = document.createElement('script');
+                script.src = '{chart_data_file}';
+                script.onload = function() {{
+                    renderCharts(window.COST_REPORT_CHART_DATA);
+                }};
+                script.onerror = function() {{
+                    console.warn('Error loading chart data: {chart_data_file}');
+                    renderCharts(null);
+                }};
+                document.body.appendChild(script);
+            }})();
 
             // PDF Download Function
             async function downloadPDF() {{
@@ -4076,22 +4062,41 @@ class LiveCostCalculator:
         </script>
     </body>
     </html>
-        '''
+        ''')
+
+    def _iter_paged_table_body(self, table_id, rows):
+        """Yield table body chunks, splitting the rows into pages of report_table_page_size rows"""
+        page_count = 1
+        yield '<tbody class="report-page">'
+        for index, row in enumerate(rows):
+            if index and index % self.report_table_page_size == 0:
+                page_count += 1
+                yield '</tbody><tbody class="report-page report-page-hidden">'
+            yield row
+        yield '''
+                    </tbody>
+                </table>'''
 
-        return html_content
+        if page_count > 1:
+            yield f'''
+                <div class="table-pager">
+                    <button onclick="changeTablePage('{table_id}', -1)">&laquo; Prev</button>
+                    <span id="{table_id}-page-label">Page 1 of {page_count}</span>
+                    <button onclick="changeTablePage('{table_id}', 1)">Next &raquo;</button>
+                </div>'''
 
-    def generate_data_tables_html_inline(self, aggregated_results, current_timestamp, current_user):
-        """Generate HTML for data tables inline with EKS table included"""
-        html = '<div class="data-tables">'
+    def iter_data_tables_html(self, aggregated_results, current_timestamp, current_user):
+        """Yield the HTML for the data tables (EKS table included) chunk by chunk"""
+        yield '<div class="data-tables">'
 
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
 
         # EC2 Summary Table
         if aggregated_results.get('ec2', {}).get('accounts'):
-            html += f'''
+            yield f'''
             <div class="table-container">
                 <div class="table-header">[DESKTOP] EC2 Instances Summary - Generated: {now_str} by varadharajaan</div>
-                <table>
+                <table id="ec2-cost-table" data-page="0">
                     <thead>
                         <tr>
                             <th>Account</th>
@@ -4108,55 +4113,55 @@ class LiveCostCalculator:
                             <th>Health Status</th>
                         </tr>
                     </thead>
-                    <tbody>
             '''
 
-            for account_id, ec2_data in aggregated_results['ec2']['accounts'].items():
-                account_name = self.account_id_to_name.get(account_id, "Unknown")
-                for region, region_data in ec2_data.get('regions', {}).items():
-                    for instance in region_data.get('instances', []):
-                        cpu_util = instance['health'].get('cpu_utilization')
-                        cpu_display = f"{cpu_util}%" if cpu_util is not None else "N/A"
-                        status = instance['health'].get('status', 'Unknown')
-
-                        # Determine status class
-                        if status.lower() == 'running':
-                            status_class = 'status-active'
-                        elif status.lower() in ['pending', 'stopping', 'starting']:
-                            status_class = 'status-warning'
-                        else:
-                            status_class = 'status-error'
-
-                        # Determine CPU class
-                        cpu_class = ''
-                        if cpu_util is not None:
-                            if cpu_util > 80:
-                                cpu_class = 'status-error'
-                            elif cpu_util > 60:
-                                cpu_class = 'status-warning'
+            def ec2_rows():
+                for account_id, ec2_data in aggregated_results['ec2']['accounts'].items():
+                    account_name = self.account_id_to_name.get(account_id, "Unknown")
+                    for region, region_data in ec2_data.get('regions', {}).items():
+                        for instance in region_data.get('instances', []):
+                            cpu_util = instance['health'].get('cpu_utilization')
+                            cpu_display = f"{cpu_util}%" if cpu_util is not None else "N/A"
+                            status = instance['health'].get('status', 'Unknown')
+
+                            # Determine status class
+                            if status.lower() == 'running':
+                                status_class = 'status-active'
+                            elif status.lower() in ['pending', 'stopping', 'starting']:
+                                status_class = 'status-warning'
                             else:
-                                cpu_class = 'status-active'
-
-                        html += f'''
-                        <tr>
-                            <td><strong>{account_name}</strong><br><small>{account_id}</small></td>
-                            <td><span class="metric-badge">{region}</span></td>
-                            <td><code>{instance['instance_id']}</code></td>
-                            <td>{instance['instance_name']}</td>
-                            <td><strong>{instance['instance_type']}</strong></td>
-                            <td><span class="{status_class}">{status}</span></td>
-                            <td>{instance['launch_time']}</td>
-                            <td>{instance['uptime_hours']:.2f}</td>
-                            <td>${instance['hourly_rate']:.4f}</td>
-                            <td class="cost-highlight">${instance['estimated_cost']:.2f}</td>
-                            <td class="{cpu_class}">{cpu_display}</td>
-                            <td class="{status_class}">{status}</td>
-                        </tr>
-                        '''
-
-            html += '''
-                    </tbody>
-                </table>
+                                status_class = 'status-error'
+
+                            # Determine CPU class
+                            cpu_class = ''
+                            if cpu_util is not None:
+                                if cpu_util > 80:
+                                    cpu_class = 'status-error'
+                                elif cpu_util > 60:
+                                    cpu_class = 'status-warning'
+                                else:
+                                    cpu_class = 'status-active'
+
+                            yield f'''
+                            <tr>
+                                <td><strong>{account_name}</strong><br><small>{account_id}</small></td>
+                                <td><span class="metric-badge">{region}</span></td>
+                                <td><code>{instance['instance_id']}</code></td>
+                                <td>{instance['instance_name']}</td>
+                                <td><strong>{instance['instance_type']}</strong></td>
+                                <td><span class="{status_class}">{status}</span></td>
+                                <td>{instance['launch_time']}</td>
+                                <td>{instance['uptime_hours']:.2f}</td>
+                                <td>${instance['hourly_rate']:.4f}</td>
+                                <td class="cost-highlight">${instance['estimated_cost']:.2f}</td>
+                                <td class="{cpu_class}">{cpu_display}</td>
+                                <td class="{status_class}">{status}</td>
+                            </tr>
+                            '''
+
+            yield from self._iter_paged_table_body('ec2-cost-table', ec2_rows())
+
+            yield '''
                 <div style="padding: 15px; background: #f8f9fa; border-top: 1px solid #e9ecef;">
                     <small>[TIP] <strong>Health Status:</strong> Data collected from CloudWatch metrics. CPU utilization shows average over last hour.</small>
                 </div>
@@ -4167,10 +4172,10 @@ class LiveCostCalculator:
 
         # EKS Summary Table - THIS WAS MISSING!
         if aggregated_results.get('eks', {}).get('accounts'):
-            html += f'''
+            yield f'''
             <div class="table-container">
                 <div class="table-header">🚢 EKS Clusters Summary - Generated: {now_str} by varadharajaan</div>
-                <table>
+                <table id="eks-cost-table" data-page="0">
                     <thead>
                         <tr>
                             <th>Account</th>
@@ -4187,44 +4192,44 @@ class LiveCostCalculator:
                             <th>Efficiency</th>
                         </tr>
                     </thead>
-                    <tbody>
             '''
 
-            for account_id, eks_data in aggregated_results['eks']['accounts'].items():
-                account_name = self.account_id_to_name.get(account_id, "Unknown")
-                for region, region_data in eks_data.get('regions', {}).items():
-                    for cluster in region_data.get('clusters', []):
-                        worker_cost = cluster['total_cost'] - cluster['control_plane']['cost']
-                        nodegroup_count = len(cluster.get('nodegroups', []))
-
-                        # Calculate efficiency score (simplified)
-                        efficiency_score = "High" if worker_cost > 0 else "Low"
-                        efficiency_class = "status-active" if efficiency_score == "High" else "status-warning"
-
-                        # Version status
-                        version = cluster['version']
-                        version_class = "status-active" if version >= "1.25" else "status-warning"
-
-                        html += f'''
-                        <tr>
-                            <td><strong>{account_name}</strong><br><small>{account_id}</small></td>
-                            <td><span class="metric-badge">{region}</span></td>
-                            <td><strong>{cluster['cluster_name']}</strong></td>
-                            <td class="{version_class}">v{version}</td>
-                            <td class="status-active">{cluster['status']}</td>
-                            <td>{cluster['created_at']}</td>
-                            <td>{cluster['uptime_hours']:.2f}</td>
-                            <td class="cost-highlight">${cluster['control_plane']['cost']:.2f}</td>
-                            <td class="cost-highlight">${worker_cost:.2f}</td>
-                            <td class="cost-highlight"><strong>${cluster['total_cost']:.2f}</strong></td>
-                            <td>{nodegroup_count}</td>
-                            <td class="{efficiency_class}">{efficiency_score}</td>
-                        </tr>
-                        '''
-
-            html += '''
-                    </tbody>
-                </table>
+            def eks_rows():
+                for account_id, eks_data in aggregated_results['eks']['accounts'].items():
+                    account_name = self.account_id_to_name.get(account_id, "Unknown")
+                    for region, region_data in eks_data.get('regions', {}).items():
+                        for cluster in region_data.get('clusters', []):
+                            worker_cost = cluster['total_cost'] - cluster['control_plane']['cost']
+                            nodegroup_count = len(cluster.get('nodegroups', []))
+
+                            # Calculate efficiency score (simplified)
+                            efficiency_score = "High" if worker_cost > 0 else "Low"
+                            efficiency_class = "status-active" if efficiency_score == "High" else "status-warning"
+
+                            # Version status
+                            version = cluster['version']
+                            version_class = "status-active" if version >= "1.25" else "status-warning"
+
+                            yield f'''
+                            <tr>
+                                <td><strong>{account_name}</strong><br><small>{account_id}</small></td>
+                                <td><span class="metric-badge">{region}</span></td>
+                                <td><strong>{cluster['cluster_name']}</strong></td>
+                                <td class="{version_class}">v{version}</td>
+                                <td class="status-active">{cluster['status']}</td>
+                                <td>{cluster['created_at']}</td>
+                                <td>{cluster['uptime_hours']:.2f}</td>
+                                <td class="cost-highlight">${cluster['control_plane']['cost']:.2f}</td>
+                                <td class="cost-highlight">${worker_cost:.2f}</td>
+                                <td class="cost-highlight"><strong>${cluster['total_cost']:.2f}</strong></td>
+                                <td>{nodegroup_count}</td>
+                                <td class="{efficiency_class}">{efficiency_score}</td>
+                            </tr>
+                            '''
+
+            yield from self._iter_paged_table_body('eks-cost-table', eks_rows())
+
+            yield '''
                 <div style="padding: 15px; background: #f8f9fa; border-top: 1px solid #e9ecef;">
                     <small>[TIP] <strong>Cost Breakdown:</strong> Control Plane = $0.10/hour per cluster. Worker Nodes = EC2 instance costs in nodegroups.</small>
                 </div>
@@ -4234,7 +4239,7 @@ class LiveCostCalculator:
             # Add message if no EKS clusters found
             now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
 
-            html += f'''
+            yield f'''
             <div class="table-container">
                 <div class="table-header">🚢 EKS Clusters Summary - Generated: {now_str} by varadharajaan</div>
                 <div style="padding: 30px; text-align: center; color: #666;">
@@ -4256,7 +4261,7 @@ class LiveCostCalculator:
 
         # Historical Analysis Table
         if aggregated_results.get('historical_analysis', {}).get('accounts'):
-            html += f'''
+            yield f'''
             <div class="table-container">
                 <div class="table-header">📈 Historical Cost Analysis (Last 9 Hours) - Generated: {now_str} by varadharajaan</div>
                 <table>
@@ -4287,7 +4292,7 @@ class LiveCostCalculator:
                         total_cost = sum(i.get('historical_cost', 0) for i in ec2_instances)
                         avg_hourly = total_cost / total_hours if total_hours > 0 else 0
 
-                        html += f'''
+                        yield f'''
                         <tr>
                             <td><strong>{account_name}</strong><br><small>{account_id}</small></td>
                             <td>[DESKTOP] EC2</td>
@@ -4308,7 +4313,7 @@ class LiveCostCalculator:
                         total_cost = sum(c.get('total_cost', 0) for c in eks_clusters)
                         avg_hourly = total_cost / total_hours if total_hours > 0 else 0
 
-                        html += f'''
+                        yield f'''
                         <tr>
                             <td><strong>{account_name}</strong><br><small>{account_id}</small></td>
                             <td>🚢 EKS</td>
@@ -4322,7 +4327,7 @@ class LiveCostCalculator:
                         </tr>
                         '''
 
-            html += '''
+            yield '''
                     </tbody>
                 </table>
                 <div style="padding: 15px; background: #f8f9fa; border-top: 1px solid #e9ecef;">
@@ -4335,7 +4340,7 @@ class LiveCostCalculator:
 
         # Forecast Analysis Table
         if aggregated_results.get('forecast_analysis', {}).get('accounts'):
-            html += f'''
+            yield f'''
             <div class="table-container">
                 <div class="table-header">🔮 Cost Forecast Analysis (Next 9 Hours) - Generated: {now_str} by varadharajaan</div>
                 <table>
@@ -4364,7 +4369,7 @@ class LiveCostCalculator:
                     if ec2_forecast:
                         total_cost = sum(i.get('forecast_cost', 0) for i in ec2_forecast)
 
-                        html += f'''
+                        yield f'''
                         <tr>
                             <td><strong>{account_name}</strong><br><small>{account_id}</small></td>
                             <td>[DESKTOP] EC2</td>
@@ -4383,7 +4388,7 @@ class LiveCostCalculator:
                     if eks_forecast:
                         total_cost = sum(c.get('total_forecast', 0) for c in eks_forecast)
 
-                        html += f'''
+                        yield f'''
                         <tr>
                             <td><strong>{account_name}</strong><br><small>{account_id}</small></td>
                             <td>🚢 EKS</td>
@@ -4397,7 +4402,7 @@ class LiveCostCalculator:
                         </tr>
                         '''
 
-            html += '''
+            yield '''
                     </tbody>
                 </table>
                 <div style="padding: 15px; background: #f8f9fa; border-top: 1px solid #e9ecef;">
@@ -4409,7 +4414,7 @@ class LiveCostCalculator:
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
 
         # Cost Optimization Recommendations Table
-        html += f'''
+        yield f'''
         <div class="table-container">
             <div class="table-header">[TIP] Cost Optimization Recommendations - Generated: {now_str} by varadharajaan</div>
             <table>
@@ -4469,8 +4474,7 @@ class LiveCostCalculator:
         </div>
         '''
 
-        html += '</div>'
-        return html
+        yield '</div>'
 
 
 def main():
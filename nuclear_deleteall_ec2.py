@@ -9,6 +9,7 @@ import threading
 from datetime import datetime
 from botocore.exceptions import ClientError, BotoCoreError
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from security_group_index import SecurityGroupUsageIndex
 
 class UltraEC2CleanupManager:
     def __init__(self, config_file='aws_accounts_config.json'):
@@ -307,6 +308,46 @@ class UltraEC2CleanupManager:
             self.log_operation('ERROR', f"Error correlating instances and security groups: {e}")
             return [], []
 
+    def build_security_group_index(self, access_key, secret_key, region, account_name):
+        """Build the region's security group usage index (ENIs, rules, launch templates, ASGs, ELBs)"""
+        start_time = time.time()
+        session = boto3.session.Session(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region
+        )
+        sg_index = SecurityGroupUsageIndex.build(session, region)
+        
+        self.log_operation('INFO', f"[SCAN] Security group usage index for {region} ({account_name}): "
+                                   f"{sg_index.summary()} ({time.time() - start_time:.1f}s)")
+        for usage_type, error in sg_index.failed_sources.items():
+            self.log_operation('WARNING', f"[WARN]  Could not read {usage_type} usages in {region} ({account_name}): {error}")
+        return sg_index
+
+    def plan_security_group_deletion(self, sg_index, instances, attached_sgs, unattached_sgs):
+        """Skip groups still used outside this cleanup and order the rest by rule references
+        
+        Returns:
+            (attached_sgs, unattached_sgs, blocked_sgs)
+        """
+        attached_sgs, unattached_sgs, blocked = sg_index.plan_deletion(
+            [instance['instance_id'] for instance in instances], attached_sgs, unattached_sgs)
+        
+        for sg, blockers in blocked:
+            users = ', '.join(f"{usage['type']} {usage['id']}" for usage in blockers[:5])
+            self.log_operation('WARNING', f"[SKIP] Skipping security group {sg['group_id']} ({sg['group_name']}): still used by {users}")
+            self.cleanup_results['skipped_resources'].append({
+                'resource_type': 'security_group',
+                'resource_id': sg['group_id'],
+                'region': sg['region'],
+                'account_name': sg['account_name'],
+                'reason': f"Still used by {users}"
+            })
+        
+        self.log_operation('INFO', f"[LINK] Security group deletion plan: {len(unattached_sgs)} unattached, "
+                                   f"{len(attached_sgs)} attached/referenced, {len(blocked)} skipped (still in use)")
+        return attached_sgs, unattached_sgs, [sg for sg, _ in blocked]
+
     def terminate_instance(self, ec2_client, instance_info, wait_for_termination=False):
         """Terminate an EC2 instance"""
         try:
@@ -605,6 +646,7 @@ class UltraEC2CleanupManager:
             security_groups = []
             attached_sgs = []
             unattached_sgs = []
+            blocked_sgs = []
             
             try:
                 # Get all instances
@@ -620,6 +662,15 @@ class UltraEC2CleanupManager:
                 self.log_operation('ERROR', f"Error during resource discovery in {account_name} ({region}): {discovery_error}")
                 # Continue with whatever we managed to discover
             
+            # One usage index per region replaces discovering blockers through failed deletions
+            if security_groups:
+                try:
+                    sg_index = self.build_security_group_index(access_key, secret_key, region, account_name)
+                    attached_sgs, unattached_sgs, blocked_sgs = self.plan_security_group_deletion(
+                        sg_index, instances, attached_sgs, unattached_sgs)
+                except Exception as index_error:
+                    self.log_operation('WARNING', f"[WARN]  Could not index security group usage in {account_name} ({region}): {index_error}")
+            
             region_summary = {
                 'account_name': account_name,
                 'account_id': account_id,
@@ -627,6 +678,7 @@ class UltraEC2CleanupManager:
                 'instances_found': len(instances),
                 'attached_security_groups': len(attached_sgs),
                 'unattached_security_groups': len(unattached_sgs),
+                'skipped_security_groups': len(blocked_sgs),
                 'total_security_groups': len(security_groups)
             }
             
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Shared On-Disk EC2 Pricing Store
+Persistent, versioned SQLite cache of EC2 on-demand prices shared by the cost and spot tools.
+
+Prices are indexed by region / instance type / operating system / tenancy. A region is only
+re-fetched from the Price List API when its published price list version has changed, so
+startup of the cost reports reads straight from disk instead of paginating get_products.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".aws_pricing_cache", "pricing_store.db")
+REGION_INDEX_URL = "https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/current/region_index.json"
+SCHEMA_VERSION = 1
+
+
+class PricingStore:
+    """SQLite-backed EC2 on-demand pricing store with per-region incremental refresh"""
+
+    def __init__(self, db_path: str = None, max_age_hours: int = 24 * 7):
+        """
+        Args:
+            db_path: Location of the SQLite file (defaults to ~/.aws_pricing_cache/pricing_store.db)
+            max_age_hours: Refresh a region after this long when its published version cannot be checked
+        """
+        self.db_path = db_path or os.environ.get('AWS_PRICING_STORE_PATH', DEFAULT_STORE_PATH)
+        self.max_age_hours = max_age_hours
+        self._refresh_lock = threading.Lock()
+        self._published_versions = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._initialize_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from worker threads)"""
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _initialize_schema(self):
+        """Create tables and indexes; drop old data if the schema version changed"""
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM store_meta WHERE key = 'schema_version'").fetchone()
+            if row and int(row[0]) != SCHEMA_VERSION:
+                logger.info(f"Pricing store schema changed ({row[0]} -> {SCHEMA_VERSION}), rebuilding")
+                conn.execute("DROP TABLE IF EXISTS ec2_prices")
+                conn.execute("DROP TABLE IF EXISTS region_versions")
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ec2_prices (
+                    region TEXT NOT NULL,
+                    instance_type TEXT NOT NULL,
+                    operating_system TEXT NOT NULL,
+                    tenancy TEXT NOT NULL,
+                    price_per_hour REAL NOT NULL,
+                    PRIMARY KEY (region, instance_type, operating_system, tenancy)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS region_versions (
+                    region TEXT NOT NULL,
+                    operating_system TEXT NOT NULL,
+                    tenancy TEXT NOT NULL,
+                    publication_version TEXT,
+                    refreshed_at TEXT NOT NULL,
+                    PRIMARY KEY (region, operating_system, tenancy)
+                )
+            """)
+            conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),)
+            )
+
+    def get_published_versions(self) -> Dict[str, str]:
+        """Get the currently published EC2 price list version for every region (fetched once per process)"""
+        if self._published_versions is not None:
+            return self._published_versions
+
+        versions = {}
+        try:
+            response = requests.get(REGION_INDEX_URL, timeout=15)
+            response.raise_for_status()
+            for region_code, region_info in response.json().get('regions', {}).items():
+                # currentVersionUrl looks like /offers/v1.0/aws/AmazonEC2/<version>/<region>/index.json
+                url_parts = region_info.get('currentVersionUrl', '').strip('/').split('/')
+                if len(url_parts) >= 3:
+                    versions[region_code] = url_parts[-3]
+        except Exception as e:
+            logger.warning(f"Could not fetch EC2 price list region index, using age-based refresh: {e}")
+
+        self._published_versions = versions
+        return versions
+
+    def _get_stored_version(self, region: str, operating_system: str, tenancy: str) -> Optional[tuple]:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT publication_version, refreshed_at FROM region_versions "
+                "WHERE region = ? AND operating_system = ? AND tenancy = ?",
+                (region, operating_system, tenancy)
+            ).fetchone()
+
+    def is_region_current(self, region: str, operating_system: str = 'Linux', tenancy: str = 'Shared') -> bool:
+        """Check whether the stored prices for a region match the published price list"""
+        stored = self._get_stored_version(region, operating_system, tenancy)
+        if not stored:
+            return False
+
+        stored_version, refreshed_at = stored
+        published_version = self.get_published_versions().get(region)
+        if published_version:
+            return stored_version == published_version
+
+        # Version unknown (offline or new region) - fall back to the age of the stored data
+        try:
+            age = datetime.now() - datetime.fromisoformat(refreshed_at)
+            return age < timedelta(hours=self.max_age_hours)
+        except ValueError:
+            return False
+
+    def lookup_ec2_prices(self, region: str, instance_types: Iterable[str] = None,
+                          operating_system: str = 'Linux', tenancy: str = 'Shared') -> Dict[str, float]:
+        """Read prices for a region from disk without touching the API"""
+        query = ("SELECT instance_type, price_per_hour FROM ec2_prices "
+                 "WHERE region = ? AND operating_system = ? AND tenancy = ?")
+        params = [region, operating_system, tenancy]
+
+        if instance_types is not None:
+            instance_types = list(instance_types)
+            if not instance_types:
+                return {}
+            query += f" AND instance_type IN ({','.join('?' * len(instance_types))})"
+            params.extend(instance_types)
+
+        with self._connect() as conn:
+            return {instance_type: price for instance_type, price in conn.execute(query, params)}
+
+    def lookup_ec2_price(self, region: str, instance_type: str,
+                         operating_system: str = 'Linux', tenancy: str = 'Shared') -> Optional[float]:
+        """Read a single price from disk; returns None if it has never been stored"""
+        return self.lookup_ec2_prices(region, [instance_type], operating_system, tenancy).get(instance_type)
+
+    def store_ec2_prices(self, region: str, prices: Dict[str, float], operating_system: str = 'Linux',
+                         tenancy: str = 'Shared', publication_version: str = None):
+        """Replace the stored prices for a region and record the version they came from"""
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM ec2_prices WHERE region = ? AND operating_system = ? AND tenancy = ?",
+                (region, operating_system, tenancy)
+            )
+            conn.executemany(
+                "INSERT INTO ec2_prices (region, instance_type, operating_system, tenancy, price_per_hour) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(region, instance_type, operating_system, tenancy, price) for instance_type, price in prices.items()]
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO region_versions "
+                "(region, operating_system, tenancy, publication_version, refreshed_at) VALUES (?, ?, ?, ?, ?)",
+                (region, operating_system, tenancy, publication_version, datetime.now().isoformat())
+            )
+
+    def fetch_ec2_prices_from_api(self, pricing_client, region: str, operating_system: str = 'Linux',
+                                  tenancy: str = 'Shared') -> Dict[str, float]:
+        """Page through the Price List API for all on-demand instance prices of a region"""
+        filters = [
+            {'Type': 'TERM_MATCH', 'Field': 'ServiceCode', 'Value': 'AmazonEC2'},
+            {'Type': 'TERM_MATCH', 'Field': 'regionCode', 'Value': region},
+            {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': operating_system},
+            {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': tenancy},
+            {'Type': 'TERM_MATCH', 'Field': 'preInstalledSw', 'Value': 'NA'},
+            {'Type': 'TERM_MATCH', 'Field': 'capacitystatus', 'Value': 'Used'}
+        ]
+
+        pricing_map = {}
+        paginator = pricing_client.get_paginator('get_products')
+        for page in paginator.paginate(ServiceCode='AmazonEC2', Filters=filters):
+            for price_item in page['PriceList']:
+                price_data = json.loads(price_item)
+                instance_type = price_data.get('product', {}).get('attributes', {}).get('instanceType')
+                if not instance_type:
+                    continue
+
+                for term in price_data.get('terms', {}).get('OnDemand', {}).values():
+                    for price_dimension in term.get('priceDimensions', {}).values():
+                        price_per_unit = float(price_dimension.get('pricePerUnit', {}).get('USD', '0'))
+                        if instance_type not in pricing_map or price_per_unit > 0:
+                            pricing_map[instance_type] = price_per_unit
+                        break
+                    break
+
+        return pricing_map
+
+    def get_ec2_prices(self, region: str, pricing_client_factory: Callable, operating_system: str = 'Linux',
+                       tenancy: str = 'Shared') -> Dict[str, float]:
+        """Get all prices for a region, refreshing from the API only if the published version changed
+
+        Args:
+            pricing_client_factory: Zero-argument callable returning a boto3 'pricing' client.
+                It is only called when the region actually needs a refresh.
+        """
+        if self.is_region_current(region, operating_system, tenancy):
+            prices = self.lookup_ec2_prices(region, operating_system=operating_system, tenancy=tenancy)
+            logger.info(f"Loaded {len(prices)} EC2 prices for {region} from pricing store")
+            return prices
+
+        with self._refresh_lock:
+            # Another thread may have refreshed this region while we waited
+            if self.is_region_current(region, operating_system, tenancy):
+                return self.lookup_ec2_prices(region, operating_system=operating_system, tenancy=tenancy)
+
+            logger.info(f"Refreshing EC2 prices for {region} from the Price List API...")
+            prices = self.fetch_ec2_prices_from_api(pricing_client_factory(), region, operating_system, tenancy)
+            if prices:
+                self.store_ec2_prices(
+                    region, prices, operating_system, tenancy,
+                    publication_version=self.get_published_versions().get(region)
+                )
+                logger.info(f"Stored {len(prices)} EC2 prices for {region} in pricing store")
+            return prices
+
+
+_shared_store = None
+_shared_store_lock = threading.Lock()
+
+
+def get_pricing_store() -> PricingStore:
+    """Get the process-wide shared PricingStore instance"""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = PricingStore()
+        return _shared_store
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Readiness Utilities for AWS Infrastructure Operations
+Adaptive polling used instead of fixed sleeps while bootstrapping clusters.
+
+A wait polls a condition predicate with exponential backoff and jitter until it holds or the
+overall deadline passes, so a step continues as soon as AWS (or Kubernetes) is actually ready.
+Time spent waiting is recorded per wait name for the run summary.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type
+
+
+class ReadinessTimeout(Exception):
+    """A condition was not met before its deadline"""
+
+
+class ReadinessFailed(Exception):
+    """A resource reached a terminal failure state; raised from predicates to stop waiting"""
+
+
+class ReadinessWaiter:
+    """Adaptive poller with backoff, jitter, deadlines and wait-time instrumentation"""
+
+    def __init__(self, initial_delay: float = 2.0, max_delay: float = 30.0, backoff: float = 1.6,
+                 jitter: float = 0.2, log_operation: Callable[[str, str], None] = None):
+        """
+        Args:
+            initial_delay: Seconds before the second poll
+            max_delay: Upper bound for the delay between polls
+            backoff: Delay multiplier after every unsuccessful poll
+            jitter: Random +/- fraction applied to each delay
+            log_operation: Callable(level, message) for wait outcomes
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.jitter = jitter
+        self.log_operation = log_operation or (lambda level, message: None)
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, name: str, seconds: float, polls: int, timed_out: bool):
+        with self._lock:
+            stat = self.stats.setdefault(name, {'waits': 0, 'seconds': 0.0, 'polls': 0, 'timeouts': 0})
+            stat['waits'] += 1
+            stat['seconds'] += seconds
+            stat['polls'] += polls
+            stat['timeouts'] += int(timed_out)
+
+    def wait_for(self, name: str, predicate: Callable[[], Any], timeout: float = 300,
+                 initial_delay: float = None, max_delay: float = None,
+                 raise_on_timeout: bool = True) -> Any:
+        """Poll predicate until it returns a truthy value
+
+        Exceptions from the predicate count as "not ready yet", except ReadinessFailed which
+        is re-raised immediately.
+
+        Returns:
+            The predicate's truthy value, or None on timeout when raise_on_timeout is False
+
+        Raises:
+            ReadinessTimeout: the deadline passed (raise_on_timeout=True)
+            ReadinessFailed: the predicate reported a terminal failure
+        """
+        delay = self.initial_delay if initial_delay is None else initial_delay
+        max_delay = self.max_delay if max_delay is None else max_delay
+        start = time.monotonic()
+        deadline = start + timeout
+        polls = 0
+        last_error = None
+
+        while True:
+            polls += 1
+            try:
+                result = predicate()
+                if result:
+                    seconds = time.monotonic() - start
+                    self._record(name, seconds, polls, False)
+                    self.log_operation('INFO', f"[WAIT] {name} ready after {seconds:.1f}s ({polls} polls)")
+                    return result
+            except ReadinessFailed:
+                self._record(name, time.monotonic() - start, polls, False)
+                raise
+            except Exception as e:
+                last_error = e
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sleep_for = delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            time.sleep(min(sleep_for, remaining))
+            delay = min(delay * self.backoff, max_delay)
+
+        seconds = time.monotonic() - start
+        self._record(name, seconds, polls, True)
+        message = f"{name} not ready after {seconds:.1f}s ({polls} polls)"
+        if last_error is not None:
+            message += f": {last_error}"
+        self.log_operation('WARNING', f"[WAIT] {message}")
+        if raise_on_timeout:
+            raise ReadinessTimeout(message)
+        return None
+
+    def call_until_success(self, name: str, func: Callable[[], Any], timeout: float = 120,
+                           retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+                           retry_if: Callable[[BaseException], bool] = None, **kwargs) -> Any:
+        """Call func until it stops raising a retryable error (e.g. IAM propagation delays)
+
+        Returns:
+            func's return value
+
+        Raises:
+            The last error from func if it is not retryable or the deadline passed
+        """
+        outcome = {}
+
+        def attempt():
+            try:
+                outcome['value'] = func()
+                return True
+            except Exception as e:
+                if not isinstance(e, retry_on) or (retry_if is not None and not retry_if(e)):
+                    raise ReadinessFailed(str(e)) from e
+                outcome['error'] = e
+                raise
+
+        try:
+            self.wait_for(name, attempt, timeout=timeout, **kwargs)
+        except ReadinessFailed as e:
+            raise (e.__cause__ or e)
+        except ReadinessTimeout:
+            raise outcome['error']
+        return outcome['value']
+
+    def wait_for_status(self, name: str, get_status: Callable[[], Optional[str]],
+                        ready: Iterable[str] = ('ACTIVE',), failed: Iterable[str] = (),
+                        timeout: float = 1200, **kwargs) -> str:
+        """Wait until get_status() returns one of the ready states
+
+        Raises:
+            ReadinessFailed: a failed state was reached
+            ReadinessTimeout: the deadline passed
+        """
+        ready = set(ready)
+        failed = set(failed)
+
+        def check():
+            status = get_status()
+            if status in failed:
+                raise ReadinessFailed(f"{name} reached status {status}")
+            return status if status in ready else None
+
+        return self.wait_for(name, check, timeout=timeout, **kwargs)
+
+    def format_summary(self) -> str:
+        """One line per wait name: count, total/average seconds, polls, timeouts"""
+        with self._lock:
+            lines = []
+            for name, stat in sorted(self.stats.items(), key=lambda item: -item[1]['seconds']):
+                average = stat['seconds'] / stat['waits'] if stat['waits'] else 0
+                lines.append(f"{name}: {int(stat['waits'])} waits, {stat['seconds']:.1f}s total "
+                             f"({average:.1f}s avg), {int(stat['polls'])} polls, {int(stat['timeouts'])} timeouts")
+            return '\n'.join(lines)
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Security Group Usage Index
+Region-wide "who uses sg-X" lookup for the EC2 cleanup scripts, built once per region.
+
+Checking one security group at a time used to re-page every launch template (plus a
+describe_launch_template_versions call per template) and every Auto Scaling group for each group
+checked. The index reads every source once, concurrently: security group rules, network
+interfaces, launch template versions, launch configurations, Auto Scaling groups and load
+balancers. After that every usage question is a dictionary lookup.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+SECURITY_GROUP_RULE = 'security_group_rule'
+NETWORK_INTERFACE = 'network_interface'
+LAUNCH_TEMPLATE = 'launch_template'
+LAUNCH_CONFIGURATION = 'launch_configuration'
+AUTO_SCALING_GROUP = 'auto_scaling_group'
+LOAD_BALANCER = 'load_balancer'
+
+# Usages that make DeleteSecurityGroup fail with DependencyViolation
+BLOCKING_USAGE_TYPES = (NETWORK_INTERFACE, SECURITY_GROUP_RULE, LOAD_BALANCER)
+
+
+class SecurityGroupUsageIndex:
+    """Every usage of every security group in one region: {sg_id: [{'type', 'id', ...details}]}"""
+
+    def __init__(self, region: str = None, max_workers: int = 8):
+        """
+        Args:
+            region: Region the index describes (informational)
+            max_workers: describe_launch_template_versions calls in flight at once
+        """
+        self.region = region
+        self.max_workers = max_workers
+        self.group_names: Dict[str, str] = {}
+        self.failed_sources: Dict[str, str] = {}  # usage type -> error of the source that could not be read
+        self._usages: Dict[str, List[Dict]] = defaultdict(list)
+        self._seen: Set[tuple] = set()
+        self._ids_by_name: Dict[str, Set[str]] = defaultdict(set)
+        self._pending_names: List[tuple] = []  # (group name, usage type, user id, details)
+        self._template_groups: Dict[str, Set[str]] = {}  # ids and names, names resolved in _link
+        self._template_ids_by_name: Dict[str, str] = {}
+        self._configuration_groups: Dict[str, Set[str]] = {}
+        self._asg_sources: List[Dict] = []
+        self._asg_instances: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, session, region: str, security_groups: List[Dict] = None,
+              max_workers: int = 8) -> 'SecurityGroupUsageIndex':
+        """Read every usage source of the region once (concurrently) and index it
+
+        Args:
+            session: boto3 Session of the account
+            region: Region to index
+            security_groups: Raw describe_security_groups entries the caller already has
+                (saves listing the groups again)
+            max_workers: describe_launch_template_versions calls in flight at once
+
+        Returns:
+            The index; sources that could not be read are listed in failed_sources
+        """
+        index = cls(region, max_workers)
+        ec2_client = session.client('ec2', region_name=region)
+        loaders = {
+            (SECURITY_GROUP_RULE,): lambda: index._load_security_groups(ec2_client, security_groups),
+            (NETWORK_INTERFACE,): lambda: index._load_network_interfaces(ec2_client),
+            (LAUNCH_TEMPLATE,): lambda: index._load_launch_templates(ec2_client),
+            (AUTO_SCALING_GROUP, LAUNCH_CONFIGURATION): lambda: index._load_auto_scaling(
+                session.client('autoscaling', region_name=region)),
+            (LOAD_BALANCER,): lambda: index._load_load_balancers(
+                session.client('elbv2', region_name=region), session.client('elb', region_name=region)),
+        }
+
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = {usage_types: executor.submit(load) for usage_types, load in loaders.items()}
+            for usage_types, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"Could not index {', '.join(usage_types)} usages in {region}: {e}")
+                    for usage_type in usage_types:
+                        index.failed_sources[usage_type] = str(e)
+
+        index._link()
+        return index
+
+    def add_usage(self, sg_id: str, usage_type: str, user_id: str, **details):
+        """Record that user_id (of usage_type) uses sg_id; duplicates are ignored"""
+        if not sg_id:
+            return
+        key = (sg_id, usage_type, user_id)
+        with self._lock:
+            if key in self._seen:
+                return
+            self._seen.add(key)
+            self._usages[sg_id].append({'type': usage_type, 'id': user_id, **details})
+
+    def _add_group_reference(self, group: str, usage_type: str, user_id: str, **details):
+        """Launch templates/configurations may name groups instead of giving their ids"""
+        if group.startswith('sg-'):
+            self.add_usage(group, usage_type, user_id, **details)
+        else:
+            with self._lock:
+                self._pending_names.append((group, usage_type, user_id, details))
+
+    @staticmethod
+    def _paginate(client, operation: str, result_key: str, **kwargs) -> List[Dict]:
+        items = []
+        for page in client.get_paginator(operation).paginate(**kwargs):
+            items.extend(page.get(result_key, []))
+        return items
+
+    def _load_security_groups(self, ec2_client, security_groups: List[Dict] = None):
+        if security_groups is None:
+            security_groups = self._paginate(ec2_client, 'describe_security_groups', 'SecurityGroups')
+
+        for sg in security_groups:
+            sg_id = sg['GroupId']
+            with self._lock:
+                self.group_names[sg_id] = sg.get('GroupName')
+                self._ids_by_name[sg.get('GroupName')].add(sg_id)
+
+            for direction, rules in (('ingress', sg.get('IpPermissions', [])),
+                                     ('egress', sg.get('IpPermissionsEgress', []))):
+                for rule in rules:
+                    for pair in rule.get('UserIdGroupPairs', []):
+                        referenced = pair.get('GroupId')
+                        if referenced and referenced != sg_id:
+                            self.add_usage(referenced, SECURITY_GROUP_RULE, sg_id,
+                                           direction=direction, group_name=sg.get('GroupName'))
+
+    def _load_network_interfaces(self, ec2_client):
+        for eni in self._paginate(ec2_client, 'describe_network_interfaces', 'NetworkInterfaces'):
+            attachment = eni.get('Attachment', {})
+            for group in eni.get('Groups', []):
+                self.add_usage(group.get('GroupId'), NETWORK_INTERFACE, eni['NetworkInterfaceId'],
+                               status=eni.get('Status'), interface_type=eni.get('InterfaceType'),
+                               description=eni.get('Description'), instance_id=attachment.get('InstanceId'))
+
+    def _template_version_groups(self, ec2_client, template_id: str) -> tuple:
+        group_ids, group_names = set(), set()
+        for version in self._paginate(ec2_client, 'describe_launch_template_versions',
+                                      'LaunchTemplateVersions', LaunchTemplateId=template_id):
+            data = version.get('LaunchTemplateData', {})
+            group_ids.update(data.get('SecurityGroupIds', []))
+            group_names.update(data.get('SecurityGroups', []))
+            for interface in data.get('NetworkInterfaces', []):
+                group_ids.update(interface.get('Groups', []))
+        return group_ids, group_names
+
+    def _load_launch_templates(self, ec2_client):
+        templates = self._paginate(ec2_client, 'describe_launch_templates', 'LaunchTemplates')
+        if not templates:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(templates))) as executor:
+            futures = [(template, executor.submit(self._template_version_groups, ec2_client,
+                                                  template['LaunchTemplateId']))
+                       for template in templates]
+
+        for template, future in futures:
+            template_id = template['LaunchTemplateId']
+            template_name = template.get('LaunchTemplateName')
+            try:
+                group_ids, group_names = future.result()
+            except Exception as e:
+                # Groups of an unreadable template may be in use; treat the source as unreadable
+                logger.warning(f"Could not read versions of launch template {template_id} in {self.region}: {e}")
+                with self._lock:
+                    self.failed_sources.setdefault(LAUNCH_TEMPLATE, f"{template_id}: {e}")
+                continue
+
+            with self._lock:
+                self._template_groups[template_id] = group_ids | group_names
+                self._template_ids_by_name[template_name] = template_id
+            for group in group_ids | group_names:
+                self._add_group_reference(group, LAUNCH_TEMPLATE, template_id, name=template_name)
+
+    def _load_auto_scaling(self, autoscaling_client):
+        for configuration in self._paginate(autoscaling_client, 'describe_launch_configurations',
+                                            'LaunchConfigurations'):
+            name = configuration['LaunchConfigurationName']
+            groups = configuration.get('SecurityGroups', [])
+            with self._lock:
+                self._configuration_groups[name] = set(groups)
+            for group in groups:
+                self._add_group_reference(group, LAUNCH_CONFIGURATION, name)
+
+        for asg in self._paginate(autoscaling_client, 'describe_auto_scaling_groups', 'AutoScalingGroups'):
+            asg_name = asg['AutoScalingGroupName']
+            template = (asg.get('LaunchTemplate')
+                        or asg.get('MixedInstancesPolicy', {}).get('LaunchTemplate', {})
+                        .get('LaunchTemplateSpecification', {}))
+            with self._lock:
+                self._asg_sources.append({
+                    'name': asg_name,
+                    'template_id': template.get('LaunchTemplateId'),
+                    'template_name': template.get('LaunchTemplateName'),
+                    'configuration': asg.get('LaunchConfigurationName')
+                })
+                for instance in asg.get('Instances', []):
+                    self._asg_instances[instance['InstanceId']] = asg_name
+
+    def _load_load_balancers(self, elbv2_client, elb_client):
+        for lb in self._paginate(elbv2_client, 'describe_load_balancers', 'LoadBalancers'):
+            for group in lb.get('SecurityGroups', []):
+                self.add_usage(group, LOAD_BALANCER, lb['LoadBalancerName'],
+                               arn=lb.get('LoadBalancerArn'), lb_type=lb.get('Type'))
+        for lb in self._paginate(elb_client, 'describe_load_balancers', 'LoadBalancerDescriptions'):
+            for group in lb.get('SecurityGroups', []):
+                self.add_usage(group, LOAD_BALANCER, lb['LoadBalancerName'], lb_type='classic')
+
+    def _group_ids(self, groups: Iterable[str]) -> Set[str]:
+        """Group ids for a mix of ids and names (launch templates/configurations accept both)"""
+        group_ids = set()
+        for group in groups:
+            if group.startswith('sg-'):
+                group_ids.add(group)
+            else:
+                group_ids.update(self._ids_by_name.get(group, ()))
+        return group_ids
+
+    def _link(self):
+        """Resolve group names and attribute template, configuration and instance usages to ASGs"""
+        for group_name, usage_type, user_id, details in self._pending_names:
+            for sg_id in self._ids_by_name.get(group_name, ()):
+                self.add_usage(sg_id, usage_type, user_id, **details)
+
+        for asg in self._asg_sources:
+            template_id = asg['template_id'] or self._template_ids_by_name.get(asg['template_name'])
+            if template_id:
+                for sg_id in self._group_ids(self._template_groups.get(template_id, ())):
+                    self.add_usage(sg_id, AUTO_SCALING_GROUP, asg['name'], via=template_id)
+            for sg_id in self._group_ids(self._configuration_groups.get(asg['configuration'], ())):
+                self.add_usage(sg_id, AUTO_SCALING_GROUP, asg['name'], via=asg['configuration'])
+
+        for sg_id, usages in list(self._usages.items()):
+            for usage in list(usages):
+                asg_name = self._asg_instances.get(usage.get('instance_id'))
+                if usage['type'] == NETWORK_INTERFACE and asg_name:
+                    self.add_usage(sg_id, AUTO_SCALING_GROUP, asg_name, via=usage['instance_id'])
+
+        # ASGs are resolved through their templates; unknown templates mean unknown ASG usage
+        if LAUNCH_TEMPLATE in self.failed_sources and AUTO_SCALING_GROUP not in self.failed_sources:
+            if any(asg['template_id'] or asg['template_name'] for asg in self._asg_sources):
+                self.failed_sources[AUTO_SCALING_GROUP] = self.failed_sources[LAUNCH_TEMPLATE]
+
+    def usages(self, sg_id: str, usage_types: Iterable[str] = None) -> List[Dict]:
+        """Usages of sg_id, optionally only of the given types"""
+        usages = self._usages.get(sg_id, [])
+        if usage_types is None:
+            return list(usages)
+        usage_types = set(usage_types)
+        return [usage for usage in usages if usage['type'] in usage_types]
+
+    def is_used_by(self, sg_id: str, usage_type: str) -> bool:
+        """True if sg_id has a usage of usage_type, or that source could not be read (err on the side of caution)"""
+        return usage_type in self.failed_sources or bool(self.usages(sg_id, (usage_type,)))
+
+    def referencing_groups(self, sg_id: str) -> Set[str]:
+        """Groups whose ingress/egress rules reference sg_id"""
+        return {usage['id'] for usage in self.usages(sg_id, (SECURITY_GROUP_RULE,))}
+
+    def blocking_usages(self, sg_id: str, ignore_instances: Iterable[str] = (),
+                        ignore_groups: Iterable[str] = ()) -> List[Dict]:
+        """Usages that would make deleting sg_id fail, apart from the ones the caller removes itself
+
+        Args:
+            ignore_instances: Instances being terminated (their interfaces go away with them)
+            ignore_groups: Groups being deleted as well (their rules are cleared first)
+
+        Sources that could not be read are not reported here; the caller's own retries cover them.
+        """
+        ignore_instances = set(ignore_instances)
+        ignore_groups = set(ignore_groups)
+        blocking = []
+        for usage in self.usages(sg_id, BLOCKING_USAGE_TYPES):
+            if usage['type'] == NETWORK_INTERFACE and usage.get('instance_id') in ignore_instances:
+                continue
+            if usage['type'] == SECURITY_GROUP_RULE and usage['id'] in ignore_groups:
+                continue
+            blocking.append(usage)
+        return blocking
+
+    def deletion_order(self, group_ids: Iterable[str]) -> List[str]:
+        """Order groups so that a group referencing another one in its rules is deleted first
+
+        Groups in a reference cycle keep their input order at the end.
+        """
+        group_ids = list(dict.fromkeys(group_ids))
+        members = set(group_ids)
+        referenced_by = {sg_id: (self.referencing_groups(sg_id) & members) - {sg_id} for sg_id in group_ids}
+        remaining = {sg_id: len(referencers) for sg_id, referencers in referenced_by.items()}
+        references = defaultdict(list)
+        for sg_id, referencers in referenced_by.items():
+            for referencer in referencers:
+                references[referencer].append(sg_id)
+
+        order = []
+        ready = [sg_id for sg_id in group_ids if remaining[sg_id] == 0]
+        while ready:
+            sg_id = ready.pop(0)
+            order.append(sg_id)
+            for referenced in references[sg_id]:
+                remaining[referenced] -= 1
+                if remaining[referenced] == 0:
+                    ready.append(referenced)
+        ordered = set(order)
+        return order + [sg_id for sg_id in group_ids if sg_id not in ordered]
+
+    def plan_deletion(self, instance_ids: Iterable[str], attached: List[Dict],
+                      unattached: List[Dict]) -> Tuple[List[Dict], List[Dict], List[Tuple[Dict, List[Dict]]]]:
+        """Plan a cleanup that terminates instance_ids and deletes the given groups
+
+        Groups kept alive by interfaces, load balancers or rules of groups that stay are skipped,
+        and so are the groups those skipped groups reference. An unattached group referenced by an
+        attached one moves to the attached (retried) pass, and both passes follow deletion_order.
+
+        Args:
+            instance_ids: Instances terminated before the groups are deleted
+            attached, unattached: Group dicts with a 'group_id' key, as the scripts correlate them
+
+        Returns:
+            (attached, unattached, blocked) where blocked holds (group, blocking usages) pairs
+        """
+        instance_ids = set(instance_ids)
+        candidates = attached + unattached
+
+        blocked = {}
+        while True:
+            remaining_ids = {sg['group_id'] for sg in candidates if sg['group_id'] not in blocked}
+            newly_blocked = {}
+            for sg_id in remaining_ids:
+                blockers = self.blocking_usages(sg_id, ignore_instances=instance_ids, ignore_groups=remaining_ids)
+                if blockers:
+                    newly_blocked[sg_id] = blockers
+            if not newly_blocked:
+                break
+            blocked.update(newly_blocked)
+
+        attached = [sg for sg in attached if sg['group_id'] not in blocked]
+        unattached = [sg for sg in unattached if sg['group_id'] not in blocked]
+
+        attached_ids = {sg['group_id'] for sg in attached}
+        while True:
+            deferred = [sg for sg in unattached if self.referencing_groups(sg['group_id']) & attached_ids]
+            if not deferred:
+                break
+            attached = attached + deferred
+            attached_ids.update(sg['group_id'] for sg in deferred)
+            unattached = [sg for sg in unattached if sg['group_id'] not in attached_ids]
+
+        position = {sg_id: i for i, sg_id in enumerate(self.deletion_order(sg['group_id'] for sg in attached + unattached))}
+        attached.sort(key=lambda sg: position[sg['group_id']])
+        unattached.sort(key=lambda sg: position[sg['group_id']])
+
+        return attached, unattached, [(sg, blocked[sg['group_id']]) for sg in candidates if sg['group_id'] in blocked]
+
+    def summary(self) -> str:
+        """Usage counts per type, e.g. '12 network_interface, 3 launch_template'"""
+        counts = defaultdict(int)
+        for usages in self._usages.values():
+            for usage in usages:
+                counts[usage['type']] += 1
+        return ', '.join(f"{count} {usage_type}" for usage_type, count in sorted(counts.items())) or 'no usages'
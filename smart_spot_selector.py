@@ -27,6 +27,8 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 import joblib
 
+from pricing_store import get_pricing_store
+
 # Color codes for terminal
 class Colors:
     HEADER = '\033[95m'
@@ -237,6 +239,7 @@ class AWSSpotDataFetcher:
         self.pricing_client = boto3.client('pricing', region_name='us-east-1')
         self. cache_dir = os.path.join(os.path.expanduser("~"), ".spot_cache")
         os.makedirs(self.cache_dir, exist_ok=True)
+        self.pricing_store = get_pricing_store()
     
     def get_spot_price_history(self, instance_types: List[str], days: int = 7) -> pd.DataFrame:
         """Fetch real spot price history from AWS"""
@@ -331,52 +334,19 @@ class AWSSpotDataFetcher:
         return prices
     
     def get_on_demand_prices(self, instance_types: List[str]) -> Dict[str, float]:
-        """Get on-demand prices from AWS Pricing API"""
+        """Get on-demand prices from the shared pricing store (refreshed from the AWS Pricing API when stale)"""
         prices = {}
-        region_name = self._get_region_name()
         
+        try:
+            region_prices = self.pricing_store.get_ec2_prices(self.region, lambda: self.pricing_client)
+            prices = {instance_type: region_prices[instance_type]
+                      for instance_type in instance_types if instance_type in region_prices}
+        except Exception:
+            pass
+        
+        # Fallback estimation for anything the price list did not cover
         for instance_type in instance_types:
-            cache_key = f"od_price_{self.region}_{instance_type}"
-            cache_file = os. path.join(self.cache_dir, f"{cache_key}. pkl")
-            
-            # Check cache (24 hour TTL)
-            if os.path.exists(cache_file):
-                mod_time = os.path.getmtime(cache_file)
-                if (datetime.now().timestamp() - mod_time) < 86400:  # 24 hours
-                    with open(cache_file, 'rb') as f:
-                        prices[instance_type] = pickle.load(f)
-                        continue
-            
-            try:
-                response = self.pricing_client.get_products(
-                    ServiceCode='AmazonEC2',
-                    Filters=[
-                        {'Type': 'TERM_MATCH', 'Field': 'instanceType', 'Value': instance_type},
-                        {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': region_name},
-                        {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': 'Linux'},
-                        {'Type': 'TERM_MATCH', 'Field': 'preInstalledSw', 'Value': 'NA'},
-                        {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': 'Shared'},
-                        {'Type': 'TERM_MATCH', 'Field': 'capacitystatus', 'Value': 'Used'}
-                    ],
-                    MaxResults=1
-                )
-                
-                if response['PriceList']:
-                    price_data = json.loads(response['PriceList'][0])
-                    on_demand = price_data. get('terms', {}).get('OnDemand', {})
-                    
-                    for term in on_demand.values():
-                        for price_dim in term.get('priceDimensions', {}).values():
-                            price = float(price_dim['pricePerUnit']['USD'])
-                            prices[instance_type] = price
-                            
-                            # Cache the price
-                            with open(cache_file, 'wb') as f:
-                                pickle.dump(price, f)
-                            break
-                        break
-            except:
-                # Fallback estimation
+            if instance_type not in prices:
                 prices[instance_type] = self._estimate_price(instance_type)
         
         return prices
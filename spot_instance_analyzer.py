@@ -13,11 +13,17 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import pytz
 import boto3
+import numpy as np
+import pandas as pd
 import statistics
 import requests
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from botocore.config import Config as BotoConfig
 
-from aws_credential_manager import CredentialInfo
+from aws_credential_manager import AWSCredentialManager, CredentialInfo
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -57,6 +63,9 @@ class ServiceQuotaInfo:
     region: str
 
 class SpotInstanceAnalyzer:
+    # Instance types per DescribeSpotPriceHistory call in the batched engine
+    SPOT_PRICE_BATCH_SIZE = 10
+
     def __init__(self, region='us-east-1', cache_dir='cache', cache_ttl_hours=24):
         self.region = region
         self.cache_dir = Path(cache_dir)
@@ -64,6 +73,9 @@ class SpotInstanceAnalyzer:
         self.cache_ttl_hours = cache_ttl_hours
         self.ist_tz = pytz.timezone('Asia/Kolkata')
         self.credentials = None
+        self._region_clients = {}
+        self._client_cache_lock = threading.Lock()
+        self.region_scan_timings = {}
 
     def set_credentials(self, credentials: CredentialInfo):
         """Set AWS credentials and create a boto3 session"""
@@ -367,66 +379,8 @@ class SpotInstanceAnalyzer:
                 aws_secret_access_key=getattr(cred_info, 'secret_key', None),
                 region_name=self.region
             )
-        
-            # Get real-time service quotas
-            quotas_by_family = self.get_real_time_service_quotas(ec2_client, service_quotas_client, instance_types)
-        
-            # Get spot placement scores for better AZ selection
-            placement_scores = self.get_spot_placement_scores(ec2_client, instance_types, self.region)
-        
-            spot_analyses = []
-            azs_response = ec2_client.describe_availability_zones()
-            all_azs = [az['ZoneName'] for az in azs_response['AvailabilityZones']]
-            unsupported_azs = self._get_unsupported_azs(self.region)
-            availability_zones = [az for az in all_azs if az not in unsupported_azs]
-        
-            print(f"Analyzing {len(instance_types)} instance types across {len(availability_zones)} availability zones...")
-        
-            # Create progress bar for better UX
-            total_analyses = len(instance_types) * len(availability_zones)
-            completed = 0
-        
-            for instance_type in instance_types:
-                family = instance_type.split('.')[0]
-                quota_info = quotas_by_family.get(family, {})
-                quota_available = quota_info.get('AvailableCapacity', 32)  # Changed default from 10 to 32
-            
-                for az in availability_zones:
-                    # Get enhanced price history with interruption analysis
-                    price_history = self.get_spot_price_history_with_interruption(
-                        ec2_client, instance_type, az, days=10
-                    )
-                
-                    # Get placement score for this AZ
-                    az_placement_score = placement_scores.get(az, {}).get('PlacementScore', 50)
-                
-                    analysis = SpotAnalysis(
-                        instance_type=instance_type,
-                        region=self.region,
-                        availability_zone=az,
-                        current_price=price_history['current_price'],
-                        price_history_avg=price_history['avg_price'],
-                        interruption_rate=price_history['estimated_interruption_rate'],
-                        quota_available=quota_available,
-                        score=self.calculate_enhanced_spot_score(
-                            price_history['current_price'], 
-                            price_history['avg_price'],
-                            price_history['estimated_interruption_rate'],
-                            quota_available,
-                            az_placement_score
-                        ),
-                        last_updated=self._get_current_ist_time().isoformat()
-                    )
-                
-                    spot_analyses.append(analysis)
-                
-                    # Update progress
-                    completed += 1
-                    if completed % 5 == 0 or completed == total_analyses:
-                        progress = completed / total_analyses * 100
-                        print(f"Progress: {progress:.1f}% ({completed}/{total_analyses})", end='\r')
-        
-            print("\nAnalysis complete!")
+
+            spot_analyses = self._analyze_region(ec2_client, service_quotas_client, instance_types, self.region)
         
             # Sort by interruption rate, score, and quota availability
             spot_analyses = self._sort_spot_analyses(spot_analyses)
@@ -441,6 +395,129 @@ class SpotInstanceAnalyzer:
             logger.error(f"Error analyzing spot instances: {e}")
             return []
 
+    def _analyze_region(self, ec2_client, service_quotas_client, instance_types: List[str], region: str) -> List[SpotAnalysis]:
+        """Analyze all instance types across the usable AZs of a single region"""
+        # Get real-time service quotas
+        quotas_by_family = self.get_real_time_service_quotas(ec2_client, service_quotas_client, instance_types)
+
+        # Get spot placement scores for better AZ selection
+        placement_scores = self.get_spot_placement_scores(ec2_client, instance_types, region)
+
+        spot_analyses = []
+        azs_response = ec2_client.describe_availability_zones()
+        all_azs = [az['ZoneName'] for az in azs_response['AvailabilityZones']]
+        unsupported_azs = self._get_unsupported_azs(region)
+        availability_zones = [az for az in all_azs if az not in unsupported_azs]
+
+        print(f"Analyzing {len(instance_types)} instance types across {len(availability_zones)} availability zones in {region}...")
+
+        # Pull price history for every (type, AZ) pair in a few multi-type calls
+        price_stats = self.get_batched_spot_price_statistics(
+            ec2_client, instance_types, availability_zones, days=10
+        )
+        last_updated = self._get_current_ist_time().isoformat()
+
+        for row in price_stats.itertuples(index=False):
+            family = row.instance_type.split('.')[0]
+            quota_info = quotas_by_family.get(family, {})
+            quota_available = quota_info.get('AvailableCapacity', 32)  # Changed default from 10 to 32
+
+            # Get placement score for this AZ
+            az_placement_score = placement_scores.get(row.availability_zone, {}).get('PlacementScore', 50)
+
+            analysis = SpotAnalysis(
+                instance_type=row.instance_type,
+                region=region,
+                availability_zone=row.availability_zone,
+                current_price=float(row.current_price),
+                price_history_avg=float(row.avg_price),
+                interruption_rate=row.estimated_interruption_rate,
+                quota_available=quota_available,
+                score=self.calculate_enhanced_spot_score(
+                    float(row.current_price),
+                    float(row.avg_price),
+                    row.estimated_interruption_rate,
+                    quota_available,
+                    az_placement_score
+                ),
+                last_updated=last_updated
+            )
+            spot_analyses.append(analysis)
+
+        print("Analysis complete!")
+
+        return spot_analyses
+
+    def _get_region_client(self, service: str, region: str, cred_info: CredentialInfo):
+        """Get a cached boto3 client for a region, with adaptive throttling backoff"""
+        cache_key = (service, region, getattr(cred_info, 'access_key', None))
+        with self._client_cache_lock:
+            client = self._region_clients.get(cache_key)
+            if client is None:
+                client = boto3.client(
+                    service,
+                    aws_access_key_id=getattr(cred_info, 'access_key', None),
+                    aws_secret_access_key=getattr(cred_info, 'secret_key', None),
+                    region_name=region,
+                    config=BotoConfig(retries={'max_attempts': 10, 'mode': 'adaptive'})
+                )
+                self._region_clients[cache_key] = client
+            return client
+
+    def _analyze_region_timed(self, cred_info: CredentialInfo, instance_types: List[str], region: str):
+        """Worker for the multi-region scan: returns (region, analyses, wall time, error)"""
+        start_time = time.time()
+        try:
+            ec2_client = self._get_region_client('ec2', region, cred_info)
+            service_quotas_client = self._get_region_client('service-quotas', region, cred_info)
+            analyses = self._analyze_region(ec2_client, service_quotas_client, instance_types, region)
+            return region, analyses, time.time() - start_time, None
+        except Exception as e:
+            return region, [], time.time() - start_time, str(e)
+
+    def analyze_spot_instances_multi_region(self, cred_info: CredentialInfo, instance_types: List[str],
+                                            regions: Optional[List[str]] = None,
+                                            max_workers: int = 6) -> List[SpotAnalysis]:
+        """Analyze spot instances across many regions concurrently and rank them globally
+
+        Each region runs on a bounded thread pool with its own cached clients. Per-region
+        wall time is kept in self.region_scan_timings and printed as a summary.
+        """
+        regions = list(regions or getattr(cred_info, 'regions', None) or [self.region])
+        self.credentials = cred_info
+        self.region_scan_timings = {}
+
+        logger.info(f"Scanning spot pools in {len(regions)} regions with {min(max_workers, len(regions))} workers")
+        scan_start = time.time()
+
+        spot_analyses = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(regions)))) as executor:
+            futures = [
+                executor.submit(self._analyze_region_timed, cred_info, instance_types, region)
+                for region in regions
+            ]
+            for completed, future in enumerate(as_completed(futures), 1):
+                region, analyses, duration, error = future.result()
+                self.region_scan_timings[region] = {
+                    'duration': duration,
+                    'results': len(analyses),
+                    'error': error
+                }
+                if error:
+                    self.print_colored(Colors.RED, f"[ERROR] [{completed}/{len(regions)}] {region}: {error} ({duration:.1f}s)")
+                else:
+                    self.print_colored(Colors.GREEN, f"[OK] [{completed}/{len(regions)}] {region}: {len(analyses)} spot pools in {duration:.1f}s")
+                spot_analyses.extend(analyses)
+
+        total_duration = time.time() - scan_start
+        self.print_colored(Colors.CYAN, "\nRegion scan timings:")
+        for region, timing in sorted(self.region_scan_timings.items(), key=lambda x: x[1]['duration'], reverse=True):
+            status = "FAILED" if timing['error'] else f"{timing['results']} pools"
+            print(f"  {region:<20} {timing['duration']:>7.1f}s  {status}")
+        print(f"  {'TOTAL (wall)':<20} {total_duration:>7.1f}s")
+
+        return self._sort_spot_analyses(spot_analyses)
+
     def _sort_spot_analyses(self, spot_analyses: List[SpotAnalysis]) -> List[SpotAnalysis]:
         """Sort spot analyses by interruption rate (low first), score (high first), and quota (high first)"""
         interruption_rate_map = {
@@ -617,6 +694,95 @@ class SpotInstanceAnalyzer:
                 'error': str(e)
             }
 
+    def get_batched_spot_price_statistics(self, ec2_client, instance_types: List[str],
+                                          availability_zones: List[str], days: int = 7) -> pd.DataFrame:
+        """Get spot price statistics for every (instance type, AZ) pair using batched multi-type calls
+
+        Returns one row per pair with the same fields as get_spot_price_history_with_interruption.
+        Pairs without any price history are reported with zero prices and an "Unknown" rate.
+        """
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(days=days)
+        paginator = ec2_client.get_paginator('describe_spot_price_history')
+
+        records = []
+        total_batches = (len(instance_types) + self.SPOT_PRICE_BATCH_SIZE - 1) // self.SPOT_PRICE_BATCH_SIZE
+        for batch_number, i in enumerate(range(0, len(instance_types), self.SPOT_PRICE_BATCH_SIZE), 1):
+            batch = instance_types[i:i + self.SPOT_PRICE_BATCH_SIZE]
+            try:
+                for page in paginator.paginate(
+                    InstanceTypes=batch,
+                    ProductDescriptions=['Linux/UNIX'],
+                    Filters=[{'Name': 'availability-zone', 'Values': availability_zones}],
+                    StartTime=start_time,
+                    EndTime=end_time,
+                    PaginationConfig={'PageSize': 1000}
+                ):
+                    for price in page['SpotPriceHistory']:
+                        records.append((
+                            price['InstanceType'],
+                            price['AvailabilityZone'],
+                            price['Timestamp'],
+                            float(price['SpotPrice'])
+                        ))
+            except Exception as e:
+                self.log_operation('WARNING', f"Error fetching spot price history for {', '.join(batch)}: {e}")
+            print(f"Fetching spot price history... [{batch_number}/{total_batches} batches]", end='\r')
+        print()
+
+        # Every requested pair gets a row, matching the per-pair behaviour
+        full_index = pd.MultiIndex.from_product(
+            [instance_types, availability_zones], names=['instance_type', 'availability_zone']
+        )
+        if not records:
+            logger.info(f"No spot price history returned for {len(full_index)} instance type/AZ pairs")
+            return pd.DataFrame({
+                'current_price': 0.0,
+                'avg_price': 0.0,
+                'max_price': 0.0,
+                'min_price': 0.0,
+                'price_volatility': 0.0,
+                'estimated_interruption_rate': "Unknown"
+            }, index=full_index).reset_index()
+
+        history = pd.DataFrame(records, columns=['instance_type', 'availability_zone', 'timestamp', 'price'])
+        history = history.astype({'price': float}).sort_values('timestamp')
+        stats = history.groupby(['instance_type', 'availability_zone'])['price'].agg(
+            current_price='last',
+            avg_price='mean',
+            max_price='max',
+            min_price='min',
+            std_price='std',
+            samples='count'
+        )
+
+        stats = stats.reindex(full_index)
+        samples = stats['samples'].fillna(0).to_numpy(dtype=float)
+        avg_price = stats['avg_price'].fillna(0.0).to_numpy(dtype=float)
+        std_price = stats['std_price'].fillna(0.0).to_numpy(dtype=float)
+
+        # Price volatility (standard deviation as percentage of mean)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volatility = np.where((samples > 1) & (avg_price > 0), std_price / avg_price * 100, 0.0)
+
+        interruption_rate = np.select(
+            [samples == 0, volatility < 5, volatility < 10, volatility < 20],
+            ["Unknown", "Low (<5%)", "Medium (5-10%)", "High (10-20%)"],
+            default="Very High (>20%)"
+        )
+
+        result = pd.DataFrame({
+            'current_price': stats['current_price'].fillna(0.0).to_numpy(),
+            'avg_price': avg_price,
+            'max_price': stats['max_price'].fillna(0.0).to_numpy(),
+            'min_price': stats['min_price'].fillna(0.0).to_numpy(),
+            'price_volatility': volatility,
+            'estimated_interruption_rate': interruption_rate
+        }, index=full_index).reset_index()
+
+        logger.info(f"Computed spot statistics for {len(result)} instance type/AZ pairs from {len(records)} price points")
+        return result
+
     def get_real_time_service_quotas(self, ec2_client, service_quotas_client, instance_types: List[str]) -> Dict[str, Dict]:
         """Fetch real-time service quotas and current usage for instance families"""
         # Extract instance families
@@ -826,4 +992,52 @@ class SpotInstanceAnalyzer:
         """Set boto3 session for API calls"""
         self.session = session
         self.region = session.region_name
-        logger.info(f"Session set with region: {self.region}")
\ No newline at end of file
+        logger.info(f"Session set with region: {self.region}")
+
+
+def select_scan_regions(available_regions: List[str]) -> List[str]:
+    """Pick the regions for a multi-region scan (all by default)"""
+    print("\nRegions available for the spot scan:")
+    for i, region in enumerate(available_regions, 1):
+        print(f"  {i:>2}. {region}")
+
+    while True:
+        choice = input("Select regions (comma-separated numbers, or 'all') [all]: ").strip().lower()
+        if choice in ('', 'all'):
+            return list(available_regions)
+        try:
+            indexes = [int(part) - 1 for part in choice.split(',') if part.strip()]
+            if indexes and all(0 <= index < len(available_regions) for index in indexes):
+                return [available_regions[index] for index in dict.fromkeys(indexes)]
+        except ValueError:
+            pass
+        print(f"[ERROR] Enter numbers between 1 and {len(available_regions)}, or 'all'")
+
+
+def main(config_file: str = 'ec2-region-ami-mapping.json', top_n: int = 25):
+    """Interactive multi-region spot scan: credentials -> regions -> globally ranked spot pools"""
+    with open(config_file, 'r') as f:
+        ami_config = json.load(f)
+    instance_types = ami_config.get('allowed_instance_types', [])
+
+    cred_info = AWSCredentialManager().get_credentials()
+    available_regions = list(ami_config.get('region_ami_mapping', {})) or cred_info.regions
+    regions = select_scan_regions(available_regions)
+
+    analyzer = SpotInstanceAnalyzer(region=regions[0])
+    spot_analyses = analyzer.analyze_spot_instances_multi_region(cred_info, instance_types, regions)
+    if not spot_analyses:
+        print("[WARN] No spot pools found")
+        return
+
+    print(f"\n[STATS] TOP {min(top_n, len(spot_analyses))} SPOT POOLS ACROSS {len(regions)} REGIONS")
+    print("-" * 90)
+    print(f"{'#':<4} {'Type':<12} {'Region':<16} {'Zone':<18} {'Price':<9} {'Score':<7} {'Interrupt':<18}")
+    print("-" * 90)
+    for i, analysis in enumerate(spot_analyses[:top_n], 1):
+        print(f"{i:<4} {analysis.instance_type:<12} {analysis.region:<16} {analysis.availability_zone:<18} "
+              f"${analysis.current_price:<8.4f} {analysis.score:<7.1f} {analysis.interruption_rate:<18}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+SSH Fleet Runner
+asyncio runner that executes commands on many hosts at once over pooled paramiko sessions
+and streams their output to log sinks as it arrives.
+
+Channel reads and sink writes run on a thread pool in bounded batches, so neither a slow
+sink nor a host that never stops printing holds up the event loop; one process can drive
+hundreds of hosts. Command output is never buffered whole: every chunk goes straight to the sinks and only
+a bounded tail is kept in memory for the summary reports.
+"""
+
+import asyncio
+import codecs
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from ssh_session_pool import SSHSessionPool
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 32768
+# Chunks read per stream in one pump pass before the host yields to the others
+MAX_CHUNKS_PER_PASS = 8
+DEFAULT_TAIL_BYTES = 64 * 1024
+
+
+class OutputTail:
+    """Bounded in-memory tail of a stream; keeps the last max_chars characters"""
+
+    def __init__(self, max_chars: int = DEFAULT_TAIL_BYTES):
+        self.max_chars = max_chars
+        self._chunks = deque()
+        self._size = 0
+        self.total_chars = 0
+
+    def append(self, text: str):
+        self.total_chars += len(text)
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size - len(self._chunks[0]) >= self.max_chars:
+            self._size -= len(self._chunks.popleft())
+
+    @property
+    def truncated(self) -> bool:
+        return self.total_chars > self.max_chars
+
+    def getvalue(self) -> str:
+        text = ''.join(self._chunks)
+        if self.truncated:
+            return text[-self.max_chars:]
+        return text
+
+
+class TextLogSink:
+    """Appends streamed command output to a plain text log file"""
+
+    def __init__(self, path, mode: str = 'a'):
+        self.file = open(path, mode, encoding='utf-8')
+
+    def write_header(self, text: str):
+        self.file.write(text)
+        self.file.flush()
+
+    def begin_command(self, command_number: int, command: str):
+        self.file.write(f"Command #{command_number}: {command}\n")
+        self.file.write("Output:\n")
+
+    def write_output(self, text: str, is_error: bool = False):
+        self.file.write(text)
+
+    def end_command(self, result: Dict):
+        self.file.write(f"\nSuccess: {'YES' if result['success'] else 'NO'} (exit code: {result['exit_code']})\n")
+        if result['exit_code'] == -1 and result['error']:
+            self.file.write(f"Error:\n{result['error']}\n")
+        self.file.write("-" * 50 + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class HTMLLogSink:
+    """Streams command output into an HTML page that can be opened while the run is in progress"""
+
+    def __init__(self, path, title: str):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write(f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{escape(title)}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; background: #f9f9f9; color: #222; }}
+        pre {{ background: #f4f4f4; border-radius: 4px; padding: 0.5em; overflow-x: auto; }}
+        code {{ background: #f4f4f4; border-radius: 3px; padding: 2px 4px; }}
+        .stderr {{ color: red; }}
+    </style>
+</head>
+<body>
+    <h1>{escape(title)}</h1>
+""")
+        self.file.flush()
+
+    def write_header(self, text: str):
+        self.file.write(f"<h2>{escape(text.strip())}</h2>\n")
+        self.file.flush()
+
+    def begin_command(self, command_number: int, command: str):
+        self.file.write(f"<div><b>Command #{command_number}:</b> <code>{escape(command)}</code><pre>")
+
+    def write_output(self, text: str, is_error: bool = False):
+        if is_error:
+            self.file.write(f'<span class="stderr">{escape(text)}</span>')
+        else:
+            self.file.write(escape(text))
+
+    def end_command(self, result: Dict):
+        color = 'green' if result['success'] else 'red'
+        status = 'SUCCESS' if result['success'] else 'FAILED'
+        self.file.write(f"</pre><b>Status:</b> <span style=\"color:{color}\">{status}</span> "
+                        f"(exit code: {result['exit_code']})</div>\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.write("</body>\n</html>\n")
+        self.file.close()
+
+
+class AsyncSSHFleetRunner:
+    """Run commands on many hosts concurrently with streaming output capture"""
+
+    def __init__(self, pool: SSHSessionPool = None, max_concurrent_hosts: int = 100,
+                 tail_chars: int = DEFAULT_TAIL_BYTES, max_poll_interval: float = 0.2):
+        """
+        Args:
+            pool: SSH session pool to run on (a private one is created if omitted)
+            max_concurrent_hosts: Hosts processed at the same time
+            tail_chars: Characters of stdout/stderr kept in memory per command
+            max_poll_interval: Upper bound for the back-off between channel polls
+        """
+        self.pool = pool or SSHSessionPool()
+        self.max_concurrent_hosts = max(1, max_concurrent_hosts)
+        self.tail_chars = tail_chars
+        self.max_poll_interval = max_poll_interval
+        # Connect/auth, channel open and the read/sink batches are blocking; they run on this executor
+        self._executor = ThreadPoolExecutor(max_workers=min(self.max_concurrent_hosts, 64),
+                                            thread_name_prefix='ssh-fleet')
+
+    async def run_blocking(self, func, *args):
+        """Run a blocking call (connect, file/report writes) off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _open_channel(self, host: str, username: str, command: str, password: Optional[str],
+                      key_path: Optional[str]):
+        client = self.pool.get_client(host, username, password, key_path)
+        channel = client.get_transport().open_session()
+        channel.exec_command(command)
+        return channel
+
+    @staticmethod
+    def _pump_channel(channel, emit_stdout: Callable[[bytes], None],
+                      emit_stderr: Callable[[bytes], None]):
+        """Move at most MAX_CHUNKS_PER_PASS chunks per stream from the channel to the sinks (blocking)
+
+        Returns:
+            (received, finished): whether any output arrived, and whether the command exited
+            with both streams drained
+        """
+        received = False
+        for _ in range(MAX_CHUNKS_PER_PASS):
+            if not channel.recv_ready():
+                break
+            emit_stdout(channel.recv(CHUNK_SIZE))
+            received = True
+        for _ in range(MAX_CHUNKS_PER_PASS):
+            if not channel.recv_stderr_ready():
+                break
+            emit_stderr(channel.recv_stderr(CHUNK_SIZE))
+            received = True
+
+        finished = channel.exit_status_ready() and not channel.recv_ready() and not channel.recv_stderr_ready()
+        return received, finished
+
+    async def run_command(self, host: str, username: str, command: str, sinks: Iterable = (),
+                          timeout: int = 30, password: Optional[str] = None,
+                          key_path: Optional[str] = None) -> Dict:
+        """Run one command on a pooled session, streaming its output to every sink
+
+        Args:
+            timeout: Seconds without any output before the command is abandoned
+
+        Returns:
+            {'success', 'output', 'error', 'exit_code', 'output_truncated'} where output/error
+            are the bounded tails of the streams
+        """
+        sinks = list(sinks)
+        stdout_tail = OutputTail(self.tail_chars)
+        stderr_tail = OutputTail(self.tail_chars)
+        stdout_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        stderr_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        def emit(text, tail, is_error):
+            if not text:
+                return
+            tail.append(text)
+            for sink in sinks:
+                sink.write_output(text, is_error)
+
+        def emit_stdout(data):
+            emit(stdout_decoder.decode(data), stdout_tail, False)
+
+        def emit_stderr(data):
+            emit(stderr_decoder.decode(data), stderr_tail, True)
+
+        try:
+            channel = await self.run_blocking(self._open_channel, host, username, command, password, key_path)
+        except Exception as e:
+            self.pool.discard_if_dead(host, username)
+            return {'success': False, 'output': '', 'error': str(e), 'exit_code': -1, 'output_truncated': False}
+
+        poll_interval = 0.005
+        last_activity = time.monotonic()
+        try:
+            while True:
+                # Each pass is one bounded batch on the executor; a host that keeps printing
+                # goes back to the end of the queue after every batch
+                received, finished = await self.run_blocking(self._pump_channel, channel, emit_stdout, emit_stderr)
+                if finished:
+                    break
+
+                if received:
+                    last_activity = time.monotonic()
+                    poll_interval = 0.005
+                else:
+                    if time.monotonic() - last_activity > timeout:
+                        channel.close()
+                        await self.run_blocking(emit, stdout_decoder.decode(b'', final=True), stdout_tail, False)
+                        return {'success': False, 'output': stdout_tail.getvalue(),
+                                'error': f"Command produced no output for {timeout}s and was abandoned",
+                                'exit_code': -1, 'output_truncated': stdout_tail.truncated}
+                    await asyncio.sleep(poll_interval)
+                    poll_interval = min(poll_interval * 2, self.max_poll_interval)
+
+            await self.run_blocking(emit, stdout_decoder.decode(b'', final=True), stdout_tail, False)
+            await self.run_blocking(emit, stderr_decoder.decode(b'', final=True), stderr_tail, True)
+            exit_code = channel.recv_exit_status()
+        finally:
+            channel.close()
+
+        return {
+            'success': exit_code == 0,
+            'output': stdout_tail.getvalue(),
+            'error': stderr_tail.getvalue(),
+            'exit_code': exit_code,
+            'output_truncated': stdout_tail.truncated or stderr_tail.truncated
+        }
+
+    async def run_fleet(self, items: List, worker: Callable[..., Awaitable]) -> List:
+        """Run worker(item) for every item with at most max_concurrent_hosts in flight
+
+        Returns:
+            Results in item order; a worker that raised returns its exception object
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_hosts)
+
+        async def limited(item):
+            async with semaphore:
+                return await worker(item)
+
+        return await asyncio.gather(*(limited(item) for item in items), return_exceptions=True)
+
+    def shutdown(self, close_sessions: bool = True):
+        """Stop the blocking-call executor and optionally close every pooled session"""
+        if close_sessions:
+            self.pool.close_all()
+        self._executor.shutdown(wait=False)
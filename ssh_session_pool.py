@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+SSH Session Pool
+Keeps one authenticated paramiko transport per (host, user) and runs commands over
+multiplexed channels on it.
+
+Replaying an instruction file used to open a fresh SSHClient (TCP connect + key exchange +
+auth) for every command. With the pool a host pays the handshake once per user; each command
+only opens a new channel on the existing transport.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import paramiko
+
+logger = logging.getLogger(__name__)
+
+
+class SSHSessionPool:
+    """Thread-safe pool of authenticated SSH transports keyed by (host, username)"""
+
+    def __init__(self, connect_timeout: int = 10, keepalive_interval: int = 30):
+        self.connect_timeout = connect_timeout
+        self.keepalive_interval = keepalive_interval
+        self._clients: Dict[Tuple[str, str], paramiko.SSHClient] = {}
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.handshake_count = 0
+
+    def _get_key_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _is_alive(client: paramiko.SSHClient) -> bool:
+        transport = client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def get_client(self, host: str, username: str, password: Optional[str] = None,
+                   key_path: Optional[str] = None) -> paramiko.SSHClient:
+        """Get a connected client for (host, username), connecting only if no live transport exists
+
+        Raises:
+            FileNotFoundError: key_path was given but does not exist
+            paramiko.SSHException / socket errors: connection or authentication failed
+        """
+        key = (host, username)
+        with self._get_key_lock(key):
+            client = self._clients.get(key)
+            if client is not None and self._is_alive(client):
+                return client
+            if client is not None:
+                client.close()
+
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            if key_path:
+                if not os.path.exists(key_path):
+                    raise FileNotFoundError(f"Key file not found: {key_path}")
+                pkey = paramiko.RSAKey.from_private_key_file(key_path)
+                client.connect(hostname=host, username=username, pkey=pkey, timeout=self.connect_timeout)
+            else:
+                client.connect(hostname=host, username=username, password=password,
+                               timeout=self.connect_timeout)
+
+            client.get_transport().set_keepalive(self.keepalive_interval)
+            with self._lock:
+                self._clients[key] = client
+                self.handshake_count += 1
+            logger.debug(f"Opened pooled SSH session {username}@{host}")
+            return client
+
+    def execute(self, host: str, username: str, command: str, timeout: int = 30,
+                password: Optional[str] = None, key_path: Optional[str] = None) -> Dict:
+        """Run a command on a new channel of the pooled transport
+
+        Returns:
+            {'success', 'output', 'error', 'exit_code'} like EKSConnector.execute_command_on_instance
+        """
+        try:
+            client = self.get_client(host, username, password, key_path)
+            stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+            output = stdout.read().decode()
+            error = stderr.read().decode()
+            exit_code = stdout.channel.recv_exit_status()
+            return {'success': exit_code == 0, 'output': output, 'error': error, 'exit_code': exit_code}
+        except Exception as e:
+            self.discard_if_dead(host, username)
+            return {'success': False, 'output': '', 'error': str(e), 'exit_code': -1}
+
+    def discard_if_dead(self, host: str, username: str):
+        """Drop a session whose transport died so the next call reconnects cleanly"""
+        client = self._clients.get((host, username))
+        if client is not None and not self._is_alive(client):
+            self.close(host, username)
+
+    def close(self, host: str, username: Optional[str] = None):
+        """Close pooled sessions for a host (all users unless username is given)"""
+        with self._lock:
+            keys = [key for key in self._clients
+                    if key[0] == host and (username is None or key[1] == username)]
+            clients = [self._clients.pop(key) for key in keys]
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def close_all(self):
+        """Close every pooled session"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_all()
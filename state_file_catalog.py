@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Local State File Catalog
+Persistent SQLite index of the JSON state/report files the creation tools write
+(eks_cluster_created_*.json, ec2_*report_*.json, aws/eks|ec2|asg/<account>/*.json).
+
+Every file is parsed once and indexed by path, filename date and the resources it describes
+(cluster name / instance ID / ASG name with account and region). Later refreshes only stat
+the files and re-parse the ones whose mtime or size changed, so looking a resource up is an
+index query no matter how many reports have piled up.
+"""
+
+import fnmatch
+import glob
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.expanduser("~"), ".aws_state_catalog", "state_files.db")
+SCHEMA_VERSION = 1
+
+# 20250603_121046 (most tools) and 2025-06-03_12-10-46 (EKS cluster files); the last one in the name wins
+COMPACT_TIMESTAMP = re.compile(r'(\d{8})_(\d{6})')
+DASHED_TIMESTAMP = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:_(\d{2})-(\d{2})-(\d{2}))?\.json$')
+
+
+def filename_timestamp(filename: str) -> tuple:
+    """Get (YYYYMMDD, HHMMSS) from a state file name; parts that are missing are None"""
+    compact = COMPACT_TIMESTAMP.findall(filename)
+    if compact:
+        return compact[-1]
+    dashed = DASHED_TIMESTAMP.search(filename)
+    if dashed:
+        year, month, day, hour, minute, second = dashed.groups()
+        return f"{year}{month}{day}", (f"{hour}{minute}{second}" if hour else None)
+    return None, None
+
+
+def extract_resources(data: Dict) -> List[Dict]:
+    """Resources described by a parsed state file: [{'resource_type', 'resource_id', 'account', 'region'}]"""
+    if not isinstance(data, dict):
+        return []
+
+    resources = []
+
+    def add(resource_type, resource_id, account, region):
+        if resource_id:
+            resources.append({'resource_type': resource_type, 'resource_id': resource_id,
+                              'account': account, 'region': region})
+
+    account_info = data.get('account_info') if isinstance(data.get('account_info'), dict) else {}
+
+    # eks_cluster(s)_created_*.json batch reports
+    for cluster in data.get('clusters') or []:
+        if isinstance(cluster, dict):
+            add('eks', cluster.get('cluster_name') or cluster.get('name'),
+                cluster.get('account_key') or data.get('account_key'), cluster.get('region'))
+
+    # ec2_*report_*.json batch reports
+    for instance in data.get('created_instances') or []:
+        if isinstance(instance, dict):
+            add('ec2', instance.get('instance_id'), instance.get('account_name'), instance.get('region'))
+
+    # aws/eks/<account>/eks_cluster_*.json
+    cluster_info = data.get('cluster_info')
+    if isinstance(cluster_info, dict):
+        add('eks', cluster_info.get('cluster_name'), account_info.get('account_name'),
+            account_info.get('region') or cluster_info.get('region'))
+
+    # aws/ec2/<account>/ec2_instance_*.json
+    instance_details = data.get('instance_details')
+    if isinstance(instance_details, dict):
+        add('ec2', instance_details.get('instance_id'), account_info.get('account_name'),
+            instance_details.get('region') or account_info.get('region'))
+
+    # aws/asg/<account>/asg_*.json
+    asg_configuration = data.get('asg_configuration')
+    if isinstance(asg_configuration, dict):
+        add('asg', asg_configuration.get('name'), account_info.get('account_name'),
+            asg_configuration.get('region') or account_info.get('region'))
+
+    return resources
+
+
+class StateFileCatalog:
+    """SQLite-backed catalog of local state files with mtime-based incremental refresh"""
+
+    def __init__(self, db_path: str = None):
+        """
+        Args:
+            db_path: Location of the SQLite file (defaults to ~/.aws_state_catalog/state_files.db)
+        """
+        self.db_path = db_path or os.environ.get('AWS_STATE_CATALOG_PATH', DEFAULT_CATALOG_PATH)
+        self._refresh_lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._initialize_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from worker threads)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _initialize_schema(self):
+        """Create tables and indexes; drop old data if the schema version changed"""
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS catalog_meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'schema_version'").fetchone()
+            if row and int(row[0]) != SCHEMA_VERSION:
+                logger.info(f"State file catalog schema changed ({row[0]} -> {SCHEMA_VERSION}), rebuilding")
+                conn.execute("DROP TABLE IF EXISTS state_files")
+                conn.execute("DROP TABLE IF EXISTS state_resources")
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS state_files (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    file_date TEXT,
+                    file_time TEXT,
+                    created_by TEXT,
+                    created_at TEXT,
+                    parse_error TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS state_resources (
+                    path TEXT NOT NULL,
+                    resource_type TEXT NOT NULL,
+                    resource_id TEXT NOT NULL,
+                    account TEXT,
+                    region TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_state_files_date ON state_files (file_date, file_time)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_state_resources_id ON state_resources (resource_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_state_resources_path ON state_resources (path)")
+            conn.execute(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),)
+            )
+
+    @staticmethod
+    def _catalog_key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    @staticmethod
+    def _display_path(key: str) -> str:
+        """Catalog keys are absolute; hand back paths relative to the working directory like glob did"""
+        try:
+            relative = os.path.relpath(key)
+        except ValueError:
+            return key
+        return key if relative.startswith('..') else relative
+
+    def _matches(self, key: str, patterns: Optional[List[str]]) -> bool:
+        if patterns is None:
+            return True
+        return any(fnmatch.fnmatch(key, pattern) for pattern in patterns)
+
+    def _normalize_patterns(self, patterns: Optional[Iterable[str]]) -> Optional[List[str]]:
+        if patterns is None:
+            return None
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return [self._catalog_key(pattern) for pattern in patterns]
+
+    @staticmethod
+    def _parse_file(path: str) -> tuple:
+        """Read a state file; returns (created_by, created_at, resources, error)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            return None, None, [], str(e)
+
+        if not isinstance(data, dict):
+            return None, None, [], None
+        metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+        created_by = data.get('created_by') or metadata.get('created_by')
+        created_at = data.get('timestamp') or metadata.get('created_on') or metadata.get('creation_date')
+        return created_by, created_at, extract_resources(data), None
+
+    def refresh(self, patterns: Iterable[str]) -> Dict[str, int]:
+        """Bring the catalog up to date for the files matching the glob patterns
+
+        New files and files whose mtime/size changed are parsed; files that disappeared are dropped.
+
+        Returns:
+            {'scanned', 'indexed', 'removed', 'errors'} counts
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        patterns = list(patterns)
+        normalized_patterns = self._normalize_patterns(patterns)
+
+        on_disk = {}
+        for pattern in patterns:
+            for path in glob.glob(pattern):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                on_disk[self._catalog_key(path)] = (path, stat.st_mtime_ns, stat.st_size)
+
+        stats = {'scanned': len(on_disk), 'indexed': 0, 'removed': 0, 'errors': 0}
+
+        with self._refresh_lock, self._connect() as conn:
+            known = {row['path']: (row['mtime_ns'], row['size'])
+                     for row in conn.execute("SELECT path, mtime_ns, size FROM state_files")
+                     if self._matches(row['path'], normalized_patterns)}
+
+            removed = [key for key in known if key not in on_disk]
+            for key in removed:
+                conn.execute("DELETE FROM state_files WHERE path = ?", (key,))
+                conn.execute("DELETE FROM state_resources WHERE path = ?", (key,))
+            stats['removed'] = len(removed)
+
+            for key, (path, mtime_ns, size) in on_disk.items():
+                if known.get(key) == (mtime_ns, size):
+                    continue
+
+                created_by, created_at, resources, error = self._parse_file(path)
+                file_date, file_time = filename_timestamp(os.path.basename(path))
+                conn.execute(
+                    "INSERT OR REPLACE INTO state_files "
+                    "(path, mtime_ns, size, file_date, file_time, created_by, created_at, parse_error) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, mtime_ns, size, file_date, file_time,
+                     str(created_by) if created_by is not None else None,
+                     str(created_at) if created_at is not None else None, error)
+                )
+                conn.execute("DELETE FROM state_resources WHERE path = ?", (key,))
+                conn.executemany(
+                    "INSERT INTO state_resources (path, resource_type, resource_id, account, region) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(key, r['resource_type'], str(r['resource_id']), r['account'], r['region']) for r in resources]
+                )
+                stats['indexed'] += 1
+                if error:
+                    stats['errors'] += 1
+                    logger.warning(f"Could not parse state file {path}: {error}")
+
+        if stats['indexed'] or stats['removed']:
+            logger.info(f"State file catalog: {stats['indexed']} indexed, {stats['removed']} removed, "
+                        f"{stats['scanned']} files matched")
+        return stats
+
+    def _file_record(self, row: sqlite3.Row) -> Dict:
+        return {
+            'path': self._display_path(row['path']),
+            'file_date': row['file_date'],
+            'file_time': row['file_time'],
+            'timestamp': f"{row['file_date']}_{row['file_time']}" if row['file_date'] and row['file_time'] else None,
+            'mtime': datetime.fromtimestamp(row['mtime_ns'] / 1e9),
+            'size': row['size'],
+            'created_by': row['created_by'],
+            'created_at': row['created_at'],
+            'parse_error': row['parse_error'],
+        }
+
+    def files(self, patterns: Iterable[str] = None, include_resources: bool = False) -> List[Dict]:
+        """Cataloged files matching the glob patterns, newest filename timestamp first
+
+        Returns:
+            [{'path', 'file_date', 'file_time', 'timestamp', 'mtime', 'size', 'created_by',
+              'created_at', 'parse_error'}] plus 'resources' when include_resources is set
+        """
+        normalized_patterns = self._normalize_patterns(patterns)
+        with self._connect() as conn:
+            rows = [row for row in conn.execute(
+                "SELECT * FROM state_files ORDER BY file_date DESC, file_time DESC, path"
+            ) if self._matches(row['path'], normalized_patterns)]
+
+            records = [self._file_record(row) for row in rows]
+            if include_resources:
+                for row, record in zip(rows, records):
+                    record['resources'] = [
+                        dict(resource) for resource in conn.execute(
+                            "SELECT resource_type, resource_id, account, region FROM state_resources "
+                            "WHERE path = ? ORDER BY rowid", (row['path'],)
+                        )
+                    ]
+        return records
+
+    def find_resource(self, resource_id: str, resource_type: str = None,
+                      patterns: Iterable[str] = None) -> Optional[Dict]:
+        """Newest cataloged file mentioning a resource (optionally limited to a type and file patterns)
+
+        Returns:
+            {'resource_type', 'resource_id', 'account', 'region', 'path', 'file_date', 'file_time'} or None
+        """
+        normalized_patterns = self._normalize_patterns(patterns)
+        query = ("SELECT r.resource_type, r.resource_id, r.account, r.region, r.path, f.file_date, f.file_time "
+                 "FROM state_resources r JOIN state_files f ON f.path = r.path WHERE r.resource_id = ?")
+        params = [resource_id]
+        if resource_type:
+            query += " AND r.resource_type = ?"
+            params.append(resource_type)
+        query += " ORDER BY f.file_date DESC, f.file_time DESC, r.rowid"
+
+        with self._connect() as conn:
+            for row in conn.execute(query, params):
+                if self._matches(row['path'], normalized_patterns):
+                    record = dict(row)
+                    record['path'] = self._display_path(row['path'])
+                    return record
+        return None
+
+
+_shared_catalog = None
+_shared_catalog_lock = threading.Lock()
+
+
+def get_state_catalog() -> StateFileCatalog:
+    """Get the process-wide shared StateFileCatalog instance"""
+    global _shared_catalog
+    with _shared_catalog_lock:
+        if _shared_catalog is None:
+            _shared_catalog = StateFileCatalog()
+        return _shared_catalog
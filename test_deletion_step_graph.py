@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the EKS deletion step graph and the per-cluster deletion checkpoints
+Runs without AWS credentials
+"""
+
+import json
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip('boto3')
+
+from ultra_cleanup.ultra_cleanup_eks import DeletionStepGraph, UltraCleanupEKSManager
+
+
+def build_graph(calls, failing=(), optional=()):
+    """Toy graph: nodegroups, addons and fargate gate control_plane, alarms follows control_plane,
+    logs depends on nothing"""
+    lock = threading.Lock()
+
+    def step(name):
+        def run():
+            with lock:
+                calls.append(name)
+            if name in failing:
+                raise RuntimeError(f"{name} failed")
+        return run
+
+    graph = DeletionStepGraph(max_workers=3)
+    graph.add_step('nodegroups', step('nodegroups'), optional='nodegroups' in optional)
+    graph.add_step('addons', step('addons'), optional='addons' in optional)
+    graph.add_step('fargate', step('fargate'), optional='fargate' in optional)
+    graph.add_step('control_plane', step('control_plane'), depends_on=('nodegroups', 'addons', 'fargate'),
+                   optional='control_plane' in optional)
+    graph.add_step('alarms', step('alarms'), depends_on=('control_plane',), optional='alarms' in optional)
+    graph.add_step('logs', step('logs'), optional='logs' in optional)
+    return graph
+
+
+def test_topological_order_puts_dependencies_first():
+    order = build_graph([]).topological_order()
+    assert set(order) == {'nodegroups', 'addons', 'fargate', 'control_plane', 'alarms', 'logs'}
+    for dependency in ('nodegroups', 'addons', 'fargate'):
+        assert order.index(dependency) < order.index('control_plane')
+    assert order.index('control_plane') < order.index('alarms')
+
+
+def test_topological_order_rejects_unknown_dependencies():
+    graph = DeletionStepGraph()
+    graph.add_step('control_plane', lambda: None, depends_on=('nodegroups',))
+    with pytest.raises(ValueError, match='unknown'):
+        graph.topological_order()
+
+
+def test_topological_order_rejects_cycles():
+    graph = DeletionStepGraph()
+    graph.add_step('a', lambda: None, depends_on=('b',))
+    graph.add_step('b', lambda: None, depends_on=('a',))
+    with pytest.raises(ValueError, match='cycle'):
+        graph.topological_order()
+
+
+def test_run_executes_every_step_after_its_dependencies():
+    calls = []
+    done = []
+    result = build_graph(calls).run(on_step_done=lambda name, status, seconds, error: done.append((name, status)))
+
+    assert sorted(result['completed']) == sorted(calls)
+    assert result['failed'] == {}
+    assert result['warnings'] == {}
+    assert result['skipped'] == []
+    assert set(result['timings']) == set(calls)
+    assert calls.index('control_plane') > max(calls.index(step) for step in ('nodegroups', 'addons', 'fargate'))
+    assert calls.index('alarms') > calls.index('control_plane')
+    assert sorted(done) == sorted((name, 'completed') for name in calls)
+
+
+def test_failed_step_skips_its_dependents_transitively():
+    calls = []
+    result = build_graph(calls, failing=('addons',)).run()
+
+    assert set(result['failed']) == {'addons'}
+    assert 'addons failed' in result['failed']['addons']
+    assert result['skipped'] == ['control_plane', 'alarms']
+    assert 'control_plane' not in calls and 'alarms' not in calls
+    # Unrelated branches still run
+    assert set(result['completed']) == {'nodegroups', 'fargate', 'logs'}
+
+
+def test_failed_optional_step_is_a_warning_and_its_dependents_still_run():
+    calls = []
+    statuses = {}
+    result = build_graph(calls, failing=('fargate',), optional=('fargate',)).run(
+        on_step_done=lambda name, status, seconds, error: statuses.update({name: status}))
+
+    assert result['failed'] == {}
+    assert set(result['warnings']) == {'fargate'}
+    assert result['skipped'] == []
+    assert 'control_plane' in result['completed'] and 'alarms' in result['completed']
+    assert statuses['fargate'] == 'warning'
+
+
+def test_run_resumes_from_completed_steps():
+    calls = []
+    result = build_graph(calls).run(completed=['nodegroups', 'addons', 'fargate', 'removed_step'])
+
+    assert sorted(calls) == ['alarms', 'control_plane', 'logs']
+    assert set(result['completed']) == {'nodegroups', 'addons', 'fargate', 'control_plane', 'alarms', 'logs'}
+    # Steps no longer in the graph are ignored instead of reported
+    assert 'removed_step' not in result['completed']
+
+
+def make_manager(tmp_path):
+    manager = object.__new__(UltraCleanupEKSManager)
+    manager.checkpoint_dir = str(tmp_path / 'checkpoints')
+    manager.operation_logger = None
+    return manager
+
+
+def make_cluster(arn='arn:aws:eks:us-east-1:123456789012:cluster/eks-test', created_at='2025-06-03 12:10:46'):
+    return {
+        'cluster_name': 'eks-test',
+        'region': 'us-east-1',
+        'arn': arn,
+        'created_at': created_at,
+        'account_info': {'account_key': 'account01'},
+    }
+
+
+def test_checkpoint_round_trip(tmp_path):
+    manager = make_manager(tmp_path)
+    cluster = make_cluster()
+
+    assert manager.load_cluster_checkpoint(cluster) == []
+    manager.save_cluster_checkpoint(cluster, ['nodegroups', 'addons'], {'nodegroups': 1.5, 'addons': 0.2})
+
+    checkpoint_path = manager._cluster_checkpoint_path(cluster)
+    assert os.path.basename(checkpoint_path) == 'account01_us-east-1_eks-test.json'
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        checkpoint = json.load(f)
+    assert checkpoint['cluster_arn'] == cluster['arn']
+    assert checkpoint['created_at'] == cluster['created_at']
+
+    assert manager.load_cluster_checkpoint(cluster) == ['nodegroups', 'addons']
+
+
+def test_checkpoint_of_an_earlier_cluster_with_the_same_name_is_discarded(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.save_cluster_checkpoint(make_cluster(), ['nodegroups'], {'nodegroups': 1.0})
+
+    recreated = make_cluster(created_at='2025-07-01 08:00:00')
+    assert manager.load_cluster_checkpoint(recreated) == []
+    assert not os.path.exists(manager._cluster_checkpoint_path(recreated))
+
+
+def test_checkpoint_is_cleared_once_the_control_plane_is_gone(tmp_path):
+    manager = make_manager(tmp_path)
+    cluster = make_cluster()
+    manager.save_cluster_checkpoint(cluster, ['nodegroups'], {'nodegroups': 1.0})
+    assert os.path.exists(manager._cluster_checkpoint_path(cluster))
+
+    manager.save_cluster_checkpoint(cluster, ['nodegroups', 'control_plane'], {'nodegroups': 1.0})
+    assert not os.path.exists(manager._cluster_checkpoint_path(cluster))
+    assert manager.load_cluster_checkpoint(cluster) == []
+
+
+REQUIRED_STEPS = {'nodegroups', 'addons', 'control_plane'}
+
+
+def make_deleting_manager(tmp_path, failing=(), control_plane_outcome='DELETED'):
+    """Manager whose cleanup helpers record their calls instead of calling AWS"""
+    manager = make_manager(tmp_path)
+    manager.cleanup_results = {'step_timings': [], 'deleted_clusters': [], 'failed_deletions': []}
+    manager.rate_limiter = Mock()
+    manager.deletion_waiter = Mock()
+    manager.deletion_waiter.wait_for_deletion.return_value.result.return_value = control_plane_outcome
+    manager.calls = []
+
+    def helper(step_name):
+        def run(*args):
+            manager.calls.append(step_name)
+            return step_name not in failing
+        return run
+
+    def delete_nodegroups(eks_client, cluster_info):
+        # Unlike the helpers, the nodegroup step raises instead of returning False
+        if not helper('nodegroups')():
+            raise RuntimeError("Failed to delete nodegroups: ng-1")
+
+    manager._delete_cluster_nodegroups = delete_nodegroups
+    manager.delete_eks_scrapers = helper('scrapers')
+    manager.delete_all_cloudwatch_alarms = helper('alarms')
+    manager.delete_related_event_rules = helper('event_rules')
+    manager.delete_all_lambda_functions = helper('lambdas')
+    manager.delete_all_iam_roles_policies = helper('iam_roles')
+    manager.delete_all_security_groups = helper('security_groups')
+    manager.delete_all_eks_addons = helper('addons')
+    return manager
+
+
+def make_deletable_cluster():
+    cluster = make_cluster()
+    cluster['account_info'].update({'access_key': 'AKIATEST', 'secret_key': 'secret'})
+    cluster.update({'vpc_id': 'vpc-1', 'version': '1.30'})
+    return cluster
+
+
+def test_cluster_deletion_graph_edges(tmp_path):
+    manager = make_deleting_manager(tmp_path)
+    graph = manager.build_cluster_deletion_graph(Mock(), make_deletable_cluster())
+
+    depends_on = {name: set(deps) for name, (_, deps) in graph.steps.items()}
+    assert depends_on == {
+        'nodegroups': set(),
+        'scrapers': set(),
+        'alarms': set(),
+        'event_rules': set(),
+        'lambdas': set(),
+        'security_groups': {'nodegroups'},
+        'addons': {'nodegroups'},
+        'control_plane': {'nodegroups', 'security_groups', 'addons'},
+        'iam_roles': {'control_plane', 'lambdas'},
+    }
+    assert set(graph.steps) - graph.optional == REQUIRED_STEPS
+
+
+@pytest.mark.parametrize('failing', ['scrapers', 'alarms', 'event_rules', 'lambdas', 'security_groups', 'iam_roles'])
+def test_optional_cluster_step_failure_does_not_fail_the_cluster(tmp_path, failing):
+    manager = make_deleting_manager(tmp_path, failing=(failing,))
+    cluster = make_deletable_cluster()
+
+    eks_client = Mock()
+
+    assert manager.delete_cluster(eks_client, cluster) is True
+    eks_client.delete_cluster.assert_called_once_with(name='eks-test')
+    assert manager.cleanup_results['failed_deletions'] == []
+    deleted = manager.cleanup_results['deleted_clusters']
+    assert len(deleted) == 1 and set(deleted[0]['cleanup_warnings']) == {failing}
+    assert not os.path.exists(manager._cluster_checkpoint_path(cluster))
+
+
+@pytest.mark.parametrize('failing', ['nodegroups', 'addons'])
+def test_required_cluster_step_failure_fails_the_cluster_and_keeps_the_checkpoint(tmp_path, failing):
+    manager = make_deleting_manager(tmp_path, failing=(failing,))
+    cluster = make_deletable_cluster()
+
+    eks_client = Mock()
+
+    assert manager.delete_cluster(eks_client, cluster) is False
+    eks_client.delete_cluster.assert_not_called()
+    assert manager.cleanup_results['deleted_clusters'] == []
+    assert failing in manager.cleanup_results['failed_deletions'][0]['error']
+    assert 'control_plane' not in manager.load_cluster_checkpoint(cluster)
+
+
+def test_resumed_cluster_deletion_skips_checkpointed_steps(tmp_path):
+    cluster = make_deletable_cluster()
+    first = make_deleting_manager(tmp_path, failing=('addons',))
+    assert first.delete_cluster(Mock(), cluster) is False
+    assert 'nodegroups' in first.load_cluster_checkpoint(cluster)
+
+    second = make_deleting_manager(tmp_path)
+    eks_client = Mock()
+    assert second.delete_cluster(eks_client, cluster) is True
+    assert 'nodegroups' not in second.calls
+    assert 'addons' in second.calls
+    eks_client.delete_cluster.assert_called_once_with(name='eks-test')
+
+
+@pytest.mark.parametrize('outcome', ['TIMEOUT', 'ACTIVE', 'FAILED'])
+def test_control_plane_step_fails_unless_the_cluster_is_deleted(tmp_path, outcome):
+    manager = make_deleting_manager(tmp_path, control_plane_outcome=outcome)
+    cluster = make_deletable_cluster()
+
+    with pytest.raises(RuntimeError, match=outcome if outcome != 'TIMEOUT' else 'Timed out'):
+        manager._delete_cluster_control_plane(Mock(), cluster)
+
+    assert manager.delete_cluster(Mock(), cluster) is False
+    checkpoint = manager.load_cluster_checkpoint(cluster)
+    assert 'addons' in checkpoint and 'control_plane' not in checkpoint
+    assert 'iam_roles' not in manager.calls
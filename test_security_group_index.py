@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the security group usage index
+Runs without AWS credentials (clients are replaced by in-memory paginators)
+"""
+
+from security_group_index import (
+    AUTO_SCALING_GROUP,
+    LAUNCH_TEMPLATE,
+    LOAD_BALANCER,
+    NETWORK_INTERFACE,
+    SECURITY_GROUP_RULE,
+    SecurityGroupUsageIndex,
+)
+
+
+class FakePaginator:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def paginate(self, **kwargs):
+        return self.pages(**kwargs) if callable(self.pages) else self.pages
+
+
+class FakeClient:
+    def __init__(self, responses):
+        self.responses = responses
+
+    def get_paginator(self, operation):
+        return FakePaginator(self.responses.get(operation, [{}]))
+
+
+class FakeSession:
+    def __init__(self, clients):
+        self.clients = clients
+
+    def client(self, service, region_name=None):
+        return self.clients.get(service, FakeClient({}))
+
+
+def rule_usage(index, referenced, referencer):
+    index.add_usage(referenced, SECURITY_GROUP_RULE, referencer, direction='ingress')
+
+
+def test_deletion_order_deletes_referencing_groups_first():
+    index = SecurityGroupUsageIndex()
+    rule_usage(index, 'sg-db', 'sg-app')   # sg-app's rules reference sg-db
+    rule_usage(index, 'sg-app', 'sg-lb')   # sg-lb's rules reference sg-app
+
+    assert index.deletion_order(['sg-db', 'sg-app', 'sg-lb', 'sg-free']) == ['sg-lb', 'sg-free', 'sg-app', 'sg-db']
+
+
+def test_deletion_order_ignores_groups_outside_the_set_and_keeps_cycles():
+    index = SecurityGroupUsageIndex()
+    rule_usage(index, 'sg-a', 'sg-b')
+    rule_usage(index, 'sg-b', 'sg-a')
+    rule_usage(index, 'sg-c', 'sg-outside')
+
+    assert index.deletion_order(['sg-a', 'sg-c', 'sg-b', 'sg-c']) == ['sg-c', 'sg-a', 'sg-b']
+
+
+def test_blocking_usages_skip_terminated_instances_and_deleted_groups():
+    index = SecurityGroupUsageIndex()
+    index.add_usage('sg-1', NETWORK_INTERFACE, 'eni-1', instance_id='i-terminated')
+    index.add_usage('sg-1', NETWORK_INTERFACE, 'eni-2', instance_id='i-kept')
+    index.add_usage('sg-1', LOAD_BALANCER, 'my-alb')
+    index.add_usage('sg-1', LAUNCH_TEMPLATE, 'lt-1')
+    rule_usage(index, 'sg-1', 'sg-deleted')
+    rule_usage(index, 'sg-1', 'sg-kept')
+    # Duplicates are ignored
+    index.add_usage('sg-1', LOAD_BALANCER, 'my-alb')
+
+    blocking = index.blocking_usages('sg-1', ignore_instances=['i-terminated'], ignore_groups=['sg-deleted'])
+    assert [(usage['type'], usage['id']) for usage in blocking] == [
+        (NETWORK_INTERFACE, 'eni-2'),
+        (LOAD_BALANCER, 'my-alb'),
+        (SECURITY_GROUP_RULE, 'sg-kept'),
+    ]
+
+
+def test_is_used_by_errs_on_the_side_of_caution_for_unreadable_sources():
+    index = SecurityGroupUsageIndex()
+    assert not index.is_used_by('sg-1', AUTO_SCALING_GROUP)
+    index.failed_sources[AUTO_SCALING_GROUP] = 'AccessDenied'
+    assert index.is_used_by('sg-1', AUTO_SCALING_GROUP)
+
+
+def test_build_attributes_template_and_instance_usages_to_auto_scaling_groups():
+    ec2 = FakeClient({
+        'describe_security_groups': [{'SecurityGroups': [
+            {'GroupId': 'sg-app', 'GroupName': 'app',
+             'IpPermissions': [{'UserIdGroupPairs': [{'GroupId': 'sg-db'}]}]},
+            {'GroupId': 'sg-db', 'GroupName': 'db'},
+        ]}],
+        'describe_network_interfaces': [{'NetworkInterfaces': [
+            {'NetworkInterfaceId': 'eni-1', 'Groups': [{'GroupId': 'sg-db'}],
+             'Attachment': {'InstanceId': 'i-asg'}},
+        ]}],
+        'describe_launch_templates': [{'LaunchTemplates': [
+            {'LaunchTemplateId': 'lt-1', 'LaunchTemplateName': 'app-template'},
+        ]}],
+        'describe_launch_template_versions': lambda LaunchTemplateId: [{'LaunchTemplateVersions': [
+            {'LaunchTemplateData': {'SecurityGroupIds': ['sg-app']}},
+        ]}],
+    })
+    autoscaling = FakeClient({
+        'describe_auto_scaling_groups': [{'AutoScalingGroups': [
+            {'AutoScalingGroupName': 'app-asg', 'LaunchTemplate': {'LaunchTemplateId': 'lt-1'}},
+            {'AutoScalingGroupName': 'db-asg', 'Instances': [{'InstanceId': 'i-asg'}]},
+        ]}],
+    })
+    index = SecurityGroupUsageIndex.build(FakeSession({'ec2': ec2, 'autoscaling': autoscaling}), 'us-east-1')
+
+    assert index.failed_sources == {}
+    assert index.group_names == {'sg-app': 'app', 'sg-db': 'db'}
+    assert index.referencing_groups('sg-db') == {'sg-app'}
+    assert [usage['id'] for usage in index.usages('sg-app', (LAUNCH_TEMPLATE,))] == ['lt-1']
+    assert [usage['id'] for usage in index.usages('sg-app', (AUTO_SCALING_GROUP,))] == ['app-asg']
+    assert [usage['id'] for usage in index.usages('sg-db', (AUTO_SCALING_GROUP,))] == ['db-asg']
+
+
+def test_build_resolves_template_group_names_for_auto_scaling_groups():
+    ec2 = FakeClient({
+        'describe_security_groups': [{'SecurityGroups': [
+            {'GroupId': 'sg-app', 'GroupName': 'app',
+             'IpPermissions': [{'UserIdGroupPairs': [{'GroupId': 'sg-db'}]}]},
+            {'GroupId': 'sg-db', 'GroupName': 'db'},
+        ]}],
+        'describe_network_interfaces': [{'NetworkInterfaces': [
+            {'NetworkInterfaceId': 'eni-1', 'Groups': [{'GroupId': 'sg-db'}],
+             'Attachment': {'InstanceId': 'i-asg'}},
+        ]}],
+        'describe_launch_templates': [{'LaunchTemplates': [
+            {'LaunchTemplateId': 'lt-1', 'LaunchTemplateName': 'app-template'},
+        ]}],
+        'describe_launch_template_versions': lambda LaunchTemplateId: [{'LaunchTemplateVersions': [
+            {'LaunchTemplateData': {'SecurityGroups': ['app']}},
+        ]}],
+    })
+    autoscaling = FakeClient({
+        'describe_auto_scaling_groups': [{'AutoScalingGroups': [
+            {'AutoScalingGroupName': 'app-asg', 'LaunchTemplate': {'LaunchTemplateName': 'app-template'}},
+            {'AutoScalingGroupName': 'db-asg', 'Instances': [{'InstanceId': 'i-asg'}]},
+        ]}],
+    })
+    index = SecurityGroupUsageIndex.build(FakeSession({'ec2': ec2, 'autoscaling': autoscaling}), 'us-east-1')
+
+    assert index.failed_sources == {}
+    assert index.group_names == {'sg-app': 'app', 'sg-db': 'db'}
+    assert index.referencing_groups('sg-db') == {'sg-app'}
+    assert [usage['id'] for usage in index.usages('sg-app', (LAUNCH_TEMPLATE,))] == ['lt-1']
+    assert [usage['id'] for usage in index.usages('sg-app', (AUTO_SCALING_GROUP,))] == ['app-asg']
+    assert [usage['id'] for usage in index.usages('sg-db', (AUTO_SCALING_GROUP,))] == ['db-asg']
+
+
+def test_plan_deletion_skips_blocked_groups_and_what_they_reference():
+    index = SecurityGroupUsageIndex()
+    index.add_usage('sg-web', NETWORK_INTERFACE, 'eni-1', instance_id='i-terminated')
+    index.add_usage('sg-busy', NETWORK_INTERFACE, 'eni-2', instance_id='i-other')
+    rule_usage(index, 'sg-shared', 'sg-busy')   # blocked group keeps sg-shared alive
+    rule_usage(index, 'sg-orphan', 'sg-web')    # unattached group referenced by an attached one
+
+    attached = [{'group_id': 'sg-web'}, {'group_id': 'sg-busy'}]
+    unattached = [{'group_id': 'sg-orphan'}, {'group_id': 'sg-shared'}, {'group_id': 'sg-free'}]
+    attached, unattached, blocked = index.plan_deletion(['i-terminated'], attached, unattached)
+
+    assert [sg['group_id'] for sg in attached] == ['sg-web', 'sg-orphan']
+    assert [sg['group_id'] for sg in unattached] == ['sg-free']
+    assert [(sg['group_id'], [usage['id'] for usage in blockers]) for sg, blockers in blocked] == [
+        ('sg-busy', ['eni-2']),
+        ('sg-shared', ['sg-busy']),
+    ]
+
+
+def test_build_records_sources_that_could_not_be_read():
+    class DeniedClient:
+        def get_paginator(self, operation):
+            raise RuntimeError('AccessDenied')
+
+    index = SecurityGroupUsageIndex.build(FakeSession({'elbv2': DeniedClient()}), 'us-east-1', security_groups=[])
+    assert set(index.failed_sources) == {LOAD_BALANCER}
+    assert index.is_used_by('sg-any', LOAD_BALANCER)
+
+
+def test_build_treats_unreadable_template_versions_as_used():
+    def versions(LaunchTemplateId):
+        if LaunchTemplateId == 'lt-throttled':
+            raise RuntimeError('Throttling')
+        return [{'LaunchTemplateVersions': [{'LaunchTemplateData': {'SecurityGroupIds': ['sg-app']}}]}]
+
+    ec2 = FakeClient({
+        'describe_launch_templates': [{'LaunchTemplates': [
+            {'LaunchTemplateId': 'lt-ok', 'LaunchTemplateName': 'ok'},
+            {'LaunchTemplateId': 'lt-throttled', 'LaunchTemplateName': 'eks-nodes'},
+        ]}],
+        'describe_launch_template_versions': versions,
+    })
+    index = SecurityGroupUsageIndex.build(FakeSession({'ec2': ec2}), 'us-east-1', security_groups=[])
+
+    assert 'lt-throttled' in index.failed_sources[LAUNCH_TEMPLATE]
+    assert [usage['id'] for usage in index.usages('sg-app', (LAUNCH_TEMPLATE,))] == ['lt-ok']
+    assert index.is_used_by('sg-eks-nodes', LAUNCH_TEMPLATE)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the local state file catalog
+Runs without AWS credentials
+"""
+
+import json
+import os
+
+from state_file_catalog import StateFileCatalog, extract_resources, filename_timestamp
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+def test_filename_timestamp_formats():
+    assert filename_timestamp('ec2_creation_report_20250603_121046.json') == ('20250603', '121046')
+    assert filename_timestamp('eks_cluster_eks-a_20250101_000000_20250603_121046.json') == ('20250603', '121046')
+    assert filename_timestamp('eks_cluster_created_2025-06-03_12-10-46.json') == ('20250603', '121046')
+    assert filename_timestamp('eks_clusters_2025-06-03.json') == ('20250603', None)
+    assert filename_timestamp('notes.json') == (None, None)
+
+
+def test_extract_resources_from_each_report_shape():
+    resources = extract_resources({
+        'account_info': {'account_name': 'account01', 'region': 'us-east-1'},
+        'clusters': [{'cluster_name': 'eks-a', 'account_key': 'account02', 'region': 'us-west-2'}],
+        'created_instances': [{'instance_id': 'i-1', 'account_name': 'account03', 'region': 'eu-west-1'}],
+        'cluster_info': {'cluster_name': 'eks-b'},
+        'instance_details': {'instance_id': 'i-2', 'region': 'us-east-2'},
+        'asg_configuration': {'name': 'asg-1'},
+    })
+    assert [(r['resource_type'], r['resource_id'], r['account'], r['region']) for r in resources] == [
+        ('eks', 'eks-a', 'account02', 'us-west-2'),
+        ('ec2', 'i-1', 'account03', 'eu-west-1'),
+        ('eks', 'eks-b', 'account01', 'us-east-1'),
+        ('ec2', 'i-2', 'account01', 'us-east-2'),
+        ('asg', 'asg-1', 'account01', 'us-east-1'),
+    ]
+    assert extract_resources(['not', 'a', 'dict']) == []
+
+
+def test_files_and_find_resource(tmp_path):
+    catalog = StateFileCatalog(str(tmp_path / 'catalog' / 'state.db'))
+    old = write_json(tmp_path / 'ec2_creation_report_20250101_080000.json', {
+        'created_by': 'tester', 'timestamp': '2025-01-01 08:00:00',
+        'created_instances': [{'instance_id': 'i-1', 'account_name': 'account01', 'region': 'us-east-1'}],
+    })
+    new = write_json(tmp_path / 'ec2_creation_report_20250603_121046.json', {
+        'created_instances': [{'instance_id': 'i-1', 'account_name': 'account01', 'region': 'us-west-2'},
+                              {'instance_id': 'i-2', 'account_name': 'account02', 'region': 'us-west-2'}],
+    })
+    write_json(tmp_path / 'aws' / 'asg' / 'account01' / 'asg_web_20250301_100000.json', {
+        'account_info': {'account_name': 'account01', 'region': 'us-east-1'},
+        'asg_configuration': {'name': 'web'},
+    })
+    ec2_pattern = str(tmp_path / 'ec2_*report_*.json')
+    asg_pattern = str(tmp_path / 'aws' / 'asg' / '*' / '*.json')
+
+    stats = catalog.refresh([ec2_pattern, asg_pattern])
+    assert stats == {'scanned': 3, 'indexed': 3, 'removed': 0, 'errors': 0}
+
+    files = catalog.files(ec2_pattern, include_resources=True)
+    assert [os.path.abspath(f['path']) for f in files] == [str(new), str(old)]
+    assert files[0]['timestamp'] == '20250603_121046'
+    assert files[1]['created_by'] == 'tester'
+    assert [r['resource_id'] for r in files[0]['resources']] == ['i-1', 'i-2']
+
+    # The newest file mentioning the resource wins
+    found = catalog.find_resource('i-1', 'ec2')
+    assert found['region'] == 'us-west-2'
+    assert os.path.abspath(found['path']) == str(new)
+
+    assert catalog.find_resource('web', 'asg')['account'] == 'account01'
+    assert catalog.find_resource('web', 'ec2') is None
+    assert catalog.find_resource('web', patterns=[ec2_pattern]) is None
+
+
+def test_refresh_only_reparses_changed_files_and_drops_removed_ones(tmp_path):
+    catalog = StateFileCatalog(str(tmp_path / 'state.db'))
+    pattern = str(tmp_path / 'reports' / '*.json')
+    first = write_json(tmp_path / 'reports' / 'ec2_report_20250101_000000.json',
+                       {'created_instances': [{'instance_id': 'i-1'}]})
+    second = write_json(tmp_path / 'reports' / 'ec2_report_20250102_000000.json',
+                        {'created_instances': [{'instance_id': 'i-2'}]})
+    assert catalog.refresh(pattern)['indexed'] == 2
+
+    assert catalog.refresh(pattern) == {'scanned': 2, 'indexed': 0, 'removed': 0, 'errors': 0}
+
+    write_json(first, {'created_instances': [{'instance_id': 'i-1'}, {'instance_id': 'i-3'}]})
+    os.remove(second)
+    assert catalog.refresh(pattern) == {'scanned': 1, 'indexed': 1, 'removed': 1, 'errors': 0}
+    assert catalog.find_resource('i-3') is not None
+    assert catalog.find_resource('i-2') is None
+
+
+def test_refresh_records_unparseable_files(tmp_path):
+    catalog = StateFileCatalog(str(tmp_path / 'state.db'))
+    broken = tmp_path / 'ec2_report_20250101_000000.json'
+    broken.write_text('{not json', encoding='utf-8')
+
+    assert catalog.refresh(str(broken))['errors'] == 1
+    files = catalog.files()
+    assert len(files) == 1
+    assert files[0]['parse_error']
+
+
+def test_catalog_persists_between_instances(tmp_path):
+    db_path = str(tmp_path / 'state.db')
+    report = write_json(tmp_path / 'ec2_report_20250101_000000.json',
+                        {'created_instances': [{'instance_id': 'i-1'}]})
+    StateFileCatalog(db_path).refresh(str(report))
+
+    reopened = StateFileCatalog(db_path)
+    assert reopened.find_resource('i-1') is not None
+    assert reopened.refresh(str(report))['indexed'] == 0
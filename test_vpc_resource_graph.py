@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the VPC resource dependency graph
+Runs without AWS credentials
+"""
+
+from vpc_resource_graph import VPCResourceGraph
+
+
+def level_of(levels, resource_type, resource_id_value, id_key):
+    for index, level in enumerate(levels):
+        if any(resource[id_key] == resource_id_value for resource in level.get(resource_type, [])):
+            return index
+    raise AssertionError(f"{resource_type} {resource_id_value} is in no level")
+
+
+def make_snapshot():
+    return {
+        'vpc_endpoints': [{'VpcEndpointId': 'vpce-1', 'SubnetIds': ['subnet-a'],
+                           'Groups': [{'GroupId': 'sg-app'}], 'RouteTableIds': ['rtb-1']}],
+        'nat_gateways': [{'NatGatewayId': 'nat-1', 'VpcId': 'vpc-1', 'SubnetId': 'subnet-a',
+                          'NatGatewayAddresses': [{'AllocationId': 'eipalloc-1', 'PublicIp': '1.2.3.4'}]}],
+        'transit_gateway_attachments': [{'TransitGatewayAttachmentId': 'tgw-attach-1', 'ResourceId': 'vpc-1'}],
+        'network_interfaces': [{'NetworkInterfaceId': 'eni-1', 'SubnetId': 'subnet-b',
+                                'Groups': [{'GroupId': 'sg-db'}]}],
+        'internet_gateways': [{'InternetGatewayId': 'igw-1', 'Attachments': [{'VpcId': 'vpc-1'}]}],
+        'security_groups': [{'GroupId': 'sg-app'}, {'GroupId': 'sg-db'}],
+        'route_tables': [{'RouteTableId': 'rtb-1', 'Associations': [{'SubnetId': 'subnet-a'}]}],
+        'subnets': [{'SubnetId': 'subnet-a', 'VpcId': 'vpc-1'}, {'SubnetId': 'subnet-b', 'VpcId': 'vpc-1'}],
+        'network_acls': [{'NetworkAclId': 'acl-1', 'Associations': [{'SubnetId': 'subnet-b'}]}],
+        'dhcp_options_sets': [{'DhcpOptionsId': 'dopt-1'}],
+    }
+
+
+def test_blockers_are_deleted_in_earlier_levels():
+    levels = VPCResourceGraph.from_snapshot(make_snapshot()).deletion_levels()
+
+    endpoint = level_of(levels, 'vpc_endpoints', 'vpce-1', 'VpcEndpointId')
+    nat = level_of(levels, 'nat_gateways', 'nat-1', 'NatGatewayId')
+    attachment = level_of(levels, 'transit_gateway_attachments', 'tgw-attach-1', 'TransitGatewayAttachmentId')
+    eni = level_of(levels, 'network_interfaces', 'eni-1', 'NetworkInterfaceId')
+    route_table = level_of(levels, 'route_tables', 'rtb-1', 'RouteTableId')
+    subnet_a = level_of(levels, 'subnets', 'subnet-a', 'SubnetId')
+    subnet_b = level_of(levels, 'subnets', 'subnet-b', 'SubnetId')
+
+    assert endpoint == nat == attachment == eni == 0
+    assert level_of(levels, 'dhcp_options_sets', 'dopt-1', 'DhcpOptionsId') == 0
+    assert route_table > endpoint
+    assert subnet_a > max(endpoint, nat, attachment, route_table)
+    assert subnet_b > max(eni, attachment)
+    assert level_of(levels, 'internet_gateways', 'igw-1', 'InternetGatewayId') > nat
+    assert level_of(levels, 'elastic_ips', 'eipalloc-1', 'AllocationId') > nat
+    assert level_of(levels, 'network_acls', 'acl-1', 'NetworkAclId') > subnet_b
+
+
+def test_nat_gateway_elastic_ips_are_added_to_the_graph():
+    graph = VPCResourceGraph.from_snapshot(make_snapshot())
+    assert ('elastic_ips', 'eipalloc-1') in graph.resources
+    assert ('elastic_ips', 'eipalloc-1') in graph.blocks[('nat_gateways', 'nat-1')]
+
+
+def test_security_groups_are_deleted_together_at_the_deepest_level():
+    levels = VPCResourceGraph.from_snapshot(make_snapshot()).deletion_levels()
+    sg_levels = [index for index, level in enumerate(levels) if 'security_groups' in level]
+    assert len(sg_levels) == 1
+    assert {sg['GroupId'] for sg in levels[sg_levels[0]]['security_groups']} == {'sg-app', 'sg-db'}
+    assert sg_levels[0] > 0
+
+
+def test_dependencies_on_resources_outside_the_snapshot_are_ignored():
+    snapshot = {'network_interfaces': [{'NetworkInterfaceId': 'eni-1', 'SubnetId': 'subnet-gone',
+                                        'Groups': [{'GroupId': 'sg-gone'}]}]}
+    levels = VPCResourceGraph.from_snapshot(snapshot).deletion_levels()
+    assert levels == [{'network_interfaces': snapshot['network_interfaces']}]
+
+
+def test_cycle_members_are_deleted_last_instead_of_dropped():
+    graph = VPCResourceGraph()
+    first = graph.add_resource('subnets', {'SubnetId': 'subnet-a'})
+    second = graph.add_resource('route_tables', {'RouteTableId': 'rtb-1'})
+    graph.add_resource('dhcp_options_sets', {'DhcpOptionsId': 'dopt-1'})
+    graph.add_dependency(first, second)
+    graph.add_dependency(second, first)
+
+    levels = graph.deletion_levels()
+    assert levels[0] == {'dhcp_options_sets': [{'DhcpOptionsId': 'dopt-1'}]}
+    assert set(levels[-1]) == {'subnets', 'route_tables'}
+
+
+def test_empty_snapshot_has_no_levels():
+    assert VPCResourceGraph.from_snapshot({}).deletion_levels() == []
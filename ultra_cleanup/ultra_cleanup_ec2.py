@@ -11,6 +11,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from root_iam_credential_manager import AWSCredentialManager, Colors
+from security_group_index import SecurityGroupUsageIndex, LAUNCH_TEMPLATE, AUTO_SCALING_GROUP
 
 
 class UltraCleanupEC2Manager:
@@ -232,39 +233,44 @@ class UltraCleanupEC2Manager:
             self.log_operation('INFO', f"[SCAN] Scanning for security groups in {region} ({account_name})")
             print(f"   [SCAN] Scanning for security groups in {region} ({account_name})...")
 
+            all_sgs = []
             paginator = ec2_client.get_paginator('describe_security_groups')
-
             for page in paginator.paginate():
-                for sg in page['SecurityGroups']:
-                    sg_id = sg['GroupId']
-                    sg_name = sg['GroupName']
-                    vpc_id = sg['VpcId']
-                    description = sg['Description']
-
-                    # Skip default security groups
-                    if sg_name == 'default':
-                        self.log_operation('DEBUG', f"Skipping default security group {sg_id} ({sg_name})")
-                        continue
-
-                    # Enhanced EKS security group protection
-                    if self.is_eks_related_security_group(sg, ec2_client, region):
-                        self.log_operation('WARNING',
-                                           f"[PROTECTED] PROTECTED: Skipping EKS-related security group {sg_id} ({sg_name})")
-                        print(f"   [PROTECTED] PROTECTED: Skipping EKS security group {sg_name}")
-                        continue
-
-                    sg_info = {
-                        'group_id': sg_id,
-                        'group_name': sg_name,
-                        'description': description,
-                        'vpc_id': vpc_id,
-                        'region': region,
-                        'account_info': account_info,
-                        'is_attached': False,
-                        'attached_instances': []
-                    }
-
-                    security_groups.append(sg_info)
+                all_sgs.extend(page['SecurityGroups'])
+
+            # Launch template / ASG usage of every group, read once for the whole region
+            sg_index = self.build_security_group_index(account_info, region, all_sgs)
+
+            for sg in all_sgs:
+                sg_id = sg['GroupId']
+                sg_name = sg['GroupName']
+                vpc_id = sg['VpcId']
+                description = sg['Description']
+
+                # Skip default security groups
+                if sg_name == 'default':
+                    self.log_operation('DEBUG', f"Skipping default security group {sg_id} ({sg_name})")
+                    continue
+
+                # Enhanced EKS security group protection
+                if self.is_eks_related_security_group(sg, sg_index):
+                    self.log_operation('WARNING',
+                                       f"[PROTECTED] PROTECTED: Skipping EKS-related security group {sg_id} ({sg_name})")
+                    print(f"   [PROTECTED] PROTECTED: Skipping EKS security group {sg_name}")
+                    continue
+
+                sg_info = {
+                    'group_id': sg_id,
+                    'group_name': sg_name,
+                    'description': description,
+                    'vpc_id': vpc_id,
+                    'region': region,
+                    'account_info': account_info,
+                    'is_attached': False,
+                    'attached_instances': []
+                }
+
+                security_groups.append(sg_info)
 
             self.log_operation('INFO',
                                f"[PROTECTED]  Found {len(security_groups)} security groups in {region} ({account_name}) (after EKS filtering)")
@@ -279,7 +285,24 @@ class UltraCleanupEC2Manager:
             print(f"   [ERROR] Error getting security groups in {region}: {e}")
             return []
 
-    def is_eks_related_security_group(self, sg, ec2_client, region):
+    def build_security_group_index(self, account_info, region, security_groups=None) -> SecurityGroupUsageIndex:
+        """Build the region's security group usage index (launch templates, ASGs, ENIs, rules, ELBs)"""
+        start_time = time.time()
+        session = boto3.session.Session(
+            aws_access_key_id=account_info['access_key'],
+            aws_secret_access_key=account_info['secret_key'],
+            region_name=region
+        )
+        sg_index = SecurityGroupUsageIndex.build(session, region, security_groups=security_groups)
+
+        self.log_operation('INFO', f"[SCAN] Security group usage index for {region}: {sg_index.summary()} "
+                                   f"({time.time() - start_time:.1f}s)")
+        for usage_type, error in sg_index.failed_sources.items():
+            self.log_operation('WARNING', f"[WARN] Could not read {usage_type} usages in {region}, "
+                                          f"treating groups as used: {error}")
+        return sg_index
+
+    def is_eks_related_security_group(self, sg, sg_index: SecurityGroupUsageIndex):
         """Comprehensive check if security group is related to EKS"""
         sg_id = sg['GroupId']
         sg_name = sg['GroupName']
@@ -320,15 +343,17 @@ class UltraCleanupEC2Manager:
                     return True
 
             # 3. Check if security group is used by Launch Templates
-            if self.is_security_group_used_by_launch_template(ec2_client, sg_id):
+            if sg_index.is_used_by(sg_id, LAUNCH_TEMPLATE):
+                templates = [usage['id'] for usage in sg_index.usages(sg_id, (LAUNCH_TEMPLATE,))]
                 self.log_operation('WARNING',
-                                   f"[START] Security group {sg_id} is used by Launch Template - likely EKS nodegroup")
+                                   f"[START] Security group {sg_id} is used by Launch Template {', '.join(templates) or '(unknown)'} - likely EKS nodegroup")
                 return True
 
             # 4. Check if security group is used by Auto Scaling Groups
-            if self.is_security_group_used_by_asg(ec2_client, sg_id, region):
+            if sg_index.is_used_by(sg_id, AUTO_SCALING_GROUP):
+                asg_names = sorted({usage['id'] for usage in sg_index.usages(sg_id, (AUTO_SCALING_GROUP,))})
                 self.log_operation('WARNING',
-                                   f"📈 Security group {sg_id} is used by Auto Scaling Group - likely EKS nodegroup")
+                                   f"📈 Security group {sg_id} is used by Auto Scaling Group {', '.join(asg_names) or '(unknown)'} - likely EKS nodegroup")
                 return True
 
             # 5. Check tags for EKS indicators
@@ -357,97 +382,6 @@ class UltraCleanupEC2Manager:
             # If we can't determine, err on the side of caution
             return True
 
-    def is_security_group_used_by_launch_template(self, ec2_client, sg_id):
-        """Check if security group is used by any Launch Template"""
-        try:
-            paginator = ec2_client.get_paginator('describe_launch_templates')
-
-            for page in paginator.paginate():
-                for lt in page['LaunchTemplates']:
-                    lt_id = lt['LaunchTemplateId']
-
-                    # Get launch template versions
-                    try:
-                        versions_response = ec2_client.describe_launch_template_versions(
-                            LaunchTemplateId=lt_id
-                        )
-
-                        for version in versions_response['LaunchTemplateVersions']:
-                            launch_template_data = version.get('LaunchTemplateData', {})
-                            security_group_ids = launch_template_data.get('SecurityGroupIds', [])
-                            security_groups = launch_template_data.get('SecurityGroups', [])
-
-                            # Check security group IDs
-                            if sg_id in security_group_ids:
-                                self.log_operation('WARNING',
-                                                   f"[START] Security group {sg_id} found in Launch Template {lt_id}")
-                                return True
-
-                            # Check security group names
-                            for sg_name in security_groups:
-                                if sg_id == sg_name:  # Sometimes names are used instead of IDs
-                                    self.log_operation('WARNING',
-                                                       f"[START] Security group {sg_id} found in Launch Template {lt_id}")
-                                    return True
-
-                    except Exception as version_error:
-                        self.log_operation('DEBUG',
-                                           f"Could not check launch template {lt_id} versions: {version_error}")
-                        continue
-
-            return False
-
-        except Exception as e:
-            self.log_operation('ERROR', f"Error checking launch templates for security group {sg_id}: {e}")
-            return True  # Err on the side of caution
-
-    def is_security_group_used_by_asg(self, ec2_client, sg_id, region):
-        """Check if security group is used by any Auto Scaling Group"""
-        try:
-            # Create Auto Scaling client
-            asg_client = boto3.client(
-                'autoscaling',
-                aws_access_key_id=ec2_client._request_signer._credentials.access_key,
-                aws_secret_access_key=ec2_client._request_signer._credentials.secret_key,
-                region_name=region
-            )
-
-            paginator = asg_client.get_paginator('describe_auto_scaling_groups')
-
-            for page in paginator.paginate():
-                for asg in page['AutoScalingGroups']:
-                    asg_name = asg['AutoScalingGroupName']
-
-                    # Check if ASG uses Launch Template
-                    if 'LaunchTemplate' in asg:
-                        lt_id = asg['LaunchTemplate']['LaunchTemplateId']
-                        if self.is_security_group_used_by_launch_template(ec2_client, sg_id):
-                            self.log_operation('WARNING',
-                                               f"📈 Security group {sg_id} used by ASG {asg_name} via Launch Template {lt_id}")
-                            return True
-
-                    # Check instances in ASG for security groups
-                    for instance in asg.get('Instances', []):
-                        instance_id = instance['InstanceId']
-                        try:
-                            instance_response = ec2_client.describe_instances(InstanceIds=[instance_id])
-                            for reservation in instance_response['Reservations']:
-                                for inst in reservation['Instances']:
-                                    for sg in inst.get('SecurityGroups', []):
-                                        if sg['GroupId'] == sg_id:
-                                            self.log_operation('WARNING',
-                                                               f"📈 Security group {sg_id} used by ASG {asg_name} instance {instance_id}")
-                                            return True
-                        except Exception as inst_error:
-                            self.log_operation('DEBUG', f"Could not check instance {instance_id}: {inst_error}")
-                            continue
-
-            return False
-
-        except Exception as e:
-            self.log_operation('ERROR', f"Error checking Auto Scaling Groups for security group {sg_id}: {e}")
-            return True  # Err on the side of caution
-
     def correlate_instances_and_security_groups(self, instances, security_groups):
         """Correlate instances with their security groups"""
         try:
@@ -1,9 +1,12 @@
 ﻿#!/usr/bin/env python3
 
 import os
+import re
 import json
 import boto3
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from botocore.exceptions import ClientError, BotoCoreError
@@ -12,6 +15,379 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from root_iam_credential_manager import AWSCredentialManager, Colors
+from eks_inventory import EKSInventoryCollector
+
+
+class AccountRateLimiter:
+    """Token bucket limiting the EKS API call rate per account"""
+
+    def __init__(self, calls_per_second: float = 5.0, burst: int = 10):
+        self.calls_per_second = calls_per_second
+        self.burst = burst
+        self._buckets = {}  # account_key -> [tokens, last_refill]
+        self._lock = threading.Lock()
+
+    def acquire(self, account_key: str):
+        """Block until a call for this account is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last_refill = self._buckets.get(account_key, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last_refill) * self.calls_per_second)
+                if tokens >= 1:
+                    self._buckets[account_key] = (tokens - 1, now)
+                    return
+                self._buckets[account_key] = (tokens, now)
+                wait_seconds = (1 - tokens) / self.calls_per_second
+            time.sleep(wait_seconds)
+
+
+class EKSDeletionWaiter:
+    """
+    Single background poller for every pending nodegroup and cluster deletion.
+
+    Instead of each deletion blocking its own thread in a describe/sleep loop, deletions are
+    registered here and one thread polls all of them every poll_interval seconds. Each
+    registration returns a Future resolving to 'DELETED', 'TIMEOUT' or the unexpected status.
+    """
+
+    def __init__(self, rate_limiter: AccountRateLimiter, poll_interval: int = 30, log_operation=None):
+        self.rate_limiter = rate_limiter
+        self.poll_interval = poll_interval
+        self.log_operation = log_operation or (lambda level, message: None)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def wait_for_deletion(self, eks_client, account_key: str, cluster_name: str,
+                          nodegroup_name: str = None, timeout: int = 1800) -> Future:
+        """Register a deletion that has already been requested and get a Future for its outcome"""
+        future = Future()
+        key = (account_key, id(eks_client), cluster_name, nodegroup_name)
+        with self._lock:
+            self._pending[key] = {
+                'eks_client': eks_client,
+                'account_key': account_key,
+                'cluster_name': cluster_name,
+                'nodegroup_name': nodegroup_name,
+                'deadline': time.time() + timeout,
+                'polls': 0,
+                'future': future
+            }
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll_loop, name='eks-deletion-waiter', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return future
+
+    def _poll_once(self, item):
+        """Poll one deletion; returns the outcome or None while it is still deleting"""
+        self.rate_limiter.acquire(item['account_key'])
+        cluster_name = item['cluster_name']
+        nodegroup_name = item['nodegroup_name']
+        resource = f"nodegroup {nodegroup_name}" if nodegroup_name else f"cluster {cluster_name}"
+
+        try:
+            if nodegroup_name:
+                status = item['eks_client'].describe_nodegroup(
+                    clusterName=cluster_name, nodegroupName=nodegroup_name)['nodegroup']['status']
+            else:
+                status = item['eks_client'].describe_cluster(name=cluster_name)['cluster']['status']
+        except ClientError as e:
+            if 'ResourceNotFound' in str(e):
+                return 'DELETED'
+            raise
+
+        if status != 'DELETING':
+            return status
+        if time.time() >= item['deadline']:
+            return 'TIMEOUT'
+
+        item['polls'] += 1
+        if item['polls'] % 10 == 0:  # Log every ~5 minutes
+            self.log_operation('INFO', f"{resource} status: {status} (Waiting...)")
+        return None
+
+    def _poll_loop(self):
+        while True:
+            with self._lock:
+                items = list(self._pending.items())
+                if not items:
+                    self._thread = None
+                    return
+
+            for key, item in items:
+                try:
+                    outcome = self._poll_once(item)
+                    if outcome is None:
+                        continue
+                    item['future'].set_result(outcome)
+                except Exception as e:
+                    item['future'].set_exception(e)
+                with self._lock:
+                    self._pending.pop(key, None)
+
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+
+class DeletionStepGraph:
+    """
+    Dependency graph of deletion steps with a topological, parallel executor.
+
+    A step starts as soon as all of its dependencies have finished, so independent
+    branches run at the same time. A failed required step skips everything that depends
+    on it (transitively) while unrelated branches carry on. A failed optional step is only
+    reported as a warning and its dependents still run.
+    """
+
+    def __init__(self, max_workers: int = 5):
+        self.max_workers = max_workers
+        self.steps = {}  # name -> (func, depends_on)
+        self.optional = set()
+
+    def add_step(self, name: str, func, depends_on=(), optional: bool = False):
+        self.steps[name] = (func, tuple(depends_on))
+        if optional:
+            self.optional.add(name)
+        else:
+            self.optional.discard(name)
+
+    def topological_order(self) -> List[str]:
+        """Get the step names in dependency order (raises ValueError on unknown deps or cycles)"""
+        for name, (_, depends_on) in self.steps.items():
+            missing = [dep for dep in depends_on if dep not in self.steps]
+            if missing:
+                raise ValueError(f"Step {name} depends on unknown steps: {missing}")
+
+        remaining = {name: set(depends_on) for name, (_, depends_on) in self.steps.items()}
+        order = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle between steps: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def run(self, completed=(), on_step_done=None) -> Dict[str, Any]:
+        """Execute the graph
+
+        Args:
+            completed: Steps already done in an earlier run (checkpoint); they are not re-run
+            on_step_done: Callback (name, status, seconds, error) invoked after every executed step;
+                status is 'completed', 'failed' or 'warning' (an optional step failed)
+
+        Returns:
+            {'completed': [...], 'failed': {name: error}, 'warnings': {name: error},
+             'skipped': [...], 'timings': {name: seconds}}
+        """
+        order = self.topological_order()
+        done = set(step for step in completed if step in self.steps)
+        failed = {}
+        warnings = {}
+        skipped = set()
+        timings = {}
+        running = {}
+
+        def blocked(name):
+            return any(dep in failed or dep in skipped for dep in self.steps[name][1])
+
+        def timed(name):
+            start = time.time()
+            try:
+                self.steps[name][0]()
+                return time.time() - start, None
+            except Exception as e:
+                return time.time() - start, e
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                for name in order:
+                    if (name in done or name in failed or name in warnings or name in skipped
+                            or name in running.values()):
+                        continue
+                    if blocked(name):
+                        skipped.add(name)
+                    elif all(dep in done or dep in warnings for dep in self.steps[name][1]):
+                        running[executor.submit(timed, name)] = name
+
+                if not running:
+                    break
+
+                finished = next(as_completed(running))
+                name = running.pop(finished)
+                seconds, error = finished.result()
+                timings[name] = round(seconds, 2)
+                if error is None:
+                    done.add(name)
+                    status = 'completed'
+                elif name in self.optional:
+                    warnings[name] = str(error)
+                    status = 'warning'
+                else:
+                    failed[name] = str(error)
+                    status = 'failed'
+                if on_step_done:
+                    on_step_done(name, status, timings[name], None if error is None else str(error))
+
+        return {
+            'completed': [name for name in order if name in done],
+            'failed': failed,
+            'warnings': warnings,
+            'skipped': [name for name in order if name in skipped],
+            'timings': timings
+        }
+
+
+class ClusterAlarmMatcher:
+    """
+    Precompiled matcher that maps alarm names and texts to the clusters they belong to.
+
+    The naming patterns of every cluster in a region are compiled into one regex alternation
+    scanned at each position of the alarm name, so an alarm is checked once for all clusters
+    instead of once per cluster per pattern.
+    """
+
+    def __init__(self, cluster_names):
+        self.cluster_names = list(dict.fromkeys(cluster_names))
+        name_patterns = {}
+        text_patterns = {}
+        for cluster_name in self.cluster_names:
+            for pattern in self.name_patterns(cluster_name):
+                name_patterns.setdefault(pattern, set()).add(cluster_name)
+            text_patterns.setdefault(cluster_name.lower(), set()).add(cluster_name)
+        self._name_regex, self._name_owners = self._compile(name_patterns)
+        self._text_regex, self._text_owners = self._compile(text_patterns)
+
+    @staticmethod
+    def name_patterns(cluster_name: str) -> set:
+        """Alarm name fragments that tie an alarm to the cluster (same rules as is_alarm_related_to_cluster)"""
+        cluster_name_lower = cluster_name.lower()
+        # "-name-", "eks-name", "name-cost" etc. all contain the plain name
+        patterns = {
+            cluster_name_lower,
+            cluster_name_lower.replace("-", "_"),
+            cluster_name_lower.replace("_", "-"),
+            cluster_name_lower.replace("-", "")
+        }
+        cluster_parts = cluster_name_lower.split('-')
+        if len(cluster_parts) > 1 and len(cluster_parts[-1]) >= 4:
+            patterns.update({f"-{cluster_parts[-1]}", f"{cluster_parts[-1]}-"})
+        return {pattern for pattern in patterns if pattern}
+
+    @staticmethod
+    def _compile(patterns: Dict[str, set]):
+        if not patterns:
+            return None, {}
+        # The lookahead reports only the longest pattern starting at each position,
+        # so each pattern also owns the clusters of the patterns that are its prefixes
+        owners = {pattern: set().union(*(clusters for other, clusters in patterns.items()
+                                         if pattern.startswith(other)))
+                  for pattern in patterns}
+        alternation = '|'.join(re.escape(pattern) for pattern in sorted(patterns, key=len, reverse=True))
+        return re.compile(f"(?=({alternation}))"), owners
+
+    @staticmethod
+    def _scan(regex, owners, text) -> set:
+        clusters = set()
+        if regex is None or not text:
+            return clusters
+        for match in regex.finditer(text.lower()):
+            clusters |= owners[match.group(1)]
+        return clusters
+
+    def clusters_for_name(self, alarm_name: str) -> set:
+        return self._scan(self._name_regex, self._name_owners, alarm_name)
+
+    def clusters_for_text(self, text: str) -> set:
+        """Clusters whose name appears anywhere in a description, alarm rule or dimension value"""
+        return self._scan(self._text_regex, self._text_owners, text)
+
+    def clusters_for_alarm(self, alarm: Dict) -> set:
+        clusters = self.clusters_for_name(alarm['AlarmName'])
+        clusters |= self.clusters_for_text(alarm.get('AlarmDescription', ''))
+        clusters |= self.clusters_for_text(alarm.get('AlarmRule', ''))
+        for dimension in alarm.get('Dimensions', []):
+            clusters |= self.clusters_for_text(dimension.get('Value', ''))
+        return clusters
+
+    def clusters_for_tags(self, tags: List[Dict]) -> set:
+        clusters = set()
+        for tag in tags:
+            tag_key = tag.get('Key', '').lower()
+            clusters |= self.clusters_for_text(tag.get('Value', ''))
+            if tag_key.startswith('kubernetes.io/cluster/'):
+                clusters |= self._text_owners.get(tag_key[len('kubernetes.io/cluster/'):], set())
+        return clusters
+
+
+class RegionAlarmSnapshot:
+    """
+    One describe_alarms listing of a region, indexed by the clusters each alarm belongs to.
+
+    Every cluster deleted in the region takes its alarms from the snapshot instead of
+    re-listing the region. claim() hands each alarm out only once, so alarms matching
+    several clusters are not deleted twice.
+    """
+
+    def __init__(self, cloudwatch_client, cluster_names, check_tags: bool = True, tag_workers: int = 8,
+                 log_operation=None):
+        self.matcher = ClusterAlarmMatcher(cluster_names)
+        self.log_operation = log_operation or (lambda level, message: None)
+        self.alarms = {cluster_name: {'composite': [], 'metric': []} for cluster_name in self.matcher.cluster_names}
+        self.alarm_count = 0
+        self._claimed = set()
+        self._lock = threading.Lock()
+        self._load(cloudwatch_client, check_tags, tag_workers)
+
+    def _add(self, clusters, alarm_type, alarm_name):
+        for cluster_name in clusters:
+            self.alarms[cluster_name][alarm_type].append(alarm_name)
+
+    def _load(self, cloudwatch_client, check_tags, tag_workers):
+        untagged = []
+        paginator = cloudwatch_client.get_paginator('describe_alarms')
+        for page in paginator.paginate(AlarmTypes=['CompositeAlarm', 'MetricAlarm']):
+            for alarm_type, key in (('composite', 'CompositeAlarms'), ('metric', 'MetricAlarms')):
+                for alarm in page.get(key, []):
+                    self.alarm_count += 1
+                    clusters = self.matcher.clusters_for_alarm(alarm)
+                    if clusters:
+                        self._add(clusters, alarm_type, alarm['AlarmName'])
+                    elif check_tags:
+                        untagged.append((alarm_type, alarm['AlarmName'], alarm['AlarmArn']))
+
+        if not untagged:
+            return
+
+        # Only alarms that nothing else matched need a tag lookup
+        def get_tags(alarm_arn):
+            try:
+                return cloudwatch_client.list_tags_for_resource(ResourceARN=alarm_arn).get('Tags', [])
+            except Exception as e:
+                self.log_operation('WARNING', f"Failed to check tags for alarm {alarm_arn.split(':')[-1]}: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=tag_workers) as executor:
+            for (alarm_type, alarm_name, _), tags in zip(untagged, executor.map(get_tags, [arn for _, _, arn in untagged])):
+                self._add(self.matcher.clusters_for_tags(tags), alarm_type, alarm_name)
+
+    def has_cluster(self, cluster_name: str) -> bool:
+        return cluster_name in self.alarms
+
+    def claim(self, cluster_name: str) -> Dict[str, List[str]]:
+        """Get the cluster's alarms that no other cluster has claimed yet"""
+        with self._lock:
+            claimed = {}
+            for alarm_type, alarm_names in self.alarms.get(cluster_name, {}).items():
+                claimed[alarm_type] = [name for name in alarm_names if name not in self._claimed]
+                self._claimed.update(claimed[alarm_type])
+            return claimed
 
 
 class UltraCleanupEKSManager:
@@ -33,6 +409,8 @@ class UltraCleanupEKSManager:
     Created: 2025-07-05
     """
 
+    MAX_ALARMS_PER_DELETE = 100  # delete_alarms / describe_alarms name limit
+
     def __init__(self, config_dir: str = None):
         """Initialize the EKS Cleanup Manager."""
         self.cred_manager = AWSCredentialManager(config_dir)
@@ -46,6 +424,7 @@ class UltraCleanupEKSManager:
         # Set up directory paths
         self.eks_dir = os.path.join(self.config_dir, "aws", "eks")
         self.reports_dir = os.path.join(self.eks_dir, "reports")
+        self.checkpoint_dir = os.path.join(self.eks_dir, "checkpoints")
 
         # Initialize log file
         self.setup_detailed_logging()
@@ -53,6 +432,21 @@ class UltraCleanupEKSManager:
         # Get user regions from config
         self.user_regions = self._get_user_regions()
 
+        # Concurrent teardown settings
+        self.max_parallel_tasks = 8  # (account, region) pairs processed at once
+        self.max_concurrent_clusters_per_account = 4
+        self.api_calls_per_second_per_account = 5
+        self.rate_limiter = AccountRateLimiter(self.api_calls_per_second_per_account)
+        self.deletion_waiter = EKSDeletionWaiter(self.rate_limiter, poll_interval=30,
+                                                 log_operation=self.log_operation)
+        self._account_semaphores = {}
+        self._account_semaphores_lock = threading.Lock()
+        self._alarm_snapshots = {}
+        self._region_cluster_names = {}
+        self._alarm_snapshot_locks = {}
+        self._alarm_snapshots_lock = threading.Lock()
+        self.inventory_collector = EKSInventoryCollector(max_workers=10)
+
         # Storage for cleanup results
         self.cleanup_results = {
             'accounts_processed': [],
@@ -61,6 +455,7 @@ class UltraCleanupEKSManager:
             'deleted_nodegroups': [],
             'failed_deletions': [],
             'skipped_resources': [],
+            'step_timings': [],
             'errors': []
         }
 
@@ -151,12 +546,13 @@ class UltraCleanupEKSManager:
     def delete_all_lambda_functions(self, access_key, secret_key, region, cluster_name):
         """Delete Lambda functions related to the EKS cluster, including node protection functions."""
         try:
-            lambda_client = boto3.client(
-                'lambda',
+            # boto3's default session is not thread-safe; these helpers run on worker threads
+            session = boto3.session.Session(
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 region_name=region
             )
+            lambda_client = session.client('lambda')
 
             deleted_functions = []
             skipped_functions = []
@@ -305,12 +701,12 @@ class UltraCleanupEKSManager:
                                            region):
         """Remove EventBridge triggers for a Lambda function before deletion."""
         try:
-            events_client = boto3.client(
-                'events',
+            session = boto3.session.Session(
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 region_name=region
             )
+            events_client = session.client('events')
 
             # Get the function's policy to find EventBridge triggers
             try:
@@ -378,12 +774,12 @@ class UltraCleanupEKSManager:
     def delete_related_event_rules(self, access_key, secret_key, region, cluster_name):
         """Delete EventBridge rules related to the EKS cluster, including node protection rules."""
         try:
-            events_client = boto3.client(
-                'events',
+            session = boto3.session.Session(
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 region_name=region
             )
+            events_client = session.client('events')
 
             deleted_rules = []
             skipped_rules = []
@@ -499,12 +895,12 @@ class UltraCleanupEKSManager:
     def delete_all_iam_roles_policies(self, access_key, secret_key, region, cluster_name):
         """Delete IAM roles and policies related to the EKS cluster with improved safety checks."""
         try:
-            iam_client = boto3.client(
-                'iam',
+            session = boto3.session.Session(
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 region_name=region
             )
+            iam_client = session.client('iam')
 
             deleted_roles = []
             deleted_policies = []
@@ -704,12 +1100,12 @@ class UltraCleanupEKSManager:
     def delete_all_security_groups(self, access_key, secret_key, region, cluster_name, vpc_id):
         """Delete security groups related to the EKS cluster with improved safety checks."""
         try:
-            ec2_client = boto3.client(
-                'ec2',
+            session = boto3.session.Session(
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 region_name=region
             )
+            ec2_client = session.client('ec2')
 
             deleted_sgs = []
             skipped_sgs = []
@@ -829,14 +1225,114 @@ class UltraCleanupEKSManager:
             self.log_operation('ERROR', f"Failed to delete security groups for cluster {cluster_name}: {e}")
             return False
 
+    def register_region_clusters(self, access_key: str, region: str, cluster_names: List[str]):
+        """Record every cluster of a region so its alarm snapshot is built once for all of them"""
+        with self._alarm_snapshots_lock:
+            self._region_cluster_names[(access_key, region)] = list(cluster_names)
+
+    def get_region_alarm_snapshot(self, cloudwatch_client, access_key: str, region: str,
+                                  cluster_name: str) -> RegionAlarmSnapshot:
+        """Get the region's alarm snapshot, listing the region's alarms only on first use
+
+        Snapshots are built under a per-(account, region) lock, so regions index their alarms
+        concurrently while clusters of the same region wait for the one shared snapshot.
+        """
+        key = (access_key, region)
+        with self._alarm_snapshots_lock:
+            region_lock = self._alarm_snapshot_locks.setdefault(key, threading.Lock())
+
+        with region_lock:
+            with self._alarm_snapshots_lock:
+                snapshot = self._alarm_snapshots.get(key)
+                cluster_names = self._region_cluster_names.get(key, [])
+            if snapshot is None or not snapshot.has_cluster(cluster_name):
+                if cluster_name not in cluster_names:
+                    cluster_names = cluster_names + [cluster_name]
+                snapshot = RegionAlarmSnapshot(cloudwatch_client, cluster_names, log_operation=self.log_operation)
+                with self._alarm_snapshots_lock:
+                    self._alarm_snapshots[key] = snapshot
+                self.log_operation('INFO', f"Indexed {snapshot.alarm_count} CloudWatch alarms in {region} "
+                                           f"for {len(cluster_names)} clusters")
+            return snapshot
+
+    def delete_alarms_in_batches(self, cloudwatch_client, alarm_names: List[str], alarm_type: str):
+        """Delete alarms with up to 100 names per delete_alarms call
+
+        Returns:
+            (deleted count, names that failed to delete)
+        """
+        deleted_count = 0
+        failed_names = []
+
+        for i in range(0, len(alarm_names), self.MAX_ALARMS_PER_DELETE):
+            batch = alarm_names[i:i + self.MAX_ALARMS_PER_DELETE]
+            try:
+                cloudwatch_client.delete_alarms(AlarmNames=batch)
+                deleted_count += len(batch)
+                for alarm_name in batch:
+                    self.log_operation('INFO', f"Deleted {alarm_type} alarm: {alarm_name}")
+                print(f"         [OK] Deleted {len(batch)} {alarm_type} alarms")
+                continue
+            except Exception as batch_error:
+                # If batch fails, try individual deletion
+                print(f"         [WARN]  Batch deletion failed, trying individual deletion...")
+                self.log_operation('WARNING', f"Batch deletion of {len(batch)} {alarm_type} alarms failed: {batch_error}")
+
+            for alarm_name in batch:
+                try:
+                    cloudwatch_client.delete_alarms(AlarmNames=[alarm_name])
+                    print(f"         [OK] Deleted {alarm_type} alarm (individual): {alarm_name}")
+                    self.log_operation('INFO', f"Deleted {alarm_type} alarm (individual): {alarm_name}")
+                    deleted_count += 1
+                except Exception as individual_error:
+                    error_msg = str(individual_error)
+                    if "ResourceNotFound" in error_msg:
+                        continue
+                    failed_names.append(alarm_name)
+                    if "CompositeAlarm" in error_msg:
+                        print(f"         [WARN]  Metric alarm {alarm_name} is still referenced by composite alarm - will retry")
+                        self.log_operation('WARNING', f"Metric alarm {alarm_name} still referenced by composite alarm")
+                    else:
+                        print(f"         [ERROR] Failed to delete {alarm_type} alarm {alarm_name}: {error_msg}")
+                        self.log_operation('ERROR', f"Failed to delete {alarm_type} alarm {alarm_name}: {error_msg}")
+
+        return deleted_count, failed_names
+
+    def find_existing_alarms(self, cloudwatch_client, alarm_names: List[str]) -> List[str]:
+        """Get which of the given alarms still exist (looked up by name, 100 at a time)"""
+        existing = []
+        for i in range(0, len(alarm_names), self.MAX_ALARMS_PER_DELETE):
+            response = cloudwatch_client.describe_alarms(
+                AlarmNames=alarm_names[i:i + self.MAX_ALARMS_PER_DELETE],
+                AlarmTypes=['CompositeAlarm', 'MetricAlarm'],
+                MaxRecords=self.MAX_ALARMS_PER_DELETE
+            )
+            existing.extend(alarm['AlarmName'] for alarm in response.get('CompositeAlarms', []))
+            existing.extend(alarm['AlarmName'] for alarm in response.get('MetricAlarms', []))
+        return existing
+
+    def force_delete_remaining_cluster_alarms(self, cloudwatch_client, cluster_name: str,
+                                              alarm_names: List[str]) -> int:
+        """Force delete the cluster alarms that survived the batched deletion"""
+        deleted_count = 0
+        for alarm_name in alarm_names:
+            try:
+                print(f"      [FIRE] FORCE deleting alarm: {alarm_name}")
+                cloudwatch_client.delete_alarms(AlarmNames=[alarm_name])
+                deleted_count += 1
+                self.log_operation('INFO', f"FORCE deleted alarm {alarm_name} of cluster {cluster_name}")
+                time.sleep(0.3)  # Longer delay for force deletion
+            except Exception as e:
+                print(f"      [ERROR] Failed to force delete alarm {alarm_name}: {str(e)}")
+                self.log_operation('ERROR', f"Failed to force delete alarm {alarm_name}: {str(e)}")
+        return deleted_count
+
     def delete_all_cloudwatch_alarms(self, access_key: str, secret_key: str, region: str, cluster_name: str) -> bool:
         """
         Delete all CloudWatch alarms associated with an EKS cluster
-        This includes composite alarms, basic alarms, and cost alarms
-        FIXED: Now properly handles composite alarm dependencies
-
-        Date: 2025-07-06 04:29:28 UTC
-        Author: varadharajaan
+        This includes composite alarms, basic alarms, cost alarms and tagged alarms.
+        The alarms come from the region's shared snapshot and are deleted in batches of 100,
+        composite alarms first (they depend on metric alarms).
         """
         try:
             self.log_operation('INFO',
@@ -854,50 +1350,51 @@ class UltraCleanupEKSManager:
 
             # Track deletion statistics
             total_deleted = 0
-            failed_deletions = 0
             max_retries = 3
 
-            # STEP 1: Find and delete composite alarms FIRST (they depend on metric alarms)
-            print(f"   [SCAN] Step 1: Finding and deleting composite alarms for cluster {cluster_name}...")
-            composite_deleted = self.delete_composite_alarms_for_cluster_fixed(cloudwatch_client, cluster_name)
-            total_deleted += composite_deleted
-
-            # STEP 2: Wait for AWS to process composite alarm deletions
-            if composite_deleted > 0:
-                print(f"   [WAIT] Waiting 5 seconds for AWS to process composite alarm deletions...")
-                time.sleep(5)
+            snapshot = self.get_region_alarm_snapshot(cloudwatch_client, access_key, region, cluster_name)
+            cluster_alarms = snapshot.claim(cluster_name)
+            composite_alarms = cluster_alarms.get('composite', [])
+            metric_alarms = cluster_alarms.get('metric', [])
+
+            # STEP 1: Delete composite alarms FIRST
+            if composite_alarms:
+                print(f"   [DELETE]  Step 1: Deleting {len(composite_alarms)} composite alarms for cluster {cluster_name}...")
+                composite_deleted, failed_names = self.delete_alarms_in_batches(
+                    cloudwatch_client, composite_alarms, 'composite')
+                total_deleted += composite_deleted
+
+                # STEP 2: Wait for AWS to process composite alarm deletions
+                if composite_deleted > 0 and metric_alarms:
+                    print(f"   [WAIT] Waiting 5 seconds for AWS to process composite alarm deletions...")
+                    time.sleep(5)
+            else:
+                failed_names = []
 
-            # STEP 3: Find and delete basic metric alarms with retry logic
+            # STEP 3: Delete metric alarms, retrying those still referenced by composite alarms
+            pending = metric_alarms
             for retry in range(max_retries):
-                print(
-                    f"   [SCAN] Step 2: Finding and deleting metric alarms for cluster {cluster_name} (attempt {retry + 1})...")
-                basic_deleted = self.delete_basic_alarms_for_cluster_fixed(cloudwatch_client, cluster_name)
-                total_deleted += basic_deleted
-
-                if basic_deleted == 0:
-                    break  # No more alarms to delete
-
-                if retry < max_retries - 1:
+                if not pending:
+                    break
+                print(f"   [DELETE]  Step 2: Deleting {len(pending)} metric alarms for cluster {cluster_name} "
+                      f"(attempt {retry + 1})...")
+                metric_deleted, pending = self.delete_alarms_in_batches(cloudwatch_client, pending, 'metric')
+                total_deleted += metric_deleted
+
+                if pending and retry < max_retries - 1:
                     print(f"   [WAIT] Waiting 3 seconds before next attempt...")
                     time.sleep(3)
 
-            # STEP 4: Find and delete cost alarms
-            print(f"   [SCAN] Step 3: Finding and deleting cost monitoring alarms for cluster {cluster_name}...")
-            cost_deleted = self.delete_cost_alarms_for_cluster_fixed(cloudwatch_client, cluster_name)
-            total_deleted += cost_deleted
-
-            # STEP 5: Final cleanup - delete any remaining alarms with cluster tags
-            print(f"   [SCAN] Step 4: Final cleanup - finding tagged alarms for cluster {cluster_name}...")
-            tagged_deleted = self.delete_tagged_alarms_for_cluster_fixed(cloudwatch_client, cluster_name)
-            total_deleted += tagged_deleted
-
-            # STEP 6: Verify no alarms remain
-            remaining_alarms = self.count_remaining_cluster_alarms(cloudwatch_client, cluster_name)
-            if remaining_alarms > 0:
+            # STEP 4: Verify no alarms remain
+            remaining_alarms = self.find_existing_alarms(cloudwatch_client, failed_names + pending)
+            failed_deletions = 0
+            if remaining_alarms:
                 self.print_colored(Colors.YELLOW,
-                                   f"   [WARN]  {remaining_alarms} alarms still remain - attempting final cleanup...")
-                final_deleted = self.force_delete_remaining_cluster_alarms(cloudwatch_client, cluster_name)
+                                   f"   [WARN]  {len(remaining_alarms)} alarms still remain - attempting final cleanup...")
+                final_deleted = self.force_delete_remaining_cluster_alarms(cloudwatch_client, cluster_name,
+                                                                           remaining_alarms)
                 total_deleted += final_deleted
+                failed_deletions = len(remaining_alarms) - final_deleted
 
             # Summary
             if total_deleted > 0:
@@ -921,464 +1418,9 @@ class UltraCleanupEKSManager:
             self.print_colored(Colors.RED, f"   [ERROR] Failed to delete CloudWatch alarms: {error_msg}")
             return False
 
-    def delete_composite_alarms_for_cluster_fixed(self, cloudwatch_client, cluster_name: str) -> int:
-        """Delete composite alarms associated with the cluster - FIXED version"""
-        try:
-            deleted_count = 0
-
-            # Get ALL composite alarms (CloudWatch doesn't have direct filtering)
-            paginator = cloudwatch_client.get_paginator('describe_alarms')
-
-            for page in paginator.paginate(AlarmTypes=['CompositeAlarm']):
-                composite_alarms = page.get('CompositeAlarms', [])
-
-                cluster_composite_alarms = []
-
-                for alarm in composite_alarms:
-                    alarm_name = alarm['AlarmName']
-
-                    # Enhanced cluster matching patterns
-                    is_cluster_related = self.is_alarm_related_to_cluster(alarm_name, cluster_name)
-
-                    if not is_cluster_related:
-                        # Check alarm description for cluster reference
-                        alarm_description = alarm.get('AlarmDescription', '')
-                        if cluster_name.lower() in alarm_description.lower():
-                            is_cluster_related = True
-
-                    if not is_cluster_related:
-                        # Check alarm rule for cluster references
-                        alarm_rule = alarm.get('AlarmRule', '')
-                        if cluster_name.lower() in alarm_rule.lower():
-                            is_cluster_related = True
-
-                    if is_cluster_related:
-                        cluster_composite_alarms.append(alarm_name)
-
-                # Delete found composite alarms
-                if cluster_composite_alarms:
-                    print(f"      [DELETE]  Deleting {len(cluster_composite_alarms)} composite alarms...")
-
-                    for alarm_name in cluster_composite_alarms:
-                        try:
-                            self.log_operation('INFO', f"[DELETE]  Deleting composite alarm: {alarm_name}")
-                            print(f"         [DELETE]  Deleting composite alarm: {alarm_name}")
-
-                            cloudwatch_client.delete_alarms(AlarmNames=[alarm_name])
-                            deleted_count += 1
-
-                            self.log_operation('INFO', f"[OK] Deleted composite alarm: {alarm_name}")
-                            print(f"         [OK] Deleted composite alarm: {alarm_name}")
-
-                            # Small delay to avoid throttling
-                            time.sleep(0.2)
-
-                        except Exception as e:
-                            error_msg = str(e)
-                            print(f"         [ERROR] Failed to delete composite alarm {alarm_name}: {error_msg}")
-                            self.log_operation('ERROR', f"Failed to delete composite alarm {alarm_name}: {error_msg}")
-
-            if deleted_count > 0:
-                self.log_operation('INFO', f"Deleted {deleted_count} composite alarms for cluster {cluster_name}")
-
-            return deleted_count
-
-        except Exception as e:
-            self.log_operation('ERROR', f"Error deleting composite alarms: {str(e)}")
-            return 0
-
-    def delete_basic_alarms_for_cluster_fixed(self, cloudwatch_client, cluster_name: str) -> int:
-        """Delete basic metric alarms associated with the cluster - FIXED version"""
-        try:
-            deleted_count = 0
-
-            # Get ALL metric alarms
-            paginator = cloudwatch_client.get_paginator('describe_alarms')
-
-            for page in paginator.paginate(AlarmTypes=['MetricAlarm']):
-                metric_alarms = page.get('MetricAlarms', [])
-
-                cluster_metric_alarms = []
-
-                for alarm in metric_alarms:
-                    alarm_name = alarm['AlarmName']
-
-                    # Enhanced cluster matching
-                    is_cluster_related = self.is_alarm_related_to_cluster(alarm_name, cluster_name)
-
-                    if not is_cluster_related:
-                        # Check alarm description for cluster reference
-                        alarm_description = alarm.get('AlarmDescription', '')
-                        if cluster_name.lower() in alarm_description.lower():
-                            is_cluster_related = True
-
-                    if not is_cluster_related:
-                        # Check dimensions for cluster name
-                        dimensions = alarm.get('Dimensions', [])
-                        for dimension in dimensions:
-                            dim_name = dimension.get('Name', '')
-                            dim_value = dimension.get('Value', '')
-
-                            # Check for various dimension patterns
-                            if (dim_name == 'ClusterName' and dim_value == cluster_name) or \
-                                    (dim_name == 'NodegroupName' and cluster_name in dim_value) or \
-                                    (cluster_name in dim_value):
-                                is_cluster_related = True
-                                break
-
-                    if not is_cluster_related:
-                        # Check metric name and namespace for EKS patterns
-                        namespace = alarm.get('Namespace', '')
-                        metric_name = alarm.get('MetricName', '')
-
-                        if 'ContainerInsights' in namespace and cluster_name in str(dimensions):
-                            is_cluster_related = True
-
-                    if is_cluster_related:
-                        cluster_metric_alarms.append(alarm_name)
-
-                # Delete found metric alarms in batches (CloudWatch allows up to 100 per call)
-                if cluster_metric_alarms:
-                    print(f"      [DELETE]  Deleting {len(cluster_metric_alarms)} metric alarms...")
-
-                    # Delete in batches of 10 to avoid issues
-                    for i in range(0, len(cluster_metric_alarms), 10):
-                        batch = cluster_metric_alarms[i:i + 10]
-
-                        try:
-                            # Try batch deletion first
-                            cloudwatch_client.delete_alarms(AlarmNames=batch)
-
-                            for alarm_name in batch:
-                                print(f"         [OK] Deleted metric alarm: {alarm_name}")
-                                self.log_operation('INFO', f"Deleted metric alarm: {alarm_name}")
-                                deleted_count += 1
-
-                            # Small delay between batches
-                            time.sleep(0.5)
-
-                        except Exception as batch_error:
-                            # If batch fails, try individual deletion
-                            print(f"         [WARN]  Batch deletion failed, trying individual deletion...")
-                            self.log_operation('WARNING', f"Batch deletion failed: {str(batch_error)}")
-
-                            for alarm_name in batch:
-                                try:
-                                    cloudwatch_client.delete_alarms(AlarmNames=[alarm_name])
-                                    print(f"         [OK] Deleted metric alarm (individual): {alarm_name}")
-                                    self.log_operation('INFO', f"Deleted metric alarm (individual): {alarm_name}")
-                                    deleted_count += 1
-                                    time.sleep(0.2)
-                                except Exception as individual_error:
-                                    error_msg = str(individual_error)
-                                    if "CompositeAlarm" in error_msg:
-                                        print(
-                                            f"         [WARN]  Metric alarm {alarm_name} is still referenced by composite alarm - will retry")
-                                        self.log_operation('WARNING',
-                                                           f"Metric alarm {alarm_name} still referenced by composite alarm")
-                                    else:
-                                        print(f"         [ERROR] Failed to delete metric alarm {alarm_name}: {error_msg}")
-                                        self.log_operation('ERROR',
-                                                           f"Failed to delete metric alarm {alarm_name}: {error_msg}")
-
-            return deleted_count
-
-        except Exception as e:
-            self.log_operation('ERROR', f"Error deleting metric alarms: {str(e)}")
-            return 0
-
-    def delete_cost_alarms_for_cluster_fixed(self, cloudwatch_client, cluster_name: str) -> int:
-        """Delete cost monitoring alarms associated with the cluster - FIXED version"""
-        try:
-            deleted_count = 0
-
-            # Get ALL metric alarms (cost alarms are metric alarms in AWS/Billing namespace)
-            paginator = cloudwatch_client.get_paginator('describe_alarms')
-
-            for page in paginator.paginate(AlarmTypes=['MetricAlarm']):
-                metric_alarms = page.get('MetricAlarms', [])
-
-                cost_alarms = []
-
-                for alarm in metric_alarms:
-                    alarm_name = alarm['AlarmName']
-
-                    # Check for cost-related alarm names
-                    if self.is_cost_alarm_for_cluster(alarm_name, cluster_name):
-                        cost_alarms.append(alarm_name)
-                        continue
-
-                    # Check if it's a billing alarm with cluster reference
-                    namespace = alarm.get('Namespace', '')
-                    metric_name = alarm.get('MetricName', '')
-
-                    if namespace == 'AWS/Billing' and metric_name == 'EstimatedCharges':
-                        alarm_description = alarm.get('AlarmDescription', '')
-                        if cluster_name.lower() in alarm_description.lower():
-                            cost_alarms.append(alarm_name)
-
-                    # Check for Cost Explorer alarms
-                    if namespace in ['AWS/Billing', 'CostExplorer'] and cluster_name.lower() in alarm_name.lower():
-                        cost_alarms.append(alarm_name)
-
-                # Delete found cost alarms
-                if cost_alarms:
-                    print(f"      [DELETE]  Deleting {len(cost_alarms)} cost monitoring alarms...")
-
-                    for alarm_name in cost_alarms:
-                        try:
-                            cloudwatch_client.delete_alarms(AlarmNames=[alarm_name])
-                            print(f"         [OK] Deleted cost alarm: {alarm_name}")
-                            self.log_operation('INFO', f"Deleted cost alarm: {alarm_name}")
-                            deleted_count += 1
-
-                            # Small delay to avoid throttling
-                            time.sleep(0.2)
-
-                        except Exception as e:
-                            print(f"         [ERROR] Failed to delete cost alarm {alarm_name}: {str(e)}")
-                            self.log_operation('ERROR', f"Failed to delete cost alarm {alarm_name}: {str(e)}")
-
-            return deleted_count
-
-        except Exception as e:
-            self.log_operation('ERROR', f"Error deleting cost alarms: {str(e)}")
-            return 0
-
-    def delete_tagged_alarms_for_cluster_fixed(self, cloudwatch_client, cluster_name: str) -> int:
-        """Delete alarms that are tagged with the cluster name - FIXED version"""
-        try:
-            deleted_count = 0
-
-            # Get all alarms (both metric and composite)
-            all_alarm_arns = []
-
-            # Get metric alarms
-            paginator = cloudwatch_client.get_paginator('describe_alarms')
-            for page in paginator.paginate(AlarmTypes=['MetricAlarm']):
-                metric_alarms = page.get('MetricAlarms', [])
-                all_alarm_arns.extend([alarm['AlarmArn'] for alarm in metric_alarms])
-
-            # Get composite alarms
-            for page in paginator.paginate(AlarmTypes=['CompositeAlarm']):
-                composite_alarms = page.get('CompositeAlarms', [])
-                all_alarm_arns.extend([alarm['AlarmArn'] for alarm in composite_alarms])
-
-            if not all_alarm_arns:
-                return 0
-
-            # Check tags for each alarm individually
-            tagged_alarms = []
-
-            for resource_arn in all_alarm_arns:
-                try:
-                    # Use the correct parameter name: ResourceARN
-                    response = cloudwatch_client.list_tags_for_resource(
-                        ResourceARN=resource_arn
-                    )
-
-                    tags = response.get('Tags', [])
-
-                    # Check if any tag references the cluster
-                    for tag in tags:
-                        tag_key = tag.get('Key', '')
-                        tag_value = tag.get('Value', '')
-
-                        if (tag_key == 'Cluster' and tag_value == cluster_name) or \
-                                (tag_key == 'ClusterName' and tag_value == cluster_name) or \
-                                (tag_key == 'EKSCluster' and tag_value == cluster_name) or \
-                                (cluster_name.lower() in tag_value.lower()) or \
-                                (tag_key.lower() == f'kubernetes.io/cluster/{cluster_name.lower()}'):
-                            # Extract alarm name from ARN
-                            alarm_name = resource_arn.split(':')[-1]
-                            tagged_alarms.append(alarm_name)
-                            break
-
-                    # Small delay between tag requests to avoid throttling
-                    time.sleep(0.05)
-
-                except Exception as e:
-                    alarm_name = resource_arn.split(':')[-1] if ':' in resource_arn else resource_arn
-                    self.log_operation('WARNING', f"Failed to check tags for alarm {alarm_name}: {str(e)}")
-
-            # Delete tagged alarms
-            if tagged_alarms:
-                print(f"      [DELETE]  Deleting {len(tagged_alarms)} tagged alarms...")
-
-                for alarm_name in tagged_alarms:
-                    try:
-                        cloudwatch_client.delete_alarms(AlarmNames=[alarm_name])
-                        print(f"         [OK] Deleted tagged alarm: {alarm_name}")
-                        self.log_operation('INFO', f"Deleted tagged alarm: {alarm_name}")
-                        deleted_count += 1
-
-                        # Small delay to avoid throttling
-                        time.sleep(0.2)
-
-                    except Exception as e:
-                        print(f"         [ERROR] Failed to delete tagged alarm {alarm_name}: {str(e)}")
-                        self.log_operation('ERROR', f"Failed to delete tagged alarm {alarm_name}: {str(e)}")
-
-            return deleted_count
-
-        except Exception as e:
-            self.log_operation('ERROR', f"Error deleting tagged alarms: {str(e)}")
-            return 0
-
-    def count_remaining_cluster_alarms(self, cloudwatch_client, cluster_name: str) -> int:
-        """Count how many alarms still remain for the cluster"""
-        try:
-            remaining_count = 0
-
-            # Count metric alarms
-            paginator = cloudwatch_client.get_paginator('describe_alarms')
-            for page in paginator.paginate(AlarmTypes=['MetricAlarm']):
-                for alarm in page.get('MetricAlarms', []):
-                    if self.is_alarm_related_to_cluster(alarm['AlarmName'], cluster_name):
-                        remaining_count += 1
-
-            # Count composite alarms
-            for page in paginator.paginate(AlarmTypes=['CompositeAlarm']):
-                for alarm in page.get('CompositeAlarms', []):
-                    if self.is_alarm_related_to_cluster(alarm['AlarmName'], cluster_name):
-                        remaining_count += 1
-
-            return remaining_count
-
-        except Exception as e:
-            self.log_operation('ERROR', f"Error counting remaining alarms: {str(e)}")
-            return 0
-
-    def force_delete_remaining_cluster_alarms(self, cloudwatch_client, cluster_name: str) -> int:
-        """Force delete any remaining cluster alarms"""
-        try:
-            deleted_count = 0
-
-            # Get ALL remaining alarms
-            all_alarms = []
-
-            paginator = cloudwatch_client.get_paginator('describe_alarms')
-
-            # Get composite alarms first
-            for page in paginator.paginate(AlarmTypes=['CompositeAlarm']):
-                for alarm in page.get('CompositeAlarms', []):
-                    if self.is_alarm_related_to_cluster(alarm['AlarmName'], cluster_name):
-                        all_alarms.append(('composite', alarm['AlarmName']))
-
-            # Get metric alarms
-            for page in paginator.paginate(AlarmTypes=['MetricAlarm']):
-                for alarm in page.get('MetricAlarms', []):
-                    if self.is_alarm_related_to_cluster(alarm['AlarmName'], cluster_name):
-                        all_alarms.append(('metric', alarm['AlarmName']))
-
-            # Force delete all remaining alarms
-            for alarm_type, alarm_name in all_alarms:
-                try:
-                    print(f"      [FIRE] FORCE deleting {alarm_type} alarm: {alarm_name}")
-                    cloudwatch_client.delete_alarms(AlarmNames=[alarm_name])
-                    deleted_count += 1
-                    self.log_operation('INFO', f"FORCE deleted {alarm_type} alarm: {alarm_name}")
-                    time.sleep(0.3)  # Longer delay for force deletion
-                except Exception as e:
-                    print(f"      [ERROR] Failed to force delete {alarm_type} alarm {alarm_name}: {str(e)}")
-                    self.log_operation('ERROR', f"Failed to force delete {alarm_type} alarm {alarm_name}: {str(e)}")
-
-            return deleted_count
-
-        except Exception as e:
-            self.log_operation('ERROR', f"Error in force deletion: {str(e)}")
-            return 0
-
     def is_alarm_related_to_cluster(self, alarm_name: str, cluster_name: str) -> bool:
         """Enhanced method to check if an alarm is related to the specified cluster"""
-        alarm_name_lower = alarm_name.lower()
-        cluster_name_lower = cluster_name.lower()
-
-        # Direct cluster name match
-        if cluster_name_lower in alarm_name_lower:
-            return True
-
-        # Common alarm naming patterns
-        alarm_patterns = [
-            f"{cluster_name_lower}-",
-            f"-{cluster_name_lower}-",
-            f"-{cluster_name_lower}",
-            cluster_name_lower.replace("-", "_"),
-            cluster_name_lower.replace("_", "-"),
-            cluster_name_lower.replace("-", "")
-        ]
-
-        for pattern in alarm_patterns:
-            if pattern in alarm_name_lower:
-                return True
-
-        # Check for cluster suffix patterns (last part of cluster name)
-        cluster_parts = cluster_name_lower.split('-')
-        if len(cluster_parts) > 1:
-            cluster_suffix = cluster_parts[-1]
-            if len(cluster_suffix) >= 4:  # Only check suffixes that are meaningful
-                suffix_patterns = [
-                    f"-{cluster_suffix}-",
-                    f"-{cluster_suffix}",
-                    f"{cluster_suffix}-"
-                ]
-
-                for pattern in suffix_patterns:
-                    if pattern in alarm_name_lower:
-                        return True
-
-        # Check for EKS-specific patterns
-        eks_patterns = [
-            f"eks-{cluster_name_lower}",
-            f"eks-cluster-{cluster_name_lower}",
-            f"{cluster_name_lower}-pod-",
-            f"{cluster_name_lower}-node-",
-            f"{cluster_name_lower}-container-"
-        ]
-
-        for pattern in eks_patterns:
-            if pattern in alarm_name_lower:
-                return True
-
-        return False
-
-    def is_cost_alarm_for_cluster(self, alarm_name: str, cluster_name: str) -> bool:
-        """Enhanced method to check if an alarm is a cost alarm for the specified cluster"""
-        # Cost alarm naming patterns
-        cost_patterns = [
-            f"{cluster_name.lower()}-daily-cost",
-            f"{cluster_name.lower()}-cost",
-            f"{cluster_name.lower()}-ec2-cost",
-            f"{cluster_name.lower()}-ebs-cost",
-            f"{cluster_name.lower()}-billing",
-            f"cost-{cluster_name.lower()}",
-            f"billing-{cluster_name.lower()}",
-            f"budget-{cluster_name.lower()}"
-        ]
-
-        alarm_name_lower = alarm_name.lower()
-
-        for pattern in cost_patterns:
-            if pattern in alarm_name_lower:
-                return True
-
-        # Check for cluster suffix in cost alarms
-        cluster_parts = cluster_name.split('-')
-        if len(cluster_parts) > 1:
-            cluster_suffix = cluster_parts[-1]
-            if len(cluster_suffix) >= 4:
-                suffix_cost_patterns = [
-                    f"{cluster_suffix}-daily-cost",
-                    f"{cluster_suffix}-cost",
-                    f"cost-{cluster_suffix}",
-                    f"billing-{cluster_suffix}"
-                ]
-
-                for pattern in suffix_cost_patterns:
-                    if pattern.lower() in alarm_name_lower:
-                        return True
-
-        return False
+        return cluster_name in ClusterAlarmMatcher([cluster_name]).clusters_for_name(alarm_name)
 
     ##############
     def delete_all_cloudwatch_alarms_bk(self, access_key: str, secret_key: str, region: str, cluster_name: str) -> bool:
@@ -1595,7 +1637,7 @@ class UltraCleanupEKSManager:
                     alarm_name = alarm['AlarmName']
 
                     # Check for cost-related alarm names
-                    if self.is_cost_alarm_for_cluster(alarm_name, cluster_name):
+                    if self.is_alarm_related_to_cluster(alarm_name, cluster_name):
                         cost_alarms.append(alarm_name)
                         continue
 
@@ -1981,12 +2023,12 @@ class UltraCleanupEKSManager:
     def create_eks_client(self, access_key, secret_key, region):
         """Create EKS client using account credentials"""
         try:
-            eks_client = boto3.client(
-                'eks',
+            session = boto3.session.Session(
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 region_name=region
             )
+            eks_client = session.client('eks')
 
             # Test the connection
             eks_client.list_clusters()
@@ -2005,68 +2047,55 @@ class UltraCleanupEKSManager:
             self.log_operation('INFO', f"[SCAN] Scanning for EKS clusters in {region} ({account_name})")
             print(f"   [SCAN] Scanning for EKS clusters in {region} ({account_name})...")
 
-            cluster_names = eks_client.list_clusters()['clusters']
+            inventory = self.inventory_collector.collect(eks_client, (account_info['access_key'], region))
 
-            if not cluster_names:
+            if not inventory:
                 self.log_operation('INFO', f"No EKS clusters found in {region} ({account_name})")
                 print(f"   [PACKAGE] No EKS clusters found in {region}")
                 return []
 
-            for cluster_name in cluster_names:
-                try:
-                    cluster_info = eks_client.describe_cluster(name=cluster_name)['cluster']
-
-                    # Extract relevant details
-                    cluster_status = cluster_info.get('status', 'UNKNOWN')
-                    created_at = cluster_info.get('createdAt', 'Unknown')
-                    version = cluster_info.get('version', 'Unknown')
-                    vpc_id = cluster_info.get('resourcesVpcConfig', {}).get('vpcId', 'Unknown')
+            for record in inventory:
+                cluster_name = record['name']
+                if record['error']:
+                    self.log_operation('ERROR',
+                                       f"Error getting details for cluster {cluster_name}: {record['error']}")
+                    continue
 
-                    # Get node groups for this cluster
-                    nodegroups = []
-                    try:
-                        nodegroup_names = eks_client.list_nodegroups(clusterName=cluster_name).get('nodegroups', [])
+                cluster_info = record['cluster']
+                if record['nodegroups_error']:
+                    self.log_operation('WARNING',
+                                       f"Could not list nodegroups for cluster {cluster_name}: {record['nodegroups_error']}")
 
-                        for ng_name in nodegroup_names:
-                            try:
-                                ng_details = eks_client.describe_nodegroup(
-                                    clusterName=cluster_name,
-                                    nodegroupName=ng_name
-                                ).get('nodegroup', {})
-
-                                nodegroups.append({
-                                    'name': ng_name,
-                                    'status': ng_details.get('status', 'UNKNOWN'),
-                                    'instance_types': ng_details.get('instanceTypes', []),
-                                    'ami_type': ng_details.get('amiType', 'Unknown'),
-                                    'created_at': ng_details.get('createdAt', 'Unknown'),
-                                    'min_size': ng_details.get('scalingConfig', {}).get('minSize', 0),
-                                    'max_size': ng_details.get('scalingConfig', {}).get('maxSize', 0),
-                                    'desired_size': ng_details.get('scalingConfig', {}).get('desiredSize', 0),
-                                })
-                            except Exception as ng_error:
-                                self.log_operation('WARNING',
-                                                   f"Could not get details for nodegroup {ng_name}: {str(ng_error)}")
-                    except Exception as ng_list_error:
+                # Get node groups for this cluster
+                nodegroups = []
+                for ng_record in record['nodegroups']:
+                    if ng_record['error']:
                         self.log_operation('WARNING',
-                                           f"Could not list nodegroups for cluster {cluster_name}: {str(ng_list_error)}")
-
-                    cluster_data = {
-                        'cluster_name': cluster_name,
-                        'status': cluster_status,
-                        'created_at': created_at,
-                        'version': version,
-                        'vpc_id': vpc_id,
-                        'region': region,
-                        'account_info': account_info,
-                        'nodegroups': nodegroups
-                    }
-
-                    clusters.append(cluster_data)
-
-                except Exception as cluster_error:
-                    self.log_operation('ERROR',
-                                       f"Error getting details for cluster {cluster_name}: {str(cluster_error)}")
+                                           f"Could not get details for nodegroup {ng_record['name']}: {ng_record['error']}")
+                        continue
+                    ng_details = ng_record['nodegroup']
+                    nodegroups.append({
+                        'name': ng_record['name'],
+                        'status': ng_details.get('status', 'UNKNOWN'),
+                        'instance_types': ng_details.get('instanceTypes', []),
+                        'ami_type': ng_details.get('amiType', 'Unknown'),
+                        'created_at': ng_details.get('createdAt', 'Unknown'),
+                        'min_size': ng_details.get('scalingConfig', {}).get('minSize', 0),
+                        'max_size': ng_details.get('scalingConfig', {}).get('maxSize', 0),
+                        'desired_size': ng_details.get('scalingConfig', {}).get('desiredSize', 0),
+                    })
+
+                clusters.append({
+                    'cluster_name': cluster_name,
+                    'arn': cluster_info.get('arn'),
+                    'status': cluster_info.get('status', 'UNKNOWN'),
+                    'created_at': cluster_info.get('createdAt', 'Unknown'),
+                    'version': cluster_info.get('version', 'Unknown'),
+                    'vpc_id': cluster_info.get('resourcesVpcConfig', {}).get('vpcId', 'Unknown'),
+                    'region': region,
+                    'account_info': account_info,
+                    'nodegroups': nodegroups
+                })
 
             self.log_operation('INFO', f"[PACKAGE] Found {len(clusters)} EKS clusters in {region} ({account_name})")
             print(f"   [PACKAGE] Found {len(clusters)} EKS clusters in {region} ({account_name})")
@@ -2079,8 +2108,33 @@ class UltraCleanupEKSManager:
             print(f"   [ERROR] Error getting clusters in {region}: {e}")
             return []
 
-    def delete_nodegroup(self, eks_client, cluster_name, nodegroup_name, region, account_info):
-        """Delete an EKS nodegroup"""
+    def _get_account_semaphore(self, account_key):
+        """Semaphore bounding how many clusters of one account are torn down at the same time"""
+        with self._account_semaphores_lock:
+            if account_key not in self._account_semaphores:
+                self._account_semaphores[account_key] = threading.Semaphore(
+                    self.max_concurrent_clusters_per_account)
+            return self._account_semaphores[account_key]
+
+    def _record_nodegroup_failure(self, cluster_name, nodegroup_name, region, account_info, error):
+        self.log_operation('ERROR', f"Failed to delete nodegroup {nodegroup_name}: {error}")
+        print(f"      [ERROR] Failed to delete nodegroup {nodegroup_name}: {error}")
+
+        self.cleanup_results['failed_deletions'].append({
+            'resource_type': 'nodegroup',
+            'resource_id': nodegroup_name,
+            'cluster_name': cluster_name,
+            'region': region,
+            'account_info': account_info,
+            'error': str(error)
+        })
+
+    def start_nodegroup_deletion(self, eks_client, cluster_name, nodegroup_name, region, account_info):
+        """Request deletion of an EKS nodegroup and register it with the combined waiter
+
+        Returns:
+            Future for the deletion outcome, or None if the delete request failed
+        """
         try:
             account_name = account_info.get('account_key', 'Unknown')
             self.log_operation('INFO',
@@ -2088,46 +2142,33 @@ class UltraCleanupEKSManager:
             print(f"      [DELETE]  Deleting nodegroup {nodegroup_name} in cluster {cluster_name}...")
 
             # Delete the nodegroup
+            self.rate_limiter.acquire(account_name)
             eks_client.delete_nodegroup(
                 clusterName=cluster_name,
                 nodegroupName=nodegroup_name
             )
 
-            # Wait for nodegroup deletion to complete
-            print(f"      [WAIT] Waiting for nodegroup {nodegroup_name} deletion to complete...")
             self.log_operation('INFO', f"[WAIT] Waiting for nodegroup {nodegroup_name} deletion to complete...")
+            return self.deletion_waiter.wait_for_deletion(
+                eks_client, account_name, cluster_name, nodegroup_name, timeout=1800)  # 30 minutes
 
-            waiter = True
-            retry_count = 0
-            max_retries = 60  # 30 minutes (30 * 60 seconds)
-
-            while waiter and retry_count < max_retries:
-                try:
-                    response = eks_client.describe_nodegroup(
-                        clusterName=cluster_name,
-                        nodegroupName=nodegroup_name
-                    )
-                    status = response['nodegroup']['status']
+        except Exception as e:
+            self._record_nodegroup_failure(cluster_name, nodegroup_name, region, account_info, e)
+            return None
 
-                    if status == 'DELETING':
-                        self.log_operation('INFO', f"Nodegroup {nodegroup_name} status: {status} (Waiting...)")
-                        time.sleep(30)  # Check every 30 seconds
-                        retry_count += 1
-                    else:
-                        self.log_operation('WARNING', f"Unexpected nodegroup status: {status}")
-                        break
-                except ClientError as e:
-                    if 'ResourceNotFoundException' in str(e):
-                        self.log_operation('INFO', f"[OK] Nodegroup {nodegroup_name} deleted successfully")
-                        print(f"      [OK] Nodegroup {nodegroup_name} deleted successfully")
-                        waiter = False
-                    else:
-                        self.log_operation('ERROR', f"Error checking nodegroup status: {e}")
-                        raise
+    def finish_nodegroup_deletion(self, future, cluster_name, nodegroup_name, region, account_info):
+        """Wait for a nodegroup deletion registered by start_nodegroup_deletion and record the result"""
+        try:
+            outcome = future.result()
 
-            if retry_count >= max_retries:
+            if outcome == 'DELETED':
+                self.log_operation('INFO', f"[OK] Nodegroup {nodegroup_name} deleted successfully")
+                print(f"      [OK] Nodegroup {nodegroup_name} deleted successfully")
+            elif outcome == 'TIMEOUT':
                 self.log_operation('WARNING', f"Timed out waiting for nodegroup {nodegroup_name} deletion")
                 print(f"      [WARN] Timed out waiting for nodegroup {nodegroup_name} deletion")
+            else:
+                self.log_operation('WARNING', f"Unexpected nodegroup status: {outcome}")
 
             self.cleanup_results['deleted_nodegroups'].append({
                 'nodegroup_name': nodegroup_name,
@@ -2140,136 +2181,245 @@ class UltraCleanupEKSManager:
             return True
 
         except Exception as e:
-            account_name = account_info.get('account_key', 'Unknown')
-            self.log_operation('ERROR', f"Failed to delete nodegroup {nodegroup_name}: {e}")
-            print(f"      [ERROR] Failed to delete nodegroup {nodegroup_name}: {e}")
+            self._record_nodegroup_failure(cluster_name, nodegroup_name, region, account_info, e)
+            return False
 
-            self.cleanup_results['failed_deletions'].append({
-                'resource_type': 'nodegroup',
-                'resource_id': nodegroup_name,
-                'cluster_name': cluster_name,
-                'region': region,
-                'account_info': account_info,
-                'error': str(e)
-            })
+    def delete_nodegroup(self, eks_client, cluster_name, nodegroup_name, region, account_info):
+        """Delete an EKS nodegroup and wait for the deletion to complete"""
+        future = self.start_nodegroup_deletion(eks_client, cluster_name, nodegroup_name, region, account_info)
+        if future is None:
             return False
+        return self.finish_nodegroup_deletion(future, cluster_name, nodegroup_name, region, account_info)
+
+    def _cluster_checkpoint_path(self, cluster_info):
+        account_name = cluster_info['account_info'].get('account_key', 'Unknown')
+        return os.path.join(self.checkpoint_dir,
+                            f"{account_name}_{cluster_info['region']}_{cluster_info['cluster_name']}.json")
+
+    @staticmethod
+    def _cluster_identity(cluster_info) -> Dict[str, str]:
+        """ARN and creation time; tell a cluster apart from an earlier one with the same name"""
+        return {
+            'cluster_arn': cluster_info.get('arn'),
+            'created_at': str(cluster_info.get('created_at', 'Unknown'))
+        }
 
-    def delete_cluster(self, eks_client, cluster_info):
-        """Delete an EKS cluster with all its nodegroups"""
-        try:
-            cluster_name = cluster_info['cluster_name']
-            region = cluster_info['region']
-            account_name = cluster_info['account_info'].get('account_key', 'Unknown')
-            nodegroups = cluster_info.get('nodegroups', [])
+    def load_cluster_checkpoint(self, cluster_info) -> List[str]:
+        """Get the deletion steps already completed for this cluster by an earlier run
 
-            self.log_operation('INFO', f"[DELETE]  Deleting EKS cluster {cluster_name} in {region} ({account_name})")
-            print(f"   [DELETE]  Deleting EKS cluster {cluster_name} in {region} ({account_name})...")
+        A checkpoint left by an earlier cluster with the same name is discarded.
+        """
+        checkpoint_path = self._cluster_checkpoint_path(cluster_info)
+        try:
+            if os.path.exists(checkpoint_path):
+                with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                    checkpoint = json.load(f)
+                identity = self._cluster_identity(cluster_info)
+                if any(checkpoint.get(key) != value for key, value in identity.items()):
+                    self.log_operation('WARNING', f"Discarding deletion checkpoint {checkpoint_path}: "
+                                                  f"it belongs to an earlier cluster named {cluster_info['cluster_name']}")
+                    self.clear_cluster_checkpoint(cluster_info)
+                    return []
+                return checkpoint.get('completed_steps', [])
+        except Exception as e:
+            self.log_operation('WARNING', f"Could not read deletion checkpoint {checkpoint_path}: {e}")
+        return []
 
-            # Step 1: Delete all nodegroups first
-            if nodegroups:
-                self.log_operation('INFO', f"Found {len(nodegroups)} nodegroups to delete in cluster {cluster_name}")
-                print(f"      Found {len(nodegroups)} nodegroups to delete in cluster {cluster_name}")
+    def save_cluster_checkpoint(self, cluster_info, completed_steps, step_timings):
+        """Persist the completed deletion steps so a failed delete can resume where it stopped
 
-                for nodegroup in nodegroups:
-                    nodegroup_name = nodegroup['name']
-                    self.delete_nodegroup(eks_client, cluster_name, nodegroup_name, region,
-                                          cluster_info['account_info'])
+        Once the control plane is gone there is nothing left to resume, so the checkpoint is removed.
+        """
+        try:
+            if 'control_plane' in completed_steps:
+                self.clear_cluster_checkpoint(cluster_info)
+                return
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            with open(self._cluster_checkpoint_path(cluster_info), 'w', encoding='utf-8') as f:
+                json.dump({
+                    'cluster_name': cluster_info['cluster_name'],
+                    **self._cluster_identity(cluster_info),
+                    'region': cluster_info['region'],
+                    'account_key': cluster_info['account_info'].get('account_key', 'Unknown'),
+                    'completed_steps': completed_steps,
+                    'step_timings': step_timings,
+                    'updated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }, f, indent=2)
+        except Exception as e:
+            self.log_operation('WARNING', f"Could not save deletion checkpoint for {cluster_info['cluster_name']}: {e}")
+
+    def clear_cluster_checkpoint(self, cluster_info):
+        checkpoint_path = self._cluster_checkpoint_path(cluster_info)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+    def _delete_cluster_nodegroups(self, eks_client, cluster_info):
+        """Request deletion of all nodegroups at once, then wait for all of them"""
+        cluster_name = cluster_info['cluster_name']
+        region = cluster_info['region']
+        nodegroups = cluster_info.get('nodegroups', [])
+
+        if not nodegroups:
+            self.log_operation('INFO', f"No nodegroups found in cluster {cluster_name}")
+            print(f"      No nodegroups found in cluster {cluster_name}")
+            return
+
+        self.log_operation('INFO', f"Found {len(nodegroups)} nodegroups to delete in cluster {cluster_name}")
+        print(f"      Found {len(nodegroups)} nodegroups to delete in cluster {cluster_name}")
+
+        nodegroup_futures = []
+        failed = []
+        for nodegroup in nodegroups:
+            future = self.start_nodegroup_deletion(eks_client, cluster_name, nodegroup['name'], region,
+                                                   cluster_info['account_info'])
+            if future is None:
+                failed.append(nodegroup['name'])
             else:
-                self.log_operation('INFO', f"No nodegroups found in cluster {cluster_name}")
-                print(f"      No nodegroups found in cluster {cluster_name}")
-
-            # Get account credentials from account info
-            access_key = cluster_info['account_info']['access_key']
-            secret_key = cluster_info['account_info']['secret_key']
-
-            # STEP 2: Delete all monitoring scrapers for this cluster
-            self.delete_eks_scrapers(
-                access_key,
-                secret_key,
-                region,
-                cluster_name
-            )
+                nodegroup_futures.append((nodegroup['name'], future))
 
-            # STEP 3: Delete all CloudWatch alarms for this cluster
-            self.delete_all_cloudwatch_alarms(
-                access_key,
-                secret_key,
-                region,
-                cluster_name
-            )
+        print(f"      [WAIT] Waiting for {len(nodegroup_futures)} nodegroup deletions to complete...")
+        for nodegroup_name, future in nodegroup_futures:
+            if not self.finish_nodegroup_deletion(future, cluster_name, nodegroup_name, region,
+                                                  cluster_info['account_info']):
+                failed.append(nodegroup_name)
 
-            # STEP 4: Delete EventBridge rules related to this cluster
-            self.delete_related_event_rules(access_key, secret_key, region, cluster_name)
+        if failed:
+            raise RuntimeError(f"Failed to delete nodegroups: {', '.join(failed)}")
 
-            # STEP 5: Delete Lambda functions related to this cluster
-            self.delete_all_lambda_functions(
-                access_key,
-                secret_key,
-                region,
-                cluster_name
-            )
+    def _delete_cluster_control_plane(self, eks_client, cluster_info):
+        """Delete the cluster itself and wait for the deletion to complete"""
+        cluster_name = cluster_info['cluster_name']
+        account_name = cluster_info['account_info'].get('account_key', 'Unknown')
 
-            # STEP 6: Delete IAM roles and policies related to this cluster
-            self.delete_all_iam_roles_policies(
-                access_key,
-                secret_key,
-                region,
-                cluster_name
-            )
+        self.log_operation('INFO', f"Deleting the cluster {cluster_name}...")
+        print(f"   [DELETE]  Deleting the cluster {cluster_name}...")
 
-            # STEP 7: Delete security groups related to this cluster
-            if cluster_info.get('vpc_id') and cluster_info['vpc_id'] != 'Unknown':
-                self.delete_all_security_groups(
-                    access_key,
-                    secret_key,
-                    region,
-                    cluster_name,
-                    cluster_info['vpc_id']
-                )
+        self.rate_limiter.acquire(account_name)
+        eks_client.delete_cluster(name=cluster_name)
 
-            # STEP 8: Delete all EKS add-ons for this cluster
-            self.delete_all_eks_addons(eks_client, cluster_name)
+        # Wait for cluster deletion to complete
+        self.log_operation('INFO', f"[WAIT] Waiting for cluster {cluster_name} deletion to complete...")
+        print(f"   [WAIT] Waiting for cluster {cluster_name} deletion to complete...")
 
-            # Step 9: Delete the cluster itself
-            self.log_operation('INFO', f"Deleting the cluster {cluster_name}...")
-            print(f"   [DELETE]  Deleting the cluster {cluster_name}...")
+        outcome = self.deletion_waiter.wait_for_deletion(
+            eks_client, account_name, cluster_name, timeout=3600).result()  # 60 minutes
 
-            eks_client.delete_cluster(name=cluster_name)
+        # Anything but DELETED fails the step so the checkpoint survives and a rerun retries it
+        if outcome == 'TIMEOUT':
+            raise RuntimeError(f"Timed out waiting for cluster {cluster_name} deletion")
+        if outcome != 'DELETED':
+            raise RuntimeError(f"Unexpected cluster status while deleting {cluster_name}: {outcome}")
 
-            # Wait for cluster deletion to complete
-            self.log_operation('INFO', f"[WAIT] Waiting for cluster {cluster_name} deletion to complete...")
-            print(f"   [WAIT] Waiting for cluster {cluster_name} deletion to complete...")
+        self.log_operation('INFO', f"[OK] Cluster {cluster_name} deleted successfully")
+        print(f"   [OK] Cluster {cluster_name} deleted successfully")
 
-            waiter = True
-            retry_count = 0
-            max_retries = 120  # 60 minutes (120 * 30 seconds)
+    def build_cluster_deletion_graph(self, eks_client, cluster_info) -> DeletionStepGraph:
+        """Build the cluster deletion recipe as a dependency graph
 
-            while waiter and retry_count < max_retries:
-                try:
-                    response = eks_client.describe_cluster(name=cluster_name)
-                    status = response['cluster']['status']
-
-                    if status == 'DELETING':
-                        if retry_count % 10 == 0:  # Log every 5 minutes
-                            self.log_operation('INFO', f"Cluster {cluster_name} status: {status} (Waiting...)")
-                            print(f"   ⌛ Cluster {cluster_name} status: {status} (Still deleting...)")
-                        time.sleep(30)  # Check every 30 seconds
-                        retry_count += 1
-                    else:
-                        self.log_operation('WARNING', f"Unexpected cluster status: {status}")
-                        break
-                except ClientError as e:
-                    if 'ResourceNotFoundException' in str(e) or 'ResourceNotFound' in str(e):
-                        self.log_operation('INFO', f"[OK] Cluster {cluster_name} deleted successfully")
-                        print(f"   [OK] Cluster {cluster_name} deleted successfully")
-                        waiter = False
-                    else:
-                        self.log_operation('ERROR', f"Error checking cluster status: {e}")
-                        raise
+        Scrapers, alarms, EventBridge rules and Lambda functions do not depend on anything and run
+        while the nodegroups drain. Security groups and add-ons wait for the nodegroups, the control
+        plane waits for them, and IAM roles go once the control plane and the Lambda functions are gone.
+
+        Only nodegroups, add-ons and the control plane are required; the other steps are best-effort
+        cleanup whose failure is reported as a warning without holding up the rest of the graph.
+        """
+        cluster_name = cluster_info['cluster_name']
+        region = cluster_info['region']
+        access_key = cluster_info['account_info']['access_key']
+        secret_key = cluster_info['account_info']['secret_key']
+        vpc_id = cluster_info.get('vpc_id')
+
+        def checked(step_name, func, *args):
+            # Helpers report failure by returning False; treat that as a failed step
+            def run_step():
+                if func(*args) is False:
+                    raise RuntimeError(f"{step_name} step reported failure")
+            return run_step
+
+        def delete_security_groups():
+            if vpc_id and vpc_id != 'Unknown':
+                checked('security_groups', self.delete_all_security_groups,
+                         access_key, secret_key, region, cluster_name, vpc_id)()
+
+        graph = DeletionStepGraph(max_workers=5)
+        graph.add_step('nodegroups', lambda: self._delete_cluster_nodegroups(eks_client, cluster_info))
+        graph.add_step('scrapers', checked('scrapers', self.delete_eks_scrapers,
+                                           access_key, secret_key, region, cluster_name), optional=True)
+        graph.add_step('alarms', checked('alarms', self.delete_all_cloudwatch_alarms,
+                                         access_key, secret_key, region, cluster_name), optional=True)
+        graph.add_step('event_rules', checked('event_rules', self.delete_related_event_rules,
+                                              access_key, secret_key, region, cluster_name), optional=True)
+        graph.add_step('lambdas', checked('lambdas', self.delete_all_lambda_functions,
+                                          access_key, secret_key, region, cluster_name), optional=True)
+        graph.add_step('security_groups', delete_security_groups, depends_on=['nodegroups'], optional=True)
+        graph.add_step('addons', checked('addons', self.delete_all_eks_addons, eks_client, cluster_name),
+                       depends_on=['nodegroups'])
+        graph.add_step('control_plane', lambda: self._delete_cluster_control_plane(eks_client, cluster_info),
+                       depends_on=['nodegroups', 'security_groups', 'addons'])
+        # The cluster role is still needed while the control plane is being deleted
+        graph.add_step('iam_roles', checked('iam_roles', self.delete_all_iam_roles_policies,
+                                            access_key, secret_key, region, cluster_name),
+                       depends_on=['control_plane', 'lambdas'], optional=True)
+        return graph
+
+    def delete_cluster(self, eks_client, cluster_info):
+        """Delete an EKS cluster with all its nodegroups by executing its deletion graph
 
-            if retry_count >= max_retries:
-                self.log_operation('WARNING', f"Timed out waiting for cluster {cluster_name} deletion")
-                print(f"   [WARN] Timed out waiting for cluster {cluster_name} deletion")
+        Completed steps are checkpointed; if a step fails, the next run resumes from that step.
+        """
+        try:
+            cluster_name = cluster_info['cluster_name']
+            region = cluster_info['region']
+            account_name = cluster_info['account_info'].get('account_key', 'Unknown')
+
+            self.log_operation('INFO', f"[DELETE]  Deleting EKS cluster {cluster_name} in {region} ({account_name})")
+            print(f"   [DELETE]  Deleting EKS cluster {cluster_name} in {region} ({account_name})...")
+
+            completed_steps = self.load_cluster_checkpoint(cluster_info)
+            if completed_steps:
+                self.log_operation('INFO', f"Resuming deletion of {cluster_name}; already done: {', '.join(completed_steps)}")
+                print(f"      [RESUME] Skipping completed steps: {', '.join(completed_steps)}")
+
+            step_timings = {}
+
+            def on_step_done(step, status, seconds, error):
+                step_timings[step] = seconds
+                self.cleanup_results['step_timings'].append({
+                    'cluster_name': cluster_name,
+                    'region': region,
+                    'account_key': account_name,
+                    'step': step,
+                    'status': status,
+                    'seconds': seconds,
+                    'error': error
+                })
+                if status == 'completed':
+                    completed_steps.append(step)
+                    self.save_cluster_checkpoint(cluster_info, completed_steps, step_timings)
+                    self.log_operation('INFO', f"[TIMER] {cluster_name}: step {step} completed in {seconds}s")
+                elif status == 'warning':
+                    self.log_operation('WARNING', f"{cluster_name}: optional step {step} failed after {seconds}s, "
+                                                  f"continuing: {error}")
+                    print(f"      [WARN] {cluster_name}: {step} cleanup failed, continuing: {error}")
+                else:
+                    self.log_operation('ERROR', f"{cluster_name}: step {step} failed after {seconds}s: {error}")
+
+            graph = self.build_cluster_deletion_graph(eks_client, cluster_info)
+            outcome = graph.run(completed=list(completed_steps), on_step_done=on_step_done)
+
+            if outcome['failed']:
+                failed_steps = ', '.join(f"{step} ({error})" for step, error in outcome['failed'].items())
+                raise RuntimeError(f"Deletion steps failed: {failed_steps}; skipped: {', '.join(outcome['skipped']) or 'none'} "
+                                   f"(checkpoint kept, rerun to resume)")
+
+            self.clear_cluster_checkpoint(cluster_info)
+
+            if outcome['warnings']:
+                self.log_operation('WARNING', f"{cluster_name} deleted; best-effort steps failed: "
+                                              f"{', '.join(outcome['warnings'])}")
+
+            timing_summary = ', '.join(f"{step}={seconds}s" for step, seconds in step_timings.items())
+            print(f"   [TIMER]  {cluster_name} step timings: {timing_summary}")
 
             self.cleanup_results['deleted_clusters'].append({
                 'cluster_name': cluster_name,
@@ -2277,6 +2427,8 @@ class UltraCleanupEKSManager:
                 'vpc_id': cluster_info['vpc_id'],
                 'region': region,
                 'account_info': cluster_info['account_info'],
+                'step_timings': step_timings,
+                'cleanup_warnings': outcome['warnings'],
                 'deleted_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             })
 
@@ -2340,26 +2492,40 @@ class UltraCleanupEKSManager:
             print(
                 f"   [STATS] EKS resources found: {len(clusters)} clusters, {region_summary['nodegroups_found']} nodegroups")
 
-            # Delete each cluster
+            # Share one alarm snapshot between all clusters of the region
+            self.register_region_clusters(access_key, region, [cluster['cluster_name'] for cluster in clusters])
+
+            # Delete clusters concurrently, bounded per account
             deleted_count = 0
             failed_count = 0
+            account_semaphore = self._get_account_semaphore(account_key)
 
-            for i, cluster in enumerate(clusters, 1):
-                cluster_name = cluster['cluster_name']
-                print(f"   [{i}/{len(clusters)}] Processing cluster {cluster_name}...")
+            def delete_cluster_limited(cluster):
+                with account_semaphore:
+                    return self.delete_cluster(eks_client, cluster)
 
-                try:
-                    if self.delete_cluster(eks_client, cluster):
-                        deleted_count += 1
-                    else:
+            with ThreadPoolExecutor(max_workers=max(1, len(clusters))) as executor:
+                future_to_cluster = {executor.submit(delete_cluster_limited, cluster): cluster
+                                     for cluster in clusters}
+
+                for i, future in enumerate(as_completed(future_to_cluster), 1):
+                    cluster_name = future_to_cluster[future]['cluster_name']
+                    try:
+                        if future.result():
+                            deleted_count += 1
+                        else:
+                            failed_count += 1
+                    except Exception as e:
                         failed_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    self.log_operation('ERROR', f"Error deleting cluster {cluster_name}: {e}")
-                    print(f"   [ERROR] Error deleting cluster {cluster_name}: {e}")
+                        self.log_operation('ERROR', f"Error deleting cluster {cluster_name}: {e}")
+                        print(f"   [ERROR] Error deleting cluster {cluster_name}: {e}")
+                    print(f"   [{i}/{len(clusters)}] Finished cluster {cluster_name} ({account_key}, {region})")
 
             print(f"   [OK] Deleted {deleted_count} clusters, [ERROR] Failed: {failed_count}")
 
+            # The cached inventory of this region no longer reflects reality
+            self.inventory_collector.cache.invalidate((access_key, region))
+
             self.log_operation('INFO', f"[OK] EKS cleanup completed for {account_key} ({region})")
             print(f"\n   [OK] EKS cleanup completed for {account_key} ({region})")
             return True
@@ -2487,6 +2653,7 @@ class UltraCleanupEKSManager:
                     "deleted_nodegroups": self.cleanup_results['deleted_nodegroups'],
                     "failed_deletions": self.cleanup_results['failed_deletions'],
                     "skipped_resources": self.cleanup_results['skipped_resources'],
+                    "step_timings": self.cleanup_results['step_timings'],
                     "errors": self.cleanup_results['errors']
                 }
             }
@@ -2502,7 +2669,7 @@ class UltraCleanupEKSManager:
             return None
 
     def run(self):
-        """Main execution method - sequential (no threading)"""
+        """Main execution method - (account, region) tasks and their clusters are torn down concurrently"""
         try:
             self.log_operation('INFO', "[ALERT] STARTING ULTRA EKS CLEANUP SESSION [ALERT]")
 
@@ -2572,7 +2739,7 @@ class UltraCleanupEKSManager:
                 self.print_colored(Colors.RED, "[ERROR] Cleanup cancelled")
                 return
 
-            # STEP 4: Start the cleanup sequentially
+            # STEP 4: Start the cleanup concurrently
             self.print_colored(Colors.CYAN, f"\n[START] Starting EKS cleanup...")
             self.log_operation('INFO',
                                f"[ALERT] EKS CLEANUP INITIATED - {len(selected_accounts)} accounts, {len(selected_regions)} regions")
@@ -2588,21 +2755,28 @@ class UltraCleanupEKSManager:
                 for region in selected_regions:
                     tasks.append((account_info, region))
 
-            # Process each task sequentially
-            for i, (account_info, region) in enumerate(tasks, 1):
-                account_key = account_info.get('account_key', 'Unknown')
-                self.print_colored(Colors.CYAN, f"\n[{i}/{len(tasks)}] Processing {account_key} in {region}...")
-
-                try:
-                    success = self.cleanup_account_region(account_info, region)
-                    if success:
-                        successful_tasks += 1
-                    else:
+            # Process tasks in parallel; clusters within a task are deleted in parallel as well
+            self.print_colored(Colors.CYAN, f"[START] Running {len(tasks)} tasks with up to "
+                                            f"{self.max_parallel_tasks} in parallel "
+                                            f"({self.max_concurrent_clusters_per_account} clusters per account)")
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_parallel_tasks, len(tasks)))) as executor:
+                future_to_task = {executor.submit(self.cleanup_account_region, account_info, region): (account_info, region)
+                                  for account_info, region in tasks}
+
+                for i, future in enumerate(as_completed(future_to_task), 1):
+                    account_info, region = future_to_task[future]
+                    account_key = account_info.get('account_key', 'Unknown')
+                    try:
+                        success = future.result()
+                        if success:
+                            successful_tasks += 1
+                        else:
+                            failed_tasks += 1
+                        self.print_colored(Colors.CYAN, f"\n[{i}/{len(tasks)}] Finished {account_key} in {region}")
+                    except Exception as e:
                         failed_tasks += 1
-                except Exception as e:
-                    failed_tasks += 1
-                    self.log_operation('ERROR', f"Task failed for {account_key} ({region}): {e}")
-                    self.print_colored(Colors.RED, f"[ERROR] Task failed for {account_key} ({region}): {e}")
+                        self.log_operation('ERROR', f"Task failed for {account_key} ({region}): {e}")
+                        self.print_colored(Colors.RED, f"[ERROR] Task failed for {account_key} ({region}): {e}")
 
             end_time = time.time()
             total_time = int(end_time - start_time)
@@ -3,7 +3,7 @@
 Ultra S3 Cleanup Manager
 Comprehensive S3 bucket cleanup across multiple AWS accounts
 - Disables versioning
-- Deletes all object versions
+- Deletes all object versions (pipelined batch deletes, or lifecycle expiry for giant buckets)
 - Removes bucket policies, notifications, lifecycle rules, CORS, website config
 - Deletes all buckets (with exclusion list support)
 """
@@ -16,11 +16,16 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import boto3
 import json
+import queue
+import threading
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 from root_iam_credential_manager import AWSCredentialManager
 
+# delete_all_objects result for a bucket handed to lifecycle expiry (deleted once it is empty)
+LIFECYCLE_EXPIRING = 'expiring'
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -59,6 +64,20 @@ class UltraCleanupS3Manager:
         
         # Excluded buckets (to be skipped during cleanup)
         self.excluded_buckets = []
+
+        # Object deletion settings
+        # delete_mode: 'batch' (pipelined delete_objects), 'lifecycle' (lifecycle expiry for every bucket)
+        # or 'auto' (lifecycle expiry only for buckets above lifecycle_object_threshold objects)
+        self.delete_mode = 'batch'
+        self.delete_batch_size = 1000  # delete_objects limit
+        self.delete_workers = 8
+        self.delete_queue_size = 32
+        self.delete_max_retries = 5
+        self.lifecycle_object_threshold = 5000000
+        self.lifecycle_poll_interval = 300
+        self.lifecycle_max_wait_hours = 48
+        # Buckets waiting for lifecycle expiry; polled together after every account is processed
+        self.lifecycle_pending = []
         
         # Cleanup results tracking
         self.cleanup_results = {
@@ -70,6 +89,7 @@ class UltraCleanupS3Manager:
             'policies_removed': [],
             'notifications_removed': [],
             'lifecycle_removed': [],
+            'lifecycle_expiry': [],
             'cors_removed': [],
             'website_removed': [],
             'encryption_removed': [],
@@ -92,61 +112,285 @@ class UltraCleanupS3Manager:
         with open(self.log_file, 'a') as f:
             f.write(log_entry)
 
-    def delete_all_objects(self, s3_client, bucket_name, region):
-        """Delete all objects and versions from a bucket"""
+    def _delete_batch_with_retry(self, s3_client, bucket_name, batch):
+        """Delete one batch of up to 1000 keys, retrying throttled calls and per-key failures
+
+        Returns:
+            (deleted_count, failed_keys) where failed_keys are the entries that still
+            failed after all retries, each with its last error code
+        """
+        pending = batch
+        attempt = 0
+        last_errors = {}
+
+        while pending and attempt <= self.delete_max_retries:
+            if attempt:
+                # Exponential backoff with a cap for SlowDown / InternalError responses
+                time.sleep(min(2 ** attempt * 0.5, 20))
+            attempt += 1
+
+            try:
+                response = s3_client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={'Objects': pending, 'Quiet': True}
+                )
+            except ClientError as e:
+                # Whole request rejected (typically throttling) - retry the full batch
+                last_errors = {(obj['Key'], obj.get('VersionId')): e.response['Error']['Code'] for obj in pending}
+                continue
+
+            # Quiet mode only reports the keys that failed
+            errors = response.get('Errors', [])
+            last_errors = {(err['Key'], err.get('VersionId')): err.get('Code', 'Unknown') for err in errors}
+            pending = [obj for obj in pending if (obj['Key'], obj.get('VersionId')) in last_errors]
+
+        failed_keys = [
+            {'Key': obj['Key'], 'VersionId': obj.get('VersionId'),
+             'Code': last_errors.get((obj['Key'], obj.get('VersionId')), 'Unknown')}
+            for obj in pending
+        ]
+        return len(batch) - len(pending), failed_keys
+
+    def _iter_version_batches(self, s3_client, bucket_name):
+        """Yield batches of up to 1000 {'Key', 'VersionId'} entries (versions and delete markers)"""
+        paginator = s3_client.get_paginator('list_object_versions')
+        batch = []
+
+        for page in paginator.paginate(Bucket=bucket_name):
+            for entry in page.get('Versions', []) + page.get('DeleteMarkers', []):
+                batch.append({'Key': entry['Key'], 'VersionId': entry['VersionId']})
+                if len(batch) == self.delete_batch_size:
+                    yield batch
+                    batch = []
+
+        if batch:
+            yield batch
+
+    def estimate_bucket_object_count(self, cloudwatch_client, bucket_name):
+        """Get the bucket object count from the daily S3 storage metric (None if unavailable)"""
         try:
-            self.print_colored(Colors.CYAN, f"   [DELETE] Deleting all objects and versions...")
-            
-            # List and delete all object versions
-            paginator = s3_client.get_paginator('list_object_versions')
-            delete_count = 0
-            
-            for page in paginator.paginate(Bucket=bucket_name):
-                objects_to_delete = []
-                
-                # Add all versions
-                if 'Versions' in page:
-                    for version in page['Versions']:
-                        objects_to_delete.append({
-                            'Key': version['Key'],
-                            'VersionId': version['VersionId']
-                        })
-                
-                # Add all delete markers
-                if 'DeleteMarkers' in page:
-                    for marker in page['DeleteMarkers']:
-                        objects_to_delete.append({
-                            'Key': marker['Key'],
-                            'VersionId': marker['VersionId']
-                        })
-                
-                # Delete in batches of 1000 (AWS limit)
-                if objects_to_delete:
-                    s3_client.delete_objects(
-                        Bucket=bucket_name,
-                        Delete={'Objects': objects_to_delete, 'Quiet': True}
-                    )
-                    delete_count += len(objects_to_delete)
-            
-            if delete_count > 0:
-                self.print_colored(Colors.GREEN, f"   [OK] Deleted {delete_count} objects/versions")
-                self.log_action(f"Deleted {delete_count} objects/versions from {bucket_name}")
-                self.cleanup_results['objects_deleted'].append({
-                    'bucket': bucket_name,
-                    'region': region,
-                    'count': delete_count
-                })
-            else:
-                self.print_colored(Colors.YELLOW, f"   [SKIP] No objects found")
-                
-            return True
-            
+            end_time = datetime.utcnow()
+            response = cloudwatch_client.get_metric_statistics(
+                Namespace='AWS/S3',
+                MetricName='NumberOfObjects',
+                Dimensions=[
+                    {'Name': 'BucketName', 'Value': bucket_name},
+                    {'Name': 'StorageType', 'Value': 'AllStorageTypes'}
+                ],
+                StartTime=end_time - timedelta(days=3),
+                EndTime=end_time,
+                Period=86400,
+                Statistics=['Average']
+            )
+            datapoints = sorted(response.get('Datapoints', []), key=lambda point: point['Timestamp'])
+            if datapoints:
+                return int(datapoints[-1]['Average'])
         except ClientError as e:
-            error_msg = f"Failed to delete objects from {bucket_name}: {e}"
+            self.log_action(f"Could not read object count for {bucket_name}: {e}", "WARNING")
+        return None
+
+    def expire_objects_with_lifecycle(self, s3_client, bucket_name, region):
+        """Apply expire-everything lifecycle rules to a giant bucket and return without waiting
+
+        Returns:
+            LIFECYCLE_EXPIRING once the rules are in place (see wait_for_lifecycle_expiry), False on failure
+        """
+        try:
+            self.print_colored(Colors.CYAN, f"   [LIFECYCLE] Applying expire-everything lifecycle rules...")
+            s3_client.put_bucket_lifecycle_configuration(
+                Bucket=bucket_name,
+                LifecycleConfiguration={
+                    'Rules': [
+                        {
+                            'ID': 'ultra-cleanup-expire-all',
+                            'Status': 'Enabled',
+                            'Filter': {'Prefix': ''},
+                            'Expiration': {'Days': 1},
+                            'NoncurrentVersionExpiration': {'NoncurrentDays': 1},
+                            'AbortIncompleteMultipartUpload': {'DaysAfterInitiation': 1}
+                        },
+                        {
+                            'ID': 'ultra-cleanup-expire-delete-markers',
+                            'Status': 'Enabled',
+                            'Filter': {'Prefix': ''},
+                            'Expiration': {'ExpiredObjectDeleteMarker': True}
+                        }
+                    ]
+                }
+            )
+            self.log_action(f"Applied lifecycle expiry rules to {bucket_name}")
+            self.cleanup_results['lifecycle_expiry'].append({'bucket': bucket_name, 'region': region,
+                                                             'status': LIFECYCLE_EXPIRING})
+            return LIFECYCLE_EXPIRING
+
+        except ClientError as e:
+            error_msg = f"Failed to expire objects in {bucket_name} via lifecycle: {e}"
             self.print_colored(Colors.RED, f"   [ERROR] {error_msg}")
             self.log_action(error_msg, "ERROR")
             return False
 
+    def wait_for_lifecycle_expiry(self):
+        """Poll every bucket handed to lifecycle expiry in one loop and delete each once it is empty
+
+        Buckets still expiring after lifecycle_max_wait_hours keep their rules and are reported;
+        a later cleanup run deletes them.
+        """
+        if not self.lifecycle_pending:
+            return
+
+        self.print_colored(Colors.CYAN, f"\n[WAIT] Waiting for lifecycle expiry of {len(self.lifecycle_pending)} buckets "
+                                        f"(up to {self.lifecycle_max_wait_hours}h)")
+        start_time = time.time()
+        deadline = start_time + self.lifecycle_max_wait_hours * 3600
+        expiry_entries = {entry['bucket']: entry for entry in self.cleanup_results['lifecycle_expiry']}
+
+        # Lifecycle expiry runs asynchronously (usually within 1-2 days)
+        while self.lifecycle_pending:
+            still_pending = []
+            for pending in self.lifecycle_pending:
+                bucket_name = pending['bucket']
+                try:
+                    response = pending['s3_client'].list_object_versions(Bucket=bucket_name, MaxKeys=1)
+                    if response.get('Versions') or response.get('DeleteMarkers'):
+                        still_pending.append(pending)
+                        continue
+
+                    elapsed_hours = (time.time() - start_time) / 3600
+                    pending['s3_client'].delete_bucket(Bucket=bucket_name)
+                    self.print_colored(Colors.GREEN, f"[OK] Lifecycle expiry emptied {bucket_name} in {elapsed_hours:.1f}h; bucket deleted")
+                    self.log_action(f"Lifecycle expiry emptied {bucket_name} in {elapsed_hours:.1f}h; deleted bucket")
+                    expiry_entries[bucket_name]['status'] = 'deleted'
+                    self.cleanup_results['deleted_buckets'].append({
+                        'bucket': bucket_name,
+                        'region': pending['region'],
+                        'account_key': pending['account_key']
+                    })
+                except ClientError as e:
+                    error_msg = f"Failed to delete lifecycle-expired bucket {bucket_name}: {e}"
+                    self.print_colored(Colors.RED, f"[ERROR] {error_msg}")
+                    self.log_action(error_msg, "ERROR")
+                    expiry_entries[bucket_name]['status'] = 'failed'
+                    self.cleanup_results['failed_deletions'].append({
+                        'bucket': bucket_name,
+                        'region': pending['region'],
+                        'error': str(e),
+                        'account_key': pending['account_key']
+                    })
+            self.lifecycle_pending = still_pending
+
+            if not self.lifecycle_pending:
+                break
+            if time.time() >= deadline:
+                for pending in self.lifecycle_pending:
+                    self.print_colored(Colors.YELLOW,
+                                       f"[WARN] {pending['bucket']} still expiring after {self.lifecycle_max_wait_hours}h; "
+                                       f"rerun cleanup later to delete it")
+                    self.log_action(f"Lifecycle expiry of {pending['bucket']} still in progress", "WARNING")
+                break
+
+            self.print_colored(Colors.CYAN,
+                               f"   [WAIT] {len(self.lifecycle_pending)} buckets still expiring, "
+                               f"next check in {self.lifecycle_poll_interval}s...")
+            time.sleep(self.lifecycle_poll_interval)
+
+    def delete_all_objects(self, s3_client, bucket_name, region, cloudwatch_client=None):
+        """Delete all objects and versions from a bucket
+
+        A lister feeds 1000-key batches through a bounded queue to a pool of delete workers.
+        In 'lifecycle' mode (or 'auto' mode for buckets above lifecycle_object_threshold objects)
+        the bucket is handed to lifecycle expiry instead and LIFECYCLE_EXPIRING is returned.
+        """
+        if self.delete_mode == 'lifecycle':
+            return self.expire_objects_with_lifecycle(s3_client, bucket_name, region)
+        if self.delete_mode == 'auto' and cloudwatch_client:
+            object_count = self.estimate_bucket_object_count(cloudwatch_client, bucket_name)
+            if object_count is not None and object_count >= self.lifecycle_object_threshold:
+                self.print_colored(Colors.YELLOW,
+                                   f"   [INFO] ~{object_count:,} objects - switching to lifecycle expiry")
+                return self.expire_objects_with_lifecycle(s3_client, bucket_name, region)
+
+        self.print_colored(Colors.CYAN, f"   [DELETE] Deleting all objects and versions "
+                                        f"({self.delete_workers} workers)...")
+
+        batch_queue = queue.Queue(maxsize=self.delete_queue_size)
+        stats_lock = threading.Lock()
+        stats = {'deleted': 0, 'batches': 0, 'failed_keys': []}
+        start_time = time.time()
+
+        def delete_worker():
+            while True:
+                batch = batch_queue.get()
+                try:
+                    if batch is None:
+                        return
+                    deleted, failed_keys = self._delete_batch_with_retry(s3_client, bucket_name, batch)
+                    with stats_lock:
+                        stats['deleted'] += deleted
+                        stats['batches'] += 1
+                        stats['failed_keys'].extend(failed_keys)
+                        if stats['batches'] % 50 == 0:
+                            rate = stats['deleted'] / max(time.time() - start_time, 0.001)
+                            self.print_colored(Colors.CYAN, f"   [PROGRESS] {stats['deleted']:,} deleted "
+                                                            f"({rate:,.0f} objects/s)")
+                except Exception as e:
+                    with stats_lock:
+                        stats['failed_keys'].extend({'Key': obj['Key'], 'VersionId': obj.get('VersionId'),
+                                                     'Code': str(e)} for obj in batch)
+                finally:
+                    batch_queue.task_done()
+
+        workers = [threading.Thread(target=delete_worker, daemon=True) for _ in range(self.delete_workers)]
+        for worker in workers:
+            worker.start()
+
+        listing_error = None
+        try:
+            for batch in self._iter_version_batches(s3_client, bucket_name):
+                batch_queue.put(batch)  # blocks while the workers are behind
+        except ClientError as e:
+            listing_error = e
+        finally:
+            for _ in workers:
+                batch_queue.put(None)
+            for worker in workers:
+                worker.join()
+
+        elapsed = time.time() - start_time
+        delete_count = stats['deleted']
+        failed_keys = stats['failed_keys']
+        throughput = delete_count / elapsed if elapsed > 0 else 0
+
+        if delete_count > 0:
+            self.print_colored(Colors.GREEN, f"   [OK] Deleted {delete_count:,} objects/versions in {elapsed:.1f}s "
+                                             f"({throughput:,.0f} objects/s)")
+            self.log_action(f"Deleted {delete_count} objects/versions from {bucket_name} in {elapsed:.1f}s "
+                            f"({throughput:.0f} objects/s)")
+            self.cleanup_results['objects_deleted'].append({
+                'bucket': bucket_name,
+                'region': region,
+                'count': delete_count,
+                'seconds': round(elapsed, 2),
+                'objects_per_second': round(throughput, 1)
+            })
+        elif not failed_keys and not listing_error:
+            self.print_colored(Colors.YELLOW, f"   [SKIP] No objects found")
+
+        if listing_error:
+            error_msg = f"Failed to delete objects from {bucket_name}: {listing_error}"
+            self.print_colored(Colors.RED, f"   [ERROR] {error_msg}")
+            self.log_action(error_msg, "ERROR")
+            return False
+
+        if failed_keys:
+            error_codes = sorted({key['Code'] for key in failed_keys})
+            error_msg = (f"Failed to delete {len(failed_keys)} objects from {bucket_name} after "
+                         f"{self.delete_max_retries} retries ({', '.join(error_codes)})")
+            self.print_colored(Colors.RED, f"   [ERROR] {error_msg}")
+            self.log_action(error_msg, "ERROR")
+            return False
+
+        return True
+
     def disable_versioning(self, s3_client, bucket_name, region):
         """Disable versioning on a bucket"""
         try:
@@ -334,7 +578,7 @@ class UltraCleanupS3Manager:
                 self.print_colored(Colors.YELLOW, f"   [WARN] Failed to remove tagging: {e.response['Error']['Code']}")
             return False
 
-    def cleanup_bucket(self, s3_client, bucket_name, region, account_key):
+    def cleanup_bucket(self, s3_client, bucket_name, region, account_key, cloudwatch_client=None):
         """Complete cleanup of a single bucket"""
         try:
             self.print_colored(Colors.CYAN, f"\n[SCAN] Processing bucket: {bucket_name} (Region: {region})")
@@ -368,7 +612,17 @@ class UltraCleanupS3Manager:
             self.remove_bucket_tagging(s3_client, bucket_name, region)
             
             # Step 3: Delete all objects and versions
-            if not self.delete_all_objects(s3_client, bucket_name, region):
+            objects_result = self.delete_all_objects(s3_client, bucket_name, region, cloudwatch_client)
+            if objects_result == LIFECYCLE_EXPIRING:
+                self.print_colored(Colors.CYAN, f"   [WAIT] Bucket is expiring; it is deleted once empty")
+                self.lifecycle_pending.append({
+                    'bucket': bucket_name,
+                    'region': region,
+                    'account_key': account_key,
+                    's3_client': s3_client
+                })
+                return
+            if not objects_result:
                 self.cleanup_results['failed_deletions'].append({
                     'bucket': bucket_name,
                     'region': region,
@@ -442,7 +696,17 @@ class UltraCleanupS3Manager:
                         aws_secret_access_key=credentials['secret_key']
                     )
                     
-                    self.cleanup_bucket(regional_s3_client, bucket_name, region, account_name)
+                    # Bucket storage metrics are used to pick lifecycle expiry for giant buckets
+                    cloudwatch_client = None
+                    if self.delete_mode == 'auto':
+                        cloudwatch_client = boto3.client(
+                            'cloudwatch',
+                            region_name=region,
+                            aws_access_key_id=credentials['access_key'],
+                            aws_secret_access_key=credentials['secret_key']
+                        )
+
+                    self.cleanup_bucket(regional_s3_client, bucket_name, region, account_name, cloudwatch_client)
                     
                 except Exception as e:
                     error_msg = f"Error processing bucket {bucket_name}: {e}"
@@ -474,6 +738,10 @@ class UltraCleanupS3Manager:
                     'total_buckets_deleted': len(self.cleanup_results['deleted_buckets']),
                     'total_buckets_excluded': len(self.cleanup_results['excluded_buckets']),
                     'total_objects_deleted': sum(obj['count'] for obj in self.cleanup_results['objects_deleted']),
+                    'total_object_delete_seconds': round(sum(obj.get('seconds', 0) for obj in self.cleanup_results['objects_deleted']), 2),
+                    'total_lifecycle_expiry_buckets': len(self.cleanup_results['lifecycle_expiry']),
+                    'total_lifecycle_still_expiring': sum(1 for entry in self.cleanup_results['lifecycle_expiry']
+                                                          if entry.get('status') == LIFECYCLE_EXPIRING),
                     'total_versioning_disabled': len(self.cleanup_results['versioning_disabled']),
                     'total_policies_removed': len(self.cleanup_results['policies_removed']),
                     'total_notifications_removed': len(self.cleanup_results['notifications_removed']),
@@ -496,6 +764,13 @@ class UltraCleanupS3Manager:
             self.print_colored(Colors.GREEN, f"[OK] Buckets Deleted: {summary['summary']['total_buckets_deleted']}")
             self.print_colored(Colors.YELLOW, f"[SKIP] Buckets Excluded: {summary['summary']['total_buckets_excluded']}")
             self.print_colored(Colors.GREEN, f"[OK] Objects Deleted: {summary['summary']['total_objects_deleted']}")
+            if summary['summary']['total_object_delete_seconds'] > 0:
+                overall_rate = summary['summary']['total_objects_deleted'] / summary['summary']['total_object_delete_seconds']
+                self.print_colored(Colors.GREEN, f"[OK] Delete Throughput: {overall_rate:,.0f} objects/s")
+            if summary['summary']['total_lifecycle_expiry_buckets'] > 0:
+                self.print_colored(Colors.GREEN, f"[OK] Buckets Sent to Lifecycle Expiry: {summary['summary']['total_lifecycle_expiry_buckets']}")
+            if summary['summary']['total_lifecycle_still_expiring'] > 0:
+                self.print_colored(Colors.YELLOW, f"[WARN] Buckets Still Expiring (rerun later): {summary['summary']['total_lifecycle_still_expiring']}")
             self.print_colored(Colors.GREEN, f"[OK] Versioning Disabled: {summary['summary']['total_versioning_disabled']}")
             self.print_colored(Colors.GREEN, f"[OK] Policies Removed: {summary['summary']['total_policies_removed']}")
             self.print_colored(Colors.GREEN, f"[OK] Notifications Removed: {summary['summary']['total_notifications_removed']}")
@@ -627,6 +902,15 @@ class UltraCleanupS3Manager:
             else:
                 self.print_colored(Colors.CYAN, "[CONFIG] No buckets excluded")
 
+            # Object deletion mode
+            self.print_colored(Colors.YELLOW, "\n[CONFIG] Object Deletion Mode:")
+            print("   1. Batch delete (parallel delete_objects) [default]")
+            print(f"   2. Auto (lifecycle expiry for buckets with more than {self.lifecycle_object_threshold:,} objects)")
+            print("   3. Lifecycle expiry for all buckets (slow to finish, no per-object API calls)")
+            mode_choice = input(f"{Colors.GREEN}Select mode (1-3): {Colors.END}").strip()
+            self.delete_mode = {'2': 'auto', '3': 'lifecycle'}.get(mode_choice, 'batch')
+            self.print_colored(Colors.CYAN, f"[CONFIG] Object deletion mode: {self.delete_mode}")
+
             # Confirm deletion
             self.print_colored(Colors.RED, "\n[WARN] WARNING: This will DELETE all S3 buckets and their contents!")
             self.print_colored(Colors.RED, "[WARN] This action is IRREVERSIBLE!")
@@ -652,6 +936,9 @@ class UltraCleanupS3Manager:
                 self.cleanup_account_s3_buckets(account_name, credentials)
                 time.sleep(2)  # Delay between accounts
 
+            # Buckets of every account expire concurrently; wait for them together
+            self.wait_for_lifecycle_expiry()
+
             # Generate summary
             self.generate_summary_report()
 
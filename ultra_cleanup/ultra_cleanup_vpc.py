@@ -4,14 +4,18 @@ import boto3
 import json
 import sys
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
-from typing import List, Dict, Any, Set, Optional, Tuple
+from typing import Callable, List, Dict, Any, Set, Optional, Tuple
 import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from root_iam_credential_manager import AWSCredentialManager
 from root_iam_credential_manager import Colors
+from vpc_resource_graph import VPCResourceGraph
 
 class UltraVPCCleanupManager:
     """
@@ -37,6 +41,16 @@ class UltraVPCCleanupManager:
         self.max_retries = 3
         self.retry_delay = 30  # seconds
         
+        # Parallel account x region settings
+        self.max_parallel_tasks = 8  # (account, region) pairs processed at once
+        self.max_concurrent_regions_per_account = 4
+        self._account_semaphores = {}
+        self._account_semaphores_lock = threading.Lock()
+        self._results_lock = threading.Lock()
+        self._running_tasks = set()
+        # Snapshot describers and per-level deleters share one client per region
+        self.client_config = Config(max_pool_connections=20, retries={'max_attempts': 10, 'mode': 'adaptive'})
+        
         # Initialize log file
         self.setup_detailed_logging()
         
@@ -63,6 +77,25 @@ class UltraVPCCleanupManager:
             'dhcp_options_sets',
             'customer_gateways'
         ]
+
+        # Deleter per snapshot resource type (see cleanup_vpc_resources_in_region)
+        self.resource_deleters = {
+            'vpc_flow_logs': self.delete_vpc_flow_logs,
+            'vpc_endpoints': self.delete_vpc_endpoints,
+            'nat_gateways': self.delete_nat_gateways_with_wait,
+            'transit_gateway_attachments': self.delete_transit_gateway_attachments,
+            'vpn_gateways': self.delete_vpn_gateways,
+            'vpc_peering_connections': self.delete_vpc_peering_connections,
+            'network_interfaces': self.delete_network_interfaces,
+            'internet_gateways': self.delete_internet_gateways,
+            'elastic_ips': self.delete_elastic_ips,
+            'security_groups': self.delete_security_groups,
+            'route_tables': self.delete_route_tables,
+            'subnets': self.delete_subnets,
+            'network_acls': self.delete_network_acls,
+            'dhcp_options_sets': self.delete_dhcp_options_sets,
+            'customer_gateways': self.delete_customer_gateways
+        }
         
         # Storage for cleanup results
         self.cleanup_results = {
@@ -156,6 +189,16 @@ class UltraVPCCleanupManager:
 
         return ['us-east-1', 'us-east-2', 'us-west-1', 'us-west-2', 'ap-south-1']
 
+    def record_result(self, category: str, entry: Any):
+        """Append to a cleanup_results list (called from parallel region tasks)"""
+        with self._results_lock:
+            self.cleanup_results[category].append(entry)
+
+    def record_deleted(self, resource_type: str, entry: Dict):
+        """Append to cleanup_results['resources_deleted'][resource_type]"""
+        with self._results_lock:
+            self.cleanup_results['resources_deleted'][resource_type].append(entry)
+
     def log_operation(self, level, message):
         """Simple logging operation"""
         if self.logger:
@@ -222,12 +265,13 @@ class UltraVPCCleanupManager:
     def create_ec2_client(self, access_key: str, secret_key: str, region: str):
         """Create EC2 client for the specified region"""
         try:
-            return boto3.client(
-                'ec2',
+            # Own session per client: the default boto3 session is not thread-safe
+            session = boto3.session.Session(
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 region_name=region
             )
+            return session.client('ec2', config=self.client_config)
         except Exception as e:
             self.log_operation('ERROR', f"Failed to create EC2 client for {region}: {e}")
             return None
@@ -277,7 +321,7 @@ class UltraVPCCleanupManager:
             for vpc in vpcs:
                 if self.is_default_vpc(vpc):
                     default_vpcs.append(vpc)
-                    self.cleanup_results['default_resources_skipped'].append({
+                    self.record_result('default_resources_skipped', {
                         'type': 'VPC',
                         'id': vpc['VpcId'],
                         'reason': 'Default VPC - protected from deletion',
@@ -416,7 +460,7 @@ class UltraVPCCleanupManager:
             for sg in all_sgs:
                 if self.is_default_security_group(sg):
                     default_sgs.append(sg)
-                    self.cleanup_results['default_resources_skipped'].append({
+                    self.record_result('default_resources_skipped', {
                         'type': 'SecurityGroup',
                         'id': sg['GroupId'],
                         'name': sg['GroupName'],
@@ -453,7 +497,7 @@ class UltraVPCCleanupManager:
                         ec2_client.delete_flow_logs(FlowLogIds=[flow_log_id])
                         self.log_operation('INFO', f"[OK] Deleted VPC Flow Log: {flow_log_id}")
                     
-                    self.cleanup_results['resources_deleted']['vpc_flow_logs'].append({
+                    self.record_deleted('vpc_flow_logs', {
                         'id': flow_log_id,
                         'region': region,
                         'account': account_name,
@@ -464,7 +508,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] VPC Flow Log {flow_log_id} already deleted")
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete VPC Flow Log {flow_log_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'VPC Flow Log',
                             'id': flow_log_id,
                             'error': str(e),
@@ -480,6 +524,39 @@ class UltraVPCCleanupManager:
             self.log_operation('ERROR', f"Error deleting VPC Flow Logs in {region} ({account_name}): {e}")
             return False
 
+    def wait_for_deletion(self, describe: Callable[[List[str]], List[Dict]], id_key: str, resource_ids: List[str],
+                          resource_label: str, max_wait_time: int = 600, check_interval: int = 15) -> bool:
+        """Wait until asynchronously deleted resources are gone or 'deleted'/'failed'
+
+        The deletion graph starts the next level as soon as a deleter returns, so deleters of
+        resources that keep blocking subnets/SGs/route tables while 'deleting' wait here first.
+
+        Args:
+            describe: Callable(ids) returning the described resources that still exist (filter-based,
+                so ids that are already gone do not raise)
+            id_key: Id field of a described resource
+
+        Returns:
+            True once every resource is deleted, False on timeout
+        """
+        remaining = list(resource_ids)
+        start_time = time.time()
+        self.log_operation('INFO', f"[WAIT] Waiting for {len(remaining)} {resource_label} to finish deleting...")
+        
+        while True:
+            remaining = [item[id_key] for item in describe(remaining)
+                         if str(item.get('State', '')).lower() not in ('deleted', 'failed')]
+            if not remaining:
+                self.log_operation('INFO', f"[OK] All {resource_label} deleted after {time.time() - start_time:.0f}s")
+                return True
+            
+            if time.time() - start_time >= max_wait_time:
+                self.log_operation('WARNING', f"[WARN] {resource_label} still deleting after {max_wait_time} seconds: {', '.join(remaining)}")
+                return False
+            
+            self.log_operation('INFO', f"[WAIT] Still waiting for {len(remaining)} {resource_label} to delete...")
+            time.sleep(check_interval)
+
     def delete_vpc_endpoints(self, ec2_client, endpoints: List[Dict], region: str, account_name: str) -> bool:
         """Delete VPC Endpoints"""
         try:
@@ -489,6 +566,7 @@ class UltraVPCCleanupManager:
             action_text = "Would delete" if self.dry_run else "Deleting"
             self.log_operation('INFO', f"[DELETE] {action_text} {len(endpoints)} VPC Endpoints in {region} ({account_name})")
             
+            deleting_ids = []
             for endpoint in endpoints:
                 endpoint_id = endpoint['VpcEndpointId']
                 endpoint_type = endpoint.get('VpcEndpointType', 'Unknown')
@@ -498,9 +576,10 @@ class UltraVPCCleanupManager:
                         self.log_operation('INFO', f"[SCAN] [DRY RUN] Would delete VPC Endpoint ({endpoint_type}): {endpoint_id}")
                     else:
                         ec2_client.delete_vpc_endpoints(VpcEndpointIds=[endpoint_id])
+                        deleting_ids.append(endpoint_id)
                         self.log_operation('INFO', f"[OK] Deleted VPC Endpoint ({endpoint_type}): {endpoint_id}")
                     
-                    self.cleanup_results['resources_deleted']['vpc_endpoints'].append({
+                    self.record_deleted('vpc_endpoints', {
                         'id': endpoint_id,
                         'type': endpoint_type,
                         'region': region,
@@ -512,7 +591,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] VPC Endpoint {endpoint_id} already deleted")
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete VPC Endpoint {endpoint_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'VPC Endpoint',
                             'id': endpoint_id,
                             'error': str(e),
@@ -522,6 +601,15 @@ class UltraVPCCleanupManager:
                         if not self.dry_run:
                             return False
             
+            # Interface endpoints hold ENIs in their subnets and security groups until fully deleted
+            if deleting_ids:
+                return self.wait_for_deletion(
+                    lambda ids: ec2_client.describe_vpc_endpoints(
+                        Filters=[{'Name': 'vpc-endpoint-id', 'Values': ids}]
+                    ).get('VpcEndpoints', []),
+                    'VpcEndpointId', deleting_ids, f"VPC Endpoints in {region} ({account_name})"
+                )
+            
             return True
             
         except Exception as e:
@@ -554,7 +642,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] NAT Gateway {nat_gw_id} already deleted")
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete NAT Gateway {nat_gw_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'NAT Gateway',
                             'id': nat_gw_id,
                             'error': str(e),
@@ -576,8 +664,9 @@ class UltraVPCCleanupManager:
                         response = ec2_client.describe_nat_gateways(NatGatewayIds=nat_gateway_ids)
                         remaining_gateways = []
                         
+                        # Subnets, EIPs and IGWs after it in the deletion graph need it fully deleted
                         for nat_gw in response.get('NatGateways', []):
-                            if nat_gw.get('State') not in ['deleted', 'deleting']:
+                            if nat_gw.get('State') not in ['deleted', 'failed']:
                                 remaining_gateways.append(nat_gw['NatGatewayId'])
                         
                         if not remaining_gateways:
@@ -602,7 +691,7 @@ class UltraVPCCleanupManager:
             
             # Record the deletions/analysis
             for nat_gw_id in nat_gateway_ids:
-                self.cleanup_results['resources_deleted']['nat_gateways'].append({
+                self.record_deleted('nat_gateways', {
                     'id': nat_gw_id,
                     'region': region,
                     'account': account_name,
@@ -636,7 +725,7 @@ class UltraVPCCleanupManager:
             for rt in all_rts:
                 if self.is_main_route_table(rt):
                     main_rts.append(rt)
-                    self.cleanup_results['default_resources_skipped'].append({
+                    self.record_result('default_resources_skipped', {
                         'type': 'RouteTable',
                         'id': rt['RouteTableId'],
                         'reason': 'Main route table - protected from deletion',
@@ -675,7 +764,7 @@ class UltraVPCCleanupManager:
             for acl in all_acls:
                 if self.is_default_network_acl(acl):
                     default_acls.append(acl)
-                    self.cleanup_results['default_resources_skipped'].append({
+                    self.record_result('default_resources_skipped', {
                         'type': 'NetworkAcl',
                         'id': acl['NetworkAclId'],
                         'reason': 'Default network ACL - protected from deletion',
@@ -839,7 +928,7 @@ class UltraVPCCleanupManager:
                     if not self.is_default_dhcp_options(dhcp, vpc_info):
                         custom_dhcp.append(dhcp)
                     else:
-                        self.cleanup_results['default_resources_skipped'].append({
+                        self.record_result('default_resources_skipped', {
                             'type': 'DhcpOptions',
                             'id': dhcp_id,
                             'reason': 'Default DHCP options - protected from deletion',
@@ -932,7 +1021,7 @@ class UltraVPCCleanupManager:
                         ec2_client.delete_internet_gateway(InternetGatewayId=igw_id)
                         self.log_operation('INFO', f"[OK] Deleted Internet Gateway: {igw_id}")
                     
-                    self.cleanup_results['resources_deleted']['internet_gateways'].append({
+                    self.record_deleted('internet_gateways', {
                         'id': igw_id,
                         'region': region,
                         'account': account_name,
@@ -943,7 +1032,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] Internet Gateway {igw_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete IGW {igw_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'Internet Gateway',
                             'id': igw_id,
                             'error': str(e),
@@ -952,7 +1041,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete Internet Gateway {igw_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Internet Gateway',
                             'id': igw_id,
                             'error': str(e),
@@ -1014,7 +1103,7 @@ class UltraVPCCleanupManager:
                 try:
                     ec2_client.delete_security_group(GroupId=sg_id)
                     self.log_operation('INFO', f"[OK] Deleted Security Group: {sg_id} ({sg_name})")
-                    self.cleanup_results['resources_deleted']['security_groups'].append({
+                    self.record_deleted('security_groups', {
                         'id': sg_id,
                         'name': sg_name,
                         'region': region,
@@ -1025,7 +1114,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] Security Group {sg_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete SG {sg_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'Security Group',
                             'id': sg_id,
                             'error': str(e),
@@ -1034,7 +1123,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete Security Group {sg_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Security Group',
                             'id': sg_id,
                             'error': str(e),
@@ -1071,7 +1160,7 @@ class UltraVPCCleanupManager:
                     # Delete the route table
                     ec2_client.delete_route_table(RouteTableId=rt_id)
                     self.log_operation('INFO', f"[OK] Deleted Route Table: {rt_id}")
-                    self.cleanup_results['resources_deleted']['route_tables'].append({
+                    self.record_deleted('route_tables', {
                         'id': rt_id,
                         'region': region,
                         'account': account_name
@@ -1081,7 +1170,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] Route Table {rt_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete RT {rt_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'Route Table',
                             'id': rt_id,
                             'error': str(e),
@@ -1090,7 +1179,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete Route Table {rt_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Route Table',
                             'id': rt_id,
                             'error': str(e),
@@ -1118,7 +1207,7 @@ class UltraVPCCleanupManager:
                 try:
                     ec2_client.delete_network_acl(NetworkAclId=acl_id)
                     self.log_operation('INFO', f"[OK] Deleted Network ACL: {acl_id}")
-                    self.cleanup_results['resources_deleted']['network_acls'].append({
+                    self.record_deleted('network_acls', {
                         'id': acl_id,
                         'region': region,
                         'account': account_name
@@ -1128,7 +1217,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] Network ACL {acl_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete ACL {acl_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'Network ACL',
                             'id': acl_id,
                             'error': str(e),
@@ -1137,7 +1226,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete Network ACL {acl_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Network ACL',
                             'id': acl_id,
                             'error': str(e),
@@ -1172,7 +1261,7 @@ class UltraVPCCleanupManager:
                         ec2_client.release_address(PublicIp=public_ip)
                     
                     self.log_operation('INFO', f"[OK] Released Elastic IP: {public_ip} ({allocation_id})")
-                    self.cleanup_results['resources_deleted']['elastic_ips'].append({
+                    self.record_deleted('elastic_ips', {
                         'allocation_id': allocation_id,
                         'public_ip': public_ip,
                         'region': region,
@@ -1183,7 +1272,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] Elastic IP {public_ip} already released")
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to release Elastic IP {public_ip}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Elastic IP',
                             'id': allocation_id or public_ip,
                             'error': str(e),
@@ -1223,7 +1312,7 @@ class UltraVPCCleanupManager:
                     # Delete the VPN Gateway
                     ec2_client.delete_vpn_gateway(VpnGatewayId=vgw_id)
                     self.log_operation('INFO', f"[OK] Deleted VPN Gateway: {vgw_id}")
-                    self.cleanup_results['resources_deleted']['vpn_gateways'].append({
+                    self.record_deleted('vpn_gateways', {
                         'id': vgw_id,
                         'region': region,
                         'account': account_name
@@ -1233,7 +1322,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] VPN Gateway {vgw_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete VPN Gateway {vgw_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'VPN Gateway',
                             'id': vgw_id,
                             'error': str(e),
@@ -1242,7 +1331,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete VPN Gateway {vgw_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'VPN Gateway',
                             'id': vgw_id,
                             'error': str(e),
@@ -1265,12 +1354,14 @@ class UltraVPCCleanupManager:
                 
             self.log_operation('INFO', f"[DELETE] Deleting {len(tgw_attachments)} Transit Gateway Attachments in {region} ({account_name})")
             
+            deleting_ids = []
             for attachment in tgw_attachments:
                 attachment_id = attachment['TransitGatewayAttachmentId']
                 try:
                     ec2_client.delete_transit_gateway_vpc_attachment(TransitGatewayAttachmentId=attachment_id)
+                    deleting_ids.append(attachment_id)
                     self.log_operation('INFO', f"[OK] Deleted TGW Attachment: {attachment_id}")
-                    self.cleanup_results['resources_deleted']['transit_gateway_attachments'].append({
+                    self.record_deleted('transit_gateway_attachments', {
                         'id': attachment_id,
                         'region': region,
                         'account': account_name
@@ -1280,7 +1371,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] TGW Attachment {attachment_id} already deleted")
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete TGW Attachment {attachment_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Transit Gateway Attachment',
                             'id': attachment_id,
                             'error': str(e),
@@ -1289,6 +1380,15 @@ class UltraVPCCleanupManager:
                         })
                         return False
             
+            # Attachment ENIs stay in the VPC subnets until the attachment is deleted
+            if deleting_ids:
+                return self.wait_for_deletion(
+                    lambda ids: ec2_client.describe_transit_gateway_vpc_attachments(
+                        Filters=[{'Name': 'transit-gateway-attachment-id', 'Values': ids}]
+                    ).get('TransitGatewayVpcAttachments', []),
+                    'TransitGatewayAttachmentId', deleting_ids, f"Transit Gateway Attachments in {region} ({account_name})"
+                )
+            
             return True
             
         except Exception as e:
@@ -1308,7 +1408,7 @@ class UltraVPCCleanupManager:
                 try:
                     ec2_client.delete_network_interface(NetworkInterfaceId=eni_id)
                     self.log_operation('INFO', f"[OK] Deleted Network Interface: {eni_id}")
-                    self.cleanup_results['resources_deleted']['network_interfaces'].append({
+                    self.record_deleted('network_interfaces', {
                         'id': eni_id,
                         'region': region,
                         'account': account_name
@@ -1318,7 +1418,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] Network Interface {eni_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete ENI {eni_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'Network Interface',
                             'id': eni_id,
                             'error': str(e),
@@ -1327,7 +1427,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete Network Interface {eni_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Network Interface',
                             'id': eni_id,
                             'error': str(e),
@@ -1359,7 +1459,7 @@ class UltraVPCCleanupManager:
                 try:
                     ec2_client.delete_subnet(SubnetId=subnet_id)
                     self.log_operation('INFO', f"[OK] Deleted Subnet: {subnet_id}")
-                    self.cleanup_results['resources_deleted']['subnets'].append({
+                    self.record_deleted('subnets', {
                         'id': subnet_id,
                         'cidr': subnet.get('CidrBlock'),
                         'az': subnet.get('AvailabilityZone'),
@@ -1371,7 +1471,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] Subnet {subnet_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete Subnet {subnet_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'Subnet',
                             'id': subnet_id,
                             'error': str(e),
@@ -1380,7 +1480,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete Subnet {subnet_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Subnet',
                             'id': subnet_id,
                             'error': str(e),
@@ -1408,7 +1508,7 @@ class UltraVPCCleanupManager:
                 try:
                     ec2_client.delete_dhcp_options(DhcpOptionsId=dhcp_id)
                     self.log_operation('INFO', f"[OK] Deleted DHCP Options Set: {dhcp_id}")
-                    self.cleanup_results['resources_deleted']['dhcp_options_sets'].append({
+                    self.record_deleted('dhcp_options_sets', {
                         'id': dhcp_id,
                         'region': region,
                         'account': account_name
@@ -1418,7 +1518,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] DHCP Options Set {dhcp_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete DHCP Options {dhcp_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'DHCP Options Set',
                             'id': dhcp_id,
                             'error': str(e),
@@ -1427,7 +1527,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete DHCP Options Set {dhcp_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'DHCP Options Set',
                             'id': dhcp_id,
                             'error': str(e),
@@ -1455,7 +1555,7 @@ class UltraVPCCleanupManager:
                 try:
                     ec2_client.delete_customer_gateway(CustomerGatewayId=cgw_id)
                     self.log_operation('INFO', f"[OK] Deleted Customer Gateway: {cgw_id}")
-                    self.cleanup_results['resources_deleted']['customer_gateways'].append({
+                    self.record_deleted('customer_gateways', {
                         'id': cgw_id,
                         'region': region,
                         'account': account_name
@@ -1465,7 +1565,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] Customer Gateway {cgw_id} already deleted")
                     elif 'DependencyViolation' in str(e):
                         self.log_operation('WARNING', f"[WARN] Cannot delete Customer Gateway {cgw_id}: dependency violation")
-                        self.cleanup_results['dependency_violations'].append({
+                        self.record_result('dependency_violations', {
                             'type': 'Customer Gateway',
                             'id': cgw_id,
                             'error': str(e),
@@ -1474,7 +1574,7 @@ class UltraVPCCleanupManager:
                         })
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete Customer Gateway {cgw_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'Customer Gateway',
                             'id': cgw_id,
                             'error': str(e),
@@ -1502,7 +1602,7 @@ class UltraVPCCleanupManager:
                 try:
                     ec2_client.delete_vpc_peering_connection(VpcPeeringConnectionId=peering_id)
                     self.log_operation('INFO', f"[OK] Deleted VPC Peering Connection: {peering_id}")
-                    self.cleanup_results['resources_deleted']['vpc_peering_connections'].append({
+                    self.record_deleted('vpc_peering_connections', {
                         'id': peering_id,
                         'region': region,
                         'account': account_name
@@ -1512,7 +1612,7 @@ class UltraVPCCleanupManager:
                         self.log_operation('WARNING', f"[WARN] VPC Peering Connection {peering_id} already deleted")
                     else:
                         self.log_operation('ERROR', f"[ERROR] Failed to delete VPC Peering Connection {peering_id}: {e}")
-                        self.cleanup_results['failed_deletions'].append({
+                        self.record_result('failed_deletions', {
                             'type': 'VPC Peering Connection',
                             'id': peering_id,
                             'error': str(e),
@@ -1659,6 +1759,117 @@ class UltraVPCCleanupManager:
             except Exception as e:
                 self.print_colored(Colors.RED, f"[ERROR] Error processing selection: {str(e)}")
 
+    def _get_account_semaphore(self, account_name: str) -> threading.Semaphore:
+        """Semaphore bounding how many regions of one account are cleaned up at the same time"""
+        with self._account_semaphores_lock:
+            if account_name not in self._account_semaphores:
+                self._account_semaphores[account_name] = threading.Semaphore(
+                    self.max_concurrent_regions_per_account)
+            return self._account_semaphores[account_name]
+
+    def cleanup_account_region(self, account_name: str, region: str) -> Dict:
+        """Clean up VPC resources, unused EBS volumes and unused EFS file systems in one account/region
+
+        Returns:
+            {'account', 'region', 'success', 'ebs_deleted', 'efs_deleted', 'seconds', 'error'}
+        """
+        result = {'account': account_name, 'region': region, 'success': False,
+                  'ebs_deleted': 0, 'efs_deleted': 0, 'seconds': 0.0, 'error': None}
+        account_data = self.config_data['accounts'][account_name]
+        access_key = account_data['access_key']
+        secret_key = account_data['secret_key']
+        task_label = f"{account_name}:{region}"
+
+        with self._get_account_semaphore(account_name):
+            start_time = time.time()
+            with self._results_lock:
+                self._running_tasks.add(task_label)
+            try:
+                self.log_operation('INFO', f"Processing {account_name} - {region}")
+
+                ec2_client = self.create_ec2_client(access_key, secret_key, region)
+                if not ec2_client:
+                    result['error'] = "Could not create EC2 client"
+                    return result
+
+                self.record_result('regions_processed', task_label)
+
+                result['success'] = self.cleanup_vpc_resources_in_region(ec2_client, region, account_name)
+                result['ebs_deleted'] = self.delete_unused_ebs_volumes(ec2_client, region, account_name)
+                result['efs_deleted'] = self.delete_unused_efs_filesystems(access_key, secret_key, region, account_name)
+            except Exception as e:
+                result['error'] = str(e)
+                self.log_operation('ERROR', f"Error in cleanup of {account_name} - {region}: {e}")
+                self.record_result('errors', {
+                    'account': account_name,
+                    'region': region,
+                    'error': str(e)
+                })
+            finally:
+                result['seconds'] = time.time() - start_time
+                with self._results_lock:
+                    self._running_tasks.discard(task_label)
+
+        return result
+
+    def print_task_result(self, index: int, total: int, result: Dict):
+        """Print one finished task as a single block (tasks of different regions finish interleaved)"""
+        label = f"{result['account']} - {result['region']}"
+        if result['error']:
+            self.print_colored(Colors.RED, f"\n[{index}/{total}] [ERROR] Cleanup failed for {label} after {result['seconds']:.1f}s: {result['error']}")
+        elif result['success']:
+            self.print_colored(Colors.GREEN, f"\n[{index}/{total}] [OK] Completed cleanup for {label} in {result['seconds']:.1f}s")
+        else:
+            self.print_colored(Colors.YELLOW, f"\n[{index}/{total}] [WARN] Cleanup completed with some issues for {label} in {result['seconds']:.1f}s")
+        print(f"   [DELETE] Deleted {result['ebs_deleted']} unused EBS volumes and {result['efs_deleted']} unused EFS file systems")
+
+        with self._results_lock:
+            running = sorted(self._running_tasks)
+        if running:
+            more = f" (+{len(running) - 5} more)" if len(running) > 5 else ""
+            print(f"   [WAIT] Still running: {', '.join(running[:5])}{more}")
+
+    def run_parallel_cleanup(self, selected_accounts: List[str], selected_regions: List[str]) -> List[Dict]:
+        """Clean up every account x region pair on one thread pool
+
+        Long NAT gateway waits in one region overlap with work in other regions and accounts;
+        at most max_concurrent_regions_per_account regions of an account run at the same time.
+
+        Returns:
+            cleanup_account_region results in completion order
+        """
+        # Region-major order spreads the first wave over all accounts instead of queueing
+        # one account's regions behind its semaphore
+        tasks = [(account_name, region) for region in selected_regions for account_name in selected_accounts]
+        for account_name in selected_accounts:
+            self.record_result('accounts_processed', account_name)
+
+        max_workers = min(self.max_parallel_tasks, len(tasks))
+        self.print_colored(Colors.CYAN, f"[START] Running {len(tasks)} account/region tasks with up to "
+                                        f"{max_workers} in parallel ({self.max_concurrent_regions_per_account} regions per account)")
+
+        start_time = time.time()
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='vpc-cleanup') as executor:
+            future_to_task = {executor.submit(self.cleanup_account_region, account_name, region): (account_name, region)
+                              for account_name, region in tasks}
+
+            for index, future in enumerate(as_completed(future_to_task), 1):
+                account_name, region = future_to_task[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'account': account_name, 'region': region, 'success': False,
+                              'ebs_deleted': 0, 'efs_deleted': 0, 'seconds': 0.0, 'error': str(e)}
+                results.append(result)
+                self.print_task_result(index, len(tasks), result)
+
+        wall_seconds = time.time() - start_time
+        task_seconds = sum(result['seconds'] for result in results)
+        self.log_operation('INFO', f"[TIMER] {len(tasks)} account/region tasks finished in {wall_seconds:.1f}s "
+                                   f"({task_seconds:.1f}s of region work)")
+        return results
+
     # Replace the run_interactive_cleanup method with this version:
     def run_interactive_cleanup(self):
         """Simplified cleanup flow using shared account/region selection"""
@@ -1701,42 +1912,7 @@ class UltraVPCCleanupManager:
 
             self.log_operation('INFO',
                                f"[START] Starting VPC cleanup for {len(selected_accounts)} accounts and {len(selected_regions)} regions")
-            total_operations = len(selected_accounts) * len(selected_regions)
-            current_operation = 0
-
-            for account_name in selected_accounts:
-                account_data = self.config_data['accounts'][account_name]
-                access_key = account_data['access_key']
-                secret_key = account_data['secret_key']
-
-                self.cleanup_results['accounts_processed'].append(account_name)
-
-                for region in selected_regions:
-                    current_operation += 1
-                    print(f"\n[{current_operation}/{total_operations}] Processing {account_name} - {region}")
-                    self.log_operation('INFO', f"Processing {account_name} - {region}")
-
-                    ec2_client = self.create_ec2_client(access_key, secret_key, region)
-                    if not ec2_client:
-                        continue
-
-                    self.cleanup_results['regions_processed'].append(f"{account_name}:{region}")
-
-                    success = self.cleanup_vpc_resources_in_region(ec2_client, region, account_name)
-
-                    # Delete unused EBS volumes
-                    ebs_deleted = self.delete_unused_ebs_volumes(ec2_client, region, account_name)
-                    print(f"   [DELETE] Deleted {ebs_deleted} unused EBS volumes in {region}")
-
-                    # Delete unused EFS file systems
-                    efs_deleted = self.delete_unused_efs_filesystems(access_key, secret_key, region, account_name)
-                    print(f"   [DELETE] Deleted {efs_deleted} unused EFS file systems in {region}")
-
-
-                    if success:
-                        print(f"   [OK] Completed cleanup for {account_name} - {region}")
-                    else:
-                        print(f"   [WARN] Cleanup completed with some issues for {account_name} - {region}")
+            self.run_parallel_cleanup(selected_accounts, selected_regions)
 
             self.generate_cleanup_report()
 
@@ -1875,12 +2051,11 @@ class UltraVPCCleanupManager:
     def delete_unused_efs_filesystems(self, access_key: str, secret_key: str, region: str, account_name: str) -> int:
         """Delete all EFS file systems with no mount targets in the region."""
         try:
-            efs_client = boto3.client(
-                'efs',
+            efs_client = boto3.session.Session(
                 aws_access_key_id=access_key,
                 aws_secret_access_key=secret_key,
                 region_name=region
-            )
+            ).client('efs', config=self.client_config)
             response = efs_client.describe_file_systems()
             filesystems = response.get('FileSystems', [])
             count = 0
@@ -1899,8 +2074,65 @@ class UltraVPCCleanupManager:
             self.log_operation('ERROR', f"Error deleting unused EFS file systems in {region} ({account_name}): {e}")
             return 0
 
+    def snapshot_region_resources(self, ec2_client, custom_vpcs: List[Dict], region: str, account_name: str) -> Dict[str, List[Dict]]:
+        """Describe every VPC-scoped resource type of the region concurrently"""
+        vpc_ids = [vpc['VpcId'] for vpc in custom_vpcs]
+        describers = {
+            'vpc_flow_logs': lambda: self.get_vpc_flow_logs(ec2_client, vpc_ids, region, account_name),
+            'vpc_endpoints': lambda: self.get_vpc_endpoints(ec2_client, vpc_ids, region, account_name),
+            'nat_gateways': lambda: self.get_nat_gateways(ec2_client, vpc_ids, region, account_name),
+            'transit_gateway_attachments': lambda: self.get_transit_gateway_attachments(ec2_client, vpc_ids, region, account_name),
+            'vpn_gateways': lambda: self.get_vpn_gateways(ec2_client, vpc_ids, region, account_name),
+            'vpc_peering_connections': lambda: self.get_vpc_peering_connections(ec2_client, vpc_ids, region, account_name),
+            'network_interfaces': lambda: self.get_network_interfaces(ec2_client, vpc_ids, region, account_name),
+            'internet_gateways': lambda: self.get_internet_gateways(ec2_client, vpc_ids, region, account_name),
+            'elastic_ips': lambda: self.get_elastic_ips(ec2_client, region, account_name),
+            'security_groups': lambda: self.get_security_groups(ec2_client, vpc_ids, region, account_name),
+            'route_tables': lambda: self.get_route_tables(ec2_client, vpc_ids, region, account_name),
+            'subnets': lambda: self.get_subnets(ec2_client, vpc_ids, region, account_name),
+            'network_acls': lambda: self.get_network_acls(ec2_client, vpc_ids, region, account_name),
+            'dhcp_options_sets': lambda: self.get_dhcp_options_sets(ec2_client, custom_vpcs, region, account_name),
+            'customer_gateways': lambda: self.get_customer_gateways(ec2_client, region, account_name)
+        }
+        
+        start_time = time.time()
+        snapshot = {}
+        with ThreadPoolExecutor(max_workers=len(describers)) as executor:
+            futures = {executor.submit(describe): resource_type for resource_type, describe in describers.items()}
+            for future in as_completed(futures):
+                # The describers log their own errors and return [] on failure
+                snapshot[futures[future]] = future.result()
+        
+        total_resources = sum(len(resources) for resources in snapshot.values())
+        self.log_operation('INFO', f"[SCAN] Snapshot of {total_resources} VPC resources in {region} ({account_name}) took {time.time() - start_time:.1f}s")
+        return snapshot
+
+    def delete_resource_graph(self, ec2_client, graph: VPCResourceGraph, region: str, account_name: str) -> bool:
+        """Delete the graph level by level; the deleters of one level run in parallel"""
+        levels = graph.deletion_levels()
+        cleanup_success = True
+        
+        for level_number, level in enumerate(levels, 1):
+            summary = ', '.join(f"{len(resources)} {resource_type}" for resource_type, resources in level.items())
+            self.log_operation('INFO', f"[DELETE] Level {level_number}/{len(levels)} in {region} ({account_name}): {summary}")
+            
+            with ThreadPoolExecutor(max_workers=len(level)) as executor:
+                futures = {
+                    executor.submit(self.resource_deleters[resource_type], ec2_client, resources, region, account_name): resource_type
+                    for resource_type, resources in level.items()
+                }
+                for future in as_completed(futures):
+                    try:
+                        if not future.result():
+                            cleanup_success = False
+                    except Exception as e:
+                        self.log_operation('ERROR', f"Error deleting {futures[future]} in {region} ({account_name}): {e}")
+                        cleanup_success = False
+        
+        return cleanup_success
+
     def cleanup_vpc_resources_in_region(self, ec2_client, region: str, account_name: str) -> bool:
-        """Clean up all VPC resources in a region following dependency order"""
+        """Clean up all VPC resources in a region: one concurrent snapshot, then graph-ordered deletion"""
         try:
             # Get all custom VPCs first
             custom_vpcs = self.get_all_vpcs_in_region(ec2_client, region, account_name)
@@ -1912,92 +2144,16 @@ class UltraVPCCleanupManager:
             self.log_operation('INFO', f"Processing {len(custom_vpcs)} custom VPCs: {vpc_ids}")
             
             for vpc in custom_vpcs:
-                self.cleanup_results['vpcs_analyzed'].append({
+                self.record_result('vpcs_analyzed', {
                     'vpc_id': vpc['VpcId'],
                     'cidr': vpc['CidrBlock'],
                     'region': region,
                     'account': account_name
                 })
             
-            # Clean up resources in dependency order
-            cleanup_success = True
-            
-            # 1. VPC Flow Logs
-            flow_logs = self.get_vpc_flow_logs(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_vpc_flow_logs(ec2_client, flow_logs, region, account_name):
-                cleanup_success = False
-            
-            # 2. VPC Endpoints
-            endpoints = self.get_vpc_endpoints(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_vpc_endpoints(ec2_client, endpoints, region, account_name):
-                cleanup_success = False
-            
-            # 3. NAT Gateways (with waiting)
-            nat_gateways = self.get_nat_gateways(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_nat_gateways_with_wait(ec2_client, nat_gateways, region, account_name):
-                cleanup_success = False
-            
-            # 4. Internet Gateways (detach then delete)
-            internet_gateways = self.get_internet_gateways(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_internet_gateways(ec2_client, internet_gateways, region, account_name):
-                cleanup_success = False
-            
-            # 5. Security Groups (clear rules then delete non-default)
-            security_groups = self.get_security_groups(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_security_groups(ec2_client, security_groups, region, account_name):
-                cleanup_success = False
-            
-            # 6. Route Tables (non-main)
-            route_tables = self.get_route_tables(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_route_tables(ec2_client, route_tables, region, account_name):
-                cleanup_success = False
-            
-            # 7. Network ACLs (non-default)
-            network_acls = self.get_network_acls(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_network_acls(ec2_client, network_acls, region, account_name):
-                cleanup_success = False
-            
-            # 8. Elastic IPs (VPC-associated)
-            elastic_ips = self.get_elastic_ips(ec2_client, region, account_name)
-            if not self.delete_elastic_ips(ec2_client, elastic_ips, region, account_name):
-                cleanup_success = False
-            
-            # 9. VPN Gateways
-            vpn_gateways = self.get_vpn_gateways(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_vpn_gateways(ec2_client, vpn_gateways, region, account_name):
-                cleanup_success = False
-            
-            # 10. Transit Gateway Attachments
-            tgw_attachments = self.get_transit_gateway_attachments(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_transit_gateway_attachments(ec2_client, tgw_attachments, region, account_name):
-                cleanup_success = False
-            
-            # 11. Network Interfaces (unattached)
-            network_interfaces = self.get_network_interfaces(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_network_interfaces(ec2_client, network_interfaces, region, account_name):
-                cleanup_success = False
-            
-            # 12. Subnets (all custom subnets)
-            subnets = self.get_subnets(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_subnets(ec2_client, subnets, region, account_name):
-                cleanup_success = False
-            
-            # 13. DHCP Options Sets (custom ones)
-            dhcp_options = self.get_dhcp_options_sets(ec2_client, custom_vpcs, region, account_name)
-            if not self.delete_dhcp_options_sets(ec2_client, dhcp_options, region, account_name):
-                cleanup_success = False
-            
-            # 14. Customer Gateways (if VPC-specific)
-            customer_gateways = self.get_customer_gateways(ec2_client, region, account_name)
-            if not self.delete_customer_gateways(ec2_client, customer_gateways, region, account_name):
-                cleanup_success = False
-            
-            # 15. VPC Peering Connections
-            peering_connections = self.get_vpc_peering_connections(ec2_client, vpc_ids, region, account_name)
-            if not self.delete_vpc_peering_connections(ec2_client, peering_connections, region, account_name):
-                cleanup_success = False
-            
-            return cleanup_success
+            snapshot = self.snapshot_region_resources(ec2_client, custom_vpcs, region, account_name)
+            graph = VPCResourceGraph.from_snapshot(snapshot)
+            return self.delete_resource_graph(ec2_client, graph, region, account_name)
             
         except Exception as e:
             self.log_operation('ERROR', f"Error cleaning up VPC resources in {region} ({account_name}): {e}")
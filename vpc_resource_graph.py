@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+VPC Resource Graph
+Dependency graph of the VPC-scoped resources of one region, used to delete them level by level
+instead of in a fixed sequence of describe + delete steps.
+
+The region is described once into a snapshot ({resource_type: [describe data]}). Edges come from
+the snapshot itself: a NAT gateway blocks its subnet, its Elastic IPs and the internet gateway of
+its VPC; endpoints and ENIs block their subnets and security groups; a route table blocks the
+subnets associated with it; a subnet blocks its custom network ACL. Level 0 holds everything
+nothing else blocks, and each later level only holds resources whose blockers are in earlier
+levels, so the deleters of one level can run in parallel.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+# Resource types in the order their deleters are reported within a level
+RESOURCE_TYPES = [
+    'vpc_flow_logs',
+    'vpc_endpoints',
+    'nat_gateways',
+    'transit_gateway_attachments',
+    'vpn_gateways',
+    'vpc_peering_connections',
+    'network_interfaces',
+    'internet_gateways',
+    'elastic_ips',
+    'security_groups',
+    'route_tables',
+    'subnets',
+    'network_acls',
+    'dhcp_options_sets',
+    'customer_gateways',
+]
+
+RESOURCE_ID_KEYS = {
+    'vpc_flow_logs': 'FlowLogId',
+    'vpc_endpoints': 'VpcEndpointId',
+    'nat_gateways': 'NatGatewayId',
+    'transit_gateway_attachments': 'TransitGatewayAttachmentId',
+    'vpn_gateways': 'VpnGatewayId',
+    'vpc_peering_connections': 'VpcPeeringConnectionId',
+    'network_interfaces': 'NetworkInterfaceId',
+    'internet_gateways': 'InternetGatewayId',
+    'elastic_ips': 'AllocationId',
+    'security_groups': 'GroupId',
+    'route_tables': 'RouteTableId',
+    'subnets': 'SubnetId',
+    'network_acls': 'NetworkAclId',
+    'dhcp_options_sets': 'DhcpOptionsId',
+    'customer_gateways': 'CustomerGatewayId',
+}
+
+# Deleters that must see the whole set at once: delete_security_groups revokes every group's
+# rules before deleting any, so groups referencing each other go in one call. These types must
+# not block other resources (their level is raised to the deepest member's).
+BATCHED_RESOURCE_TYPES = ('security_groups',)
+
+NodeKey = Tuple[str, str]
+
+
+def resource_id(resource_type: str, resource: Dict) -> str:
+    """Id of a described resource (classic Elastic IPs only have a PublicIp)"""
+    if resource_type == 'elastic_ips':
+        return resource.get('AllocationId') or resource.get('PublicIp')
+    return resource[RESOURCE_ID_KEYS[resource_type]]
+
+
+class VPCResourceGraph:
+    """Resources keyed by (resource_type, id) with 'delete X before Y' edges"""
+
+    def __init__(self):
+        self.resources: Dict[NodeKey, Dict] = {}
+        self.blocks: Dict[NodeKey, Set[NodeKey]] = defaultdict(set)
+        self.blocked_by: Dict[NodeKey, Set[NodeKey]] = defaultdict(set)
+
+    def add_resource(self, resource_type: str, resource: Dict) -> NodeKey:
+        key = (resource_type, resource_id(resource_type, resource))
+        self.resources.setdefault(key, resource)
+        return key
+
+    def add_dependency(self, first: NodeKey, then: NodeKey):
+        """Record that first has to be deleted before then (ignored unless both are in the graph)"""
+        if first != then and first in self.resources and then in self.resources:
+            self.blocks[first].add(then)
+            self.blocked_by[then].add(first)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, List[Dict]]) -> 'VPCResourceGraph':
+        """Build the graph of a region snapshot ({resource_type: [describe data]})"""
+        graph = cls()
+        for resource_type, resources in snapshot.items():
+            for resource in resources:
+                graph.add_resource(resource_type, resource)
+
+        # Elastic IPs of a NAT gateway are associated at snapshot time but released with it
+        for nat_gw in snapshot.get('nat_gateways', []):
+            for address in nat_gw.get('NatGatewayAddresses', []):
+                if address.get('AllocationId'):
+                    graph.add_resource('elastic_ips', {'AllocationId': address['AllocationId'],
+                                                       'PublicIp': address.get('PublicIp')})
+
+        graph._link(snapshot)
+        return graph
+
+    def _link(self, snapshot: Dict[str, List[Dict]]):
+        subnets_by_vpc = defaultdict(list)
+        for subnet in snapshot.get('subnets', []):
+            subnets_by_vpc[subnet.get('VpcId')].append(('subnets', subnet['SubnetId']))
+
+        igws_by_vpc = defaultdict(list)
+        for igw in snapshot.get('internet_gateways', []):
+            for attachment in igw.get('Attachments', []):
+                igws_by_vpc[attachment.get('VpcId')].append(('internet_gateways', igw['InternetGatewayId']))
+
+        for endpoint in snapshot.get('vpc_endpoints', []):
+            key = ('vpc_endpoints', endpoint['VpcEndpointId'])
+            for subnet_id in endpoint.get('SubnetIds', []):
+                self.add_dependency(key, ('subnets', subnet_id))
+            for group in endpoint.get('Groups', []):
+                self.add_dependency(key, ('security_groups', group.get('GroupId')))
+            for route_table_id in endpoint.get('RouteTableIds', []):
+                self.add_dependency(key, ('route_tables', route_table_id))
+
+        for nat_gw in snapshot.get('nat_gateways', []):
+            key = ('nat_gateways', nat_gw['NatGatewayId'])
+            self.add_dependency(key, ('subnets', nat_gw.get('SubnetId')))
+            for address in nat_gw.get('NatGatewayAddresses', []):
+                if address.get('AllocationId'):
+                    self.add_dependency(key, ('elastic_ips', address['AllocationId']))
+            # An IGW cannot be detached while the VPC still has NAT public addresses mapped
+            for igw_key in igws_by_vpc.get(nat_gw.get('VpcId'), []):
+                self.add_dependency(key, igw_key)
+
+        for attachment in snapshot.get('transit_gateway_attachments', []):
+            key = ('transit_gateway_attachments', attachment['TransitGatewayAttachmentId'])
+            for subnet_key in subnets_by_vpc.get(attachment.get('ResourceId'), []):
+                self.add_dependency(key, subnet_key)
+
+        for eni in snapshot.get('network_interfaces', []):
+            key = ('network_interfaces', eni['NetworkInterfaceId'])
+            self.add_dependency(key, ('subnets', eni.get('SubnetId')))
+            for group in eni.get('Groups', []):
+                self.add_dependency(key, ('security_groups', group.get('GroupId')))
+
+        for route_table in snapshot.get('route_tables', []):
+            key = ('route_tables', route_table['RouteTableId'])
+            # delete_route_tables disassociates first, which fails once the subnet is gone
+            for association in route_table.get('Associations', []):
+                if association.get('SubnetId'):
+                    self.add_dependency(key, ('subnets', association['SubnetId']))
+
+        for network_acl in snapshot.get('network_acls', []):
+            key = ('network_acls', network_acl['NetworkAclId'])
+            # A custom ACL stays in use until its subnets are deleted (they fall back to the default)
+            for association in network_acl.get('Associations', []):
+                if association.get('SubnetId'):
+                    self.add_dependency(('subnets', association['SubnetId']), key)
+
+    def deletion_levels(self) -> List[Dict[str, List[Dict]]]:
+        """Group the resources into levels that only depend on earlier levels
+
+        Returns:
+            One {resource_type: [describe data]} per level, first level first
+        """
+        remaining = {key: len(self.blocked_by[key]) for key in self.resources}
+        depth = {key: 0 for key in self.resources}
+
+        ready = [key for key, count in remaining.items() if count == 0]
+        while ready:
+            key = ready.pop()
+            for dependent in self.blocks[key]:
+                depth[dependent] = max(depth[dependent], depth[key] + 1)
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        # The edge rules cannot form a cycle; should one appear, delete its members last
+        # rather than dropping them
+        stuck = [key for key, count in remaining.items() if count]
+        if stuck:
+            last_level = max(depth.values()) + 1
+            for key in stuck:
+                depth[key] = last_level
+
+        for resource_type in BATCHED_RESOURCE_TYPES:
+            members = [key for key in depth if key[0] == resource_type]
+            if members:
+                level = max(depth[key] for key in members)
+                for key in members:
+                    depth[key] = level
+
+        levels: List[Dict[str, List[Dict]]] = [dict() for _ in range(max(depth.values(), default=-1) + 1)]
+        for key in sorted(depth, key=lambda k: (RESOURCE_TYPES.index(k[0]), k[1])):
+            levels[depth[key]].setdefault(key[0], []).append(self.resources[key])
+        return [level for level in levels if level]